@@ -1,14 +1,14 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 import uuid
 from docx import Document
-from bs4 import BeautifulSoup
 from pathlib import Path
 import logging
 
 from backend.services.suggestion_generator import SuggestionGenerator
 from backend.services.docx_template_manager import DocxTemplateManager
+from backend.services.cpu_executor import CPUExecutor, get_cpu_executor
 
 logger = logging.getLogger(__name__)
 
@@ -137,17 +137,37 @@ async def get_editor_session(session_id: str):
     )
 
 @router.post("/rescore", response_model=RescoreResponse)
-async def rescore_resume(request: RescoreRequest):
+async def rescore_resume(
+    request: RescoreRequest,
+    executor: CPUExecutor = Depends(get_cpu_executor)
+):
     """Re-score the current working DOCX and generate fresh suggestions"""
-    from backend.services.scorer_ats import ATSScorer
-    from backend.services.parser import ResumeData
-
     # Validate session exists
     if request.session_id not in SESSION_STORE:
         raise HTTPException(status_code=404, detail="Session not found")
 
     session_data = SESSION_STORE[request.session_id]
 
+    # Scoring runs on the shared CPU pool; only the session update stays here
+    score, suggestions = await executor.run(
+        _rescore_sync, session_data.get("sections", [])
+    )
+
+    # Update session with new score
+    SESSION_STORE[request.session_id]["current_score"] = score
+    SESSION_STORE[request.session_id]["suggestions"] = suggestions
+
+    return RescoreResponse(
+        score=score,
+        suggestions=suggestions
+    )
+
+
+def _rescore_sync(sections: List[Dict[str, Any]]):
+    """Blocking body of rescore_resume; returns (score, suggestions)."""
+    from backend.services.scorer_ats import ATSScorer
+    from backend.services.parser import ResumeData
+
     # TODO: Load actual working DOCX from storage
     # For now, create a mock document
     doc = Document()
@@ -232,7 +252,6 @@ async def rescore_resume(request: RescoreRequest):
 
     # Generate fresh suggestions
     generator = SuggestionGenerator(role="software_engineer", level="mid")
-    sections = session_data.get("sections", [])
 
     # Create resume data dict for suggestion generation
     resume_data_dict = {
@@ -248,14 +267,7 @@ async def rescore_resume(request: RescoreRequest):
         sections=sections
     )
 
-    # Update session with new score
-    SESSION_STORE[request.session_id]["current_score"] = score
-    SESSION_STORE[request.session_id]["suggestions"] = suggestions
-
-    return RescoreResponse(
-        score=score,
-        suggestions=suggestions
-    )
+    return score, suggestions
 
 
 @router.post("/update-section", response_model=UpdateSectionResponse)
@@ -268,6 +280,8 @@ async def update_section(request: UpdateSectionRequest):
 
     try:
         # Parse HTML content to extract text
+        from bs4 import BeautifulSoup  # Only needed for section updates
+
         soup = BeautifulSoup(request.content, 'html.parser')
         text = soup.get_text(separator='\n').strip()
 
@@ -1,13 +1,11 @@
 """Export API for resume and report downloads"""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import Response
 from pydantic import BaseModel
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import io
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
-from docx import Document
+
+from backend.services.cpu_executor import CPUExecutor, get_cpu_executor
 
 router = APIRouter(prefix="/api/export", tags=["export"])
 
@@ -27,17 +25,40 @@ class ExportReportRequest(BaseModel):
 
 
 @router.post("/resume")
-async def export_resume(request: ExportResumeRequest):
+async def export_resume(
+    request: ExportResumeRequest,
+    executor: CPUExecutor = Depends(get_cpu_executor)
+):
     """Export edited resume as PDF or DOCX"""
+    if request.format not in ("pdf", "docx"):
+        raise HTTPException(400, "Invalid format. Use 'pdf' or 'docx'")
+
+    # reportlab / python-docx rendering is blocking; run it on the CPU pool
+    content, media_type, filename = await executor.run(
+        _render_resume, request.content, request.name, request.format
+    )
+
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+
+def _render_resume(content: str, name: str, file_format: str) -> Tuple[bytes, str, str]:
+    """Render resume HTML to (file bytes, media type, filename)."""
+    if file_format == "pdf":
+        # reportlab is only loaded once a PDF is exported
+        from reportlab.lib.pagesizes import letter
+        from reportlab.pdfgen import canvas
 
-    if request.format == "pdf":
         # Simple PDF generation with text wrapping
         buffer = io.BytesIO()
         c = canvas.Canvas(buffer, pagesize=letter)
 
         # Strip HTML tags for simple text
         import re
-        text = re.sub('<[^<]+?>', '', request.content)
+        text = re.sub('<[^<]+?>', '', content)
 
         # Page dimensions
         page_width = 612  # letter size width in points
@@ -94,21 +115,19 @@ async def export_resume(request: ExportResumeRequest):
         c.save()
         buffer.seek(0)
 
-        filename = f"{request.name.replace(' ', '_')}_Resume.pdf"
+        filename = f"{name.replace(' ', '_')}_Resume.pdf"
 
-        return Response(
-            content=buffer.read(),
-            media_type="application/pdf",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
+        return buffer.read(), "application/pdf", filename
+
+    elif file_format == "docx":
+        from docx import Document
 
-    elif request.format == "docx":
         # Simple DOCX generation
         doc = Document()
 
         # Strip HTML for simple text
         import re
-        text = re.sub('<[^<]+?>', '', request.content)
+        text = re.sub('<[^<]+?>', '', content)
 
         for line in text.split('\n'):
             if line.strip():
@@ -118,38 +137,56 @@ async def export_resume(request: ExportResumeRequest):
         doc.save(buffer)
         buffer.seek(0)
 
-        filename = f"{request.name.replace(' ', '_')}_Resume.docx"
+        filename = f"{name.replace(' ', '_')}_Resume.docx"
 
-        return Response(
-            content=buffer.read(),
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        return (
+            buffer.read(),
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            filename
         )
 
     else:
-        raise HTTPException(400, "Invalid format. Use 'pdf' or 'docx'")
+        raise ValueError(f"Invalid format: {file_format}")
 
 
 @router.post("/report")
-async def export_score_report(request: ExportReportRequest):
+async def export_score_report(
+    request: ExportReportRequest,
+    executor: CPUExecutor = Depends(get_cpu_executor)
+):
     """Export ATS score report as PDF"""
+    content, filename = await executor.run(
+        _render_report, request.resumeData, request.scoreData, request.mode
+    )
+
+    return Response(
+        content=content,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+
+def _render_report(resume_data: Dict, score_data: Dict, mode: str) -> Tuple[bytes, str]:
+    """Render the score report PDF; returns (file bytes, filename)."""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
 
     buffer = io.BytesIO()
     c = canvas.Canvas(buffer, pagesize=letter)
 
     # Title
     c.setFont("Helvetica-Bold", 18)
-    name = request.resumeData.get("contact", {}).get("name", "Resume")
+    name = resume_data.get("contact", {}).get("name", "Resume")
     c.drawString(50, 750, f"ATS Resume Report - {name}")
 
     # Mode
     c.setFont("Helvetica", 12)
-    mode_text = "ATS Simulation Mode" if request.mode == "ats_simulation" else "Quality Coach Mode"
+    mode_text = "ATS Simulation Mode" if mode == "ats_simulation" else "Quality Coach Mode"
     c.drawString(50, 720, f"Mode: {mode_text}")
 
     # Score
     c.setFont("Helvetica-Bold", 14)
-    score = request.scoreData.get("overall_score", 0)
+    score = score_data.get("overall_score", 0)
     c.drawString(50, 690, f"Score: {score}/100")
 
     # Breakdown
@@ -158,7 +195,7 @@ async def export_score_report(request: ExportReportRequest):
     c.drawString(50, y, "Breakdown:")
     y -= 20
 
-    breakdown = request.scoreData.get("breakdown", {})
+    breakdown = score_data.get("breakdown", {})
     for category, score_val in breakdown.items():
         c.drawString(60, y, f"• {category.replace('_', ' ').title()}: {score_val}")
         y -= 15
@@ -168,8 +205,4 @@ async def export_score_report(request: ExportReportRequest):
 
     filename = f"{name.replace(' ', '_')}_ATS_Report.pdf"
 
-    return Response(
-        content=buffer.read(),
-        media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
+    return buffer.read(), filename
@@ -11,7 +11,10 @@ import tempfile
 import os
 from pathlib import Path
 
-from backend.services.docx_to_latex import convert_docx_to_latex
+from backend.services.lazy_imports import lazy_callable
+
+# The DOCX -> LaTeX converter loads on first use, not at app startup
+convert_docx_to_latex = lazy_callable("backend.services.docx_to_latex", "convert_docx_to_latex")
 
 logger = logging.getLogger(__name__)
 
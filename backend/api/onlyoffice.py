@@ -14,7 +14,6 @@ Requirements:
 
 import os
 import time
-import jwt
 import json
 import hashlib
 from typing import Dict, Any, Optional
@@ -65,6 +64,8 @@ def generate_jwt_token(payload: Dict[str, Any]) -> str:
     Returns:
         JWT token string
     """
+    import jwt  # PyJWT, only needed once OnlyOffice is used
+
     return jwt.encode(
         payload,
         JWT_SECRET,
@@ -85,6 +86,8 @@ def verify_jwt_token(token: str) -> Dict[str, Any]:
     Raises:
         HTTPException: If token is invalid
     """
+    import jwt
+
     try:
         return jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
     except jwt.InvalidTokenError as e:
@@ -8,14 +8,15 @@ Provides endpoints for:
 - Confidence Intervals
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field
 
 from backend.services.ats_simulator import ATSSimulator, analyze_ats_compatibility
 from backend.services.skills_categorizer import SkillsCategorizer, analyze_skills
 from backend.services.confidence_scorer import ConfidenceScorer, add_confidence_intervals
-from backend.services.semantic_matcher import SemanticKeywordMatcher
+from backend.services.semantic_matcher import get_semantic_matcher
+from backend.services.cpu_executor import CPUExecutor, get_cpu_executor
 
 
 router = APIRouter(prefix="/api/phase2", tags=["phase2"])
@@ -51,7 +52,10 @@ class ConfidenceRequest(BaseModel):
 # Endpoints
 
 @router.post("/ats-simulation")
-async def simulate_ats_platforms(request: ATSSimulationRequest) -> Dict[str, Any]:
+async def simulate_ats_platforms(
+    request: ATSSimulationRequest,
+    executor: CPUExecutor = Depends(get_cpu_executor)
+) -> Dict[str, Any]:
     """
     Simulate how different ATS platforms will parse the resume.
 
@@ -62,10 +66,19 @@ async def simulate_ats_platforms(request: ATSSimulationRequest) -> Dict[str, Any
 
     Plus overall ATS compatibility score.
     """
+    return await executor.run(
+        _ats_simulation_sync,
+        request.resume_text,
+        request.resume_metadata
+    )
+
+
+def _ats_simulation_sync(resume_text: str, resume_metadata: Optional[Dict]) -> Dict[str, Any]:
+    """Blocking body of simulate_ats_platforms (runs on the CPU executor)."""
     try:
         result = analyze_ats_compatibility(
-            request.resume_text,
-            request.resume_metadata
+            resume_text,
+            resume_metadata
         )
 
         return {
@@ -83,7 +96,8 @@ async def simulate_ats_platforms(request: ATSSimulationRequest) -> Dict[str, Any
 @router.post("/ats-simulation/platform/{platform}")
 async def simulate_specific_platform(
     platform: str,
-    request: ATSSimulationRequest
+    request: ATSSimulationRequest,
+    executor: CPUExecutor = Depends(get_cpu_executor)
 ) -> Dict[str, Any]:
     """
     Simulate a specific ATS platform.
@@ -98,15 +112,31 @@ async def simulate_specific_platform(
             detail=f"Unsupported platform: {platform}. Must be one of: taleo, workday, greenhouse"
         )
 
+    return await executor.run(
+        _platform_simulation_sync,
+        platform,
+        request.resume_text,
+        request.resume_metadata
+    )
+
+
+def _platform_simulation_sync(
+    platform: str,
+    resume_text: str,
+    resume_metadata: Optional[Dict]
+) -> Dict[str, Any]:
+    """Blocking body of simulate_specific_platform (runs on the CPU executor)."""
+    platform_lower = platform.lower()
+
     try:
         simulator = ATSSimulator()
 
         if platform_lower == 'taleo':
-            result = simulator.simulate_taleo(request.resume_text, request.resume_metadata)
+            result = simulator.simulate_taleo(resume_text, resume_metadata)
         elif platform_lower == 'workday':
-            result = simulator.simulate_workday(request.resume_text, request.resume_metadata)
+            result = simulator.simulate_workday(resume_text, resume_metadata)
         else:  # greenhouse
-            result = simulator.simulate_greenhouse(request.resume_text, request.resume_metadata)
+            result = simulator.simulate_greenhouse(resume_text, resume_metadata)
 
         return {
             "success": True,
@@ -122,7 +152,10 @@ async def simulate_specific_platform(
 
 
 @router.post("/skills-analysis")
-async def analyze_skills_categorization(request: SkillsAnalysisRequest) -> Dict[str, Any]:
+async def analyze_skills_categorization(
+    request: SkillsAnalysisRequest,
+    executor: CPUExecutor = Depends(get_cpu_executor)
+) -> Dict[str, Any]:
     """
     Categorize skills into Hard Skills and Soft Skills.
 
@@ -134,10 +167,19 @@ async def analyze_skills_categorization(request: SkillsAnalysisRequest) -> Dict[
     - Match rates (if job description provided)
     - Missing skills recommendations
     """
+    return await executor.run(
+        _skills_analysis_sync,
+        request.resume_text,
+        request.job_description
+    )
+
+
+def _skills_analysis_sync(resume_text: str, job_description: Optional[str]) -> Dict[str, Any]:
+    """Blocking body of analyze_skills_categorization (runs on the CPU executor)."""
     try:
         result = analyze_skills(
-            request.resume_text,
-            request.job_description
+            resume_text,
+            job_description
         )
 
         return {
@@ -153,7 +195,10 @@ async def analyze_skills_categorization(request: SkillsAnalysisRequest) -> Dict[
 
 
 @router.post("/heat-map")
-async def generate_heat_map_data(request: HeatMapRequest) -> Dict[str, Any]:
+async def generate_heat_map_data(
+    request: HeatMapRequest,
+    executor: CPUExecutor = Depends(get_cpu_executor)
+) -> Dict[str, Any]:
     """
     Generate keyword heat map data for visual highlighting.
 
@@ -168,18 +213,28 @@ async def generate_heat_map_data(request: HeatMapRequest) -> Dict[str, Any]:
     - Yellow: 0.5-0.8 similarity
     - No highlight: <0.5 similarity
     """
+    return await executor.run(
+        _heat_map_sync,
+        request.resume_text,
+        request.job_description,
+        request.threshold
+    )
+
+
+def _heat_map_sync(resume_text: str, job_description: str, threshold: float) -> Dict[str, Any]:
+    """Blocking body of generate_heat_map_data (runs on the CPU executor)."""
     try:
-        matcher = SemanticKeywordMatcher()
+        matcher = get_semantic_matcher()
         result = matcher.get_keyword_matches_detailed(
-            resume_text=request.resume_text,
-            job_description=request.job_description,
-            threshold=request.threshold
+            resume_text=resume_text,
+            job_description=job_description,
+            threshold=threshold
         )
 
         return {
             "success": True,
             "data": result,
-            "threshold": request.threshold,
+            "threshold": threshold,
             "color_mapping": {
                 "high_match": ">0.8 similarity (green)",
                 "moderate_match": "0.5-0.8 similarity (yellow)",
@@ -232,7 +287,8 @@ async def calculate_confidence_intervals(request: ConfidenceRequest) -> Dict[str
 async def comprehensive_phase2_analysis(
     resume_text: str,
     job_description: Optional[str] = None,
-    resume_metadata: Optional[Dict] = None
+    resume_metadata: Optional[Dict] = None,
+    executor: CPUExecutor = Depends(get_cpu_executor)
 ) -> Dict[str, Any]:
     """
     Run all Phase 2 analyses in one request.
@@ -245,6 +301,20 @@ async def comprehensive_phase2_analysis(
 
     This is a convenience endpoint for getting all Phase 2 features at once.
     """
+    return await executor.run(
+        _comprehensive_analysis_sync,
+        resume_text,
+        job_description,
+        resume_metadata
+    )
+
+
+def _comprehensive_analysis_sync(
+    resume_text: str,
+    job_description: Optional[str],
+    resume_metadata: Optional[Dict]
+) -> Dict[str, Any]:
+    """Blocking body of comprehensive_phase2_analysis (runs on the CPU executor)."""
     try:
         results = {}
 
@@ -262,7 +332,7 @@ async def comprehensive_phase2_analysis(
 
         # 3. Heat Map Data (if job description provided)
         if job_description:
-            matcher = SemanticKeywordMatcher()
+            matcher = get_semantic_matcher()
             results['heat_map'] = matcher.get_keyword_matches_detailed(
                 resume_text=resume_text,
                 job_description=job_description,
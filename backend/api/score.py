@@ -1,10 +1,20 @@
 """Score endpoint for re-scoring updated resume data"""
-from fastapi import APIRouter, HTTPException
+import io
+import json
+import os
+import threading
+import zipfile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 from backend.services.parser import ResumeData
-from backend.services.scorer_v3_adapter import ScorerV3Adapter
+from backend.services.scoring_engine import get_scoring_engine
+from backend.services.cpu_executor import CPUExecutor, ExecutorSaturatedError, get_cpu_executor
+from backend.services.batch_scorer import iter_resume_files, prepare_batch_job, score_batch, with_summary
 from backend.services.role_taxonomy import get_role_scoring_data, ExperienceLevel
 from backend.services.suggestion_integrator import SuggestionIntegrator
 from backend.services.scoring_utils import normalize_scoring_mode
@@ -22,6 +32,11 @@ from backend.schemas.resume import (
 
 router = APIRouter(prefix="/api", tags=["score"])
 
+MAX_BATCH_ZIP_SIZE = int(os.getenv("BATCH_MAX_ZIP_SIZE", str(200 * 1024 * 1024)))  # 200MB
+
+# Each batch runs its own worker pool; limit how many run at once
+_batch_slots = threading.BoundedSemaphore(int(os.getenv("BATCH_MAX_CONCURRENT", "1")))
+
 
 class ScoreRequest(BaseModel):
     """Request body for score endpoint"""
@@ -40,7 +55,10 @@ class ScoreRequest(BaseModel):
 
 
 @router.post("/score", response_model=ScoreResponse)
-async def score_resume(request: ScoreRequest):
+async def score_resume(
+    request: ScoreRequest,
+    executor: CPUExecutor = Depends(get_cpu_executor)
+):
     """
     Re-score a resume with updated data (e.g., after editing).
 
@@ -58,7 +76,80 @@ async def score_resume(request: ScoreRequest):
 
     Returns updated score (0-100) with mode-specific breakdown.
     """
+    # Scoring is CPU-bound; run it on the shared pool, not the event loop
+    return await executor.run(_score_resume_sync, request)
+
+
+@router.post("/score/batch")
+async def score_resume_batch(
+    file: UploadFile = File(...),
+    jobDescription: Optional[str] = Form(""),
+    role: Optional[str] = Form(None),
+    level: Optional[str] = Form(None),
+):
+    """
+    Score every resume in a zip archive against one job description.
+
+    - **file**: .zip of .pdf/.docx resumes
+    - **jobDescription**: (Optional) Job description; keywords are extracted once for the batch
+    - **role**: (Optional) Role identifier for default keywords when no JD is given
+    - **level**: (Optional) Experience level ("entry", "mid", "senior", "lead", "executive")
+
+    Streams NDJSON (application/x-ndjson): one line per resume as it finishes
+    ({"file", "status", "overallScore", "breakdown", ...} or
+    {"file", "status": "error", "error"}), then a final {"summary": true, ...}.
+    """
+    content = await file.read(MAX_BATCH_ZIP_SIZE + 1)
+    if len(content) > MAX_BATCH_ZIP_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Archive too large. Maximum size is {MAX_BATCH_ZIP_SIZE // (1024 * 1024)}MB"
+        )
+    if not zipfile.is_zipfile(io.BytesIO(content)):
+        raise HTTPException(status_code=400, detail="Batch upload must be a .zip archive of PDF/DOCX resumes")
+
+    if not _batch_slots.acquire(blocking=False):
+        raise ExecutorSaturatedError("Another batch is already running", retry_after=30)
+
+    released = threading.Event()
+
+    def _release_slot():
+        if not released.is_set():
+            released.set()
+            _batch_slots.release()
+
+    try:
+        # JD keyword extraction may load models; keep it off the event loop
+        job = await run_in_threadpool(
+            prepare_batch_job, jobDescription or "", level or "mid", role or "software_engineer"
+        )
+    except Exception:
+        _release_slot()
+        raise
+
+    def _ndjson():
+        try:
+            records = score_batch(
+                iter_resume_files(content), job,
+                kind=os.getenv("BATCH_EXECUTOR_KIND", "process")
+            )
+            for record in with_summary(records):
+                yield json.dumps(record) + "\n"
+        except ValueError as e:
+            yield json.dumps({'status': 'error', 'error': str(e)}) + "\n"
+        finally:
+            _release_slot()
+
+    # The background task frees the slot if the client disconnects before streaming starts
+    return StreamingResponse(
+        _ndjson(),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(_release_slot)
+    )
+
 
+def _score_resume_sync(request: ScoreRequest) -> ScoreResponse:
+    """Blocking body of score_resume (runs on the CPU executor)."""
     # Convert request to ResumeData
     resume_data = ResumeData(
         fileName=request.fileName,
@@ -73,8 +164,8 @@ async def score_resume(request: ScoreRequest):
     # Normalize mode parameter using utility function
     mode = normalize_scoring_mode(request.mode or "auto", request.jobDescription or "")
 
-    # Calculate score using ScorerV3 via adapter
-    scorer = ScorerV3Adapter()
+    # Calculate score using the process-wide ScorerV3 adapter
+    scorer = get_scoring_engine().adapter
     score_result = scorer.score(
         resume_data=resume_data,
         level=request.level or "mid",
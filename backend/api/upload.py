@@ -1,22 +1,24 @@
 """Upload endpoint for resume file upload and initial scoring"""
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from fastapi.responses import FileResponse
-from typing import Optional
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
+from fastapi.responses import FileResponse, StreamingResponse
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
+import asyncio
 import io
+import json
 import os
 import uuid
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-from backend.services.parser import parse_pdf, parse_docx
-# Updated to use ScorerV3 via adapter
-from backend.services.scorer_v3_adapter import ScorerV3Adapter
+from backend.services.parser import ResumeData, parse_pdf, parse_docx
+from backend.services.parsed_docx import ParsedDocx
+from backend.services.parse_cache import ParsedUpload, get_parse_cache
+# Updated to use ScorerV3 via the shared warm engine
+from backend.services.scoring_engine import get_scoring_engine
+from backend.services.cpu_executor import CPUExecutor, get_cpu_executor
 from backend.services.format_checker import ATSFormatChecker
-from backend.services.docx_to_pdf import convert_docx_to_pdf
-from backend.services.document_to_html import docx_to_html, pdf_to_html
-from backend.services.pdf_to_docx import convert_pdf_to_docx
-from backend.services.docx_to_html_advanced import docx_to_html_advanced
+from backend.services.lazy_imports import lazy_callable
 from backend.services.section_detector import SectionDetector
 from backend.services.docx_template_manager import DocxTemplateManager
 from backend.services.scoring_utils import normalize_scoring_mode
@@ -35,12 +37,22 @@ from backend.schemas.resume import (
     EnhancedSuggestion,
 )
 
+# Conversion stacks (pdf2docx + OpenCV, mammoth, reportlab) load on first use,
+# not at app startup
+convert_docx_to_pdf = lazy_callable("backend.services.docx_to_pdf", "convert_docx_to_pdf")
+docx_to_html = lazy_callable("backend.services.document_to_html", "docx_to_html")
+pdf_to_html = lazy_callable("backend.services.document_to_html", "pdf_to_html")
+convert_pdf_to_docx = lazy_callable("backend.services.pdf_to_docx", "convert_pdf_to_docx")
+docx_to_html_advanced = lazy_callable("backend.services.docx_to_html_advanced", "docx_to_html_advanced")
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["upload"])
 
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-ALLOWED_TYPES = ["application/pdf", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"]
+DOCX_HTML_TIMEOUT = 30  # seconds before a DOCX falls back to the basic (mammoth) converter
+DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+ALLOWED_TYPES = ["application/pdf", DOCX_CONTENT_TYPE]
 
 # Storage directory for uploaded files
 UPLOAD_DIR = Path(__file__).parent.parent / "storage" / "uploads"
@@ -54,7 +66,8 @@ async def upload_resume(
     level: Optional[str] = Form(None),
     jobDescription: Optional[str] = Form(None),
     mode: Optional[str] = Form("auto"),  # "ats", "quality", or "auto" (default)
-    industry: Optional[str] = Form(None)  # Kept for backward compatibility
+    industry: Optional[str] = Form(None),  # Kept for backward compatibility
+    executor: CPUExecutor = Depends(get_cpu_executor)
 ):
     """
     Upload a resume file (PDF or DOCX), parse it, and get an initial score.
@@ -72,6 +85,106 @@ async def upload_resume(
     Returns parsed resume data with comprehensive score (0-100) in selected mode.
     """
 
+    file_content = await _read_upload(file)
+
+    # Conversion, parsing and scoring are blocking CPU work; run them on the
+    # shared pool so one slow resume does not stall the event loop
+    return await executor.run(
+        _process_upload,
+        file_content,
+        file.filename,
+        file.content_type,
+        role,
+        level,
+        jobDescription,
+        mode,
+        industry,
+    )
+
+
+@router.post("/upload/stream")
+async def upload_resume_stream(
+    file: UploadFile = File(...),
+    role: Optional[str] = Form(None),
+    level: Optional[str] = Form(None),
+    jobDescription: Optional[str] = Form(None),
+    mode: Optional[str] = Form("auto"),
+    industry: Optional[str] = Form(None),
+    executor: CPUExecutor = Depends(get_cpu_executor)
+):
+    """
+    Streaming variant of /api/upload using Server-Sent Events.
+
+    Takes the same form fields and emits events as each stage finishes, so
+    the client can render the parsed resume before scoring is done:
+
+    - **parsed**: fileName, fileId, originalFileUrl, contact, metadata
+    - **parameter**: one per ScorerV3 parameter (code, category, score, maxScore, status)
+    - **score**: overallScore, rating and per-category breakdown
+    - **suggestions**: enhanced/prioritized suggestions and pass probability
+    - **html**: editableHtml
+    - **result**: the complete UploadResponse (same body as /api/upload)
+    - **error**: status and detail; ends the stream
+
+    With CPU_EXECUTOR_KIND=process, progress events cannot leave the worker
+    while it runs and are sent together just before the result.
+    """
+    file_content = await _read_upload(file)
+    args = (
+        file_content, file.filename, file.content_type,
+        role, level, jobDescription, mode, industry,
+    )
+
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+
+    def _emit(event: str, data: Dict[str, Any]) -> None:
+        loop.call_soon_threadsafe(events.put_nowait, (event, data))
+
+    # Submit before responding so a saturated pool still answers 429
+    if executor.kind == "process":
+        future = executor.submit(_process_upload_buffered, *args)
+    else:
+        future = executor.submit(_process_upload, *args, emit=_emit)
+    # None marks the end of the event stream
+    future.add_done_callback(lambda _: loop.call_soon_threadsafe(events.put_nowait, None))
+
+    async def _stream():
+        deadline = loop.time() + executor.timeout if executor.timeout else None
+        try:
+            while True:
+                remaining = max(0.0, deadline - loop.time()) if deadline else None
+                item = await asyncio.wait_for(events.get(), timeout=remaining)
+                if item is None:
+                    break
+                yield _sse_event(*item)
+
+            result = await executor.wait(future, name="upload_stream")
+            if executor.kind == "process":
+                buffered, result = result
+                for event, data in buffered:
+                    yield _sse_event(event, data)
+            yield _sse_event("result", result.model_dump(mode="json"))
+        except asyncio.TimeoutError:
+            yield _sse_event("error", {
+                "status": 503,
+                "detail": f"Processing timed out after {executor.timeout:.0f}s"
+            })
+        except HTTPException as e:
+            yield _sse_event("error", {"status": e.status_code, "detail": e.detail})
+        except Exception as e:
+            logger.error(f"Streaming upload failed: {str(e)}")
+            yield _sse_event("error", {"status": 500, "detail": str(e)})
+
+    return StreamingResponse(
+        _stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _read_upload(file: UploadFile) -> bytes:
+    """Validate type and size of an uploaded resume and read it."""
     # Validate file type
     if file.content_type not in ALLOWED_TYPES:
         raise HTTPException(
@@ -92,13 +205,47 @@ async def upload_resume(
             )
 
     # Now read file content
-    file_content = await file.read()
-    original_content_type = file.content_type
+    return await file.read()
+
+
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _process_upload_buffered(*args) -> Tuple[List[Tuple[str, Dict[str, Any]]], UploadResponse]:
+    """_process_upload for process pools: returns (events, response)."""
+    events: List[Tuple[str, Dict[str, Any]]] = []
+    response = _process_upload(*args, emit=lambda event, data: events.append((event, data)))
+    return events, response
+
+
+def _process_upload(
+    file_content: bytes,
+    filename: Optional[str],
+    content_type: str,
+    role: Optional[str],
+    level: Optional[str],
+    jobDescription: Optional[str],
+    mode: Optional[str],
+    industry: Optional[str],
+    emit: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> UploadResponse:
+    """
+    Blocking body of upload_resume (runs on the CPU executor).
+
+    Args:
+        emit: Optional callback(event, data) receiving progress events for
+            /api/upload/stream, in order: "parsed", one "parameter" per
+            ScorerV3 parameter, "score", "suggestions", "html"
+    """
+    emit = emit or (lambda event, data: None)
+    original_content_type = content_type
 
     # DISABLED: PDF to DOCX conversion loses text structure in multi-column layouts
     # Parse PDF directly instead for better accuracy
     docx_content = None
-    # if file.content_type == "application/pdf":
+    # if content_type == "application/pdf":
     #     try:
     #         logger.info("Converting PDF to DOCX for better formatting preservation...")
     #         docx_content = convert_pdf_to_docx(file_content)
@@ -110,7 +257,7 @@ async def upload_resume(
 
     # Save original file for preview
     file_id = str(uuid.uuid4())
-    file_extension = ".pdf" if file.content_type == "application/pdf" else ".docx"
+    file_extension = ".pdf" if content_type == "application/pdf" else ".docx"
     file_path = UPLOAD_DIR / f"{file_id}{file_extension}"
 
     with open(file_path, "wb") as f:
@@ -132,81 +279,22 @@ async def upload_resume(
     # over its limit.  The original DOCX is already saved and downloadable.
     preview_pdf_url = None
 
-    # Convert to editable HTML with formatting preserved
-    # Use converted DOCX if available for better formatting
-    editable_html = None
-    try:
-        logger.info("Converting document to editable HTML with advanced converter...")
-        if docx_content:
-            _bytes_for_html = docx_content
-            def _adv_html(): return docx_to_html_advanced(_bytes_for_html)
-            executor = ThreadPoolExecutor(max_workers=1)
-            try:
-                future = executor.submit(_adv_html)
-                try:
-                    editable_html = future.result(timeout=30)
-                    logger.info("Generated editable HTML from converted DOCX (advanced)")
-                except FuturesTimeoutError:
-                    logger.warning("docx_to_html_advanced timed out (converted DOCX) — will use fallback")
-            finally:
-                executor.shutdown(wait=False)
-        elif original_content_type == "application/pdf":
-            editable_html = pdf_to_html(file_content)
-            logger.info("Generated editable HTML from PDF")
-        else:  # Original DOCX
-            _bytes_for_html = file_content
-            def _adv_html(): return docx_to_html_advanced(_bytes_for_html)
-            executor = ThreadPoolExecutor(max_workers=1)
-            try:
-                future = executor.submit(_adv_html)
-                try:
-                    editable_html = future.result(timeout=30)
-                    logger.info("Generated editable HTML from DOCX (advanced)")
-                except FuturesTimeoutError:
-                    logger.warning("docx_to_html_advanced timed out (original DOCX) — will use fallback")
-            finally:
-                executor.shutdown(wait=False)
-        if editable_html:
-            logger.info(f"Editable HTML length: {len(editable_html)} chars")
-    except Exception as e:
-        logger.error(f"Failed to convert to HTML with advanced converter: {str(e)}")
-        logger.info("Falling back to basic converter...")
-        try:
-            if docx_content:
-                editable_html = docx_to_html(docx_content)
-            elif original_content_type == "application/pdf":
-                editable_html = pdf_to_html(file_content)
-            else:
-                editable_html = docx_to_html(file_content)
-            logger.info("Fallback conversion successful")
-        except Exception as e2:
-            logger.error(f"Fallback conversion also failed: {str(e2)}")
-            # Continue without editable HTML - not critical
-
-    # Parse resume based on file type
-    # Use converted DOCX if available for better parsing
-    try:
-        if docx_content:
-            logger.info("Parsing converted DOCX (from PDF)")
-            resume_data = parse_docx(docx_content, file.filename)
-        elif original_content_type == "application/pdf":
-            logger.info("Parsing original PDF")
-            resume_data = parse_pdf(file_content, file.filename)
-        else:  # Original DOCX
-            logger.info("Parsing original DOCX")
-            resume_data = parse_docx(file_content, file.filename)
-
-        # Debug logging
-        logger.info(f"Parsed resume - Word count: {resume_data.metadata.get('wordCount', 0)}")
-        logger.info(f"Experience entries: {len(resume_data.experience)}")
-        logger.info(f"Education entries: {len(resume_data.education)}")
-        logger.info(f"Skills count: {len(resume_data.skills)}")
-        if resume_data.experience:
-            logger.info(f"First experience entry: {str(resume_data.experience[0])[:200]}")
-    except Exception as e:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unable to read file. May be corrupted or password-protected: {str(e)}"
+    is_docx = bool(docx_content) or original_content_type == DOCX_CONTENT_TYPE
+    docx_path = (docx_file_path if docx_content else file_path) if is_docx else None
+
+    # Re-uploads of identical bytes reuse the cached parse result (resume
+    # data, editable HTML and detected sections) keyed by content hash
+    parse_cache = get_parse_cache()
+    cache_key = parse_cache.key_for(docx_content or file_content)
+    cached = parse_cache.get(cache_key)
+    parsed_docx = None
+    if cached is not None:
+        logger.info(f"Parse cache hit for {filename} — skipping conversion and parsing")
+        resume_data = cached.resume_data
+        resume_data.fileName = filename or resume_data.fileName
+    else:
+        parsed_docx, resume_data = _parse_document(
+            file_content, docx_content, original_content_type, filename
         )
 
     # Check if resume is empty (relaxed threshold)
@@ -217,27 +305,39 @@ async def upload_resume(
             detail=f"Resume appears empty or unreadable. Only {word_count} words detected. Please upload a properly formatted PDF or DOCX file."
         )
 
+    emit("parsed", {
+        "fileName": filename,
+        "fileId": file_id,
+        "originalFileUrl": f"/api/files/{file_id}{file_extension}",
+        "contact": resume_data.contact,
+        "metadata": resume_data.metadata,
+    })
+
     # Save template and detect sections
     session_id = None
     sections = []
     preview_url = None
 
     # Only save template if we have DOCX content (either original or converted)
-    if docx_content or original_content_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+    sections_detected = False
+    if is_docx:
         try:
             # Generate session ID
             session_id = str(uuid.uuid4())
 
-            # Save template (use converted DOCX if available, else original DOCX)
+            # Save template from the DOCX already written to storage above
             template_manager = DocxTemplateManager()
-            template_bytes = docx_content if docx_content else file_content
-            template_manager.save_template(session_id, template_bytes)
+            template_manager.save_template_from_file(session_id, docx_path)
 
             logger.info(f"Saved template for session: {session_id}")
 
-            # Detect sections
-            section_detector = SectionDetector()
-            sections = section_detector.detect(template_bytes)
+            # Detect sections (cached alongside the parse result)
+            if cached is not None:
+                sections = cached.sections
+            else:
+                section_detector = SectionDetector()
+                sections = section_detector.detect(parsed_docx)
+            sections_detected = True
 
             logger.info(f"Detected {len(sections)} sections")
 
@@ -277,8 +377,8 @@ async def upload_resume(
 
     logger.info(f"Using role={role_to_use}, level={level_to_use} (defaults applied if not specified)")
 
-    # Use ScorerV3 via adapter
-    scorer = ScorerV3Adapter()
+    # Use the process-wide ScorerV3 adapter (built once at startup)
+    scorer = get_scoring_engine().adapter
 
     try:
         logger.info(f"Calculating score with level={level_to_use}, role={role_to_use}, mode={scoring_mode}")
@@ -286,9 +386,24 @@ async def upload_resume(
             resume_data=resume_data,
             level=level_to_use,
             role=role_to_use,
-            job_description=jobDescription
+            job_description=jobDescription,
+            on_parameter=lambda code, category, result: emit("parameter", {
+                "code": code,
+                "category": category,
+                "score": result.get("score", 0),
+                "maxScore": result.get("max_score", 0),
+                "status": result.get("status"),
+            })
         )
         logger.info(f"Score calculated: {score_result.get('overallScore', 0)}")
+        emit("score", {
+            "overallScore": score_result["overallScore"],
+            "rating": score_result.get("rating"),
+            "breakdown": {
+                category: {"score": details["score"], "maxScore": details["maxScore"]}
+                for category, details in score_result["breakdown"].items()
+            },
+        })
 
         # Enrich with enhanced suggestions
         from backend.services.suggestion_integrator import SuggestionIntegrator
@@ -390,6 +505,25 @@ async def upload_resume(
         passProbability=pass_probability
     )
 
+    emit("suggestions", {
+        "enhancedSuggestions": enhanced_suggestions,
+        "prioritizedSuggestions": prioritized_suggestions.model_dump() if prioritized_suggestions else None,
+        "passProbability": pass_probability.model_dump() if pass_probability else None,
+    })
+
+    # Editable HTML is only needed by the editor, so it is produced last
+    if cached is not None:
+        editable_html = cached.editable_html
+    else:
+        editable_html = _convert_to_html(file_content, docx_content, original_content_type, parsed_docx)
+        if sections_detected or not is_docx:
+            parse_cache.set(cache_key, ParsedUpload(
+                resume_data=resume_data,
+                editable_html=editable_html,
+                sections=sections
+            ))
+    emit("html", {"editableHtml": editable_html})
+
     # Format check response
     format_check_response = FormatCheckResponse(
         passed=format_check_result["passed"],
@@ -400,7 +534,7 @@ async def upload_resume(
 
     return UploadResponse(
         resumeId=None,  # Guest user, no saved resume
-        fileName=file.filename,
+        fileName=filename,
         fileId=file_id,
         originalFileUrl=f"/api/files/{file_id}{file_extension}",
         previewPdfUrl=preview_pdf_url,  # Only set for DOCX files
@@ -426,6 +560,119 @@ async def upload_resume(
     )
 
 
+def _parse_document(
+    file_content: bytes,
+    docx_content: Optional[bytes],
+    original_content_type: str,
+    filename: Optional[str],
+) -> Tuple[Optional[ParsedDocx], ResumeData]:
+    """
+    Parse an uploaded document.
+
+    Returns:
+        (parsed_docx or None for PDFs, resume_data)
+    """
+    # Parse the DOCX package once (converted DOCX if available, else the
+    # original); HTML conversion, parsing and section detection all read
+    # from the same ParsedDocx instead of re-opening the bytes
+    parsed_docx = None
+    if docx_content or original_content_type == DOCX_CONTENT_TYPE:
+        try:
+            parsed_docx = ParsedDocx.from_bytes(docx_content or file_content)
+        except Exception as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unable to read file. May be corrupted or password-protected: {str(e)}"
+            )
+
+    # Parse resume based on file type
+    # Use converted DOCX if available for better parsing
+    try:
+        if parsed_docx is not None:
+            logger.info("Parsing converted DOCX (from PDF)" if docx_content else "Parsing original DOCX")
+            resume_data = parse_docx(parsed_docx, filename)
+        else:
+            logger.info("Parsing original PDF")
+            resume_data = parse_pdf(file_content, filename)
+
+        # Debug logging
+        logger.info(f"Parsed resume - Word count: {resume_data.metadata.get('wordCount', 0)}")
+        logger.info(f"Experience entries: {len(resume_data.experience)}")
+        logger.info(f"Education entries: {len(resume_data.education)}")
+        logger.info(f"Skills count: {len(resume_data.skills)}")
+        if resume_data.experience:
+            logger.info(f"First experience entry: {str(resume_data.experience[0])[:200]}")
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unable to read file. May be corrupted or password-protected: {str(e)}"
+        )
+
+    return parsed_docx, resume_data
+
+
+def _convert_to_html(
+    file_content: bytes,
+    docx_content: Optional[bytes],
+    original_content_type: str,
+    parsed_docx: Optional[ParsedDocx],
+) -> Optional[str]:
+    """Convert an uploaded document to editable HTML (None if conversion fails)."""
+    # Convert to editable HTML with formatting preserved
+    # Use converted DOCX if available for better formatting
+    editable_html = None
+    try:
+        logger.info("Converting document to editable HTML with advanced converter...")
+        if parsed_docx is not None:
+            editable_html = _docx_to_html_advanced_bounded(parsed_docx)
+            logger.info("Generated editable HTML from DOCX (advanced)")
+        else:
+            editable_html = pdf_to_html(file_content)
+            logger.info("Generated editable HTML from PDF")
+        if editable_html:
+            logger.info(f"Editable HTML length: {len(editable_html)} chars")
+    except Exception as e:
+        logger.error(f"Failed to convert to HTML with advanced converter: {str(e)}")
+        logger.info("Falling back to basic converter...")
+        try:
+            if docx_content:
+                editable_html = docx_to_html(docx_content)
+            elif original_content_type == "application/pdf":
+                editable_html = pdf_to_html(file_content)
+            else:
+                editable_html = docx_to_html(file_content)
+            logger.info("Fallback conversion successful")
+        except Exception as e2:
+            logger.error(f"Fallback conversion also failed: {str(e2)}")
+            # Continue without editable HTML - not critical
+
+    return editable_html
+
+
+def _docx_to_html_advanced_bounded(parsed_docx: ParsedDocx) -> Optional[str]:
+    """
+    Run docx_to_html_advanced with a DOCX_HTML_TIMEOUT limit.
+
+    A pathological DOCX must not hold the request until the CPU executor
+    timeout; on timeout the caller falls back to the basic converter.  The
+    helper thread is not joined, so a runaway conversion finishes in the
+    background.
+
+    Raises:
+        TimeoutError: Conversion did not finish in time
+    """
+    helper = ThreadPoolExecutor(max_workers=1, thread_name_prefix="docx-html")
+    try:
+        future = helper.submit(docx_to_html_advanced, parsed_docx)
+        try:
+            return future.result(timeout=DOCX_HTML_TIMEOUT)
+        except TimeoutError:
+            logger.warning("docx_to_html_advanced timed out after %ds", DOCX_HTML_TIMEOUT)
+            raise
+    finally:
+        helper.shutdown(wait=False)
+
+
 @router.get("/files/{file_name}")
 async def get_original_file(file_name: str):
     """
@@ -0,0 +1,57 @@
+"""
+Batch scoring CLI: score a directory or zip of resumes against one JD.
+
+Usage (from the repository root):
+  python -m backend.batch RESUMES --jd job.txt [--level mid] [--role software_engineer]
+                          [--workers 8] [--output results.ndjson]
+
+RESUMES is a directory (searched recursively for .pdf/.docx) or a .zip.
+Writes NDJSON, one line per resume as it finishes plus a final summary line,
+to --output or stdout; progress goes to stderr.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from backend.services.batch_scorer import iter_resume_files, prepare_batch_job, score_batch, with_summary
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Score many resumes against one job description")
+    parser.add_argument("source", help="Directory or .zip of .pdf/.docx resumes")
+    jd = parser.add_mutually_exclusive_group()
+    jd.add_argument("--jd", help="Path to a job description text file")
+    jd.add_argument("--jd-text", help="Job description text")
+    parser.add_argument("--level", default="mid", help="Experience level (entry/mid/senior/lead/executive)")
+    parser.add_argument("--role", default="software_engineer", help="Role for default keywords when no JD is given")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--output", help="Write NDJSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    job_description = args.jd_text or ""
+    if args.jd:
+        job_description = Path(args.jd).read_text(encoding="utf-8")
+
+    job = prepare_batch_job(job_description, level=args.level, role=args.role)
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        count = 0
+        for record in with_summary(score_batch(iter_resume_files(args.source), job, workers=args.workers)):
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+            if not record.get("summary"):
+                count += 1
+                print(f"[{count}] {record['file']}: {record.get('overallScore', record.get('error'))}", file=sys.stderr)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""
+Build the corpus store.
+
+Compiles data/corpus/skills_database.json, data/corpus/role_mappings.json and
+data/keywords/role_keywords.json into one read-only SQLite file that the API
+queries lazily instead of loading the JSON into every worker (see
+services/corpus_store.py).
+
+Run after changing any of those files (a stale store is ignored at runtime),
+or as part of the build:
+  python backend/build_corpus_store.py [--output PATH]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build the corpus store")
+    parser.add_argument("--output", help="Output file (default: CORPUS_STORE_PATH or backend/data/corpus/corpus.sqlite)")
+    args = parser.parse_args(argv)
+
+    from backend.services.corpus_store import build_store
+
+    try:
+        path = build_store(args.output)
+    except Exception as e:
+        print(f"✗ Failed to build corpus store: {e}")
+        return 1
+
+    print(f"✓ Corpus store written to {path} ({path.stat().st_size / 1e6:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
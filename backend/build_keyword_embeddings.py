@@ -0,0 +1,42 @@
+"""
+Build the role keyword embedding store.
+
+Encodes every required/preferred keyword in services/role_keywords.py with the
+sentence encoder selected by SEMANTIC_ENCODER and writes a float16 matrix + index that the API
+memory-maps at startup (see services/keyword_embedding_store.py).
+
+Run after changing ROLE_KEYWORDS (a stale store is ignored at runtime), or as
+part of the build after preload_models.py:
+  python backend/build_keyword_embeddings.py [--output DIR]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build the role keyword embedding store")
+    parser.add_argument("--output", help="Output directory (default: KEYWORD_EMBEDDING_DIR or backend/data/embeddings)")
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    from backend.services.keyword_embedding_store import build_store, role_keyword_list
+    from backend.services.sentence_encoder import configured_model_id, load_sentence_encoder
+
+    print(f"Encoding {len(role_keyword_list())} role keywords with '{configured_model_id()}'...")
+    try:
+        model = load_sentence_encoder()
+        directory = build_store(model, args.output, batch_size=args.batch_size)
+    except Exception as e:
+        print(f"✗ Failed to build keyword embedding store: {e}")
+        return 1
+
+    print(f"✓ Keyword embedding store written to {directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Build the int8 ONNX sentence encoder.
+
+Exports the sentence-transformers model's transformer to ONNX, quantizes its
+weights to int8 (dynamic quantization) and writes the files the "onnx"
+encoder backend loads (see services/sentence_encoder.py):
+
+- model.int8.onnx   quantized transformer (token embeddings out)
+- tokenizer.json    fast tokenizer
+- encoder.json      export version, model name, dimension, max_seq_length
+
+Needs torch, sentence-transformers, onnx and onnxruntime at build time; the
+runtime only needs onnxruntime and tokenizers.  Run as part of the build
+before build_keyword_embeddings.py when SEMANTIC_ENCODER=onnx:
+  python backend/build_onnx_encoder.py [--output DIR]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _is_mean_pooling(pooling) -> bool:
+    config = pooling.get_config_dict()
+    if 'pooling_mode' in config:
+        return config['pooling_mode'] == 'mean'
+    # sentence-transformers 2.x: one flag per mode
+    return [key for key, on in config.items() if key.startswith('pooling_mode_') and on] == ['pooling_mode_mean_tokens']
+
+
+def export(model_name_or_path: str, output: Path, model_name: str) -> Path:
+    """Export and quantize ``model_name_or_path`` into ``output``."""
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from sentence_transformers import SentenceTransformer
+    from sentence_transformers.models import Normalize, Pooling
+
+    from backend.services.sentence_encoder import ONNX_EXPORT_VERSION
+
+    model = SentenceTransformer(model_name_or_path, device='cpu')
+    pooling = next((m for m in model if isinstance(m, Pooling)), None)
+    if pooling is None or not _is_mean_pooling(pooling):
+        raise ValueError("Only mean-pooled models can be exported")
+    transformer = model[0].auto_model.eval()
+
+    class TokenEmbeddings(torch.nn.Module):
+        def __init__(self, auto_model):
+            super().__init__()
+            self.auto_model = auto_model
+
+        def forward(self, input_ids, attention_mask, token_type_ids):
+            return self.auto_model(
+                input_ids=input_ids, attention_mask=attention_mask, token_type_ids=token_type_ids
+            )[0]
+
+    output.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=output) as tmp:
+        fp32_path = Path(tmp) / "model.onnx"
+        sample = model.tokenizer(["an example sentence"], return_tensors='pt')
+        token_type_ids = sample.get('token_type_ids', torch.zeros_like(sample['input_ids']))
+        dynamic = {0: 'batch', 1: 'sequence'}
+        torch.onnx.export(
+            TokenEmbeddings(transformer),
+            (sample['input_ids'], sample['attention_mask'], token_type_ids),
+            str(fp32_path),
+            input_names=['input_ids', 'attention_mask', 'token_type_ids'],
+            output_names=['token_embeddings'],
+            dynamic_axes={
+                'input_ids': dynamic, 'attention_mask': dynamic, 'token_type_ids': dynamic,
+                'token_embeddings': dynamic,
+            },
+            opset_version=14,
+            dynamo=False,
+        )
+        int8_path = Path(tmp) / "model.int8.onnx"
+        quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8, per_channel=True)
+
+        model.tokenizer.backend_tokenizer.save(str(Path(tmp) / "tokenizer.json"))
+        with open(Path(tmp) / "encoder.json", 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': ONNX_EXPORT_VERSION,
+                'model': model_name,
+                'dimension': model.get_sentence_embedding_dimension(),
+                'max_seq_length': model.max_seq_length,
+                'normalize': any(isinstance(m, Normalize) for m in model),
+            }, f, indent=2)
+
+        # Replace the files only once everything was written
+        for name in ("model.int8.onnx", "tokenizer.json", "encoder.json"):
+            os.replace(Path(tmp) / name, output / name)
+    return output
+
+
+def main(argv=None) -> int:
+    from backend.services.keyword_embedding_store import MODEL_NAME
+    from backend.services.sentence_encoder import default_onnx_dir
+
+    parser = argparse.ArgumentParser(description="Build the int8 ONNX sentence encoder")
+    parser.add_argument("--output", help="Output directory (default: ONNX_ENCODER_DIR or backend/data/models/)")
+    parser.add_argument("--model", default=MODEL_NAME, help="Model name or a local copy of it (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    output = Path(args.output) if args.output else default_onnx_dir()
+    print(f"Exporting '{args.model}' to int8 ONNX...")
+    try:
+        export(args.model, output, model_name=MODEL_NAME)
+    except Exception as e:
+        print(f"✗ Failed to build ONNX encoder: {e}")
+        return 1
+
+    size = (output / "model.int8.onnx").stat().st_size
+    print(f"✓ ONNX encoder written to {output} ({size / 1e6:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""
+Gunicorn configuration: pre-fork workers that share preloaded models.
+
+    gunicorn -c gunicorn.conf.py main:app
+
+The master imports the app, loads models and read-only indexes once
+(services/prefork.py) and forks WEB_CONCURRENCY uvicorn workers that share
+them copy-on-write.  ``uvicorn --workers`` cannot do this: it spawns fresh
+interpreters that each load their own copy.
+
+Environment:
+- WEB_CONCURRENCY   number of workers (default 2)
+- PORT              port to bind (default 8000)
+- WORKER_TIMEOUT    seconds before a silent worker is restarted (default 120)
+"""
+
+import gc
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = int(os.getenv("WORKER_TIMEOUT", "120"))
+
+# Import the app in the master so the workers inherit it
+preload_app = True
+
+# No collections while the master builds long-lived state: freed objects would
+# leave holes that worker allocations later fill, unsharing those pages
+gc.disable()
+
+
+def when_ready(server):
+    """Master is listening and about to fork the first workers."""
+    from backend.services.prefork import preload_shared_state
+
+    preload_shared_state()
+
+
+def post_fork(server, worker):
+    """In each worker: collect normally again (frozen objects are skipped)."""
+    gc.enable()
@@ -13,6 +13,11 @@ backend_dir = Path(__file__).parent
 parent_dir = backend_dir.parent
 sys.path.insert(0, str(parent_dir))
 
+# STARTUP_PROFILE=true: log per-module import time and RSS growth for
+# everything imported below (see services/startup_profile.py)
+from backend.services.startup_profile import finish_startup_profile, start_startup_profile
+_startup_profile = start_startup_profile()
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -51,15 +56,49 @@ def _warmup_models():
         logger.info("Semantic matcher warmed up")
     except Exception as e:
         logger.warning("Semantic matcher warmup failed: %s", e)
+
+    try:
+        from backend.services.keyword_embedding_store import get_keyword_embedding_store
+        store = get_keyword_embedding_store()
+        if store is not None:
+            logger.info("Keyword embedding store mapped (%d keywords)", len(store))
+    except Exception as e:
+        logger.warning("Keyword embedding store load failed: %s", e)
     logger.info("Background model warmup complete")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Kick off model warmup in a daemon thread so it doesn't block startup
-    t = threading.Thread(target=_warmup_models, daemon=True, name="model-warmup")
-    t.start()
+    # Build the shared scoring engine once so parameter scorer construction
+    # is not paid inside request latency
+    from backend.services.scoring_engine import init_scoring_engine
+    try:
+        init_scoring_engine()
+    except Exception as e:
+        logger.warning("Scoring engine prebuild failed, will build on first request: %s", e)
+
+    # Kick off model warmup in a daemon thread so it doesn't block startup;
+    # workers forked from a preloaded master (gunicorn.conf.py) already
+    # share the models
+    from backend.services.prefork import is_preloaded
+    if not is_preloaded():
+        t = threading.Thread(target=_warmup_models, daemon=True, name="model-warmup")
+        t.start()
+
+    # Create the shared CPU pool used by the heavy endpoints
+    from backend.services.cpu_executor import get_cpu_executor, shutdown_cpu_executor
+    get_cpu_executor()
     yield
+    shutdown_cpu_executor()
+
+    from backend.services.scorer_v3 import shutdown_parameter_pools
+    shutdown_parameter_pools()
+
+    from backend.services.pdf_page_extractor import shutdown_page_pool
+    shutdown_page_pool()
+
+    from backend.services.languagetool_pool import shutdown_languagetool_pool
+    shutdown_languagetool_pool()
 
 
 app = FastAPI(
@@ -120,6 +159,30 @@ app.include_router(docx_editor_router)
 app.include_router(onlyoffice_router)
 app.include_router(phase2_router)
 
+from backend.services.cpu_executor import ExecutorSaturatedError, ExecutorUnavailableError
+
+
+@app.exception_handler(ExecutorSaturatedError)
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturatedError):
+    """Backpressure: CPU pool queue is full"""
+    logger.warning(f"Rejecting {request.url.path}: {exc}")
+    return JSONResponse(
+        status_code=429,
+        content={"detail": "Server is busy processing other resumes. Please retry shortly."},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+
+@app.exception_handler(ExecutorUnavailableError)
+async def executor_unavailable_handler(request: Request, exc: ExecutorUnavailableError):
+    """CPU pool timed out or is shutting down"""
+    logger.warning(f"Executor unavailable for {request.url.path}: {exc}")
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)}
+    )
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -130,10 +193,22 @@ async def global_exception_handler(request: Request, exc: Exception):
         content={"detail": "Internal server error"}
     )
 
+
+finish_startup_profile(_startup_profile)
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy"}
+    from backend.services.languagetool_pool import get_languagetool_pool
+    from backend.services.prefork import memory_report
+
+    health = {"status": "healthy", "memory": memory_report()}
+    pool = get_languagetool_pool()
+    if pool is not None:
+        # Grammar falls back to basic checks when no server is available
+        health["languagetool"] = pool.status()
+    return health
 
 @app.get("/")
 async def root():
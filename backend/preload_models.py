@@ -9,8 +9,13 @@ What this does:
    HuggingFace local cache — loads in ~1-2s at runtime instead of 4+ minutes.
 2. Starts a LanguageTool JVM to download its JAR (~200 MB) and verify it works.
    The JVM cache is preserved so subsequent startups are fast.
+3. With SEMANTIC_ENCODER=onnx, exports the int8 ONNX encoder
+   (build_onnx_encoder.py) that serves requests instead of torch.
+4. Builds the role keyword embedding store (build_keyword_embeddings.py) so
+   role keywords are not re-encoded on every scoring request.
 """
 
+import os
 import sys
 
 
@@ -43,7 +48,25 @@ def preload_language_tool():
         print(f"⚠ LanguageTool not available ({e}) — grammar checking will use fallback at runtime")
 
 
+def build_onnx_encoder():
+    """Fatal when requested: the onnx backend cannot serve without the export."""
+    if os.getenv("SEMANTIC_ENCODER", "torch").lower() != "onnx":
+        return
+    from build_onnx_encoder import main as build_encoder_main
+    if build_encoder_main([]) != 0:
+        sys.exit(1)
+
+
+def build_keyword_embedding_store():
+    """Non-fatal: without the store keywords are encoded per request."""
+    from build_keyword_embeddings import main as build_store_main
+    if build_store_main([]) != 0:
+        print("⚠ Keyword embedding store not built — role keywords will be encoded at runtime")
+
+
 if __name__ == "__main__":
     preload_sentence_transformer()
     preload_language_tool()
+    build_onnx_encoder()
+    build_keyword_embedding_store()
     print("\nPre-load complete.")
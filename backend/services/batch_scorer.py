@@ -0,0 +1,270 @@
+"""
+Batch Scorer - score many resumes against one job description.
+
+Used by POST /api/score/batch and the ``python -m backend.batch`` CLI.  The
+previous entry points scored one resume per request and the calibration
+scripts looped over ScorerV3Adapter().score file by file, re-extracting the
+same JD keywords every time.
+
+A batch:
+1. Extracts the JD keywords once (prepare_batch_job, memoized in the JD
+   analysis cache) and primes their embeddings into the shared embedding
+   cache, whose disk tier the workers read instead of re-encoding
+2. Fans parsing + scoring out over a process pool, with at most
+   ``2 x workers`` resumes in flight so large zips are not loaded into memory
+   all at once
+3. Yields one JSON-serializable record per resume as soon as it finishes
+   (completion order, not input order); with_summary appends a final
+   aggregate record
+
+Sources are a directory (searched recursively) or a .zip archive of .pdf and
+.docx files.
+"""
+
+import io
+import logging
+import os
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+# Archive limits (zip bombs / accidental huge uploads)
+MAX_BATCH_FILES = int(os.getenv("BATCH_MAX_FILES", "5000"))
+MAX_RESUME_BYTES = 10 * 1024 * 1024  # same limit as /api/upload
+
+
+@dataclass
+class BatchJob:
+    """Per-batch inputs shared by every resume (picklable for worker processes)."""
+    job_description: str
+    job_requirements: Optional[Dict[str, List[str]]]
+    level: str = "mid"
+    role: str = "software_engineer"
+
+
+def prepare_batch_job(
+    job_description: str,
+    level: str = "mid",
+    role: str = "software_engineer"
+) -> BatchJob:
+    """Extract JD keywords once for the whole batch."""
+    from backend.services.scoring_engine import get_scoring_engine
+
+    job_requirements = None
+    if job_description and job_description.strip():
+        adapter = get_scoring_engine().adapter
+        job_requirements = adapter._extract_job_requirements(job_description)
+        _prime_keyword_embeddings(job_requirements)
+
+    return BatchJob(
+        job_description=job_description or "",
+        job_requirements=job_requirements,
+        level=level or "mid",
+        role=role or "software_engineer",
+    )
+
+
+def _prime_keyword_embeddings(job_requirements: Dict[str, List[str]]) -> None:
+    """Encode the JD keywords once so workers hit the embedding cache."""
+    try:
+        from backend.services.embedding_cache import get_embedding_cache
+        from backend.services.hybrid_keyword_matcher import get_hybrid_matcher
+        from backend.services.sentence_encoder import model_id_for
+
+        matcher = get_hybrid_matcher()
+        matcher._lazy_init()
+        if matcher._model is None:
+            return
+        keywords = list(job_requirements.get('required_keywords', [])) + \
+            list(job_requirements.get('preferred_keywords', []))
+        if keywords:
+            get_embedding_cache().encode(matcher._model, model_id_for(matcher._model), keywords)
+    except Exception as e:
+        logger.warning("Could not prime JD keyword embeddings: %s", e)
+
+
+def iter_resume_files(source: Union[str, Path, bytes]) -> Iterator[Tuple[str, bytes]]:
+    """
+    Yield (name, content) for every supported resume in ``source``.
+
+    Args:
+        source: Directory path, path to a .zip file, or zip archive bytes
+
+    Raises:
+        ValueError: Source is not a directory or a valid zip archive
+    """
+    if isinstance(source, (bytes, bytearray)):
+        yield from _iter_zip(zipfile.ZipFile(io.BytesIO(source)))
+        return
+
+    path = Path(source)
+    if path.is_dir():
+        count = 0
+        for file_path in sorted(path.rglob('*')):
+            if file_path.is_file() and file_path.suffix.lower() in SUPPORTED_EXTENSIONS:
+                count += 1
+                if count > MAX_BATCH_FILES:
+                    raise ValueError(f"Batch exceeds {MAX_BATCH_FILES} files")
+                yield str(file_path.relative_to(path)), file_path.read_bytes()
+        return
+
+    if path.is_file() and zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            yield from _iter_zip(archive)
+        return
+
+    raise ValueError(f"Not a directory or zip archive: {source}")
+
+
+def _iter_zip(archive: zipfile.ZipFile) -> Iterator[Tuple[str, bytes]]:
+    members = [
+        info for info in archive.infolist()
+        if not info.is_dir()
+        and not info.filename.startswith('__MACOSX/')
+        and Path(info.filename).suffix.lower() in SUPPORTED_EXTENSIONS
+    ]
+    if len(members) > MAX_BATCH_FILES:
+        raise ValueError(f"Batch exceeds {MAX_BATCH_FILES} files")
+    for info in members:
+        if info.file_size > MAX_RESUME_BYTES:
+            # Reported as a per-file error rather than read into memory
+            yield info.filename, b''
+            continue
+        yield info.filename, archive.read(info)
+
+
+def score_resume_file(name: str, content: bytes, job: BatchJob) -> Dict[str, Any]:
+    """
+    Parse and score one resume (runs in a worker process).
+
+    Returns:
+        Record with file, status ('ok' or 'error'), and either score fields
+        or an error message
+    """
+    from backend.services.parse_cache import get_parse_cache
+    from backend.services.parsed_docx import ParsedDocx
+    from backend.services.parser import parse_docx, parse_pdf
+    from backend.services.scoring_engine import get_scoring_engine
+
+    start = time.perf_counter()
+    filename = Path(name).name
+    try:
+        if not content:
+            raise ValueError("Empty file or larger than 10MB")
+
+        # Reuse an earlier upload's parse when the same bytes were seen before
+        cached = get_parse_cache().get(get_parse_cache().key_for(content))
+        if cached is not None:
+            resume_data = cached.resume_data
+            resume_data.fileName = filename
+        elif name.lower().endswith('.docx'):
+            resume_data = parse_docx(ParsedDocx.from_bytes(content), filename)
+        else:
+            resume_data = parse_pdf(content, filename)
+
+        result = get_scoring_engine().adapter.score(
+            resume_data=resume_data,
+            job_description=job.job_description,
+            level=job.level,
+            role=job.role,
+            job_requirements=job.job_requirements,
+        )
+        keyword_details = result.get('keyword_details') or {}
+        return {
+            'file': name,
+            'status': 'ok',
+            'overallScore': result['overallScore'],
+            'rating': result.get('rating'),
+            'breakdown': {
+                category: {'score': details['score'], 'maxScore': details['maxScore']}
+                for category, details in result['breakdown'].items()
+            },
+            'keywordMatchPercentage': keyword_details.get('matchPercentage'),
+            'missingKeywords': keyword_details.get('missingKeywords', []),
+            'elapsed_ms': round((time.perf_counter() - start) * 1000, 1),
+        }
+    except Exception as e:
+        return {
+            'file': name,
+            'status': 'error',
+            'error': str(e),
+            'elapsed_ms': round((time.perf_counter() - start) * 1000, 1),
+        }
+
+
+def score_batch(
+    files: Iterable[Tuple[str, bytes]],
+    job: BatchJob,
+    workers: Optional[int] = None,
+    kind: str = "process"
+) -> Iterator[Dict[str, Any]]:
+    """
+    Score resumes in parallel, yielding each record as it finishes.
+
+    Args:
+        files: (name, content) pairs, e.g. from iter_resume_files
+        job: Batch inputs from prepare_batch_job
+        workers: Pool size (default: BATCH_WORKERS env var or cpu_count)
+        kind: "process" (default) or "thread"
+    """
+    from backend.services.cpu_executor import _warm_worker_process
+
+    workers = workers or int(os.getenv("BATCH_WORKERS", str(os.cpu_count() or 1)))
+    if kind == "process":
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker_process)
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch-score")
+
+    max_in_flight = workers * 2
+    in_flight: Dict[Any, str] = {}
+    try:
+        for name, content in files:
+            if len(in_flight) >= max_in_flight:
+                yield from _collect_finished(in_flight)
+            in_flight[pool.submit(score_resume_file, name, content, job)] = name
+
+        while in_flight:
+            yield from _collect_finished(in_flight)
+    finally:
+        # Client disconnects / CLI interrupts abandon queued work
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _collect_finished(in_flight: Dict[Any, str]) -> Iterator[Dict[str, Any]]:
+    """Wait for at least one job, then yield and forget every finished one."""
+    done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+    for future in done:
+        name = in_flight.pop(future)
+        try:
+            yield future.result()
+        except Exception as e:
+            # Worker crashed (e.g. BrokenProcessPool); report, keep going
+            yield {'file': name, 'status': 'error', 'error': str(e)}
+
+
+def with_summary(records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Pass records through, then yield one summary record for the batch."""
+    scores = []
+    errors = 0
+    for record in records:
+        if record.get('status') == 'ok':
+            scores.append(record['overallScore'])
+        else:
+            errors += 1
+        yield record
+
+    yield {
+        'summary': True,
+        'scored': len(scores),
+        'errors': errors,
+        'average_score': round(sum(scores) / len(scores), 1) if scores else None,
+        'max_score': max(scores) if scores else None,
+        'min_score': min(scores) if scores else None,
+    }
@@ -7,18 +7,106 @@ Features:
 - Configurable TTL (time-to-live)
 - Memory-safe (doesn't consume RAM)
 - Automatic cache invalidation
+- TwoTierCache: in-memory LRU + disk base of the service caches
 """
 
 import hashlib
 import json
+import logging
+import threading
+from collections import OrderedDict
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Hashable, Optional
 import os
 
+logger = logging.getLogger(__name__)
 
 # Global cache instance
 _cache_instance = None
 
+# Sentinel distinguishing "not cached" from a cached None
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded in-memory LRU with hit/miss counters.
+
+    Used as the hot tier in front of the diskcache instance for caches that
+    must stay small per worker (parse results, embeddings, grammar results).
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max(1, max_entries)
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return cached value (marking it recently used) or default."""
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Insert or refresh a value, evicting the least recently used entry."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Return size and hit-rate statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._data),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def stable_digest(*parts: Any) -> str:
+    """
+    SHA-256 hex digest of the given parts, stable across processes.
+
+    Unlike hash(), the result does not depend on PYTHONHASHSEED, so it can
+    key disk cache entries shared by workers and restarts.  Bytes are
+    hashed as-is; everything else via str().
+    """
+    h = hashlib.sha256()
+    for part in parts:
+        data = part if isinstance(part, (bytes, bytearray, memoryview)) else str(part).encode('utf-8')
+        h.update(len(data).to_bytes(8, 'big'))
+        h.update(data)
+    return h.hexdigest()
+
 
 def get_cache():
     """
@@ -45,6 +133,140 @@ def get_cache():
         return None
 
 
+class TwoTierCache:
+    """
+    In-memory LRU in front of the shared diskcache instance (get_cache()).
+
+    Base of the service caches (parse results, embeddings, JD analysis,
+    grammar results).  Subclasses build the keys, copy values where callers
+    may mutate them, and can convert values on their way to and from disk
+    by overriding _to_disk()/_from_disk().
+
+    Counters: hits (memory tier), disk_hits and misses.  shared() returns
+    the process-wide instance configured from ``<env_prefix>_MAX_ENTRIES``,
+    ``<env_prefix>_EXPIRE`` (seconds) and ``<env_prefix>_DISK`` ("false"
+    keeps the cache in memory only).
+    """
+
+    label = "Two-tier"
+    env_prefix = ""
+    default_max_entries = 256
+    default_expire = 24 * 3600
+
+    # Per-subclass instance returned by shared()
+    _shared: Optional["TwoTierCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        expire: Optional[int] = None,
+        use_disk: bool = True
+    ):
+        self.expire = expire if expire is not None else self.default_expire
+        self.use_disk = use_disk
+        self._memory = LRUCache(
+            max_entries=max_entries if max_entries is not None else self.default_max_entries
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @classmethod
+    def shared(cls):
+        """Get or create the process-wide instance of this cache."""
+        instance = cls.__dict__.get('_shared')
+        if instance is None:
+            with cls._shared_lock:
+                instance = cls.__dict__.get('_shared')
+                if instance is None:
+                    instance = cls(
+                        max_entries=int(os.getenv(f"{cls.env_prefix}_MAX_ENTRIES", str(cls.default_max_entries))),
+                        expire=int(os.getenv(f"{cls.env_prefix}_EXPIRE", str(cls.default_expire))),
+                        use_disk=os.getenv(f"{cls.env_prefix}_DISK", "true").lower() == "true",
+                    )
+                    cls._shared = instance
+        return instance
+
+    def _get(self, key: str) -> Optional[Any]:
+        """Stored value for ``key`` (memory first, then disk); None on a miss."""
+        value = self._memory.get(key)
+        if value is not None:
+            with self._lock:
+                self.hits += 1
+            return value
+
+        if self.use_disk:
+            value = self._disk_get(key)
+            if value is not None:
+                self._memory.set(key, value)
+                with self._lock:
+                    self.disk_hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _set(self, key: str, value: Any) -> None:
+        """Store ``value`` in both tiers."""
+        self._memory.set(key, value)
+        if self.use_disk:
+            self._disk_set(key, value)
+
+    def _to_disk(self, value: Any) -> Any:
+        """Value as written to the disk tier."""
+        return value
+
+    def _from_disk(self, payload: Any) -> Any:
+        """Inverse of _to_disk()."""
+        return payload
+
+    def _disk_get(self, key: str) -> Optional[Any]:
+        cache = get_cache()
+        if cache is None:
+            return None
+        try:
+            payload = cache.get(key)
+            return self._from_disk(payload) if payload is not None else None
+        except Exception as e:
+            logger.warning("%s cache read error: %s", self.label, e)
+            return None
+
+    def _disk_set(self, key: str, value: Any) -> None:
+        cache = get_cache()
+        if cache is None:
+            return
+        try:
+            cache.set(key, self._to_disk(value), expire=self.expire)
+        except Exception as e:
+            logger.warning("%s cache write error: %s", self.label, e)
+
+    def clear(self) -> None:
+        """Clear the in-memory tier and counters (disk entries expire on their own)."""
+        self._memory.clear()
+        with self._lock:
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for both tiers."""
+        memory = self._memory.stats()
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'entries': memory['entries'],
+                'max_entries': memory['max_entries'],
+                'evictions': memory['evictions'],
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+            }
+
+
 def cache_result(
     expire: int = 3600,
     key_prefix: str = "",
@@ -109,10 +331,31 @@ def cache_result(
     return decorator
 
 
+def _stable_arg_repr(value: Any) -> str:
+    """
+    Process-independent representation of a cache key argument.
+
+    JSON-serializable values are dumped with sorted keys.  Objects with the
+    default repr (``<Foo object at 0x...>``, e.g. ``self`` of a singleton
+    service) are identified by their type, since their address differs per
+    process.  Anything else uses str(); hash() is never used because it is
+    randomized per process for strings.
+    """
+    try:
+        return json.dumps(value, sort_keys=True)
+    except (TypeError, ValueError):
+        pass
+    if type(value).__repr__ is object.__repr__ and type(value).__str__ is object.__str__:
+        return f"<{type(value).__module__}.{type(value).__qualname__}>"
+    return str(value)
+
+
 def _generate_cache_key(prefix: str, args: tuple, kwargs: dict) -> str:
     """
     Generate a unique cache key from function arguments.
 
+    Keys are stable across workers and restarts (see _stable_arg_repr).
+
     Args:
         prefix: Key prefix
         args: Positional arguments
@@ -121,29 +364,11 @@ def _generate_cache_key(prefix: str, args: tuple, kwargs: dict) -> str:
     Returns:
         Cache key string
     """
-    # Convert args and kwargs to string
-    key_parts = [prefix]
+    parts = [prefix]
+    parts.extend(_stable_arg_repr(arg) for arg in args)
+    parts.extend(f"{k}={_stable_arg_repr(v)}" for k, v in sorted(kwargs.items()))
 
-    # Add args
-    for arg in args:
-        if isinstance(arg, (str, int, float, bool)):
-            key_parts.append(str(arg))
-        else:
-            # For complex objects, use hash
-            key_parts.append(str(hash(str(arg))))
-
-    # Add kwargs
-    for k, v in sorted(kwargs.items()):
-        if isinstance(v, (str, int, float, bool)):
-            key_parts.append(f"{k}={v}")
-        else:
-            key_parts.append(f"{k}={hash(str(v))}")
-
-    # Create hash of the key parts
-    key_str = "|".join(key_parts)
-    key_hash = hashlib.md5(key_str.encode()).hexdigest()
-
-    return f"{prefix}:{key_hash}"
+    return f"{prefix}:{stable_digest(*parts)}"
 
 
 def _clear_cache(prefix: str) -> int:
@@ -239,6 +464,9 @@ def cache_embeddings(expire: int = 7200):
     """
     Cache embeddings for 2 hours.
     Embeddings are expensive to compute but stable.
+
+    Caches whole function results; the semantic matchers cache individual
+    vectors through backend.services.embedding_cache instead.
     """
     return cache_result(expire=expire, key_prefix='embeddings')
 
@@ -3,6 +3,9 @@ Corpus Skills Database Service
 
 Loads and provides access to the corpus-derived skills database.
 This service enables querying skill frequencies and getting skills by role.
+
+Lookups go to the compiled corpus store (see corpus_store) when it is built
+and current; otherwise the JSON file is loaded into memory.
 """
 
 import json
@@ -10,6 +13,8 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from backend.services.corpus_store import CorpusStore, get_corpus_store
+
 logger = logging.getLogger(__name__)
 
 # Path to skills database
@@ -35,12 +40,27 @@ class CorpusSkillsDatabase:
             db_path: Optional custom path to skills database JSON
         """
         self.db_path = db_path or SKILLS_DB_PATH
-        self.skills: Dict[str, int] = {}
+        self._skills: Optional[Dict[str, int]] = None
+        self._store: Optional[CorpusStore] = None
         self._available = False
         self._load_database()
 
+    @property
+    def skills(self) -> Dict[str, int]:
+        """Skill -> frequency dict (materialized on first use when store-backed)."""
+        if self._skills is None:
+            self._skills = self._store.skill_frequencies() if self._store is not None else {}
+        return self._skills
+
     def _load_database(self) -> None:
-        """Load skills database from JSON file."""
+        """Open the corpus store, or load the skills database from JSON."""
+        store = get_corpus_store()
+        if store is not None and store.covers('skills', self.db_path):
+            self._store = store
+            self._available = True
+            logger.info(f"Using corpus store for {store.skill_count():,} skills")
+            return
+
         try:
             if not self.db_path.exists():
                 logger.warning(f"Skills database not found at {self.db_path}")
@@ -50,7 +70,7 @@ class CorpusSkillsDatabase:
                 data = json.load(f)
 
             # Convert {"skill": {"frequency": N}} to {"skill": N}
-            self.skills = {
+            self._skills = {
                 skill.lower(): info.get('frequency', 0)
                 for skill, info in data.items()
             }
@@ -60,7 +80,7 @@ class CorpusSkillsDatabase:
 
         except Exception as e:
             logger.error(f"Failed to load skills database: {e}")
-            self.skills = {}
+            self._skills = {}
             self._available = False
 
     def is_available(self) -> bool:
@@ -85,6 +105,8 @@ class CorpusSkillsDatabase:
         if not self._available:
             return 0
 
+        if self._store is not None:
+            return self._store.skill_frequency(skill.lower())
         return self.skills.get(skill.lower(), 0)
 
     def get_skills_for_role(
@@ -109,6 +131,9 @@ class CorpusSkillsDatabase:
         if not self._available:
             return []
 
+        if self._store is not None:
+            return self._store.skills_by_frequency(min_frequency)
+
         # Filter skills by frequency threshold
         filtered_skills = [
             skill for skill, freq in self.skills.items()
@@ -130,6 +155,9 @@ class CorpusSkillsDatabase:
         if not self._available:
             return []
 
+        if self._store is not None:
+            return self._store.skills_by_frequency()
+
         # Sort by frequency descending
         sorted_skills = sorted(
             self.skills.keys(),
@@ -152,6 +180,9 @@ class CorpusSkillsDatabase:
         if not self._available:
             return []
 
+        if self._store is not None:
+            return self._store.skills_by_frequency(limit=n)
+
         all_skills = self.get_all_skills()
         return all_skills[:n]
 
@@ -0,0 +1,316 @@
+"""
+Corpus Store - read-only SQLite image of the corpus JSON files.
+
+CorpusSkillsDatabase and RoleMappingService json.load()ed ~1.4 MB each into
+per-worker dicts (tens of MB resident), KeywordMatcher loaded
+role_keywords.json again, and role_taxonomy.get_corpus_keywords re-read and
+re-parsed it on every call.  The store compiles all three into one indexed
+SQLite file, built offline:
+
+    python backend/build_corpus_store.py
+
+Tables:
+- skills(skill, ord, frequency)      lowercased skill -> corpus frequency,
+                                     indexed by (frequency DESC, ord)
+- titles(title, role_id)             normalized job title -> role id
+- role_titles(role_id, ord, title)   role id -> original titles in file order
+- role_keywords(key, keywords)       "<role>_<level>" -> JSON keyword list
+- meta(key, value)                   store version and source file digests
+
+The file (CORPUS_STORE_PATH, default backend/data/corpus/corpus.sqlite) is
+opened read-only and immutable with mmap, so lookups touch only the pages they
+need and workers share them through the page cache.  It is ignored (with a
+warning) when its version or any source digest does not match, and callers
+fall back to loading the JSON files.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the schema or build rules change
+STORE_VERSION = "1"
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+SOURCE_FILES: Dict[str, Path] = {
+    'skills': BACKEND_DIR / "data" / "corpus" / "skills_database.json",
+    'role_mappings': BACKEND_DIR / "data" / "corpus" / "role_mappings.json",
+    'role_keywords': BACKEND_DIR / "data" / "keywords" / "role_keywords.json",
+}
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE skills (skill TEXT PRIMARY KEY, ord INTEGER NOT NULL, frequency INTEGER NOT NULL) WITHOUT ROWID;
+CREATE INDEX skills_by_frequency ON skills (frequency DESC, ord);
+CREATE TABLE titles (title TEXT PRIMARY KEY, role_id TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE role_titles (role_id TEXT NOT NULL, ord INTEGER NOT NULL, title TEXT NOT NULL,
+                          PRIMARY KEY (role_id, ord)) WITHOUT ROWID;
+CREATE TABLE role_keywords (key TEXT PRIMARY KEY, keywords TEXT NOT NULL) WITHOUT ROWID;
+"""
+
+
+def default_store_path() -> Path:
+    """Location of the compiled store."""
+    configured = os.getenv("CORPUS_STORE_PATH")
+    if configured:
+        return Path(configured)
+    return BACKEND_DIR / "data" / "corpus" / "corpus.sqlite"
+
+
+def normalize_title(text: str) -> str:
+    """Lowercase, trimmed, single-spaced job title (RoleMappingService rules)."""
+    if not text:
+        return ""
+    return " ".join(text.lower().strip().split())
+
+
+def _file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _source_digests(sources: Dict[str, Path]) -> Dict[str, str]:
+    return {name: _file_digest(path) for name, path in sorted(sources.items())}
+
+
+def build_store(output: Optional[Path] = None, sources: Optional[Dict[str, Path]] = None) -> Path:
+    """
+    Compile the corpus JSON files into a SQLite store.
+
+    The file is written next to ``output`` and renamed into place, so running
+    workers never see a half-written store.
+
+    Returns:
+        Path of the written store
+    """
+    output = Path(output) if output else default_store_path()
+    sources = {**SOURCE_FILES, **(sources or {})}
+
+    with open(sources['skills'], encoding='utf-8') as f:
+        raw_skills = json.load(f)
+    with open(sources['role_mappings'], encoding='utf-8') as f:
+        mappings = json.load(f)
+    with open(sources['role_keywords'], encoding='utf-8') as f:
+        role_keywords = json.load(f)
+
+    # Same collapsing as the JSON loaders: first position, last value wins
+    skills = {skill.lower(): info.get('frequency', 0) for skill, info in raw_skills.items()}
+    titles = {normalize_title(title): role_id for title, role_id in mappings.items()}
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_name(output.name + ".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(_SCHEMA)
+        conn.executemany(
+            "INSERT INTO skills VALUES (?, ?, ?)",
+            ((skill, ord_, int(freq)) for ord_, (skill, freq) in enumerate(skills.items()))
+        )
+        conn.executemany("INSERT INTO titles VALUES (?, ?)", titles.items())
+        conn.executemany(
+            "INSERT INTO role_titles VALUES (?, ?, ?)",
+            ((role_id, ord_, title) for ord_, (title, role_id) in enumerate(mappings.items()))
+        )
+        conn.executemany(
+            "INSERT INTO role_keywords VALUES (?, ?)",
+            ((key, json.dumps(keywords)) for key, keywords in role_keywords.items())
+        )
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ('version', STORE_VERSION),
+            ('sources', json.dumps(_source_digests(sources), sort_keys=True)),
+        ])
+        conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, output)
+    return output
+
+
+class CorpusStore:
+    """
+    Read-only lookups against a compiled corpus store.
+
+    Safe to share between threads and forked processes: each thread of each
+    process gets its own connection.
+    """
+
+    def __init__(self, path: Path, sources: Dict[str, Path]):
+        self.path = Path(path)
+        self.sources = sources
+        self._local = threading.local()
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None, sources: Optional[Dict[str, Path]] = None) -> Optional['CorpusStore']:
+        """
+        Open the store, or return None if it is missing or stale.
+        """
+        path = Path(path) if path else default_store_path()
+        sources = {**SOURCE_FILES, **(sources or {})}
+        if not path.exists():
+            logger.info("No corpus store at %s — corpus JSON files will be loaded into memory", path)
+            return None
+
+        try:
+            store = cls(path, sources)
+            meta = dict(store._query("SELECT key, value FROM meta"))
+            if meta.get('version') != STORE_VERSION:
+                logger.warning("Corpus store at %s is for another version; ignoring", path)
+                return None
+            if json.loads(meta.get('sources', '{}')) != _source_digests(sources):
+                logger.warning(
+                    "Corpus store at %s is stale (corpus JSON changed); "
+                    "rebuild with backend/build_corpus_store.py", path
+                )
+                return None
+            return store
+        except Exception as e:
+            logger.warning("Could not open corpus store: %s", e)
+            return None
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        # A connection inherited through fork() (prefork workers) must not be
+        # used by the child: reopen it per process
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro&immutable=1", uri=True)
+            conn.execute(f"PRAGMA mmap_size={self.path.stat().st_size}")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        return self._connection().execute(sql, params).fetchall()
+
+    def covers(self, name: str, path) -> bool:
+        """True if source ``name`` of this store is the file at ``path``."""
+        try:
+            return Path(path).resolve() == Path(self.sources[name]).resolve()
+        except Exception:
+            return False
+
+    # Skills
+
+    def skill_count(self) -> int:
+        return self._query("SELECT COUNT(*) FROM skills")[0][0]
+
+    def skill_frequency(self, skill: str) -> int:
+        """Corpus frequency of a lowercased skill (0 if unknown)."""
+        row = self._query("SELECT frequency FROM skills WHERE skill = ?", (skill,))
+        return row[0][0] if row else 0
+
+    def skills_by_frequency(self, min_frequency: int = 0, limit: Optional[int] = None) -> List[str]:
+        """Skills with at least ``min_frequency``, most frequent first (ties in file order)."""
+        sql = "SELECT skill FROM skills WHERE frequency >= ? ORDER BY frequency DESC, ord"
+        params: tuple = (min_frequency,)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (max(0, limit),)
+        return [row[0] for row in self._query(sql, params)]
+
+    def skill_frequencies(self) -> Dict[str, int]:
+        """All skills -> frequency, in file order."""
+        return dict(self._query("SELECT skill, frequency FROM skills ORDER BY ord"))
+
+    # Role mappings
+
+    def title_count(self) -> int:
+        return self._query("SELECT COUNT(*) FROM titles")[0][0]
+
+    def role_count(self) -> int:
+        return self._query("SELECT COUNT(DISTINCT role_id) FROM role_titles")[0][0]
+
+    def role_for_title(self, normalized_title: str) -> Optional[str]:
+        row = self._query("SELECT role_id FROM titles WHERE title = ?", (normalized_title,))
+        return row[0][0] if row else None
+
+    def titles_for_role(self, role_id: str) -> Optional[List[str]]:
+        rows = self._query("SELECT title FROM role_titles WHERE role_id = ? ORDER BY ord", (role_id,))
+        return [row[0] for row in rows] or None
+
+    # Role keywords
+
+    def role_keywords(self, key: str) -> Optional[List[str]]:
+        row = self._query("SELECT keywords FROM role_keywords WHERE key = ?", (key,))
+        return json.loads(row[0][0]) if row else None
+
+    def role_keyword_keys(self) -> List[str]:
+        return [row[0] for row in self._query("SELECT key FROM role_keywords ORDER BY key")]
+
+    def close(self) -> None:
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class RoleKeywordsView(Mapping):
+    """Read-only "<role>_<level>" -> keywords mapping backed by the store."""
+
+    def __init__(self, store: CorpusStore):
+        self._store = store
+
+    def __getitem__(self, key: str) -> List[str]:
+        keywords = self._store.role_keywords(key) if isinstance(key, str) else None
+        if keywords is None:
+            raise KeyError(key)
+        return keywords
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.role_keyword_keys())
+
+    def __len__(self) -> int:
+        return len(self._store.role_keyword_keys())
+
+
+# Global store instance (None when missing or stale)
+_store: Optional[CorpusStore] = None
+_store_checked = False
+_store_lock = threading.Lock()
+
+
+def get_corpus_store() -> Optional[CorpusStore]:
+    """Get the shared corpus store, opening it on first use."""
+    global _store, _store_checked
+    if not _store_checked:
+        with _store_lock:
+            if not _store_checked:
+                _store = CorpusStore.load()
+                _store_checked = True
+    return _store
+
+
+@lru_cache(maxsize=1)
+def get_role_keywords() -> Mapping:
+    """
+    "<role>_<level>" -> corpus keywords, from the store or role_keywords.json.
+
+    Returns an empty mapping if neither is available.
+    """
+    store = get_corpus_store()
+    if store is not None:
+        return RoleKeywordsView(store)
+
+    path = SOURCE_FILES['role_keywords']
+    if not path.exists():
+        logger.debug(f"role_keywords.json not found at {path}")
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
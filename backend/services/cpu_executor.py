@@ -0,0 +1,252 @@
+"""
+CPU Executor - bounded worker pool for blocking parse/score work.
+
+The heavy endpoints (upload, score, editor rescore, phase2, export) are
+declared ``async def`` but their bodies are synchronous CPU work: PyMuPDF and
+python-docx parsing, ScorerV3, suggestion enrichment, reportlab rendering.
+Running that on the event loop stalls every other request on the worker.
+
+This module provides one shared pool that those endpoints submit to:
+
+- CPU_EXECUTOR_KIND      "thread" (default) or "process"
+- CPU_EXECUTOR_WORKERS   pool size (default: min(4, cpu_count))
+- CPU_EXECUTOR_MAX_QUEUE jobs allowed to wait for a free worker (default: 2x workers)
+- CPU_EXECUTOR_TIMEOUT   seconds a caller waits for a job (default: 60, 0 = no limit)
+
+When running + queued jobs reach ``workers + max_queue`` new submissions are
+rejected with ExecutorSaturatedError (mapped to HTTP 429 in main.py) instead of
+piling up unbounded.  Timeouts and a shut-down pool raise
+ExecutorUnavailableError (HTTP 503).  A timed-out job keeps its slot until it
+really finishes, so the concurrency bound holds even for runaway jobs.
+
+Process mode requires module-level functions with picklable arguments and
+results; each child warms its own scoring engine on start.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorSaturatedError(Exception):
+    """Raised when the executor queue is full (client should retry later)."""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ExecutorUnavailableError(Exception):
+    """Raised when a job times out or the executor is shut down."""
+
+
+def _warm_worker_process():
+    """Process-pool initializer: build the scoring engine once per child."""
+    try:
+        from backend.services.scoring_engine import init_scoring_engine
+        init_scoring_engine()
+    except Exception as e:
+        logger.warning("Worker process engine warmup failed: %s", e)
+
+
+class CPUExecutor:
+    """
+    Shared pool for blocking work with queue-depth backpressure.
+
+    Attributes:
+        kind: "thread" or "process"
+        max_workers: Number of pool workers
+        max_queue: Jobs allowed to wait beyond the running ones
+        timeout: Default per-job wait in seconds (None = unlimited)
+    """
+
+    def __init__(
+        self,
+        kind: str = "thread",
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        timeout: Optional[float] = 60.0
+    ):
+        kind = (kind or "thread").lower()
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind!r} (use 'thread' or 'process')")
+
+        self.kind = kind
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.max_queue = max_queue if max_queue is not None else self.max_workers * 2
+        self.timeout = timeout if timeout else None
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._closed = False
+        self._pool = self._create_pool()
+
+    def _create_pool(self) -> Executor:
+        if self.kind == "process":
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_warm_worker_process
+            )
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="cpu-worker"
+        )
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of running + queued jobs."""
+        return self.max_workers + self.max_queue
+
+    def _acquire_slot(self) -> None:
+        with self._lock:
+            if self._closed:
+                raise ExecutorUnavailableError("CPU executor is shut down")
+            if self._in_flight >= self.capacity:
+                self._rejected += 1
+                raise ExecutorSaturatedError(
+                    f"Server busy: {self._in_flight} jobs in flight (limit {self.capacity})"
+                )
+            self._in_flight += 1
+
+    def _release_slot(self, _future=None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Start ``func(*args, **kwargs)`` on the pool without waiting for it.
+
+        Saturation is reported immediately, so callers that stream results
+        (see /api/upload/stream) can still answer 429 before responding.
+        Await the returned future with wait().
+
+        Raises:
+            ExecutorSaturatedError: Queue is full
+            ExecutorUnavailableError: Executor is shut down
+        """
+        self._acquire_slot()
+        try:
+            future = self._pool.submit(partial(func, *args, **kwargs))
+        except RuntimeError as e:
+            # Pool already shut down (interpreter exit / lifespan end)
+            self._release_slot()
+            raise ExecutorUnavailableError(str(e)) from e
+
+        # Slot is released when the job really finishes, not when we stop waiting
+        future.add_done_callback(self._release_slot)
+        return future
+
+    async def wait(self, future: Future, timeout: Optional[float] = None, name: str = "job") -> Any:
+        """
+        Await a future from submit().
+
+        Raises:
+            ExecutorUnavailableError: Job timed out
+        """
+        wait_for = timeout if timeout is not None else self.timeout
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=wait_for)
+        except asyncio.TimeoutError as e:
+            with self._lock:
+                self._timed_out += 1
+            logger.warning("%s timed out after %.1fs", name, wait_for)
+            raise ExecutorUnavailableError(
+                f"Processing timed out after {wait_for:.0f}s"
+            ) from e
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Run ``func(*args, **kwargs)`` on the pool and await its result.
+
+        Args:
+            func: Blocking callable (module-level when kind == "process")
+            timeout: Override the default wait in seconds
+
+        Raises:
+            ExecutorSaturatedError: Queue is full
+            ExecutorUnavailableError: Job timed out or executor is shut down
+        """
+        future = self.submit(func, *args, **kwargs)
+        return await self.wait(future, timeout=timeout, name=getattr(func, "__name__", str(func)))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool configuration and counters."""
+        with self._lock:
+            return {
+                'kind': self.kind,
+                'max_workers': self.max_workers,
+                'max_queue': self.max_queue,
+                'in_flight': self._in_flight,
+                'completed': self._completed,
+                'rejected': self._rejected,
+                'timed_out': self._timed_out,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs and shut the pool down."""
+        with self._lock:
+            self._closed = True
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# Global executor instance
+_executor: Optional[CPUExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _env_int(name: str, default: Optional[int]) -> Optional[int]:
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return int(value)
+
+
+def get_cpu_executor() -> CPUExecutor:
+    """
+    Get or create the shared CPU executor (FastAPI dependency).
+
+    Configuration is read from the environment on first use.
+    """
+    global _executor
+
+    if _executor is not None:
+        return _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = CPUExecutor(
+                kind=os.getenv("CPU_EXECUTOR_KIND", "thread"),
+                max_workers=_env_int("CPU_EXECUTOR_WORKERS", None),
+                max_queue=_env_int("CPU_EXECUTOR_MAX_QUEUE", None),
+                timeout=float(os.getenv("CPU_EXECUTOR_TIMEOUT", "60")),
+            )
+            logger.info(
+                "CPU executor ready: kind=%s workers=%d max_queue=%d",
+                _executor.kind, _executor.max_workers, _executor.max_queue
+            )
+    return _executor
+
+
+def shutdown_cpu_executor(wait: bool = False) -> None:
+    """Shut down the shared executor (called at app shutdown)."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
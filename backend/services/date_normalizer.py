@@ -0,0 +1,222 @@
+"""
+Date Normalizer - shared, memoized parsing of resume date strings.
+
+Experience dates were parsed independently by RedFlagsValidator (strptime
+loop), GapDetector and JobHoppingDetector (dateutil), CareerRecencyScorer
+(dateutil) and YearsAlignmentScorer (regex), so the same dozen strings were
+parsed 5+ times per score, mostly through dateutil's slow generic parser.
+
+normalize_date() maps a date string to (year, month):
+
+- Fast path: anchored regexes for the formats resumes actually use
+  ("Jan 2020", "January 2020", "Sept. 2020", "01/2020", "2020-01",
+  "2020-01-15", "2020")
+- Slow path: dateutil (imported on first use), then the old regex
+  fallbacks; strings without a year (e.g. "March") are unparseable rather
+  than dated to the current year
+- loose=True additionally accepts any 19xx/20xx year in the string, with
+  the first month name found (default January), for free-form dates such
+  as "Summer 2019"
+
+Results are cached per (string, loose) in an LRU (DATE_CACHE_SIZE entries,
+default 4096).  "Present"-style terms resolve to the current month and are
+never cached.
+
+ScorerV3Adapter stores normalize_entry_dates() on each experience entry
+(start_month, end_month, is_current), so scorers read the months via
+entry_months() instead of re-parsing.
+"""
+
+import os
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+YearMonth = Tuple[int, int]
+
+PRESENT_TERMS = frozenset({'present', 'current', 'now', 'ongoing'})
+
+MONTHS = {
+    'january': 1, 'jan': 1,
+    'february': 2, 'feb': 2,
+    'march': 3, 'mar': 3,
+    'april': 4, 'apr': 4,
+    'may': 5,
+    'june': 6, 'jun': 6,
+    'july': 7, 'jul': 7,
+    'august': 8, 'aug': 8,
+    'september': 9, 'sep': 9, 'sept': 9,
+    'october': 10, 'oct': 10,
+    'november': 11, 'nov': 11,
+    'december': 12, 'dec': 12,
+}
+
+DATE_CACHE_SIZE = int(os.getenv("DATE_CACHE_SIZE", "4096"))
+
+_MONTH_NAMES = '|'.join(sorted(MONTHS, key=len, reverse=True))
+
+# Fast path (input is stripped and lowercased)
+_MONTH_YEAR_RE = re.compile(r'^(%s)\.?,?\s*(\d{4})$' % _MONTH_NAMES)
+_MONTH_SLASH_YEAR_RE = re.compile(r'^(\d{1,2})\s*[/.\-]\s*(\d{4})$')
+_YEAR_MONTH_RE = re.compile(r'^(\d{4})\s*[/.\-]\s*(\d{1,2})(?:\s*[/.\-]\s*\d{1,2})?$')
+_YEAR_RE = re.compile(r'^(\d{4})$')
+
+# Fallbacks after dateutil (same as the per-detector parsers had)
+_FALLBACK_YM_RE = re.compile(r'(\d{4})-(\d{2})')
+_FALLBACK_MY_RE = re.compile(r'(\d{2})/(\d{4})')
+
+# Two dateutil defaults that differ only in year (see _slow_path)
+_NO_YEAR_DEFAULTS = (datetime(2000, 1, 1), datetime(2001, 1, 1))
+
+# loose=True
+_ANY_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_ANY_MONTH_RE = re.compile(r'\b(%s)\b' % _MONTH_NAMES)
+
+
+def is_present(date_str: Any) -> bool:
+    """True for "Present", "Current", "Now" and "Ongoing" (any case)."""
+    return bool(date_str) and str(date_str).strip().lower() in PRESENT_TERMS
+
+
+def _current_month() -> YearMonth:
+    now = datetime.now()
+    return (now.year, now.month)
+
+
+def _valid(year: int, month: int) -> Optional[YearMonth]:
+    return (year, month) if 1 <= month <= 12 else None
+
+
+def _fast_path(text: str) -> Optional[YearMonth]:
+    match = _MONTH_YEAR_RE.match(text)
+    if match:
+        return (int(match.group(2)), MONTHS[match.group(1)])
+    match = _YEAR_RE.match(text)
+    if match:
+        return (int(match.group(1)), 1)
+    match = _MONTH_SLASH_YEAR_RE.match(text)
+    if match:
+        return _valid(int(match.group(2)), int(match.group(1)))
+    match = _YEAR_MONTH_RE.match(text)
+    if match:
+        return _valid(int(match.group(1)), int(match.group(2)))
+    return None
+
+
+def _slow_path(text: str) -> Optional[YearMonth]:
+    try:
+        from dateutil import parser
+
+        # dateutil fills a missing year from ``default``; parsing against two
+        # defaults exposes that, so year-less strings ("March") return None
+        # instead of caching this year's date for the life of the process
+        parsed = parser.parse(text, default=_NO_YEAR_DEFAULTS[0])
+        if parser.parse(text, default=_NO_YEAR_DEFAULTS[1]).year == parsed.year:
+            return (parsed.year, parsed.month)
+        return None
+    except Exception:
+        pass
+
+    match = _FALLBACK_YM_RE.match(text)
+    if match:
+        return _valid(int(match.group(1)), int(match.group(2)))
+    match = _FALLBACK_MY_RE.match(text)
+    if match:
+        return _valid(int(match.group(2)), int(match.group(1)))
+    return None
+
+
+def _loose(text: str) -> Optional[YearMonth]:
+    year = _ANY_YEAR_RE.search(text)
+    if not year:
+        return None
+    month = _ANY_MONTH_RE.search(text)
+    return (int(year.group(0)), MONTHS[month.group(1)] if month else 1)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _normalize(text: str, loose: bool) -> Optional[YearMonth]:
+    result = _fast_path(text) or _slow_path(text)
+    if result is None and loose:
+        result = _loose(text)
+    return result
+
+
+def normalize_date(date_str: Any, loose: bool = False) -> Optional[YearMonth]:
+    """
+    Normalize a resume date string to (year, month).
+
+    Args:
+        date_str: Date string, e.g. "Jan 2020", "01/2020", "2020", "Present"
+        loose: Fall back to any year (and month name) found in the string
+
+    Returns:
+        (year, month), the current month for "Present"-style terms, or None
+        if unparseable
+    """
+    if not date_str:
+        return None
+    text = str(date_str).strip().lower()
+    if text in PRESENT_TERMS:
+        return _current_month()
+    return _normalize(text, loose)
+
+
+def parse_date(date_str: Any, loose: bool = False) -> Optional[datetime]:
+    """
+    normalize_date() as a datetime on the first of the month.
+
+    "Present"-style terms return datetime.now().
+    """
+    if is_present(date_str):
+        return datetime.now()
+    normalized = normalize_date(date_str, loose)
+    return datetime(normalized[0], normalized[1], 1) if normalized else None
+
+
+def normalize_entry_dates(entry: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Normalized months of one experience entry.
+
+    Reads start_date/end_date (or startDate/endDate) and returns
+    ``{'start_month', 'end_month', 'is_current'}``; a "Present" end date
+    gives the current month and is_current=True.
+    """
+    start = entry.get('start_date') or entry.get('startDate') or ''
+    end = entry.get('end_date') or entry.get('endDate') or ''
+    return {
+        'start_month': normalize_date(start),
+        'end_month': normalize_date(end),
+        'is_current': is_present(end),
+    }
+
+
+def entry_months(entry: Mapping[str, Any]) -> Tuple[Optional[YearMonth], Optional[YearMonth], bool]:
+    """
+    (start_month, end_month, is_current) of an experience entry.
+
+    Uses the values precomputed by ScorerV3Adapter when present, otherwise
+    normalizes the entry's start/end dates.
+    """
+    if 'start_month' not in entry:
+        entry = normalize_entry_dates(entry)
+    return entry.get('start_month'), entry.get('end_month'), bool(entry.get('is_current'))
+
+
+def month_to_datetime(month: Optional[YearMonth]) -> Optional[datetime]:
+    """(year, month) as a datetime on the first of the month."""
+    return datetime(month[0], month[1], 1) if month else None
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the date string cache."""
+    info = _normalize.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        'entries': info.currsize,
+        'max_entries': info.maxsize,
+        'hits': info.hits,
+        'misses': info.misses,
+        'hit_rate': round(info.hits / lookups, 3) if lookups else 0.0,
+    }
@@ -4,6 +4,7 @@ Stores original and working copies, handles section updates.
 """
 from pathlib import Path
 from docx import Document
+import os
 import shutil
 import logging
 from datetime import datetime
@@ -46,6 +47,37 @@ class DocxTemplateManager:
 
         return str(original_path)
 
+    def save_template_from_file(self, session_id: str, source_path) -> str:
+        """
+        Save original template from a DOCX already on disk and create working copy.
+
+        The original is hard-linked when possible (it is never modified), so
+        an upload that was just written to storage is not written again.
+
+        Args:
+            session_id: Unique session identifier
+            source_path: Path to an existing DOCX file
+
+        Returns:
+            Path to original template file
+        """
+        original_path = self.storage_dir / f"{session_id}_original.docx"
+        try:
+            os.link(source_path, original_path)
+        except OSError:
+            # Different filesystem or links unsupported
+            shutil.copy(source_path, original_path)
+
+        logger.info(f"Saved original template: {original_path}")
+
+        # Working copy must be a real copy: update_section rewrites it
+        working_path = self.storage_dir / f"{session_id}_working.docx"
+        shutil.copy(original_path, working_path)
+
+        logger.info(f"Created working copy: {working_path}")
+
+        return str(original_path)
+
     def get_working_path(self, session_id: str) -> Path:
         """Get path to working DOCX"""
         return self.storage_dir / f"{session_id}_working.docx"
@@ -1,28 +1,29 @@
 """
 Advanced DOCX to HTML conversion that preserves images, colors, and layout.
 """
-import io
 import logging
-from docx import Document
+from typing import Union
 from docx.oxml import parse_xml
 from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from backend.services.parsed_docx import ParsedDocx, ParsedParagraph
 
 logger = logging.getLogger(__name__)
 
 
-def docx_to_html_advanced(docx_bytes: bytes) -> str:
+def docx_to_html_advanced(docx_bytes: Union[bytes, ParsedDocx]) -> str:
     """
     Convert DOCX to HTML preserving images, colors, tables, and layout.
 
     Args:
-        docx_bytes: DOCX file content as bytes
+        docx_bytes: DOCX file content as bytes, or a ParsedDocx shared with
+            the parser and section detector
 
     Returns:
         HTML string with full formatting preserved
     """
     try:
-        doc = Document(io.BytesIO(docx_bytes))
+        parsed = ParsedDocx.coerce(docx_bytes)
         html_parts = []
 
         # Add wrapper and styles
@@ -38,11 +39,11 @@ def docx_to_html_advanced(docx_bytes: bytes) -> str:
         """)
 
         # Process document elements
-        for element in doc.element.body:
-            if element.tag.endswith('p'):  # Paragraph
-                html_parts.append(_process_paragraph(element))
-            elif element.tag.endswith('tbl'):  # Table
-                html_parts.append(_process_table(element, doc))
+        for block in parsed.blocks:
+            if isinstance(block, ParsedParagraph):
+                html_parts.append(_process_paragraph(block.element))
+            else:  # Table
+                html_parts.append(_process_table(block.element, parsed.document))
 
         # Image extraction disabled: embedding images as base64 data URIs can
         # add 1–10 MB to the HTML string (resume headshots are often 1–5 MB).
@@ -0,0 +1,128 @@
+"""
+Embedding Cache - shared text -> vector cache for the semantic matchers.
+
+SemanticKeywordMatcher and HybridKeywordMatcher used to call model.encode()
+directly, and the old cache_embeddings decorator cached whole match results
+under keys built from Python's per-process hash(), so nothing was shared
+across workers or restarts.
+
+EmbeddingCache caches individual vectors:
+
+- Key: SHA-256 of (model name, whitespace-normalized text), identical in
+  every worker and across restarts
+- Hot tier: in-memory LRU of float32 numpy vectors per worker
+  (EMBEDDING_CACHE_MAX_ENTRIES, default 4096)
+- Disk tier: diskcache via cache_utils.get_cache(), shared by workers
+  (EMBEDDING_CACHE_EXPIRE seconds, default 7 days)
+- Counters: memory hits, disk hits, misses (lookups sent to the model)
+
+encode() looks every text up and sends only the misses to the model, in one
+batch, so re-scoring an unchanged resume encodes nothing.
+
+numpy is imported lazily: it is only needed when semantic matching is on.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from backend.services.cache_utils import TwoTierCache, stable_digest
+
+_KEY_PREFIX = "emb"
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so formatting-only differences share an entry."""
+    return ' '.join((text or '').split())
+
+
+def cosine_matrix(a, b):
+    """
+    Cosine similarity between every row of ``a`` (N x D) and ``b`` (M x D).
+
+    Returns:
+        N x M float32 numpy array
+    """
+    import numpy as np
+
+    a = np.asarray(a, dtype=np.float32)
+    b = np.asarray(b, dtype=np.float32)
+    if a.ndim == 1:
+        a = a[None, :]
+    if b.ndim == 1:
+        b = b[None, :]
+    a = a / np.maximum(np.linalg.norm(a, axis=1, keepdims=True), 1e-12)
+    b = b / np.maximum(np.linalg.norm(b, axis=1, keepdims=True), 1e-12)
+    return a @ b.T
+
+
+class EmbeddingCache(TwoTierCache):
+    """
+    Two-tier (memory LRU + disk) cache of text embeddings.
+
+    Cached vectors are read-only float32 arrays; encode() returns a fresh
+    stacked matrix, so callers never alias cached storage.
+    """
+
+    label = "Embedding"
+    env_prefix = "EMBEDDING_CACHE"
+    default_max_entries = 4096
+    default_expire = 7 * 24 * 3600
+
+    @staticmethod
+    def key_for(model_name: str, text: str) -> str:
+        """Stable key for ``text`` embedded by ``model_name``."""
+        return f"{_KEY_PREFIX}:{stable_digest(model_name, normalize_text(text))}"
+
+    def get(self, model_name: str, text: str):
+        """Return the cached vector for ``text`` or None."""
+        return self._get(self.key_for(model_name, text))
+
+    def put(self, model_name: str, text: str, vector) -> None:
+        """Store one vector in both tiers."""
+        import numpy as np
+
+        vector = np.array(vector, dtype=np.float32).reshape(-1)
+        vector.flags.writeable = False
+        self._set(self.key_for(model_name, text), vector)
+
+    def encode(self, model: Any, model_name: str, texts: Sequence[str]):
+        """
+        Embed ``texts`` with ``model``, encoding only cache misses.
+
+        Args:
+            model: Object with a sentence-transformers style encode()
+            model_name: Name that identifies the model's vector space
+            texts: Texts to embed
+
+        Returns:
+            float32 numpy array (len(texts) x dimension)
+        """
+        import numpy as np
+
+        vectors: List[Optional[Any]] = [self.get(model_name, text) for text in texts]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+
+        if missing:
+            # Encode each distinct missing text once
+            unique_texts: Dict[str, int] = {}
+            for i in missing:
+                unique_texts.setdefault(normalize_text(texts[i]), i)
+            batch = [texts[i] for i in unique_texts.values()]
+            encoded = np.asarray(
+                model.encode(batch, show_progress_bar=False), dtype=np.float32
+            ).reshape(len(batch), -1)
+
+            by_text = {}
+            for text, vector in zip(batch, encoded):
+                self.put(model_name, text, vector)
+                by_text[normalize_text(text)] = vector
+            for i in missing:
+                vectors[i] = by_text[normalize_text(texts[i])]
+
+        if not vectors:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack(vectors).astype(np.float32, copy=False)
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get or create the shared embedding cache."""
+    return EmbeddingCache.shared()
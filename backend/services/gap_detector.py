@@ -16,11 +16,11 @@ Penalty structure:
 Calculation: penalty = -(total_gap_months // 6), capped at -5
 """
 
-import re
 from datetime import datetime
-from dateutil import parser
 from typing import Dict, List, Optional
 
+from backend.services.date_normalizer import entry_months, month_to_datetime, parse_date
+
 
 class GapDetector:
     """
@@ -57,32 +57,7 @@ class GapDetector:
         Returns:
             datetime object or None if unparseable
         """
-        if not date_str:
-            return None
-
-        date_str = str(date_str).strip()
-
-        # Handle "Present", "Current", "Now"
-        if date_str.lower() in ['present', 'current', 'now', 'ongoing']:
-            return datetime.now()
-
-        try:
-            # Try parsing with dateutil (handles many formats)
-            return parser.parse(date_str, default=datetime(datetime.now().year, 1, 1))
-        except:
-            # Try manual parsing for YYYY-MM format
-            match = re.match(r'(\d{4})-(\d{2})', date_str)
-            if match:
-                year, month = match.groups()
-                return datetime(int(year), int(month), 1)
-
-            # Try MM/YYYY format
-            match = re.match(r'(\d{2})/(\d{4})', date_str)
-            if match:
-                month, year = match.groups()
-                return datetime(int(year), int(month), 1)
-
-            return None
+        return parse_date(date_str)
 
     def _calculate_gap_months(self, end_date: datetime, start_date: datetime) -> int:
         """
@@ -172,13 +147,13 @@ class GapDetector:
         # Parse and sort employment by start date
         parsed_employment = []
         for job in employment_history:
-            start = self._parse_date(job.get('start_date'))
-            end = self._parse_date(job.get('end_date'))
+            # Months precomputed by the adapter, or normalized here
+            start_month, end_month, _ = entry_months(job)
 
-            if start:
+            if start_month:
                 parsed_employment.append({
-                    'start': start,
-                    'end': end if end else datetime.now(),
+                    'start': month_to_datetime(start_month),
+                    'end': month_to_datetime(end_month) or datetime.now(),
                     'start_str': str(job.get('start_date')),
                     'end_str': str(job.get('end_date'))
                 })
@@ -0,0 +1,75 @@
+"""
+Grammar Cache - shared, size-bounded cache of grammar check results.
+
+Grammar checks are the slowest text pass in scoring (a LanguageTool round
+trip, or pyspellchecker over every word), and the same bullets come back on
+every rescore.  GrammarChecker kept results per checker instance and
+RedFlagsValidator kept an unbounded dict per validator, which was lost each
+time an ATSScorer was built.  Both now share this cache, and so does
+GrammarScorer (P4.1) through GrammarChecker.check():
+
+- Key: SHA-256 of (RULESET_VERSION, backend, variant, text), where backend
+  is the checker that produced the result ('languagetool', 'fallback',
+  'basic', ...) and variant covers anything else the result depends on
+  (language, max_issues); a result from the fallback checker is therefore
+  never served once LanguageTool is available again
+- Hot tier: in-memory LRU per worker (GRAMMAR_CACHE_MAX_ENTRIES,
+  default 4096)
+- Optional disk tier: diskcache via cache_utils.get_cache(), shared by
+  workers and restarts (GRAMMAR_CACHE_DISK=false disables it;
+  GRAMMAR_CACHE_EXPIRE seconds, default 7 days)
+
+Bump RULESET_VERSION whenever GrammarChecker or RedFlagsValidator grammar
+rules, their issue mapping, or the LanguageTool version change (including
+the languagetool image tag pinned in docker-compose.yml).
+"""
+
+import copy
+from typing import Any, Dict, Optional
+
+from backend.services.cache_utils import TwoTierCache, stable_digest
+
+# Part of every key; bump when grammar check output changes
+RULESET_VERSION = "1"
+
+_KEY_PREFIX = "grammar"
+
+
+class GrammarResultCache(TwoTierCache):
+    """
+    Two-tier (memory LRU + disk) cache of grammar results keyed by text digest.
+
+    Values are plain JSON-like data (dicts/lists); get() returns deep copies,
+    so callers may mutate them freely.
+    """
+
+    label = "Grammar"
+    env_prefix = "GRAMMAR_CACHE"
+    default_max_entries = 4096
+    default_expire = 7 * 24 * 3600
+
+    @staticmethod
+    def key_for(text: str, backend: str, variant: Any = '') -> str:
+        """Key for ``text`` as checked by ``backend`` under the current rule set."""
+        digest = stable_digest(RULESET_VERSION, backend, variant, text)
+        return f"{_KEY_PREFIX}:{RULESET_VERSION}:{digest}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look up a result (memory first, then disk); None on a miss."""
+        value = self._get(key)
+        return copy.deepcopy(value) if value is not None else None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a result in both tiers."""
+        self._set(key, copy.deepcopy(value))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss statistics across both tiers."""
+        stats = super().stats()
+        stats['ruleset_version'] = RULESET_VERSION
+        return stats
+
+
+def get_grammar_result_cache() -> GrammarResultCache:
+    """Get or create the shared grammar result cache."""
+    return GrammarResultCache.shared()
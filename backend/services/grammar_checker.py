@@ -7,15 +7,28 @@ This module provides:
 - Spelling error detection
 - Typographical error detection
 - Scoring based on error count
+- Batch checking: many texts in one LanguageTool call (check_batch), with
+  per-text results kept in the shared grammar result cache (grammar_cache)
+- Either an in-process JVM (ENABLE_LANGUAGE_TOOL=true) or shared LanguageTool
+  HTTP servers (LANGUAGETOOL_SERVERS, see languagetool_pool)
 """
 
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import copy
 import logging
 import os
 import time
+from bisect import bisect_right
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from functools import lru_cache
 
+from backend.services.grammar_cache import GrammarResultCache, get_grammar_result_cache
+from backend.services.languagetool_pool import (
+    LanguageToolPool,
+    LanguageToolUnavailableError,
+    get_languagetool_pool,
+)
+
 logger = logging.getLogger(__name__)
 
 # LanguageTool starts a JVM (~200 MB, 60-90 s cold-start) that monopolises the
@@ -26,6 +39,38 @@ _LANGUAGE_TOOL_ENABLED = os.getenv("ENABLE_LANGUAGE_TOOL", "false").lower() == "
 
 _GRAMMAR_LOAD_TIMEOUT_SECONDS = 20
 _RETRY_COOLDOWN_SECONDS = 300  # 5 minutes
+_CHECK_TIMEOUT_SECONDS = 10
+
+# check_batch() joins texts with a blank line, so LanguageTool treats each
+# one as its own paragraph; rules comparing neighbouring paragraphs would
+# relate unrelated bullets and are dropped
+_SEGMENT_SEPARATOR = "\n\n"
+_CROSS_SEGMENT_RULES = frozenset({'PARAGRAPH_REPEAT_BEGINNING_RULE'})
+
+
+def _too_short_result() -> Dict:
+    return {
+        'total_issues': 0,
+        'issues': [],
+        'score': 100,
+        'severity_breakdown': {'critical': 0, 'warning': 0, 'info': 0},
+        'message': 'Text too short to analyze'
+    }
+
+
+def _close_late_tool(future) -> None:
+    """Done-callback for a timed-out JVM start: shut the JVM down once it is up."""
+    try:
+        future.result().close()
+    except Exception:
+        pass
+
+
+def _context(text: str, offset: int, length: int, width: int = 20) -> str:
+    """Snippet of ``text`` around an issue, like LanguageTool's match context."""
+    start = max(0, offset - width)
+    end = min(len(text), offset + length + width)
+    return ('...' if start > 0 else '') + text[start:end] + ('...' if end < len(text) else '')
 
 
 class GrammarChecker:
@@ -38,27 +83,37 @@ class GrammarChecker:
     - Scores based on error severity and count
     """
 
-    def __init__(self, language: str = 'en-US'):
+    def __init__(self, language: str = 'en-US', cache: Optional[GrammarResultCache] = None):
         """
         Initialize grammar checker.
 
         Args:
             language: Language code (default: 'en-US')
+            cache: Result cache (default: the shared grammar result cache)
         """
         self._tool = None
         self._language = language
         self._initialized = False
         self._last_failed_at: float = 0.0
+        self._results = cache if cache is not None else get_grammar_result_cache()
+        self._pool: Optional[LanguageToolPool] = None
 
     def _lazy_init(self):
         """
         Lazy initialization with a hard timeout and cooldown-based retry.
 
-        Skipped entirely when ENABLE_LANGUAGE_TOOL is not set (default), so
-        the JVM is never started and the fallback checker is always used.
+        With LANGUAGETOOL_SERVERS set, checks go to those shared servers and
+        no JVM is started in this process.  Otherwise skipped entirely when
+        ENABLE_LANGUAGE_TOOL is not set (default), so the JVM is never
+        started and the fallback checker is always used.
         Set ENABLE_LANGUAGE_TOOL=true on servers that have Java available and
         enough RAM (≥1 GB recommended).
         """
+        if self._pool is None:
+            self._pool = get_languagetool_pool()
+        if self._pool is not None:
+            return  # Shared LanguageTool servers replace the in-process JVM
+
         if not _LANGUAGE_TOOL_ENABLED:
             return  # Use pyspellchecker fallback; never start the JVM
 
@@ -83,6 +138,8 @@ class GrammarChecker:
                     self._last_failed_at = 0.0
                     logger.info("LanguageTool grammar checker initialized successfully")
                 except FuturesTimeoutError:
+                    # Close the JVM if the load finishes after we gave up on it
+                    future.add_done_callback(_close_late_tool)
                     logger.warning(
                         "LanguageTool initialization timed out after %ds — "
                         "falling back to basic grammar checking. Will retry in %d minutes.",
@@ -105,6 +162,13 @@ class GrammarChecker:
             self._tool = None
             self._last_failed_at = time.time()
 
+    @property
+    def backend(self) -> str:
+        """'languagetool' when the JVM checker is loaded, otherwise 'fallback'."""
+        if self._pool is not None:
+            return 'languagetool' if self._pool.available() else 'fallback'
+        return 'languagetool' if self._initialized and self._tool else 'fallback'
+
     def check(self, text: str, max_issues: int = 50) -> Dict:
         """
         Check text for grammar, spelling, and typographical errors.
@@ -120,20 +184,91 @@ class GrammarChecker:
             - score: Grammar score (0-100)
             - severity_breakdown: Count by severity
         """
-        self._lazy_init()
+        return self.check_batch([text], max_issues=max_issues)[0]
 
-        if not text or len(text.strip()) < 5:
-            return {
-                'total_issues': 0,
-                'issues': [],
-                'score': 100,
-                'severity_breakdown': {'critical': 0, 'warning': 0, 'info': 0},
-                'message': 'Text too short to analyze'
-            }
+    def check_batch(self, texts: Sequence[str], max_issues: int = 50) -> List[Dict]:
+        """
+        Check several independent texts (e.g. every bullet of a resume) at once.
+
+        Texts not in the result cache are joined with _SEGMENT_SEPARATOR and
+        sent to LanguageTool in a single check() call; each match is mapped
+        back to the text its offset falls in, with offsets relative to that
+        text.  Results are cached per text by content digest, so unchanged
+        bullets are not re-checked when a resume is rescored.
 
-        if not self._initialized or not self._tool:
-            # LanguageTool unavailable — use pyspellchecker-based fallback
-            return self._fallback_check(text)
+        Args:
+            texts: Texts to check
+            max_issues: Maximum number of issues per text
+
+        Returns:
+            One check() result per text, in order
+        """
+        self._lazy_init()
+        backend = self.backend
+
+        results: List[Optional[Dict]] = [None] * len(texts)
+        pending: Dict[str, List[int]] = {}
+        for index, text in enumerate(texts):
+            if not text or len(text.strip()) < 5:
+                results[index] = _too_short_result()
+                continue
+            cached = self._results.get(self._cache_key(text, backend, max_issues))
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.setdefault(text, []).append(index)
+
+        if pending:
+            unique = list(pending)
+            checked = self._check_languagetool(unique, max_issues) if backend == 'languagetool' else None
+            if checked is None:
+                # LanguageTool unavailable or failed — use pyspellchecker-based fallback
+                backend = 'fallback'
+                checked = [self._fallback_check(text) for text in unique]
+
+            for text, result in zip(unique, checked):
+                self._results.set(self._cache_key(text, backend, max_issues), result)
+                for index in pending[text]:
+                    results[index] = copy.deepcopy(result)
+
+        return results
+
+    def _cache_key(self, text: str, backend: str, max_issues: int) -> str:
+        return GrammarResultCache.key_for(text, backend, (self._language, max_issues))
+
+    def _check_languagetool(self, texts: List[str], max_issues: int) -> Optional[List[Dict]]:
+        """One LanguageTool round trip for all ``texts``; None if it fails or times out."""
+        joined = _SEGMENT_SEPARATOR.join(texts)
+        starts = []
+        position = 0
+        for text in texts:
+            starts.append(position)
+            position += len(text) + len(_SEGMENT_SEPARATOR)
+
+        matches = self._run_languagetool(joined)
+        if matches is None:
+            return None
+
+        per_text: List[List[Tuple[int, Any]]] = [[] for _ in texts]
+        for match in matches:
+            if match.ruleId in _CROSS_SEGMENT_RULES:
+                continue
+            index = bisect_right(starts, match.offset) - 1
+            offset = match.offset - starts[index]
+            if offset + match.errorLength > len(texts[index]):
+                continue  # Spans the separator
+            per_text[index].append((offset, match))
+
+        return [self._build_result(text, found, max_issues) for text, found in zip(texts, per_text)]
+
+    def _run_languagetool(self, text: str) -> Optional[List[Any]]:
+        """LanguageTool matches for ``text`` (remote pool or in-process); None on failure."""
+        if self._pool is not None:
+            try:
+                return self._pool.check(text, self._language)
+            except LanguageToolUnavailableError as e:
+                logger.warning("%s — falling back to basic checking", e)
+                return None
 
         try:
             tool = self._tool  # local ref for thread safety
@@ -142,65 +277,66 @@ class GrammarChecker:
             try:
                 future = executor.submit(tool.check, text)
                 try:
-                    matches = future.result(timeout=10)
+                    return future.result(timeout=_CHECK_TIMEOUT_SECONDS)
                 except FuturesTimeoutError:
                     logger.warning("LanguageTool.check() timed out — falling back to basic checking")
-                    return self._fallback_check(text)
+                    return None
             finally:
                 executor.shutdown(wait=False)
+        except Exception as e:
+            logger.warning("Grammar checking failed: %s", e)
+            return None
 
-            # Filter and categorize issues
-            issues = []
-            severity_count = {'critical': 0, 'warning': 0, 'info': 0}
+    def _build_result(self, text: str, matches: List[Tuple[int, Any]], max_issues: int) -> Dict:
+        """check() result for one text from its (offset, match) pairs."""
+        # Filter and categorize issues
+        issues = []
+        severity_count = {'critical': 0, 'warning': 0, 'info': 0}
 
-            for match in matches[:max_issues]:
-                # Determine severity
-                issue_type = match.ruleIssueType or 'unknown'
-                category = self._categorize_issue(match)
+        for offset, match in matches[:max_issues]:
+            # Determine severity
+            issue_type = match.ruleIssueType or 'unknown'
+            category = self._categorize_issue(match)
 
+            severity = 'warning'
+            if issue_type in ['misspelling', 'grammar']:
+                severity = 'critical'
+            elif issue_type in ['typographical', 'style']:
                 severity = 'warning'
-                if issue_type in ['misspelling', 'grammar']:
-                    severity = 'critical'
-                elif issue_type in ['typographical', 'style']:
-                    severity = 'warning'
-                else:
-                    severity = 'info'
-
-                severity_count[severity] += 1
-
-                issue = {
-                    'message': match.message,
-                    'context': match.context,
-                    'replacements': match.replacements[:3] if match.replacements else [],
-                    'offset': match.offset,
-                    'length': match.errorLength,
-                    'category': category,
-                    'severity': severity,
-                    'rule': match.ruleId
-                }
-                issues.append(issue)
-
-            # Calculate score
-            total_issues = len(matches)
-            score = self._calculate_score(
-                total_issues,
-                severity_count,
-                len(text.split())
-            )
+            else:
+                severity = 'info'
+
+            severity_count[severity] += 1
+
+            issue = {
+                'message': match.message,
+                'context': _context(text, offset, match.errorLength),
+                'replacements': match.replacements[:3] if match.replacements else [],
+                'offset': offset,
+                'length': match.errorLength,
+                'category': category,
+                'severity': severity,
+                'rule': match.ruleId
+            }
+            issues.append(issue)
 
-            message = self._generate_message(total_issues, severity_count)
+        # Calculate score
+        total_issues = len(matches)
+        score = self._calculate_score(
+            total_issues,
+            severity_count,
+            len(text.split())
+        )
 
-            return {
-                'total_issues': total_issues,
-                'issues': issues,
-                'score': score,
-                'severity_breakdown': severity_count,
-                'message': message
-            }
+        message = self._generate_message(total_issues, severity_count)
 
-        except Exception as e:
-            print(f"Grammar checking failed: {e}")
-            return self._fallback_check(text)
+        return {
+            'total_issues': total_issues,
+            'issues': issues,
+            'score': score,
+            'severity_breakdown': severity_count,
+            'message': message
+        }
 
     def check_and_suggest(self, text: str, max_suggestions: int = 10) -> Dict:
         """
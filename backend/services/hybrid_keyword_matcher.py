@@ -19,9 +19,64 @@ Examples:
 """
 
 import re
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
+from backend.services.keyword_automaton import get_keyword_automaton
+from backend.services.embedding_cache import cosine_matrix, get_embedding_cache
+from backend.services.keyword_embedding_store import get_keyword_embedding_store
+from backend.services.sentence_encoder import model_id_for
+
+# Cap on chunks encoded per resume (bounds encode cost on very long documents)
+MAX_RESUME_CHUNKS = 200
+
+# Bullet glyphs / list markers stripped from the start of a chunk
+_BULLET_PREFIX = re.compile(r'^\s*(?:[-*•●▪◦‣○■□➢➤►✓✔]|\d{1,2}[.)])\s*')
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?;])\s+(?=[A-Z0-9])')
+
+
+def split_resume_chunks(text: str, max_chunks: int = MAX_RESUME_CHUNKS) -> List[str]:
+    """
+    Split resume text into bullet/sentence chunks for embedding.
+
+    Lines are split further at sentence boundaries, bullet markers are
+    stripped, fragments under 3 characters and duplicates are dropped.
+    """
+    chunks: List[str] = []
+    seen = set()
+    for line in (text or '').splitlines():
+        line = _BULLET_PREFIX.sub('', line).strip()
+        if not line:
+            continue
+        for sentence in _SENTENCE_SPLIT.split(line):
+            sentence = sentence.strip()
+            if len(sentence) < 3 or sentence in seen:
+                continue
+            seen.add(sentence)
+            chunks.append(sentence)
+            if len(chunks) >= max_chunks:
+                return chunks
+    return chunks
+
+
+def max_chunk_similarity(keyword_vecs, chunk_vecs) -> Tuple[Any, Any]:
+    """
+    Best cosine similarity of each keyword over all chunks.
+
+    Args:
+        keyword_vecs: (K x D) array-like
+        chunk_vecs: (C x D) array-like
+
+    Returns:
+        (scores, chunk_indices): length-K arrays with the max similarity per
+        keyword and the index of the chunk that produced it
+    """
+    import numpy as np
+
+    similarities = cosine_matrix(keyword_vecs, chunk_vecs)
+    best = similarities.argmax(axis=1)
+    return similarities[np.arange(similarities.shape[0]), best], best
+
 
 class HybridKeywordMatcher:
     """
@@ -52,10 +107,18 @@ class HybridKeywordMatcher:
         if self._initialized:
             return
 
-        # Initialize the semantic matcher and get access to the model
+        # Initialize the semantic matcher and get access to the model.  Stay
+        # uninitialized while it is unavailable, so a model loaded later (by
+        # the warmup thread or after the retry cooldown) is picked up.
         self.semantic_matcher_service._lazy_init()
         self._model = self.semantic_matcher_service._model
-        self._initialized = True
+        self._initialized = self._model is not None
+
+    @property
+    def match_mode(self) -> str:
+        """Encoder model id when semantic matching is available, otherwise 'exact'."""
+        self._lazy_init()
+        return model_id_for(self._model) if self._model is not None else 'exact'
 
     def _exact_match_score(self, keyword: str, text: str) -> float:
         """
@@ -77,12 +140,23 @@ class HybridKeywordMatcher:
         if not keyword or not text:
             return 0.0
 
-        # Case-insensitive search with word boundaries
-        # \b ensures we match whole words or word-like components
-        # Handles: "Python", "Python-based", "Django (Python)", etc.
-        pattern = re.compile(r'\b' + re.escape(keyword) + r'\b', re.IGNORECASE)
+        return self._exact_match_scores([keyword], text)[keyword]
 
-        return 1.0 if pattern.search(text) else 0.0
+    def _exact_match_scores(self, keywords: List[str], text: str) -> Dict[str, float]:
+        """
+        Exact-match every keyword in one pass over the text.
+
+        Same semantics as _exact_match_score (case-insensitive, \\b on both
+        ends), using a cached KeywordAutomaton for the keyword list.
+
+        Returns:
+            Dictionary mapping keyword → 1.0 (found) or 0.0
+        """
+        if not text:
+            return {kw: 0.0 for kw in keywords}
+
+        found = get_keyword_automaton(keywords).found(text)
+        return {kw: 1.0 if kw in found else 0.0 for kw in keywords}
 
     def _semantic_match_score(self, keyword: str, text: str) -> float:
         """
@@ -113,27 +187,23 @@ class HybridKeywordMatcher:
             return 0.0
 
         try:
-            from sentence_transformers import util
-
             model = self._model  # local ref for thread safety
 
             def _encode():
-                kw_emb = model.encode(keyword, convert_to_tensor=True, show_progress_bar=False)
-                txt_emb = model.encode(text, convert_to_tensor=True, show_progress_bar=False)
-                return kw_emb, txt_emb
+                return get_embedding_cache().encode(model, model_id_for(model), [keyword, text])
 
             executor = ThreadPoolExecutor(max_workers=1)
             try:
                 future = executor.submit(_encode)
                 try:
-                    keyword_embedding, text_embedding = future.result(timeout=10)
+                    vectors = future.result(timeout=10)
                 except FuturesTimeoutError:
                     return 0.0
             finally:
                 executor.shutdown(wait=False)
 
             # Calculate cosine similarity
-            similarity = util.cos_sim(keyword_embedding, text_embedding)[0][0].item()
+            similarity = float(cosine_matrix(vectors[0], vectors[1])[0][0])
 
             # Clamp to [0, 1] range (cosine sim can be -1 to 1, but we only care about positive)
             return max(0.0, min(1.0, similarity))
@@ -193,8 +263,7 @@ class HybridKeywordMatcher:
         """
         Match multiple keywords against resume text efficiently.
 
-        Batch-encodes resume + all keywords in two model.encode() calls with a
-        single 30s timeout, instead of one pair of encode calls per keyword.
+        See match_keywords_with_evidence for how scores are computed.
         Falls back to pure exact matching if the model is unavailable or slow.
 
         Args:
@@ -205,6 +274,37 @@ class HybridKeywordMatcher:
             Dictionary mapping keyword → match score
             Example: {"Python": 0.98, "Django": 0.95, "React": 0.15}
         """
+        return {
+            keyword: match['score']
+            for keyword, match in self.match_keywords_with_evidence(keywords, resume_text).items()
+        }
+
+    def match_keywords_with_evidence(
+        self,
+        keywords: List[str],
+        resume_text: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Match multiple keywords and report the resume chunk behind each score.
+
+        The resume is split into bullet/sentence chunks (split_resume_chunks)
+        and the chunks plus any keywords missing from the keyword embedding
+        store are embedded through the shared EmbeddingCache (one
+        model.encode() call for the cache misses) with a 30s timeout.
+        A keyword's semantic score is its best cosine similarity over all
+        chunks (one keyword x chunk matrix, max per row), which avoids
+        truncating long resumes and rewards a keyword that one bullet is
+        about rather than diluting it across the whole document.
+
+        Args:
+            keywords: List of keywords to match
+            resume_text: Full resume text or relevant section
+
+        Returns:
+            Dictionary mapping keyword → {'score': float, 'evidence': str or None}
+            where evidence is the line containing the exact match when that
+            decides the score, otherwise the best-matching chunk
+        """
         if not keywords:
             return {}
 
@@ -212,41 +312,69 @@ class HybridKeywordMatcher:
 
         # If model unavailable, use pure exact matching for all keywords at once
         if self._model is None:
-            return {kw: self._exact_match_score(kw, resume_text) for kw in keywords}
+            return self._exact_match_results(keywords, resume_text)
 
-        try:
-            from sentence_transformers import util
+        chunks = split_resume_chunks(resume_text)
+        if not chunks:
+            return self._exact_match_results(keywords, resume_text)
 
+        try:
             model = self._model  # local ref for thread safety
+            store = get_keyword_embedding_store()
+            to_encode = [kw for kw in keywords if kw not in store] if store is not None else list(keywords)
 
             def _batch_encode():
-                r_emb = model.encode(resume_text, convert_to_tensor=True, show_progress_bar=False)
-                kw_embs = model.encode(keywords, convert_to_tensor=True, show_progress_bar=False)
-                return r_emb, kw_embs
+                vectors = get_embedding_cache().encode(model, model_id_for(model), chunks + to_encode)
+                chunk_vecs = vectors[:len(chunks)]
+                if store is not None:
+                    # Role keywords come precomputed; the rest were encoded above
+                    kw_vecs = store.embeddings_for(keywords, lambda missing: vectors[len(chunks):])
+                else:
+                    kw_vecs = vectors[len(chunks):]
+                return chunk_vecs, kw_vecs
 
             executor = ThreadPoolExecutor(max_workers=1)
             try:
                 future = executor.submit(_batch_encode)
                 try:
-                    resume_emb, kw_embs = future.result(timeout=30)
+                    chunk_vecs, kw_vecs = future.result(timeout=30)
                 except FuturesTimeoutError:
                     # Batch timed out — fall back to exact matching for all keywords
-                    return {kw: self._exact_match_score(kw, resume_text) for kw in keywords}
+                    return self._exact_match_results(keywords, resume_text)
             finally:
                 executor.shutdown(wait=False)
 
-            # Compute per-keyword hybrid scores from batch embeddings
-            similarities = util.cos_sim(resume_emb, kw_embs)[0]
+            best_scores, best_chunks = max_chunk_similarity(kw_vecs, chunk_vecs)
+            exact_results = self._exact_match_results(keywords, resume_text)
             results = {}
             for i, keyword in enumerate(keywords):
-                exact_score = self._exact_match_score(keyword, resume_text)
-                semantic_score = max(0.0, min(1.0, similarities[i].item()))
-                hybrid = (semantic_score * self.semantic_weight) + (exact_score * self.exact_weight)
-                results[keyword] = max(exact_score, hybrid)
+                exact = exact_results[keyword]
+                semantic_score = max(0.0, min(1.0, float(best_scores[i])))
+                hybrid = (semantic_score * self.semantic_weight) + (exact['score'] * self.exact_weight)
+                # A verbatim match is its own evidence, even if another
+                # chunk is semantically closer
+                if exact['score'] >= hybrid:
+                    results[keyword] = exact
+                else:
+                    results[keyword] = {'score': hybrid, 'evidence': chunks[int(best_chunks[i])]}
             return results
 
         except Exception:
-            return {kw: self._exact_match_score(kw, resume_text) for kw in keywords}
+            return self._exact_match_results(keywords, resume_text)
+
+    def _exact_match_results(self, keywords: List[str], text: str) -> Dict[str, Dict[str, Any]]:
+        """Exact-only results, with the line of the first occurrence as evidence."""
+        evidence: Dict[str, str] = {}
+        if text:
+            for hit in get_keyword_automaton(keywords).find_all(text):
+                if hit.keyword not in evidence:
+                    line_start = text.rfind('\n', 0, hit.start) + 1
+                    line_end = text.find('\n', hit.end)
+                    evidence[hit.keyword] = text[line_start:line_end if line_end != -1 else len(text)].strip()
+        return {
+            kw: {'score': 1.0 if kw in evidence else 0.0, 'evidence': evidence.get(kw)}
+            for kw in keywords
+        }
 
     def get_match_summary(
         self,
@@ -272,7 +400,8 @@ class HybridKeywordMatcher:
                 'match_rate': float,             # Percentage of matched keywords (0-100)
                 'scores': Dict[str, float],      # Individual keyword scores
                 'matched': List[str],            # List of matched keywords
-                'unmatched': List[str]           # List of unmatched keywords
+                'unmatched': List[str],          # List of unmatched keywords
+                'evidence': Dict[str, str]       # Matched keyword → resume chunk
             }
 
         Example:
@@ -290,7 +419,8 @@ class HybridKeywordMatcher:
                 'unmatched': ['React']
             }
         """
-        scores = self.match_keywords(keywords, resume_text)
+        results = self.match_keywords_with_evidence(keywords, resume_text)
+        scores = {kw: match['score'] for kw, match in results.items()}
 
         matched = [kw for kw, score in scores.items() if score >= threshold]
         unmatched = [kw for kw, score in scores.items() if score < threshold]
@@ -305,7 +435,8 @@ class HybridKeywordMatcher:
             'match_rate': match_rate,
             'scores': scores,
             'matched': matched,
-            'unmatched': unmatched
+            'unmatched': unmatched,
+            'evidence': {kw: results[kw]['evidence'] for kw in matched}
         }
 
 
@@ -0,0 +1,130 @@
+"""
+JD Analysis Cache - memoized job-description analysis keyed by JD digest.
+
+Every score or rescore against the same job description used to re-run
+ScorerV3Adapter._extract_job_requirements (KeyBERT or its fallback
+heuristics), and the phase 2 endpoints re-extracted the JD's keywords and
+skills on every request.  Recruiters score many resumes against one posting,
+so this work is now done once per JD:
+
+- Key: SHA-256 of (ANALYSIS_VERSION, whitespace-normalized JD text), so
+  formatting-only differences share an entry in every worker, plus the
+  result name
+- Named results per JD, each computed on first request: the
+  required/preferred keyword split, extracted keywords for the heat map,
+  and hard/soft job skills
+- Hot tier: in-memory LRU of results per worker
+  (JD_ANALYSIS_CACHE_MAX_ENTRIES, default 1024)
+- Disk tier: diskcache via cache_utils.get_cache(), shared by workers
+  (JD_ANALYSIS_CACHE_EXPIRE seconds, default 1 day)
+
+Results that depend on the semantic model are stored under names that
+include extraction_mode(), so a heuristic fallback computed while the model
+was unavailable is never served once it loads, and results from one encoder
+backend are never served after switching to the other.
+
+Bump ANALYSIS_VERSION whenever extraction output changes.
+"""
+
+import copy
+import threading
+from typing import Any, Callable, Dict, List
+
+from backend.services.cache_utils import LRUCache, TwoTierCache, stable_digest
+from backend.services.embedding_cache import normalize_text
+
+# Part of every key; bump when extraction output changes
+ANALYSIS_VERSION = "1"
+
+_KEY_PREFIX = "jd"
+
+
+def extraction_mode() -> str:
+    """
+    'semantic:<encoder model id>' when the model is loaded, otherwise 'heuristic'.
+
+    The model id separates torch/KeyBERT from ONNX extraction, so switching
+    SEMANTIC_ENCODER never serves keywords extracted by the other backend.
+    """
+    from backend.services.semantic_matcher import get_semantic_matcher
+    from backend.services.sentence_encoder import model_id_for
+
+    matcher = get_semantic_matcher()
+    matcher._lazy_init()
+    if matcher._model is None:
+        return 'heuristic'
+    return f"semantic:{model_id_for(matcher._model)}"
+
+
+class JDAnalysisCache(TwoTierCache):
+    """
+    Two-tier (memory LRU + disk) cache of per-JD analysis results.
+
+    get_or_compute() returns deep copies, so callers may mutate them freely.
+    Concurrent requests for the same JD and result wait for one computation
+    instead of repeating it.
+    """
+
+    label = "JD analysis"
+    env_prefix = "JD_ANALYSIS_CACHE"
+    default_max_entries = 1024
+    default_expire = 24 * 3600
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # One lock per result key, so each result is computed once
+        self._compute_locks = LRUCache(max_entries=self._memory.max_entries)
+
+    @staticmethod
+    def digest_for(job_description: str) -> str:
+        """Stable digest of the normalized job description."""
+        return stable_digest(ANALYSIS_VERSION, normalize_text(job_description))
+
+    def get_or_compute(self, job_description: str, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return result ``name`` for ``job_description``, computing it once.
+
+        Args:
+            job_description: Raw job description text
+            name: Result name, e.g. "requirements:semantic"
+            compute: Zero-argument callable producing a picklable result
+
+        Returns:
+            Deep copy of the cached or freshly computed result
+        """
+        key = f"{_KEY_PREFIX}:{self.digest_for(job_description)}:{name}"
+        with self._compute_lock(key):
+            value = self._get(key)
+            if value is None:
+                value = compute()
+                self._set(key, value)
+        return copy.deepcopy(value)
+
+    def job_requirements(
+        self,
+        job_description: str,
+        extract: Callable[[], Dict[str, List[str]]]
+    ) -> Dict[str, List[str]]:
+        """Required/preferred keyword split (see ScorerV3Adapter._extract_job_requirements)."""
+        return self.get_or_compute(job_description, f"requirements:{extraction_mode()}", extract)
+
+    def extracted_keywords(self, job_description: str, top_n: int, extract: Callable[[], Any]) -> Any:
+        """Top-N (keyword, relevance) pairs used by the keyword heat map."""
+        return self.get_or_compute(job_description, f"keywords:{extraction_mode()}:{top_n}", extract)
+
+    def job_skills(self, job_description: str, extract: Callable[[], Dict[str, List[str]]]) -> Dict[str, List[str]]:
+        """Hard/soft skills found in the job description."""
+        return self.get_or_compute(job_description, "skills", extract)
+
+    def _compute_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            lock = self._compute_locks.get(key)
+            if lock is None:
+                lock = threading.Lock()
+                self._compute_locks.set(key, lock)
+            return lock
+
+
+def get_jd_analysis_cache() -> JDAnalysisCache:
+    """Get or create the shared JD analysis cache."""
+    return JDAnalysisCache.shared()
@@ -16,11 +16,11 @@ Penalty structure:
 Calculation: penalty = -min(short_stints_count, 3)
 """
 
-import re
 from datetime import datetime
-from dateutil import parser
 from typing import Dict, List, Optional
 
+from backend.services.date_normalizer import entry_months, month_to_datetime, parse_date
+
 
 class JobHoppingDetector:
     """
@@ -55,31 +55,7 @@ class JobHoppingDetector:
 
         Handles same formats as GapDetector.
         """
-        if not date_str:
-            return None
-
-        date_str = str(date_str).strip()
-
-        # Handle "Present", "Current"
-        if date_str.lower() in ['present', 'current', 'now', 'ongoing']:
-            return datetime.now()
-
-        try:
-            return parser.parse(date_str, default=datetime(datetime.now().year, 1, 1))
-        except:
-            # Try manual parsing for YYYY-MM
-            match = re.match(r'(\d{4})-(\d{2})', date_str)
-            if match:
-                year, month = match.groups()
-                return datetime(int(year), int(month), 1)
-
-            # Try MM/YYYY
-            match = re.match(r'(\d{2})/(\d{4})', date_str)
-            if match:
-                month, year = match.groups()
-                return datetime(int(year), int(month), 1)
-
-            return None
+        return parse_date(date_str)
 
     def _calculate_duration_months(self, start_date: datetime, end_date: datetime) -> int:
         """Calculate duration in months between two dates."""
@@ -143,8 +119,10 @@ class JobHoppingDetector:
 
         for job in employment_history:
             title = job.get('title', 'Unknown')
-            start = self._parse_date(job.get('start_date'))
-            end = self._parse_date(job.get('end_date'))
+            # Months precomputed by the adapter, or normalized here
+            start_month, end_month, _ = entry_months(job)
+            start = month_to_datetime(start_month)
+            end = month_to_datetime(end_month)
 
             if not start or not end:
                 continue
@@ -0,0 +1,163 @@
+"""
+Keyword Automaton - multi-keyword matching in one pass over the text.
+
+Exact keyword matching used to compile and run one ``\\b<kw>\\b`` regex per
+keyword per call (HybridKeywordMatcher: every JD/role keyword; SkillsCategorizer:
+hundreds of taxonomy skills), i.e. hundreds of passes over the resume text.
+
+KeywordAutomaton compiles a whole keyword set into a single trie-factored
+alternation, so the regex engine only explores keywords whose prefix matches
+at each position.  Semantics are identical to searching each keyword with
+``\\b<kw>\\b``:
+
+- word boundaries are checked at both ends exactly like ``\\b``
+- overlapping hits are all reported ("machine learning" and "learning")
+- keywords sharing a start position are all reported ("react" and
+  "react native"): the regex yields the longest one, shorter keywords that
+  are prefixes of it are boundary-checked from a precomputed table
+
+Automata are cached per keyword set (get_keyword_automaton), so role keyword
+lists, JD keyword lists and the skills taxonomy are compiled once per process.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+from backend.services.cache_utils import LRUCache
+
+# Trie node key marking "a keyword ends here"
+_END = ''
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    """One keyword occurrence: ``text[start:end]`` matches ``keyword``."""
+    keyword: str
+    start: int
+    end: int
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same character class as regex ``\\w``."""
+    return ch.isalnum() or ch == '_'
+
+
+def _is_boundary(text: str, pos: int) -> bool:
+    """True if ``\\b`` matches at ``pos`` in ``text``."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+def _trie_to_regex(node: Dict[str, dict]) -> str:
+    """Serialize a character trie into a factored regex alternation."""
+    branches = [
+        re.escape(ch) + _trie_to_regex(child)
+        for ch, child in sorted(node.items())
+        if ch != _END
+    ]
+    if not branches:
+        return ''
+    if len(branches) == 1 and _END not in node:
+        return branches[0]
+    group = '(?:' + '|'.join(branches) + ')'
+    # Optional continuation: greedy, so longer keywords are preferred and the
+    # engine backtracks to the shorter one if the trailing \b fails
+    return group + '?' if _END in node else group
+
+
+class KeywordAutomaton:
+    """
+    Compiled matcher for a fixed set of keywords.
+
+    Attributes:
+        keywords: The keywords as given (duplicates removed, order kept)
+        case_sensitive: Whether matching respects case
+    """
+
+    def __init__(self, keywords: Iterable[str], case_sensitive: bool = False):
+        self.case_sensitive = case_sensitive
+        self.keywords: List[str] = []
+        # normalized keyword -> original spellings
+        self._originals: Dict[str, List[str]] = {}
+
+        seen = set()
+        for keyword in keywords:
+            if not keyword or keyword in seen:
+                continue
+            seen.add(keyword)
+            self.keywords.append(keyword)
+            self._originals.setdefault(self._normalize(keyword), []).append(keyword)
+
+        trie: Dict[str, dict] = {}
+        for norm in self._originals:
+            node = trie
+            for ch in norm:
+                node = node.setdefault(ch, {})
+            node[_END] = {}
+
+        # normalized keyword -> shorter keywords that are prefixes of it
+        self._prefixes: Dict[str, List[str]] = {
+            norm: [other for other in self._originals if other != norm and norm.startswith(other)]
+            for norm in self._originals
+        }
+
+        self._pattern = None
+        if trie:
+            flags = 0 if case_sensitive else re.IGNORECASE
+            self._pattern = re.compile(r'(?=\b(' + _trie_to_regex(trie) + r')\b)', flags)
+
+    def _normalize(self, value: str) -> str:
+        return value if self.case_sensitive else value.lower()
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """
+        Return every keyword occurrence in ``text``, ordered by position.
+
+        Each original spelling of a keyword gets its own hit when the set
+        holds case variants (e.g. "AWS" and "aws") and matching ignores case.
+        """
+        if self._pattern is None or not text:
+            return []
+
+        hits = []
+        for match in self._pattern.finditer(text):
+            start = match.start(1)
+            norm = self._normalize(match.group(1))
+            if norm not in self._originals:
+                # Case folding changed the length (rare non-ASCII); skip
+                continue
+            candidates = [norm] + [
+                prefix for prefix in self._prefixes[norm]
+                if _is_boundary(text, start + len(prefix))
+            ]
+            for candidate in sorted(candidates, key=len):
+                for original in self._originals[candidate]:
+                    hits.append(KeywordHit(original, start, start + len(candidate)))
+        return hits
+
+    def found(self, text: str) -> Set[str]:
+        """Return the set of keywords that occur in ``text``."""
+        return {hit.keyword for hit in self.find_all(text)}
+
+
+# Compiled automata keyed by (keyword set, case_sensitive)
+_automaton_cache = LRUCache(max_entries=128)
+
+
+def get_keyword_automaton(keywords: Iterable[str], case_sensitive: bool = False) -> KeywordAutomaton:
+    """
+    Get a cached automaton for the given keywords.
+
+    Keyword order does not matter for the cache key, so the same role/JD
+    keyword list maps to the same compiled automaton on every request.
+    """
+    keyword_list = list(keywords)
+    key: FrozenSet = frozenset(keyword_list)
+    cache_key = (key, case_sensitive)
+    automaton = _automaton_cache.get(cache_key)
+    if automaton is None:
+        automaton = KeywordAutomaton(keyword_list, case_sensitive=case_sensitive)
+        _automaton_cache.set(cache_key, automaton)
+    return automaton
@@ -0,0 +1,232 @@
+"""
+Keyword Embedding Store - precomputed embeddings for role keyword lists.
+
+With ENABLE_SEMANTIC_MATCHING=true every HybridKeywordMatcher.match_keywords
+call used to re-encode the role's required/preferred keywords, although
+ROLE_KEYWORDS is static.  This store holds one float16 row per unique role
+keyword, built offline:
+
+    python backend/build_keyword_embeddings.py
+
+Files (in KEYWORD_EMBEDDING_DIR, default backend/data/embeddings):
+- role_keywords.f16.npy   float16 matrix, one row per keyword
+- role_keywords.json      store version, model id, dimension, a digest of
+                          ROLE_KEYWORDS and the keyword -> row order
+
+The matrix is memory-mapped, so workers share the pages and loading costs
+nothing.  The model id names the encoder backend as well (SEMANTIC_ENCODER,
+see sentence_encoder.py), so the store is built with the backend that serves
+requests.  The store is ignored (with a warning) when its version, model or
+ROLE_KEYWORDS digest does not match the running code, so a stale file can
+never supply wrong vectors; keywords not in the store (e.g. JD keywords) are
+encoded on demand.
+
+numpy is imported lazily: it is only needed when semantic matching is on.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from backend.services.cache_utils import stable_digest
+
+logger = logging.getLogger(__name__)
+
+# Bump when the file layout changes
+STORE_VERSION = "1"
+
+# Model loaded by every sentence encoder backend (sentence_encoder.py)
+MODEL_NAME = 'all-MiniLM-L6-v2'
+
+_MATRIX_FILE = "role_keywords.f16.npy"
+_INDEX_FILE = "role_keywords.json"
+
+
+def default_store_dir() -> Path:
+    """Directory holding the store files."""
+    configured = os.getenv("KEYWORD_EMBEDDING_DIR")
+    if configured:
+        return Path(configured)
+    return Path(__file__).resolve().parent.parent / "data" / "embeddings"
+
+
+def role_keyword_list() -> List[str]:
+    """Unique required + preferred keywords across all roles, in stable order."""
+    from backend.services.role_keywords import ROLE_KEYWORDS
+
+    seen = set()
+    keywords = []
+    for role_id in sorted(ROLE_KEYWORDS):
+        role = ROLE_KEYWORDS[role_id]
+        for kind in ('required', 'preferred'):
+            for keyword in role.get(kind, []):
+                if keyword not in seen:
+                    seen.add(keyword)
+                    keywords.append(keyword)
+    return keywords
+
+
+def role_keywords_digest() -> str:
+    """Digest of ROLE_KEYWORDS; a changed list invalidates the store."""
+    from backend.services.role_keywords import ROLE_KEYWORDS
+    return stable_digest(json.dumps(ROLE_KEYWORDS, sort_keys=True))
+
+
+class KeywordEmbeddingStore:
+    """
+    Read-only, memory-mapped keyword -> embedding lookup.
+
+    Attributes:
+        matrix: float16 array (rows x dimension), memory-mapped
+        index: keyword -> row number
+        dimension: Embedding size
+    """
+
+    def __init__(self, matrix, keywords: Sequence[str]):
+        self.matrix = matrix
+        self.index: Dict[str, int] = {kw: i for i, kw in enumerate(keywords)}
+        self.dimension = int(matrix.shape[1]) if matrix.ndim == 2 else 0
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self.index
+
+    @classmethod
+    def load(cls, directory: Optional[Path] = None) -> Optional['KeywordEmbeddingStore']:
+        """
+        Load the store, or return None if it is missing or stale.
+        """
+        directory = Path(directory) if directory else default_store_dir()
+        matrix_path = directory / _MATRIX_FILE
+        index_path = directory / _INDEX_FILE
+        if not matrix_path.exists() or not index_path.exists():
+            logger.info("No keyword embedding store at %s — keywords will be encoded per request", directory)
+            return None
+
+        try:
+            import numpy as np
+
+            with open(index_path, encoding='utf-8') as f:
+                meta = json.load(f)
+
+            from backend.services.sentence_encoder import configured_model_id
+
+            if meta.get('version') != STORE_VERSION or meta.get('model') != configured_model_id():
+                logger.warning("Keyword embedding store at %s is for another version/model; ignoring", directory)
+                return None
+            if meta.get('role_keywords_digest') != role_keywords_digest():
+                logger.warning(
+                    "Keyword embedding store at %s is stale (ROLE_KEYWORDS changed); "
+                    "rebuild with backend/build_keyword_embeddings.py", directory
+                )
+                return None
+
+            matrix = np.load(matrix_path, mmap_mode='r')
+            keywords = meta['keywords']
+            if matrix.shape[0] != len(keywords):
+                logger.warning("Keyword embedding store at %s is corrupt (row count mismatch); ignoring", directory)
+                return None
+            return cls(matrix, keywords)
+        except Exception as e:
+            logger.warning("Could not load keyword embedding store: %s", e)
+            return None
+
+    def embeddings_for(
+        self,
+        keywords: Sequence[str],
+        encode: Callable[[List[str]], object]
+    ):
+        """
+        Return a float32 (len(keywords) x dimension) matrix for ``keywords``.
+
+        Rows come from the store; keywords it does not hold are passed to
+        ``encode`` in one batch (a callable returning a 2-D array-like).
+        """
+        import numpy as np
+
+        result = np.empty((len(keywords), self.dimension), dtype=np.float32)
+        missing = []
+        missing_rows = []
+        for i, keyword in enumerate(keywords):
+            row = self.index.get(keyword)
+            if row is None:
+                missing.append(keyword)
+                missing_rows.append(i)
+            else:
+                result[i] = self.matrix[row]
+
+        if missing:
+            encoded = np.asarray(encode(missing), dtype=np.float32).reshape(len(missing), -1)
+            result[missing_rows] = encoded
+        return result
+
+
+def build_store(model, directory: Optional[Path] = None, batch_size: int = 256) -> Path:
+    """
+    Encode every role keyword with ``model`` and write the store files.
+
+    Args:
+        model: Loaded sentence encoder (MODEL_NAME, any backend)
+        directory: Output directory (default: default_store_dir())
+        batch_size: Encode batch size
+
+    Returns:
+        The output directory
+    """
+    import numpy as np
+
+    from backend.services.sentence_encoder import model_id_for
+
+    directory = Path(directory) if directory else default_store_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+
+    keywords = role_keyword_list()
+    embeddings = model.encode(keywords, batch_size=batch_size, show_progress_bar=False)
+    matrix = np.asarray(embeddings, dtype=np.float16)
+
+    # Write to temp names and rename, so running workers never map a half-written file
+    tmp_matrix = directory / (_MATRIX_FILE + ".tmp.npy")
+    tmp_index = directory / (_INDEX_FILE + ".tmp")
+    np.save(tmp_matrix, matrix)
+    with open(tmp_index, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': STORE_VERSION,
+            'model': model_id_for(model),
+            'dimension': int(matrix.shape[1]),
+            'role_keywords_digest': role_keywords_digest(),
+            'keywords': keywords,
+        }, f)
+    os.replace(tmp_matrix, directory / _MATRIX_FILE)
+    os.replace(tmp_index, directory / _INDEX_FILE)
+    return directory
+
+
+# Global store instance (None = not built / stale)
+_store: Optional[KeywordEmbeddingStore] = None
+_store_loaded = False
+_store_lock = threading.Lock()
+
+
+def get_keyword_embedding_store() -> Optional[KeywordEmbeddingStore]:
+    """Get the shared store, loading it on first use (None if unavailable)."""
+    global _store, _store_loaded
+    if _store_loaded:
+        return _store
+    with _store_lock:
+        if not _store_loaded:
+            _store = KeywordEmbeddingStore.load()
+            _store_loaded = True
+    return _store
+
+
+def reset_keyword_embedding_store() -> None:
+    """Forget the loaded store (tests / after a rebuild)."""
+    global _store, _store_loaded
+    with _store_lock:
+        _store = None
+        _store_loaded = False
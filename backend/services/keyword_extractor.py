@@ -9,7 +9,7 @@ matching, which is crucial for ATS Simulation mode scoring.
 import re
 from typing import Dict, List, Set, Tuple
 
-from backend.services.synonym_database import get_all_synonyms
+from backend.services.synonym_index import SYNONYM_INDEX
 
 
 # Technical keywords to extract from job descriptions
@@ -165,7 +165,7 @@ def _classify_keywords(keywords: Set[str], text: str) -> Tuple[Set[str], Set[str
 
     for keyword in keywords:
         # Get all synonyms for the keyword
-        all_forms = get_all_synonyms(keyword)
+        all_forms = SYNONYM_INDEX.expand(keyword)
 
         # Count total occurrences across all synonym forms
         total_count = 0
@@ -257,7 +257,7 @@ def match_with_synonyms(keyword: str, text: str) -> bool:
     """
     Check if keyword or any of its synonyms appear in text.
 
-    Uses the SYNONYM_DATABASE to find all related terms and checks
+    Uses the synonym index to find all related terms and checks
     if any of them appear in the text. This enables intelligent matching
     where "kubernetes" can match "k8s" in the text.
 
@@ -278,15 +278,7 @@ def match_with_synonyms(keyword: str, text: str) -> bool:
         >>> match_with_synonyms("python", "I know Java")
         False
     """
-    # Get all forms of this keyword (including synonyms)
-    all_forms = get_all_synonyms(keyword)
-
-    # Check if any form appears in the text
-    for form in all_forms:
-        # Use word boundary regex to match whole words only
-        # This prevents "python" from matching "pythonic" or "py" from matching "copy"
-        pattern = r'\b' + re.escape(form) + r'\b'
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-
-    return False
+    # One precompiled whole-word pattern over all forms of this keyword
+    # (including synonyms); word boundaries prevent "python" from matching
+    # "pythonic" or "py" from matching "copy"
+    return SYNONYM_INDEX.pattern(keyword).search(text) is not None
@@ -3,12 +3,14 @@ Keyword matching engine with O(1) lookup and synonym support.
 Matches resume text against role keywords with fuzzy matching.
 """
 
-import json
 import re
 from pathlib import Path
 from typing import Dict, List, Set
 from fuzzywuzzy import fuzz
 
+from backend.services.corpus_store import get_role_keywords
+from backend.services.synonym_index import SYNONYM_INDEX
+
 
 class KeywordMatcher:
     """
@@ -20,19 +22,12 @@ class KeywordMatcher:
         """Load keyword database and synonyms"""
         self.data_dir = Path(__file__).parent.parent / "data"
 
-        # Load role keywords
-        with open(self.data_dir / "keywords" / "role_keywords.json", 'r') as f:
-            self.role_keywords = json.load(f)
-
-        # Load synonyms
-        with open(self.data_dir / "synonyms" / "skill_synonyms.json", 'r') as f:
-            self.synonyms = json.load(f)
+        # Role keywords (corpus store, or role_keywords.json parsed once)
+        self.role_keywords = get_role_keywords()
 
-        # Build reverse synonym map for faster lookup
-        self.reverse_synonyms = {}
-        for primary, variations in self.synonyms.items():
-            for variation in variations:
-                self.reverse_synonyms[variation.lower()] = primary
+        # Shared synonym index (loaded once per process)
+        self.synonym_index = SYNONYM_INDEX
+        self.synonyms = SYNONYM_INDEX.groups
 
     def normalize_text(self, text: str) -> str:
         """Normalize text: lowercase, remove special chars"""
@@ -52,22 +47,7 @@ class KeywordMatcher:
 
     def expand_with_synonyms(self, keyword: str) -> Set[str]:
         """Expand keyword with all synonyms"""
-        keyword_lower = keyword.lower()
-        variations = {keyword_lower}
-
-        # Check if this keyword has synonyms (primary key)
-        if keyword_lower in self.synonyms:
-            variations.update([v.lower() for v in self.synonyms[keyword_lower]])
-
-        # Check if this keyword is a synonym of another term (reverse lookup)
-        if keyword_lower in self.reverse_synonyms:
-            primary = self.reverse_synonyms[keyword_lower]
-            variations.add(primary)
-            # Also add all other synonyms of the primary term
-            if primary in self.synonyms:
-                variations.update([v.lower() for v in self.synonyms[primary]])
-
-        return variations
+        return set(self.synonym_index.expand(keyword))
 
     def match_keywords(self, resume_text: str, keywords: List[str]) -> Dict:
         """
@@ -0,0 +1,311 @@
+"""
+LanguageTool Pool - grammar checks against shared LanguageTool HTTP servers.
+
+GrammarChecker used to start an in-process language_tool_python JVM
+(~250 MB) in every uvicorn worker, and a start that outlived its timeout
+left a half-initialized JVM behind.  With LANGUAGETOOL_SERVERS set, the
+workers instead send checks to one or more local LanguageTool servers
+(e.g. the ``languagetool`` service in docker-compose.yml), so N workers
+share one JVM:
+
+- LANGUAGETOOL_SERVERS            comma-separated base URLs
+                                  (e.g. "http://localhost:8010")
+- LANGUAGETOOL_TIMEOUT            seconds per HTTP request (default 5)
+- LANGUAGETOOL_FAILURE_THRESHOLD  consecutive failures that open a
+                                  server's circuit (default 3)
+- LANGUAGETOOL_COOLDOWN           seconds an open circuit rejects requests
+                                  before one trial request (default 30)
+- LANGUAGETOOL_PROBE_INTERVAL     seconds between readiness probes of a
+                                  server that is not ready (default 15)
+
+Requests go round-robin over pooled keep-alive connections (one httpx
+client per process).  A server only receives traffic once its readiness
+probe (GET /v2/languages) succeeds.  When every circuit is open, check()
+raises LanguageToolUnavailableError and GrammarChecker falls back to its
+pyspellchecker-based check.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class LanguageToolUnavailableError(Exception):
+    """Raised when no LanguageTool server can take the request."""
+
+
+@dataclass(frozen=True)
+class RemoteMatch:
+    """
+    One issue from the LanguageTool HTTP API.
+
+    Mirrors the attributes GrammarChecker reads from language_tool_python's
+    Match, so both backends share one result builder.
+    """
+    offset: int
+    errorLength: int
+    message: str
+    replacements: List[str]
+    ruleId: str
+    ruleIssueType: str
+    context: str = ''
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "RemoteMatch":
+        rule = data.get('rule') or {}
+        context = data.get('context') or {}
+        return cls(
+            offset=int(data.get('offset', 0)),
+            errorLength=int(data.get('length', 0)),
+            message=data.get('message', ''),
+            replacements=[r.get('value', '') for r in data.get('replacements') or []],
+            ruleId=rule.get('id', ''),
+            ruleIssueType=rule.get('issueType', ''),
+            context=context.get('text', ''),
+        )
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed    requests flow; ``failure_threshold`` failures in a row open it
+    open      requests are rejected for ``cooldown`` seconds
+    half_open one trial request; success closes, failure re-opens
+    """
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 30.0, clock=time.monotonic):
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if self._clock() - self.opened_at >= self.cooldown:
+            return 'half_open'
+        return 'open'
+
+    def allow(self) -> bool:
+        """True if a request may be sent now (claims the half-open trial)."""
+        with self._lock:
+            state = self._state()
+            if state == 'closed':
+                return True
+            if state == 'half_open' and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = self._clock()
+
+
+@dataclass
+class LanguageToolServer:
+    """One LanguageTool server and its health state."""
+    url: str
+    breaker: CircuitBreaker
+    ready: bool = False
+    last_probe: float = field(default=float('-inf'))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'url': self.url,
+            'ready': self.ready,
+            'circuit': self.breaker.state,
+            'consecutive_failures': self.breaker.failures,
+        }
+
+
+class LanguageToolPool:
+    """
+    Round-robin client for a set of LanguageTool HTTP servers.
+
+    Args:
+        servers: Base URLs, e.g. ["http://localhost:8010"]
+        timeout: Seconds per HTTP request (connect + read)
+        failure_threshold: Consecutive failures that open a server's circuit
+        cooldown: Seconds before an open circuit allows a trial request
+        probe_interval: Minimum seconds between readiness probes of a server
+        client: httpx.Client to use (default: a pooled keep-alive client)
+    """
+
+    def __init__(
+        self,
+        servers: Sequence[str],
+        timeout: float = 5.0,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        probe_interval: float = 15.0,
+        client: Any = None
+    ):
+        if not servers:
+            raise ValueError("LanguageToolPool needs at least one server URL")
+        self.timeout = timeout
+        self.probe_interval = probe_interval
+        self.servers = [
+            LanguageToolServer(url.rstrip('/'), CircuitBreaker(failure_threshold, cooldown))
+            for url in servers
+        ]
+        if client is None:
+            import httpx
+
+            client = httpx.Client(
+                timeout=timeout,
+                limits=httpx.Limits(max_connections=8 * len(self.servers), max_keepalive_connections=4 * len(self.servers)),
+            )
+        self._client = client
+        self._lock = threading.Lock()
+        self._next = 0
+        self.requests = 0
+        self.failures = 0
+        self.rejected = 0
+
+    def check(self, text: str, language: str = 'en-US') -> List[RemoteMatch]:
+        """
+        Check ``text`` on the next healthy server.
+
+        Raises:
+            LanguageToolUnavailableError: No server is ready or every attempt failed
+        """
+        last_error: Optional[Exception] = None
+        for server in self._rotation():
+            if not server.breaker.allow():
+                continue
+            if not self._is_ready(server):
+                server.breaker.record_failure()
+                continue
+            try:
+                response = self._client.post(
+                    f"{server.url}/v2/check",
+                    data={'text': text, 'language': language},
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+                matches = [RemoteMatch.from_json(m) for m in response.json().get('matches', [])]
+            except Exception as e:
+                last_error = e
+                server.breaker.record_failure()
+                # Once the circuit opens, the server must pass a probe again
+                server.ready = server.breaker.state == 'closed'
+                with self._lock:
+                    self.failures += 1
+                logger.warning("LanguageTool server %s failed: %s", server.url, e)
+                continue
+            server.breaker.record_success()
+            with self._lock:
+                self.requests += 1
+            return matches
+
+        with self._lock:
+            self.rejected += 1
+        raise LanguageToolUnavailableError(
+            f"No LanguageTool server available ({last_error or 'all circuits open or not ready'})"
+        )
+
+    def available(self) -> bool:
+        """True if at least one server's circuit is not open."""
+        return any(server.breaker.state != 'open' for server in self.servers)
+
+    def probe(self, server: LanguageToolServer) -> bool:
+        """Readiness probe: GET /v2/languages answers 200 once the server is up."""
+        server.last_probe = time.monotonic()
+        try:
+            response = self._client.get(f"{server.url}/v2/languages", timeout=self.timeout)
+            server.ready = response.status_code == 200
+        except Exception as e:
+            logger.info("LanguageTool server %s not ready: %s", server.url, e)
+            server.ready = False
+        return server.ready
+
+    def _is_ready(self, server: LanguageToolServer) -> bool:
+        if server.ready:
+            return True
+        if time.monotonic() - server.last_probe < self.probe_interval:
+            return False
+        return self.probe(server)
+
+    def _rotation(self) -> List[LanguageToolServer]:
+        with self._lock:
+            start = self._next
+            self._next = (self._next + 1) % len(self.servers)
+        return self.servers[start:] + self.servers[:start]
+
+    def status(self) -> Dict[str, Any]:
+        """Health summary for /health (does not probe)."""
+        with self._lock:
+            counters = {'requests': self.requests, 'failures': self.failures, 'rejected': self.rejected}
+        return {
+            'available': self.available(),
+            'servers': [server.to_dict() for server in self.servers],
+            **counters,
+        }
+
+    def close(self) -> None:
+        try:
+            self._client.close()
+        except Exception:
+            pass
+
+
+def configured_servers() -> List[str]:
+    """Server URLs from LANGUAGETOOL_SERVERS (empty when unset)."""
+    return [url.strip() for url in os.getenv("LANGUAGETOOL_SERVERS", "").split(',') if url.strip()]
+
+
+# Global pool instance
+_pool: Optional[LanguageToolPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_languagetool_pool() -> Optional[LanguageToolPool]:
+    """Get or create the shared pool; None when LANGUAGETOOL_SERVERS is unset."""
+    global _pool
+    if _pool is None:
+        servers = configured_servers()
+        if not servers:
+            return None
+        with _pool_lock:
+            if _pool is None:
+                _pool = LanguageToolPool(
+                    servers,
+                    timeout=float(os.getenv("LANGUAGETOOL_TIMEOUT", "5")),
+                    failure_threshold=int(os.getenv("LANGUAGETOOL_FAILURE_THRESHOLD", "3")),
+                    cooldown=float(os.getenv("LANGUAGETOOL_COOLDOWN", "30")),
+                    probe_interval=float(os.getenv("LANGUAGETOOL_PROBE_INTERVAL", "15")),
+                )
+    return _pool
+
+
+def shutdown_languagetool_pool() -> None:
+    """Close pooled connections (called at app shutdown)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+        _pool = None
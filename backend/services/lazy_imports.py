@@ -0,0 +1,50 @@
+"""
+Lazy Imports - shims that defer heavy optional stacks to first use.
+
+Routers are imported when the app starts, so every module-level import in
+them is paid on every cold start, including stacks that most requests never
+touch (pdf2docx + OpenCV for PDF -> DOCX, mammoth, reportlab, the LaTeX
+converter).  A router binds such a function through lazy_callable() instead:
+
+    convert_pdf_to_docx = lazy_callable("backend.services.pdf_to_docx", "convert_pdf_to_docx")
+
+The module is imported on the first call and the real function is used from
+then on.  lazy_status() reports which deferred modules have been loaded, and
+the startup profile (services/startup_profile.py) lists them.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict
+
+# Deferred module -> names bound through lazy_callable()
+_registered: Dict[str, set] = {}
+
+
+def lazy_callable(module: str, name: str) -> Callable[..., Any]:
+    """
+    Return a function that imports ``module`` on first call and calls ``module.name``.
+
+    Args:
+        module: Dotted module path
+        name: Callable attribute of that module
+    """
+    _registered.setdefault(module, set()).add(name)
+    target = None
+
+    def shim(*args, **kwargs):
+        nonlocal target
+        if target is None:
+            # Imports are serialized by the import lock; a racing first call
+            # just resolves the same attribute twice
+            target = getattr(importlib.import_module(module), name)
+        return target(*args, **kwargs)
+
+    shim.__name__ = shim.__qualname__ = name
+    shim.__doc__ = f"Lazy shim for {module}.{name} (imported on first call)."
+    return shim
+
+
+def lazy_status() -> Dict[str, bool]:
+    """Deferred module -> whether it has been imported yet."""
+    return {module: module in sys.modules for module in sorted(_registered)}
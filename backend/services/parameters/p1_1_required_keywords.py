@@ -105,7 +105,8 @@ class RequiredKeywordsMatcher:
             }
 
         # Use hybrid matcher to get individual keyword scores
-        match_results = self.hybrid_matcher.match_keywords(keywords, resume_text)
+        match_evidence = self.hybrid_matcher.match_keywords_with_evidence(keywords, resume_text)
+        match_results = {kw: match['score'] for kw, match in match_evidence.items()}
 
         # Separate matched from unmatched based on threshold
         matched = []
@@ -141,6 +142,7 @@ class RequiredKeywordsMatcher:
             'matched_keywords': matched,
             'unmatched_keywords': unmatched,
             'match_details': match_results,
+            'match_evidence': {kw: match_evidence[kw]['evidence'] for kw in matched},
             'points_per_keyword': round(points_per_keyword, 2),
             'scoring_formula': f'{matched_count} matched × {round(points_per_keyword, 2)} pts = {score} pts (capped at {self.MAX_SCORE})'
         }
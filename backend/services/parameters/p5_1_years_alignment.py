@@ -30,6 +30,8 @@ from datetime import datetime
 import re
 import logging
 
+from backend.services.date_normalizer import is_present, normalize_date
+
 logger = logging.getLogger(__name__)
 
 
@@ -142,6 +144,13 @@ class YearsAlignmentScorer:
         current_month = datetime.now().month
 
         for entry in experience:
+            if entry.get('start_month') and entry.get('end_month'):
+                # Months precomputed by the adapter; dates its strict parser
+                # rejects ("Summer 2019", "Q1 2008") fall through to the loose
+                # parsing below
+                total_years += self._years_between(entry['start_month'], entry['end_month'])
+                continue
+
             dates = entry.get('dates', '')
             if not dates:
                 continue
@@ -189,7 +198,7 @@ class YearsAlignmentScorer:
                 return 0.0
 
             # Parse end date
-            if end_str.lower() in ['present', 'current', 'now']:
+            if is_present(end_str):
                 end_year = current_year
                 end_month = current_month
             else:
@@ -206,6 +215,13 @@ class YearsAlignmentScorer:
             logger.warning(f"Error parsing date range '{dates}': {e}")
             return 0.0
 
+    def _years_between(self, start_month, end_month) -> float:
+        """Years from start to end (year, month) pairs; 0.0 if either is missing."""
+        if not start_month or not end_month:
+            return 0.0
+        years = (end_month[0] - start_month[0]) + (end_month[1] - start_month[1]) / 12.0
+        return max(0.0, years)
+
     def _parse_date(self, date_str: str) -> tuple:
         """
         Parse a date string to extract year and month.
@@ -216,39 +232,8 @@ class YearsAlignmentScorer:
         Returns:
             Tuple of (year, month) or (None, None) if parsing fails
         """
-        date_str = date_str.strip()
-
-        # Month name mappings
-        months = {
-            'january': 1, 'jan': 1,
-            'february': 2, 'feb': 2,
-            'march': 3, 'mar': 3,
-            'april': 4, 'apr': 4,
-            'may': 5,
-            'june': 6, 'jun': 6,
-            'july': 7, 'jul': 7,
-            'august': 8, 'aug': 8,
-            'september': 9, 'sep': 9, 'sept': 9,
-            'october': 10, 'oct': 10,
-            'november': 11, 'nov': 11,
-            'december': 12, 'dec': 12
-        }
-
-        # Try to extract year (4 digits)
-        year_match = re.search(r'\b(19|20)\d{2}\b', date_str)
-        if not year_match:
-            return (None, None)
-
-        year = int(year_match.group(0))
-
-        # Try to extract month
-        month = 1  # Default to January if no month specified
-        for month_name, month_num in months.items():
-            if month_name in date_str.lower():
-                month = month_num
-                break
-
-        return (year, month)
+        # Month defaults to January when only a year is given
+        return normalize_date(date_str, loose=True) or (None, None)
 
     def _check_alignment(self, years: float, expected_range: tuple, level: str) -> Dict:
         """
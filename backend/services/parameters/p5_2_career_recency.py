@@ -18,9 +18,10 @@ Research basis:
 
 import re
 from datetime import datetime
-from dateutil import parser
 from typing import List, Dict, Any, Optional
 
+from backend.services.date_normalizer import is_present, month_to_datetime, parse_date
+
 
 class CareerRecencyScorer:
     """Scores resume based on recency of most recent employment."""
@@ -49,38 +50,7 @@ class CareerRecencyScorer:
         Returns:
             datetime object or None if unparseable
         """
-        if not date_str:
-            return None
-
-        date_str = str(date_str).strip()
-
-        # Handle "Present", "Current", "Now", "ongoing"
-        if date_str.lower() in ['present', 'current', 'now', 'ongoing']:
-            return datetime.now()
-
-        try:
-            # Try parsing with dateutil (handles many formats)
-            return parser.parse(date_str, default=datetime(datetime.now().year, 1, 1))
-        except:
-            # Try manual parsing for YYYY-MM format
-            match = re.match(r'(\d{4})-(\d{2})', date_str)
-            if match:
-                year, month = match.groups()
-                return datetime(int(year), int(month), 1)
-
-            # Try MM/YYYY format
-            match = re.match(r'(\d{2})/(\d{4})', date_str)
-            if match:
-                month, year = match.groups()
-                return datetime(int(year), int(month), 1)
-
-            # Try YYYY only
-            match = re.match(r'(\d{4})$', date_str)
-            if match:
-                year = match.group(1)
-                return datetime(int(year), 1, 1)
-
-            return None
+        return parse_date(date_str)
 
     def _extract_dates_from_range(self, date_range: str) -> tuple[Optional[str], Optional[str]]:
         """
@@ -174,8 +144,7 @@ class CareerRecencyScorer:
         if not end_date_str:
             return False
 
-        end_str_lower = end_date_str.strip().lower()
-        return end_str_lower in ['present', 'current', 'now', 'ongoing']
+        return is_present(end_date_str)
 
     def _get_recency_score(self, months_since: int, is_current: bool) -> tuple[int, str]:
         """
@@ -223,24 +192,32 @@ class CareerRecencyScorer:
         is_currently_employed = False
 
         for job in experience:
-            dates = job.get('dates')
-            if not dates:
-                continue
-
-            start_str, end_str = self._extract_dates_from_range(dates)
+            if 'end_month' in job:
+                # Months precomputed by the adapter
+                end_str = job.get('end_date') or job.get('endDate') or ''
+                is_current = bool(job.get('is_current'))
+            else:
+                dates = job.get('dates')
+                if not dates:
+                    continue
+                start_str, end_str = self._extract_dates_from_range(dates)
+                is_current = self._is_currently_employed(end_str)
 
             if not end_str:
                 continue
 
             # Check if currently employed
-            if self._is_currently_employed(end_str):
+            if is_current:
                 is_currently_employed = True
                 most_recent_end = datetime.now()
                 most_recent_end_str = end_str
                 break  # Current employment trumps all
 
             # Parse end date
-            end_date = self._parse_date(end_str)
+            if 'end_month' in job:
+                end_date = month_to_datetime(job['end_month'])
+            else:
+                end_date = self._parse_date(end_str)
 
             if end_date:
                 if most_recent_end is None or end_date > most_recent_end:
@@ -16,6 +16,7 @@ Advanced Parameters (metadata, no points):
 - Readability: P7.1-P7.3
 """
 
+import time
 from typing import Dict, Optional, Any
 
 
@@ -38,6 +39,9 @@ class ParameterRegistry:
 
     def _initialize_registry(self):
         """Initialize the parameter registry with all scorers."""
+        # Seconds spent constructing each scorer (populated by create_scorer)
+        self._init_costs: Dict[str, float] = {}
+
         # Import all scorer classes - Core Parameters (P1-P4)
         from backend.services.parameters.p1_1_required_keywords import RequiredKeywordsMatcher
         from backend.services.parameters.p1_2_preferred_keywords import PreferredKeywordsMatcher
@@ -263,6 +267,35 @@ class ParameterRegistry:
         """
         return self._parameters.get(code)
 
+    def create_scorer(self, code: str) -> Any:
+        """
+        Instantiate the scorer class for a parameter and record its init cost.
+
+        Args:
+            code: Parameter code (e.g., 'P1.1')
+
+        Returns:
+            New scorer instance
+
+        Raises:
+            KeyError: If the parameter code is not registered
+        """
+        scorer_class = self._parameters[code]['scorer_class']
+        start = time.perf_counter()
+        scorer = scorer_class()
+        self._init_costs[code] = time.perf_counter() - start
+        return scorer
+
+    def get_init_costs(self) -> Dict[str, float]:
+        """
+        Get the most recent construction time per parameter.
+
+        Returns:
+            Dictionary mapping parameter codes to init time in seconds
+            (only parameters that have been instantiated via create_scorer)
+        """
+        return dict(self._init_costs)
+
     def get_max_score(self) -> int:
         """
         Get total maximum score across all parameters.
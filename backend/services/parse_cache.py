@@ -0,0 +1,100 @@
+"""
+Parse Cache - content-addressed cache of upload parse results.
+
+Users re-upload the same resume many times.  Each upload used to re-run the
+full PDF extractor cascade or parse_docx, plus HTML conversion and section
+detection.  Results are keyed by SHA-256 of (PARSER_VERSION, file bytes), so
+identical bytes return the stored ResumeData, editable HTML and detected
+sections in milliseconds.
+
+Two tiers:
+- In-memory LRU per worker (PARSE_CACHE_MAX_ENTRIES, default 64)
+- diskcache via cache_utils.get_cache(), shared across workers and restarts
+  (PARSE_CACHE_EXPIRE seconds, default 7 days; disabled if diskcache is
+  not installed)
+
+Bump PARSER_VERSION whenever parser, HTML converter or section detector
+output changes so stale entries stop matching.
+"""
+
+import copy
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from backend.services.cache_utils import TwoTierCache, stable_digest
+from backend.services.parser import ResumeData
+
+# Part of every cache key; bump when parse output changes
+PARSER_VERSION = "3"
+
+_KEY_PREFIX = "parse"
+
+
+@dataclass
+class ParsedUpload:
+    """Cached result of parsing one uploaded file."""
+    resume_data: ResumeData
+    editable_html: Optional[str] = None
+    sections: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class ParseCache(TwoTierCache):
+    """
+    Two-tier (memory LRU + disk) cache of ParsedUpload keyed by file hash.
+
+    Returned values are deep copies, so callers may mutate them freely.
+    """
+
+    label = "Parse"
+    env_prefix = "PARSE_CACHE"
+    default_max_entries = 64
+    default_expire = 7 * 24 * 3600
+
+    @staticmethod
+    def key_for(file_content: bytes) -> str:
+        """Content-addressed key for the given file bytes."""
+        return f"{_KEY_PREFIX}:{PARSER_VERSION}:{stable_digest(PARSER_VERSION, file_content)}"
+
+    def get(self, key: str) -> Optional[ParsedUpload]:
+        """Look up a parse result (memory first, then disk)."""
+        entry = self._get(key)
+        return _copy_upload(entry) if entry is not None else None
+
+    def set(self, key: str, value: ParsedUpload) -> None:
+        """Store a parse result in both tiers."""
+        self._set(key, _copy_upload(value))
+
+    def _to_disk(self, entry: ParsedUpload) -> Dict[str, Any]:
+        # Store plain data, not pickled model classes, so entries survive
+        # pydantic/model refactors as long as PARSER_VERSION matches
+        return {
+            'resume_data': entry.resume_data.model_dump(),
+            'editable_html': entry.editable_html,
+            'sections': entry.sections,
+        }
+
+    def _from_disk(self, payload: Dict[str, Any]) -> ParsedUpload:
+        return ParsedUpload(
+            resume_data=ResumeData(**payload['resume_data']),
+            editable_html=payload.get('editable_html'),
+            sections=payload.get('sections', []),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss statistics for both tiers."""
+        stats = super().stats()
+        stats['parser_version'] = PARSER_VERSION
+        return stats
+
+
+def _copy_upload(value: ParsedUpload) -> ParsedUpload:
+    return ParsedUpload(
+        resume_data=value.resume_data.model_copy(deep=True),
+        editable_html=value.editable_html,
+        sections=copy.deepcopy(value.sections),
+    )
+
+
+def get_parse_cache() -> ParseCache:
+    """Get or create the shared parse cache."""
+    return ParseCache.shared()
@@ -0,0 +1,185 @@
+"""
+Single-parse DOCX document model.
+
+A DOCX upload used to be deserialized by python-docx once per consumer
+(parse_docx, docx_to_html_advanced, SectionDetector.detect).  ParsedDocx
+opens the package once and exposes everything those consumers read:
+
+- body blocks (paragraphs and tables) in document order
+- top-level paragraphs with their doc.paragraphs index, style name, plain
+  text, hyperlink-aware full text and run formatting
+- tables with cell text per row
+- the original bytes (for template storage)
+
+Consumers accept either raw bytes or a ParsedDocx (see ParsedDocx.coerce),
+so callers that only have bytes keep working.
+"""
+
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import Any, List, Optional, Union
+
+from docx import Document
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_W_R = '{%s}r' % W_NS
+_W_T = '{%s}t' % W_NS
+_W_BR = '{%s}br' % W_NS
+_W_HYPERLINK = '{%s}hyperlink' % W_NS
+
+
+def para_full_text(para_element) -> str:
+    """
+    Return the full text of a paragraph element, including text that is nested
+    inside <w:hyperlink> child elements.  python-docx's Paragraph.text only
+    walks direct <w:r> children and silently drops runs that live inside
+    hyperlinks, causing email addresses (which Word stores as mailto hyperlinks)
+    to be invisible to the normal para.text property.
+
+    This function replicates what python-docx does for normal runs (including
+    the \\n emitted for <w:br> line-breaks) but also descends into <w:hyperlink>
+    elements so that hyperlinked text (e.g. a mailto: email address) is included.
+    """
+    parts = []
+
+    def _collect_run(run_el):
+        """Collect text from a single <w:r> element, emitting \\n for <w:br>.
+        Also descends into any <w:hyperlink> that is a child of this run,
+        because Word occasionally nests the hyperlink element inside <w:r>.
+        """
+        for child in run_el:
+            if child.tag == _W_T:
+                if child.text:
+                    parts.append(child.text)
+            elif child.tag == _W_BR:
+                parts.append('\n')
+            elif child.tag == _W_HYPERLINK:
+                # Hyperlink nested inside a run — collect all its runs too
+                for grandchild in child:
+                    if grandchild.tag == _W_R:
+                        _collect_run(grandchild)
+
+    for child in para_element:
+        if child.tag == _W_R:
+            _collect_run(child)
+        elif child.tag == _W_HYPERLINK:
+            # Hyperlink as a direct child of the paragraph
+            for grandchild in child:
+                if grandchild.tag == _W_R:
+                    _collect_run(grandchild)
+
+    return ''.join(parts)
+
+
+@dataclass
+class ParsedRun:
+    """Formatting of a single run (direct formatting only)."""
+    text: str
+    bold: Optional[bool]
+    font_size_pt: Optional[float]
+
+
+def parse_run(run) -> ParsedRun:
+    """Snapshot a python-docx Run's text and direct formatting."""
+    size = None
+    try:
+        if run.font.size is not None:
+            size = run.font.size.pt
+    except (AttributeError, TypeError):
+        size = None
+    return ParsedRun(text=run.text, bold=run.bold, font_size_pt=size)
+
+
+@dataclass
+class ParsedParagraph:
+    """
+    Top-level body paragraph.
+
+    Attributes:
+        index: Position in doc.paragraphs (used for section/template edits)
+        text: python-docx Paragraph.text (direct runs only)
+        full_text: Hyperlink-aware text (see para_full_text)
+        style_name: Paragraph style name ('' if unstyled)
+        runs: Direct runs with formatting
+        element: Underlying <w:p> element
+    """
+    index: int
+    text: str
+    full_text: str
+    style_name: str
+    runs: List[ParsedRun]
+    element: Any = field(repr=False)
+
+
+@dataclass
+class ParsedTable:
+    """Top-level body table with stripped cell text per row."""
+    rows: List[List[str]]
+    element: Any = field(repr=False)
+
+
+class ParsedDocx:
+    """
+    DOCX package parsed once and shared by all consumers.
+
+    Attributes:
+        raw_bytes: Original DOCX bytes
+        document: python-docx Document (for consumers needing the XML tree)
+        paragraphs: Top-level paragraphs in doc.paragraphs order
+        tables: Top-level tables in document order
+        blocks: Paragraphs and tables interleaved in body order
+        section_count: Number of document sections (page-count proxy)
+    """
+
+    def __init__(self, raw_bytes: bytes, document):
+        self.raw_bytes = raw_bytes
+        self.document = document
+        self.paragraphs: List[ParsedParagraph] = []
+        self.tables: List[ParsedTable] = []
+        self.blocks: List[Union[ParsedParagraph, ParsedTable]] = []
+        self.section_count = len(document.sections)
+        self._index_body()
+
+    @classmethod
+    def from_bytes(cls, docx_bytes: bytes) -> 'ParsedDocx':
+        """Parse DOCX bytes (raises the python-docx error on invalid input)."""
+        return cls(docx_bytes, Document(BytesIO(docx_bytes)))
+
+    @classmethod
+    def coerce(cls, source: Union[bytes, 'ParsedDocx']) -> 'ParsedDocx':
+        """Return ``source`` unchanged if already parsed, else parse the bytes."""
+        if isinstance(source, ParsedDocx):
+            return source
+        return cls.from_bytes(source)
+
+    def _index_body(self) -> None:
+        """Walk the body once, matching elements to python-docx objects by identity."""
+        doc = self.document
+        para_by_element = {id(p._element): (i, p) for i, p in enumerate(doc.paragraphs)}
+        table_by_element = {id(t._element): t for t in doc.tables}
+
+        for element in doc.element.body:
+            if element.tag.endswith('p'):
+                match = para_by_element.get(id(element))
+                if match is None:
+                    continue
+                idx, para = match
+                parsed = ParsedParagraph(
+                    index=idx,
+                    text=para.text,
+                    full_text=para_full_text(element),
+                    style_name=para.style.name if para.style is not None else '',
+                    runs=[parse_run(run) for run in para.runs],
+                    element=element,
+                )
+                self.paragraphs.append(parsed)
+                self.blocks.append(parsed)
+
+            elif element.tag.endswith('tbl'):
+                table = table_by_element.get(id(element))
+                if table is None:
+                    continue
+                rows = [[cell.text.strip() for cell in row.cells] for row in table.rows]
+                parsed_table = ParsedTable(rows=rows, element=element)
+                self.tables.append(parsed_table)
+                self.blocks.append(parsed_table)
@@ -4,13 +4,15 @@ PDF and DOCX parser service for extracting structured data from resumes.
 import re
 import io
 import logging
-from io import BytesIO
-from typing import Dict, List, Optional
+import time
+from typing import Dict, List, Optional, Tuple, Union
 from pydantic import BaseModel, Field
 import fitz  # PyMuPDF
 import pypdf
-import pdfplumber
-from docx import Document
+from backend.services.parsed_docx import ParsedDocx, ParsedParagraph
+from backend.services.pdf_layout_probe import LayoutProbe, probe_pdf_layout
+from backend.services.pdf_page_extractor import extract_pdfplumber_pages, extract_pymupdf_pages, page_limit
+from backend.services.section_headers import PARSER_SECTIONS, get_section_header_classifier
 
 logger = logging.getLogger(__name__)
 
@@ -462,29 +464,36 @@ def is_likely_section_header(line: str) -> bool:
     - Don't contain many commas or periods
     - Don't start with bullets or numbers
     """
-    line_stripped = line.strip()
-
-    # Too long to be a header
-    if len(line_stripped) > 80:
-        return False
-
-    # Starts with bullet or number (likely a list item, not a header)
-    if line_stripped and line_stripped[0] in ['•', '-', '*', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0']:
-        return False
-
-    # Has lots of punctuation (likely a sentence, not a header)
-    comma_count = line_stripped.count(',')
-    period_count = line_stripped.count('.')
-    if comma_count > 2 or period_count > 1:
-        return False
-
-    return True
+    return get_section_header_classifier().looks_like_header(line)
+
+
+def _flush_section(sections: Dict[str, List], section: Optional[str], content: List[str]) -> None:
+    """Parse the collected lines of ``section`` into its structured entries."""
+    if not section or not content:
+        return
+    content_text = '\n'.join(content)
+    if section == 'experience':
+        for exp_chunk in split_experience_entries(content_text):
+            sections[section].append(parse_experience_entry(exp_chunk))
+    elif section == 'education':
+        # Split multiple education entries by blank lines or degree patterns
+        for edu_text in split_education_entries(content_text):
+            if edu_text.strip():
+                sections[section].append(parse_education_entry(edu_text))
+    elif section == 'certifications':
+        sections[section].append({'name': content_text})
+    else:
+        # Skills (split below) and summary keep the raw text
+        sections[section].append(content_text)
 
 
 def extract_resume_sections(text: str) -> Dict[str, List]:
     """
     Extract structured sections from resume text.
 
+    Section headers are recognized by the shared SectionHeaderClassifier
+    (see section_headers), restricted to the sections returned here.
+
     Args:
         text: Full resume text
 
@@ -507,139 +516,23 @@ def extract_resume_sections(text: str) -> Dict[str, List]:
     lines = text.split('\n')
     current_section = None
     current_content = []
-
-    # Section headers to detect (expanded to recognize alternate names)
-    summary_headers = [
-        'summary', 'objective', 'about', 'profile', 'brief',
-        'professional summary', 'career summary', 'executive summary',
-        'profile brief', 'professional profile', 'career profile',
-        'about me', 'career objective', 'professional objective',
-        'personal statement', 'introduction', 'overview'
-    ]
-    experience_headers = ['experience', 'work history', 'employment', 'professional experience', 'work experience']
-    education_headers = ['education', 'academic background', 'qualifications', 'academic']
-    skills_headers = ['skills', 'technical skills', 'core competencies', 'expertise', 'technologies',
-                      'additional information', 'additional', 'other information', 'technical competencies',
-                      'technical expertise', 'tools', 'tools and technologies', 'key skills']
-    cert_headers = ['certifications', 'certificates', 'licenses', 'professional certifications']
+    classifier = get_section_header_classifier()
 
     # Debug: Log all section headers found
     logger.info(f"Scanning {len(lines)} lines for resume sections")
 
     for line in lines:
-        line_lower = line.lower().strip()
-
-        # Detect section headers
-        # IMPORTANT: Check more specific headers FIRST (e.g., "experience summary" should match "experience" not "summary")
-        # Only match if the line is likely to be a header (not body text)
-
-        # Check experience BEFORE summary (because "EXPERIENCE SUMMARY" should be experience, not summary)
-        if is_likely_section_header(line) and any(header in line_lower for header in experience_headers):
-            if current_section and current_content:
-                content_text = '\n'.join(current_content)
-                if current_section == 'experience':
-                    for exp_chunk in split_experience_entries(content_text):
-                        sections[current_section].append(parse_experience_entry(exp_chunk))
-                elif current_section == 'education':
-                    sections[current_section].append(parse_education_entry(content_text))
-                elif current_section == 'skills':
-                    sections[current_section].append(content_text)
-                elif current_section == 'certifications':
-                    sections[current_section].append({'name': content_text})
-                elif current_section == 'summary':
-                    sections[current_section].append(content_text)
-            current_section = 'experience'
-            current_content = []
-        elif is_likely_section_header(line) and any(header in line_lower for header in education_headers):
-            if current_section and current_content:
-                content_text = '\n'.join(current_content)
-                if current_section == 'experience':
-                    for exp_chunk in split_experience_entries(content_text):
-                        sections[current_section].append(parse_experience_entry(exp_chunk))
-                elif current_section == 'education':
-                    sections[current_section].append(parse_education_entry(content_text))
-                elif current_section == 'skills':
-                    sections[current_section].append(content_text)
-                elif current_section == 'certifications':
-                    sections[current_section].append({'name': content_text})
-                elif current_section == 'summary':
-                    sections[current_section].append(content_text)
-            current_section = 'education'
-            current_content = []
-        elif is_likely_section_header(line) and any(header in line_lower for header in skills_headers):
-            logger.info(f"Found skills header: '{line}' (matched: {[h for h in skills_headers if h in line_lower]})")
-            if current_section and current_content:
-                content_text = '\n'.join(current_content)
-                if current_section == 'experience':
-                    for exp_chunk in split_experience_entries(content_text):
-                        sections[current_section].append(parse_experience_entry(exp_chunk))
-                elif current_section == 'education':
-                    sections[current_section].append(parse_education_entry(content_text))
-                elif current_section == 'skills':
-                    sections[current_section].append(content_text)
-                elif current_section == 'certifications':
-                    sections[current_section].append({'name': content_text})
-                elif current_section == 'summary':
-                    sections[current_section].append(content_text)
-            current_section = 'skills'
-            current_content = []
-        elif is_likely_section_header(line) and any(header in line_lower for header in cert_headers):
-            if current_section and current_content:
-                content_text = '\n'.join(current_content)
-                if current_section == 'experience':
-                    for exp_chunk in split_experience_entries(content_text):
-                        sections[current_section].append(parse_experience_entry(exp_chunk))
-                elif current_section == 'education':
-                    sections[current_section].append(parse_education_entry(content_text))
-                elif current_section == 'skills':
-                    # Add skills content before switching sections
-                    sections[current_section].append(content_text)
-                elif current_section == 'certifications':
-                    sections[current_section].append({'name': content_text})
-                elif current_section == 'summary':
-                    sections[current_section].append(content_text)
-            current_section = 'certifications'
-            current_content = []
-        # Check summary LAST (lowest priority, so "EXPERIENCE SUMMARY" doesn't match here)
-        elif is_likely_section_header(line) and any(header in line_lower for header in summary_headers):
-            if current_section and current_content:
-                content_text = '\n'.join(current_content)
-                if current_section == 'experience':
-                    for exp_chunk in split_experience_entries(content_text):
-                        sections[current_section].append(parse_experience_entry(exp_chunk))
-                elif current_section == 'education':
-                    sections[current_section].append(parse_education_entry(content_text))
-                elif current_section == 'skills':
-                    sections[current_section].append(content_text)
-                elif current_section == 'certifications':
-                    sections[current_section].append({'name': content_text})
-                elif current_section == 'summary':
-                    sections[current_section].append(content_text)
-            current_section = 'summary'
+        header = classifier.classify(line, PARSER_SECTIONS)
+        if header:
+            logger.debug(f"Found {header} header: '{line.strip()}'")
+            _flush_section(sections, current_section, current_content)
+            current_section = header
             current_content = []
         elif current_section and line.strip():
             current_content.append(line.strip())
 
     # Add last section
-    if current_section and current_content:
-        content_text = '\n'.join(current_content)
-        if current_section == 'experience':
-            for exp_chunk in split_experience_entries(content_text):
-                sections[current_section].append(parse_experience_entry(exp_chunk))
-        elif current_section == 'education':
-            # Split multiple education entries by blank lines or degree patterns
-            edu_entries = split_education_entries(content_text)
-            for edu_text in edu_entries:
-                if edu_text.strip():
-                    sections[current_section].append(parse_education_entry(edu_text))
-        elif current_section == 'skills':
-            # For skills, just add the raw text to be processed below
-            logger.info(f"Adding skills content: {content_text[:200]}...")
-            sections[current_section].append(content_text)
-        elif current_section == 'certifications':
-            sections[current_section].append({'name': content_text})
-        elif current_section == 'summary':
-            sections[current_section].append(content_text)
+    _flush_section(sections, current_section, current_content)
 
     # Special handling for skills - split by commas/bullets (keep as strings)
     logger.info(f"Skills section raw data: {sections['skills']}")
@@ -657,6 +550,89 @@ def extract_resume_sections(text: str) -> Dict[str, List]:
     return sections
 
 
+def _empty_pdf_result(filename: str) -> ResumeData:
+    """Minimal result when no extractor could read the PDF."""
+    return ResumeData(
+        fileName=filename,
+        contact={},
+        experience=[],
+        education=[],
+        skills=[],
+        metadata={"pageCount": 0, "wordCount": 0, "hasPhoto": False, "fileFormat": "pdf"}
+    )
+
+
+def _build_pdf_resume_data(
+    full_text: str,
+    page_count: int,
+    filename: str,
+    include_location: bool = True
+) -> ResumeData:
+    """Build ResumeData from text extracted from a PDF."""
+    sections = extract_resume_sections(full_text)
+
+    # Extract contact info - search full text for multi-column layouts
+    # (email/phone might be in right column, not in first 500 chars)
+    contact_info = {
+        "name": extract_name_from_header(full_text),
+        "email": extract_email(full_text),
+        "phone": extract_phone(full_text),
+        "linkedin": extract_linkedin(full_text)
+    }
+    if include_location:
+        contact_info["location"] = extract_location(full_text[:1000])  # Location usually in header
+
+    metadata = {
+        "pageCount": page_count,
+        "wordCount": len(full_text.split()),
+        "hasPhoto": False,
+        "fileFormat": "pdf"
+    }
+
+    # Extract summary (join all summary sections)
+    summary_list = sections.get('summary', [])
+    summary = ' '.join(summary_list) if summary_list else None
+
+    return ResumeData(
+        fileName=filename,
+        contact=contact_info,
+        summary=summary,
+        experience=sections.get('experience', []),
+        education=sections.get('education', []),
+        skills=sections.get('skills', []),
+        certifications=sections.get('certifications', []),
+        metadata=metadata
+    )
+
+
+def _extract_text_pypdf(file_content: bytes) -> Tuple[str, int]:
+    """Extract (text, page count) with pypdf (first page_limit() pages)."""
+    reader = pypdf.PdfReader(io.BytesIO(file_content))
+    page_count = len(reader.pages)
+    parts = [
+        (reader.pages[i].extract_text() or "") + "\n"
+        for i in range(page_limit(page_count))
+    ]
+    return "".join(parts), page_count
+
+
+def _extract_text_pdfplumber(file_content: bytes) -> Tuple[str, int]:
+    """Extract (text, page count) with pdfplumber, including table cells."""
+    pages, page_count = extract_pdfplumber_pages(file_content)
+    return "\n".join(page for page in pages if page), page_count
+
+
+def _extract_text_pymupdf(file_content: bytes, doc, probe: LayoutProbe, columns: bool) -> Tuple[str, int]:
+    """
+    Extract (text, page count) with PyMuPDF.
+
+    With ``columns``, pages the probe found to have a gutter are read column
+    by column instead of in content-stream order.
+    """
+    gutters = {page.page_number: page.gutter for page in probe.pages} if columns else {}
+    return "".join(extract_pymupdf_pages(file_content, doc, gutters)), len(doc)
+
+
 def parse_pdf_with_pypdf(file_content: bytes, filename: str) -> ResumeData:
     """
     Parse PDF using pypdf library (fallback strategy).
@@ -669,66 +645,11 @@ def parse_pdf_with_pypdf(file_content: bytes, filename: str) -> ResumeData:
         ResumeData with extracted content
     """
     try:
-        reader = pypdf.PdfReader(io.BytesIO(file_content))
-
-        # Extract text from all pages
-        full_text = ""
-        for page in reader.pages:
-            full_text += page.extract_text() + "\n"
-
-        # Get metadata
-        page_count = len(reader.pages)
-        word_count = len(full_text.split())
-
-        # Extract sections
-        sections = extract_resume_sections(full_text)
-
-        # Extract contact info - search full text for multi-column layouts
-        # (email/phone might be in right column, not in first 500 chars)
-        name = extract_name_from_header(full_text)
-        email = extract_email(full_text)  # Search full text
-        phone = extract_phone(full_text)  # Search full text
-        linkedin = extract_linkedin(full_text)  # Search full text
-
-        contact_info = {
-            "name": name,
-            "email": email,
-            "phone": phone,
-            "linkedin": linkedin
-        }
-
-        metadata = {
-            "pageCount": page_count,
-            "wordCount": word_count,
-            "hasPhoto": False,
-            "fileFormat": "pdf"
-        }
-
-        # Extract summary (join all summary sections)
-        summary_list = sections.get('summary', [])
-        summary = ' '.join(summary_list) if summary_list else None
-
-        return ResumeData(
-            fileName=filename,
-            contact=contact_info,
-            summary=summary,
-            experience=sections.get('experience', []),
-            education=sections.get('education', []),
-            skills=sections.get('skills', []),
-            certifications=sections.get('certifications', []),
-            metadata=metadata
-        )
-
+        full_text, page_count = _extract_text_pypdf(file_content)
+        return _build_pdf_resume_data(full_text, page_count, filename, include_location=False)
     except Exception as e:
         # Return minimal result on failure
-        return ResumeData(
-            fileName=filename,
-            contact={},
-            experience=[],
-            education=[],
-            skills=[],
-            metadata={"pageCount": 0, "wordCount": 0, "hasPhoto": False, "fileFormat": "pdf"}
-        )
+        return _empty_pdf_result(filename)
 
 
 def parse_pdf_with_pdfplumber(file_content: bytes, filename: str) -> ResumeData:
@@ -743,80 +664,11 @@ def parse_pdf_with_pdfplumber(file_content: bytes, filename: str) -> ResumeData:
         ResumeData with extracted content
     """
     try:
-        with pdfplumber.open(io.BytesIO(file_content)) as pdf:
-            # Extract text from all pages
-            full_text_parts = []
-
-            for page in pdf.pages:
-                # Get regular text
-                page_text = page.extract_text()
-                if page_text:
-                    full_text_parts.append(page_text)
-
-                # Get table content (pdfplumber's specialty)
-                tables = page.extract_tables()
-                for table in tables:
-                    for row in table:
-                        if row:
-                            row_text = " | ".join([str(cell) for cell in row if cell])
-                            full_text_parts.append(row_text)
-
-            full_text = "\n".join(full_text_parts)
-
-            # Get metadata
-            page_count = len(pdf.pages)
-            word_count = len(full_text.split())
-
-            # Extract sections
-            sections = extract_resume_sections(full_text)
-
-            # Extract contact info
-            # Extract contact info - search full text for multi-column layouts
-            name = extract_name_from_header(full_text)
-            email = extract_email(full_text)
-            phone = extract_phone(full_text)
-            linkedin = extract_linkedin(full_text)
-
-            contact_info = {
-                "name": name,
-                "email": email,
-                "phone": phone,
-                "linkedin": linkedin,
-                "location": extract_location(full_text[:1000])  # Location usually in header
-            }
-
-            metadata = {
-                "pageCount": page_count,
-                "wordCount": word_count,
-                "hasPhoto": False,
-                "fileFormat": "pdf"
-            }
-
-            # Extract summary (join all summary sections)
-            summary_list = sections.get('summary', [])
-            summary = ' '.join(summary_list) if summary_list else None
-
-            return ResumeData(
-                fileName=filename,
-                contact=contact_info,
-                summary=summary,
-                experience=sections.get('experience', []),
-                education=sections.get('education', []),
-                skills=sections.get('skills', []),
-                certifications=sections.get('certifications', []),
-                metadata=metadata
-            )
-
+        full_text, page_count = _extract_text_pdfplumber(file_content)
+        return _build_pdf_resume_data(full_text, page_count, filename)
     except Exception as e:
         # Return minimal result on failure
-        return ResumeData(
-            fileName=filename,
-            contact={},
-            experience=[],
-            education=[],
-            skills=[],
-            metadata={"pageCount": 0, "wordCount": 0, "hasPhoto": False, "fileFormat": "pdf"}
-        )
+        return _empty_pdf_result(filename)
 
 
 def assess_parse_quality(resume: ResumeData, raw_text: str) -> float:
@@ -849,11 +701,24 @@ def assess_parse_quality(resume: ResumeData, raw_text: str) -> float:
     return score
 
 
+# Extractors tried, in this order, when the probed choice yields no text
+_PDF_EXTRACTORS = ("pymupdf", "pypdf", "pdfplumber")
+
+
 def parse_pdf(file_content: bytes, filename: str) -> ResumeData:
     """
-    Parse a PDF resume using multi-strategy approach.
+    Parse a PDF resume, choosing the extractor up front.
+
+    A layout probe (see pdf_layout_probe) reads PyMuPDF block geometry -
+    columns, table-like rows, text density - and picks PyMuPDF,
+    column-ordered PyMuPDF, pdfplumber or pypdf, so the document is
+    extracted and parsed once.  Only if the chosen extractor fails or finds
+    no text are the others tried.  The decision, its reasons and the
+    per-page features are recorded in metadata["parseStrategy"].
 
-    Tries PyMuPDF first, falls back to pypdf, then pdfplumber if needed.
+    Long documents are extracted page-parallel and only the first
+    PDF_MAX_PAGES pages are read (see pdf_page_extractor); a capped result
+    has metadata["truncated"] = True and metadata["pagesParsed"].
 
     Args:
         file_content: PDF file content as bytes
@@ -862,203 +727,96 @@ def parse_pdf(file_content: bytes, filename: str) -> ResumeData:
     Returns:
         ResumeData object with extracted information
     """
-    # Strategy 1: PyMuPDF (current implementation - fast and reliable)
+    start = time.perf_counter()
+    doc = None
     try:
         doc = fitz.open(stream=file_content, filetype="pdf")
-
-        # Extract text from all pages
-        full_text = ""
-        for page in doc:
-            full_text += page.get_text()
-
-        page_count = len(doc)
-        word_count = len(full_text.split())
-        doc.close()
-
-        # If extraction seems successful, continue with PyMuPDF
-        if word_count >= 50:  # Minimum threshold for valid extraction
-            # Debug: log first 1000 chars of extracted text
-            logger.info(f"PyMuPDF extracted {word_count} words from PDF")
-            logger.info(f"First 1000 chars: {full_text[:1000]}")
-
-            sections = extract_resume_sections(full_text)
-            logger.info(f"Sections extracted - Experience: {len(sections.get('experience', []))}, Education: {len(sections.get('education', []))}, Skills: {len(sections.get('skills', []))}")
-            logger.info(f"Education entries: {sections.get('education', [])}")
-            logger.info(f"Skills entries: {sections.get('skills', [])}")
-
-            # Debug: Check if skills section exists in text
-            text_lower = full_text.lower()
-            skills_found = 'skills' in text_lower or 'technical' in text_lower or 'competencies' in text_lower
-            logger.info(f"Skills keywords in text: {skills_found}")
-
-            # Extract contact info - search full text for multi-column layouts
-            name = extract_name_from_header(full_text)
-            email = extract_email(full_text)
-            phone = extract_phone(full_text)
-            linkedin = extract_linkedin(full_text)
-
-            contact_info = {
-                "name": name,
-                "email": email,
-                "phone": phone,
-                "linkedin": linkedin,
-                "location": extract_location(full_text[:1000])  # Location usually in header
-            }
-
-            metadata = {
-                "pageCount": page_count,
-                "wordCount": word_count,
-                "hasPhoto": False,
-                "fileFormat": "pdf"
-            }
-
-            # Extract summary (join all summary sections)
-            summary_list = sections.get('summary', [])
-            summary = ' '.join(summary_list) if summary_list else None
-
-            result = ResumeData(
-                fileName=filename,
-                contact=contact_info,
-                summary=summary,
-                experience=sections.get('experience', []),
-                education=sections.get('education', []),
-                skills=sections.get('skills', []),
-                certifications=sections.get('certifications', []),
-                metadata=metadata
-            )
-
-            quality = assess_parse_quality(result, full_text)
-            # If skills or education sections are missing, try pdfplumber (better for tables)
-            if not sections.get('skills') or not sections.get('education'):
-                logger.info(f"PyMuPDF missing skills/education sections, will try pdfplumber for table extraction")
-            elif quality >= 0.7:  # Good quality, use it
-                return result
+        probe = probe_pdf_layout(doc, max_pages=page_limit(len(doc)))
     except Exception as e:
-        pass  # Fall through to next strategy
+        probe = LayoutProbe("pypdf", [f"PyMuPDF could not read the file: {e}"])
+    probe_ms = (time.perf_counter() - start) * 1000
 
-    # Strategy 2: pypdf fallback
     try:
-        result = parse_pdf_with_pypdf(file_content, filename)
-        quality = assess_parse_quality(result, "")  # Note: no raw text available
-        if quality >= 0.5:  # Lower threshold for fallback
-            return result
-    except Exception as e:
-        pass  # Fall through to next strategy
+        candidates = [probe.extractor] + [
+            name for name in _PDF_EXTRACTORS
+            if name != probe.extractor and not (name == "pymupdf" and probe.extractor == "pymupdf_columns")
+        ]
+        used = None
+        for name in candidates:
+            if name.startswith("pymupdf") and doc is None:
+                continue
+            try:
+                if name == "pypdf":
+                    full_text, page_count = _extract_text_pypdf(file_content)
+                elif name == "pdfplumber":
+                    full_text, page_count = _extract_text_pdfplumber(file_content)
+                else:
+                    full_text, page_count = _extract_text_pymupdf(
+                        file_content, doc, probe, columns=name == "pymupdf_columns"
+                    )
+            except Exception as e:
+                logger.warning(f"{name} extraction failed for {filename}: {e}")
+                continue
+            if full_text.split():
+                used = name
+                break
+    finally:
+        if doc is not None:
+            doc.close()
 
-    # Strategy 3: pdfplumber (best for tables)
-    try:
-        result = parse_pdf_with_pdfplumber(file_content, filename)
-        return result  # Use whatever we got
-    except Exception as e:
+    if used is None:
         # All strategies failed - return minimal result
-        return ResumeData(
-            fileName=filename,
-            contact={},
-            experience=[],
-            education=[],
-            skills=[],
-            metadata={"pageCount": 0, "wordCount": 0, "hasPhoto": False, "fileFormat": "pdf"}
-        )
+        result = _empty_pdf_result(filename)
+    else:
+        result = _build_pdf_resume_data(full_text, page_count, filename)
+        if page_count > page_limit(page_count):
+            # Pages past the cap were not extracted
+            result.metadata["truncated"] = True
+            result.metadata["pagesParsed"] = page_limit(page_count)
+            logger.warning(f"{filename}: parsed first {page_limit(page_count)} of {page_count} pages")
+
+    strategy = probe.to_metadata()
+    strategy["used"] = used
+    strategy["probeMs"] = round(probe_ms, 2)
+    result.metadata["parseStrategy"] = strategy
+    logger.info(
+        f"Parsed {filename} with {used} (chose {probe.extractor}: {'; '.join(probe.reasons)}) - "
+        f"{result.metadata['wordCount']} words"
+    )
+    return result
 
 
-def _para_full_text(para_element) -> str:
-    """
-    Return the full text of a paragraph element, including text that is nested
-    inside <w:hyperlink> child elements.  python-docx's Paragraph.text only
-    walks direct <w:r> children and silently drops runs that live inside
-    hyperlinks, causing email addresses (which Word stores as mailto hyperlinks)
-    to be invisible to the normal para.text property.
-
-    This function replicates what python-docx does for normal runs (including
-    the \\n emitted for <w:br> line-breaks) but also descends into <w:hyperlink>
-    elements so that hyperlinked text (e.g. a mailto: email address) is included.
-    """
-    W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
-    _W_R = '{%s}r' % W
-    _W_T = '{%s}t' % W
-    _W_BR = '{%s}br' % W
-    _W_HYPERLINK = '{%s}hyperlink' % W
-
-    parts = []
-
-    def _collect_run(run_el):
-        """Collect text from a single <w:r> element, emitting \\n for <w:br>.
-        Also descends into any <w:hyperlink> that is a child of this run,
-        because Word occasionally nests the hyperlink element inside <w:r>.
-        """
-        for child in run_el:
-            if child.tag == _W_T:
-                if child.text:
-                    parts.append(child.text)
-            elif child.tag == _W_BR:
-                parts.append('\n')
-            elif child.tag == _W_HYPERLINK:
-                # Hyperlink nested inside a run — collect all its runs too
-                for grandchild in child:
-                    if grandchild.tag == _W_R:
-                        _collect_run(grandchild)
-
-    for child in para_element:
-        if child.tag == _W_R:
-            _collect_run(child)
-        elif child.tag == _W_HYPERLINK:
-            # Hyperlink as a direct child of the paragraph
-            for grandchild in child:
-                if grandchild.tag == _W_R:
-                    _collect_run(grandchild)
-
-    return ''.join(parts)
-
-
-def parse_docx(file_content: bytes, filename: str) -> ResumeData:
+def parse_docx(file_content: Union[bytes, ParsedDocx], filename: str) -> ResumeData:
     """
     Parse a DOCX resume and extract structured data including tables.
 
     Args:
-        file_content: DOCX file content as bytes
+        file_content: DOCX file content as bytes, or an already parsed
+            ParsedDocx shared with the other upload consumers
         filename: Original filename of the DOCX
 
     Returns:
         ResumeData object with extracted information
     """
-    # Open DOCX from bytes using BytesIO
-    doc = Document(BytesIO(file_content))
+    parsed = ParsedDocx.coerce(file_content)
 
     # Extract text from paragraphs AND tables (CRITICAL FIX)
     # Must preserve document order to correctly detect sections
     full_text_parts = []
 
-    # Process document elements in order
-    # DOCX structure: doc.element.body contains all elements in document order
-    for element in doc.element.body:
-        # Check if element is a paragraph
-        if element.tag.endswith('p'):
-            # Find corresponding paragraph object
-            for para in doc.paragraphs:
-                if para._element == element:
-                    # Use _para_full_text() instead of para.text so that text
-                    # inside <w:hyperlink> elements (e.g. mailto: email addresses)
-                    # is also included.
-                    text = _para_full_text(element)
-                    if text.strip():
-                        full_text_parts.append(text)
-                    break
-
-        # Check if element is a table
-        elif element.tag.endswith('tbl'):
-            # Find corresponding table object
-            for table in doc.tables:
-                if table._element == element:
-                    # Extract table rows
-                    for row in table.rows:
-                        row_text = []
-                        for cell in row.cells:
-                            cell_text = cell.text.strip()
-                            if cell_text:
-                                row_text.append(cell_text)
-                        if row_text:
-                            full_text_parts.append(" | ".join(row_text))
-                    break
+    for block in parsed.blocks:
+        if isinstance(block, ParsedParagraph):
+            # Use the hyperlink-aware full text instead of para.text so that
+            # text inside <w:hyperlink> elements (e.g. mailto: email
+            # addresses) is also included.
+            if block.full_text.strip():
+                full_text_parts.append(block.full_text)
+        else:
+            # Table: one line per row, non-empty cells joined
+            for row in block.rows:
+                row_text = [cell for cell in row if cell]
+                if row_text:
+                    full_text_parts.append(" | ".join(row_text))
 
     full_text = "\n".join(full_text_parts)
 
@@ -1084,7 +842,7 @@ def parse_docx(file_content: bytes, filename: str) -> ResumeData:
 
     # Metadata
     metadata = {
-        "pageCount": len(doc.sections),  # Approximate page count
+        "pageCount": parsed.section_count,  # Approximate page count
         "wordCount": word_count,
         "hasPhoto": False,  # TODO: Implement image detection
         "fileFormat": "docx"
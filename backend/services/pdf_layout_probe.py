@@ -0,0 +1,254 @@
+"""
+PDF Layout Probe - pick the text extractor from PyMuPDF block geometry.
+
+parse_pdf used to parse every PDF with PyMuPDF, build a full ResumeData,
+and on missing skills/education throw it away and re-parse with pypdf and
+then pdfplumber, so a two-column resume could be parsed three times.
+
+The probe reads each page's text blocks (``page.get_text("blocks")``, which
+is cheap next to parsing) and looks at:
+
+- Columns: a vertical gutter that splits the text into two sides with few
+  blocks crossing it (sidebar and two-column layouts)
+- Tables: rows holding three or more side-by-side blocks
+- Text density: characters per page area, and pages with images but almost
+  no text (scanned pages)
+
+choose_extractor() turns the page layouts into one decision, made before
+any parsing:
+
+- "pypdf"            almost no text layer according to PyMuPDF
+- "pdfplumber"       table-like pages (pdfplumber also extracts cell text)
+- "pymupdf_columns"  multi-column pages, read column by column
+- "pymupdf"          everything else
+
+The decision and its inputs are recorded in metadata["parseStrategy"] so the
+thresholds below can be tuned from real uploads.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Fewer extracted characters than this means PyMuPDF found no usable text
+MIN_TEXT_CHARS = 250
+
+# Column detection: each side must hold this share of the page's characters
+MIN_COLUMN_SHARE = 0.1
+# ... while blocks crossing the gutter hold at most this share (headers)
+MAX_SPANNING_SHARE = 0.25
+# Gutter candidates are searched in this band of the page width
+GUTTER_SEARCH = (0.25, 0.75)
+GUTTER_STEPS = 40
+
+# Table detection: blocks within this many points of each other share a row
+ROW_TOLERANCE = 3.0
+MIN_TABLE_CELLS = 3
+MIN_TABLE_ROWS = 3
+
+# Characters per 1000 square points below which an image page counts as scanned
+SCANNED_DENSITY = 0.5
+
+Block = Tuple[float, float, float, float, str]
+
+
+@dataclass
+class PageLayout:
+    """Layout features of one page."""
+    page_number: int
+    columns: int = 1
+    gutter: Optional[float] = None
+    table_rows: int = 0
+    chars: int = 0
+    density: float = 0.0
+    images: int = 0
+
+    @property
+    def has_table(self) -> bool:
+        return self.table_rows >= MIN_TABLE_ROWS
+
+    @property
+    def scanned(self) -> bool:
+        return self.images > 0 and self.density < SCANNED_DENSITY
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'page': self.page_number,
+            'columns': self.columns,
+            'tableRows': self.table_rows,
+            'chars': self.chars,
+            'density': round(self.density, 2),
+            'images': self.images,
+        }
+
+
+@dataclass
+class LayoutProbe:
+    """Extractor decision for a whole document."""
+    extractor: str
+    reasons: List[str] = field(default_factory=list)
+    pages: List[PageLayout] = field(default_factory=list)
+
+    def to_metadata(self) -> Dict[str, Any]:
+        """JSON-serializable record for ResumeData.metadata['parseStrategy']."""
+        return {
+            'extractor': self.extractor,
+            'reasons': list(self.reasons),
+            'pages': [page.to_dict() for page in self.pages],
+        }
+
+
+def _text_blocks(blocks: Sequence[Sequence[Any]]) -> List[Block]:
+    """Keep non-empty text blocks as (x0, y0, x1, y1, text)."""
+    result = []
+    for block in blocks:
+        # PyMuPDF: (x0, y0, x1, y1, text, block_no, block_type); type 1 = image
+        if len(block) > 6 and block[6] != 0:
+            continue
+        text = (block[4] or '').strip()
+        if text:
+            result.append((float(block[0]), float(block[1]), float(block[2]), float(block[3]), text))
+    return result
+
+
+def find_gutter(blocks: Sequence[Block], width: float) -> Optional[float]:
+    """
+    Return the x position of a two-column gutter, or None.
+
+    A candidate x splits blocks into left (x1 <= x), right (x0 >= x) and
+    spanning; the best candidate has the least spanning text and is accepted
+    when both sides hold at least MIN_COLUMN_SHARE of the characters.
+    """
+    total = sum(len(b[4]) for b in blocks)
+    if total == 0 or width <= 0:
+        return None
+
+    best = None
+    lo, hi = GUTTER_SEARCH
+    for step in range(GUTTER_STEPS + 1):
+        x = width * (lo + (hi - lo) * step / GUTTER_STEPS)
+        left = right = spanning = 0
+        for x0, _, x1, _, text in blocks:
+            if x1 <= x:
+                left += len(text)
+            elif x0 >= x:
+                right += len(text)
+            else:
+                spanning += len(text)
+        if left / total < MIN_COLUMN_SHARE or right / total < MIN_COLUMN_SHARE:
+            continue
+        if spanning / total > MAX_SPANNING_SHARE:
+            continue
+        balance = min(left, right)
+        if best is None or (spanning, -balance) < best[0]:
+            best = ((spanning, -balance), x)
+    return best[1] if best else None
+
+
+def count_table_rows(blocks: Sequence[Block]) -> int:
+    """Number of rows holding MIN_TABLE_CELLS or more side-by-side blocks."""
+    rows: List[List[Block]] = []
+    for block in sorted(blocks, key=lambda b: b[1]):
+        if rows and abs(rows[-1][0][1] - block[1]) <= ROW_TOLERANCE:
+            rows[-1].append(block)
+        else:
+            rows.append([block])
+
+    table_rows = 0
+    for row in rows:
+        cells = sorted(row, key=lambda b: b[0])
+        # Side by side = no horizontal overlap between neighbours
+        side_by_side = 1 + sum(1 for a, b in zip(cells, cells[1:]) if b[0] >= a[2])
+        if side_by_side >= MIN_TABLE_CELLS:
+            table_rows += 1
+    return table_rows
+
+
+def analyze_page_blocks(
+    page_number: int,
+    blocks: Sequence[Sequence[Any]],
+    width: float,
+    height: float,
+    images: int = 0
+) -> PageLayout:
+    """Compute layout features from one page's PyMuPDF text blocks."""
+    text_blocks = _text_blocks(blocks)
+    chars = sum(len(b[4]) for b in text_blocks)
+    area = max(width * height, 1.0)
+    gutter = find_gutter(text_blocks, width)
+    return PageLayout(
+        page_number=page_number,
+        columns=2 if gutter is not None else 1,
+        gutter=gutter,
+        table_rows=count_table_rows(text_blocks),
+        chars=chars,
+        density=chars / area * 1000,
+        images=images,
+    )
+
+
+def choose_extractor(pages: Sequence[PageLayout]) -> LayoutProbe:
+    """Pick one extractor for the document from its page layouts."""
+    pages = list(pages)
+    total_chars = sum(page.chars for page in pages)
+    if total_chars < MIN_TEXT_CHARS:
+        reasons = [f"PyMuPDF found {total_chars} characters (< {MIN_TEXT_CHARS})"]
+        scanned = [page.page_number for page in pages if page.scanned]
+        if scanned:
+            reasons.append(f"image pages with little text: {scanned}")
+        return LayoutProbe('pypdf', reasons, pages)
+
+    table_pages = [page.page_number for page in pages if page.has_table]
+    if table_pages:
+        return LayoutProbe('pdfplumber', [f"table-like rows on pages {table_pages}"], pages)
+
+    column_pages = [page.page_number for page in pages if page.columns > 1]
+    if column_pages:
+        return LayoutProbe('pymupdf_columns', [f"two-column layout on pages {column_pages}"], pages)
+
+    return LayoutProbe('pymupdf', ["single-column text layout"], pages)
+
+
+def probe_pdf_layout(doc: Any, max_pages: Optional[int] = None) -> LayoutProbe:
+    """
+    Probe an open PyMuPDF document and choose its extractor.
+
+    Args:
+        doc: fitz.Document
+        max_pages: Only probe the first N pages (default: all)
+    """
+    pages = []
+    for index, page in enumerate(doc):
+        if max_pages is not None and index >= max_pages:
+            break
+        rect = page.rect
+        pages.append(analyze_page_blocks(
+            index + 1,
+            page.get_text("blocks"),
+            rect.width,
+            rect.height,
+            images=len(page.get_images()),
+        ))
+    return choose_extractor(pages)
+
+
+def column_ordered_text(blocks: Sequence[Sequence[Any]], gutter: float) -> str:
+    """
+    Page text in reading order for a two-column page.
+
+    Full-width blocks above the columns (the header) come first, then the
+    left column top to bottom, then the right column, then any remaining
+    full-width blocks (footers).
+    """
+    text_blocks = _text_blocks(blocks)
+    left = [b for b in text_blocks if b[2] <= gutter]
+    right = [b for b in text_blocks if b[0] >= gutter]
+    spanning = [b for b in text_blocks if b[0] < gutter < b[2]]
+
+    columns_top = min((b[1] for b in left + right), default=0.0)
+    header = [b for b in spanning if b[1] < columns_top]
+    footer = [b for b in spanning if b[1] >= columns_top]
+
+    ordered = []
+    for group in (header, left, right, footer):
+        ordered.extend(sorted(group, key=lambda b: (b[1], b[0])))
+    return "\n".join(b[4] for b in ordered) + "\n"
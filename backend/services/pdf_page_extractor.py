@@ -0,0 +1,227 @@
+"""
+PDF Page Extractor - page-parallel text extraction with a page cap.
+
+Long CVs, academic CVs and portfolios run to 10-30 pages, and both PyMuPDF
+and pdfplumber extraction walked the pages serially on one worker.  Here:
+
+- Documents with at least PDF_PARALLEL_MIN_PAGES pages (default 8) are
+  split into contiguous page ranges, one per pool worker; each worker
+  opens the PDF bytes itself and the page texts are stitched back in order
+- Pages beyond PDF_MAX_PAGES (default 30, 0 = no cap) are not extracted,
+  so a pathological PDF cannot pin a worker; parse_pdf flags the result
+  with metadata["truncated"]
+- Page texts are collected in lists and joined once
+
+The pool (PDF_EXTRACT_PROCESSES workers, default min(4, cpu_count)) is
+created on first use and shut down with the app.  If it fails (e.g. a
+worker crashed) extraction falls back to the serial path.  If the page
+ranges take longer than PDF_PAGE_TIMEOUT seconds (default 20, 0 = no
+limit) PageExtractionTimeout is raised instead: a page that hung in the
+pool would hang again on the serial path, so parse_pdf moves on to its next
+extractor.  The timed-out pool is discarded and its workers terminated, so
+they are not left busy for later requests.
+"""
+
+import io
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.services.pdf_layout_probe import column_ordered_text
+
+logger = logging.getLogger(__name__)
+
+MAX_PDF_PAGES = int(os.getenv("PDF_MAX_PAGES", "30"))
+PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "8"))
+PAGE_TIMEOUT = float(os.getenv("PDF_PAGE_TIMEOUT", "20"))
+
+
+class PageExtractionTimeout(Exception):
+    """Raised when parallel page extraction exceeds PDF_PAGE_TIMEOUT."""
+
+
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_lock = threading.Lock()
+
+
+def page_limit(page_count: int) -> int:
+    """Number of pages that will be extracted from a ``page_count``-page PDF."""
+    if MAX_PDF_PAGES > 0:
+        return min(page_count, MAX_PDF_PAGES)
+    return page_count
+
+
+def _pool_workers() -> int:
+    return max(1, int(os.getenv("PDF_EXTRACT_PROCESSES", str(min(4, os.cpu_count() or 1)))))
+
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            _page_pool = ProcessPoolExecutor(max_workers=_pool_workers())
+        return _page_pool
+
+
+def shutdown_page_pool(wait: bool = False) -> None:
+    """Shut down the page extraction pool (called at app shutdown)."""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is not None:
+            _page_pool.shutdown(wait=wait, cancel_futures=True)
+        _page_pool = None
+
+
+def _discard_page_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a pool whose workers may be stuck and terminate its processes."""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is pool:
+            _page_pool = None
+    # Snapshot before shutdown() clears the executor's process table
+    processes = list((getattr(pool, "_processes", None) or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        try:
+            process.terminate()
+        except Exception:
+            pass
+
+
+def _page_ranges(count: int, parts: int) -> List[Tuple[int, int]]:
+    """Split range(count) into at most ``parts`` contiguous (start, stop) ranges."""
+    parts = max(1, min(parts, count))
+    size, extra = divmod(count, parts)
+    ranges = []
+    start = 0
+    for i in range(parts):
+        stop = start + size + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _pymupdf_page_text(page: Any, gutter: Optional[float]) -> str:
+    if gutter is not None:
+        return column_ordered_text(page.get_text("blocks"), gutter)
+    return page.get_text()
+
+
+def _pymupdf_range(
+    file_content: bytes,
+    start: int,
+    stop: int,
+    gutters: Dict[int, Optional[float]]
+) -> List[str]:
+    """Worker: PyMuPDF text of pages [start, stop) (0-based)."""
+    import fitz
+
+    with fitz.open(stream=file_content, filetype="pdf") as doc:
+        return [_pymupdf_page_text(doc[i], gutters.get(i + 1)) for i in range(start, stop)]
+
+
+def _pdfplumber_page_text(page: Any) -> str:
+    parts = []
+    # Get regular text
+    page_text = page.extract_text()
+    if page_text:
+        parts.append(page_text)
+
+    # Get table content (pdfplumber's specialty)
+    for table in page.extract_tables():
+        for row in table:
+            if row:
+                parts.append(" | ".join([str(cell) for cell in row if cell]))
+    return "\n".join(parts)
+
+
+def _pdfplumber_range(file_content: bytes, start: int, stop: int) -> List[str]:
+    """Worker: pdfplumber text (including table rows) of pages [start, stop)."""
+    import pdfplumber
+
+    with pdfplumber.open(io.BytesIO(file_content)) as pdf:
+        return [_pdfplumber_page_text(pdf.pages[i]) for i in range(start, stop)]
+
+
+def _run_ranges(worker, file_content: bytes, count: int, *args) -> Optional[List[str]]:
+    """
+    Fan page ranges out over the pool; None if the pool fails.
+
+    Raises:
+        PageExtractionTimeout: The ranges did not finish within PDF_PAGE_TIMEOUT
+    """
+    pool = None
+    try:
+        pool = _get_page_pool()
+        futures = [
+            pool.submit(worker, file_content, start, stop, *args)
+            for start, stop in _page_ranges(count, _pool_workers())
+        ]
+        deadline = time.monotonic() + PAGE_TIMEOUT if PAGE_TIMEOUT > 0 else None
+        pages: List[str] = []
+        for future in futures:
+            remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+            pages.extend(future.result(timeout=remaining))
+        return pages
+    except FuturesTimeoutError as e:
+        _discard_page_pool(pool)
+        raise PageExtractionTimeout(
+            f"Page extraction timed out after {PAGE_TIMEOUT:.0f}s"
+        ) from e
+    except Exception as e:
+        logger.warning("Parallel page extraction failed, extracting serially: %s", e)
+        return None
+
+
+def extract_pymupdf_pages(
+    file_content: bytes,
+    doc: Any,
+    gutters: Optional[Dict[int, Optional[float]]] = None
+) -> List[str]:
+    """
+    PyMuPDF text of each page (up to the page cap), in page order.
+
+    Args:
+        file_content: PDF bytes (re-opened by pool workers)
+        doc: The already open fitz.Document (used for the serial path)
+        gutters: 1-based page number -> column gutter x for pages to read
+            column by column (see pdf_layout_probe)
+
+    Raises:
+        PageExtractionTimeout: Parallel extraction timed out (not retried serially)
+    """
+    gutters = gutters or {}
+    count = page_limit(len(doc))
+    if count >= PARALLEL_MIN_PAGES:
+        pages = _run_ranges(_pymupdf_range, file_content, count, gutters)
+        if pages is not None:
+            return pages
+    return [_pymupdf_page_text(doc[i], gutters.get(i + 1)) for i in range(count)]
+
+
+def extract_pdfplumber_pages(file_content: bytes) -> Tuple[List[str], int]:
+    """
+    pdfplumber text of each page (up to the page cap), in page order.
+
+    Returns:
+        (page texts, total page count of the document)
+
+    Raises:
+        PageExtractionTimeout: Parallel extraction timed out (not retried serially)
+    """
+    import pdfplumber
+
+    with pdfplumber.open(io.BytesIO(file_content)) as pdf:
+        total = len(pdf.pages)
+        count = page_limit(total)
+        if count < PARALLEL_MIN_PAGES:
+            return [_pdfplumber_page_text(pdf.pages[i]) for i in range(count)], total
+
+    pages = _run_ranges(_pdfplumber_range, file_content, count)
+    if pages is None:
+        pages = _pdfplumber_range(file_content, 0, count)
+    return pages, total
@@ -0,0 +1,191 @@
+"""
+Prefork - load shared read-only state once in the server master, before forking.
+
+Started as ``uvicorn main:app --workers N``, every worker imports the app and
+then loads its own copy of everything: the sentence-transformers model and
+KeyBERT (~90 MB each time with ENABLE_SEMANTIC_MATCHING=true), the scoring
+engine, keyword automata, the synonym index and the corpus.  uvicorn starts its
+workers with the multiprocessing "spawn" method, so nothing can be shared.
+
+Under gunicorn with ``preload_app`` (see backend/gunicorn.conf.py) the master
+imports the app, calls preload_shared_state() and then forks the workers,
+which inherit those objects copy-on-write.  Two things keep the pages shared:
+
+- gc.freeze() right before forking moves every object the master created into
+  the permanent generation, so collections in the workers never write to
+  their GC headers (which would copy the page)
+- the master disables gc while loading, so freed objects do not leave holes
+  that later allocations in the workers would fill (dirtying shared pages)
+
+Only state that is safe to share after fork() is loaded: no threads or pools
+are left running in the master, and per-process handles (the corpus store's
+SQLite connections, diskcache connections) reconnect when the pid changes.
+
+memory_report() is exposed on /health: a worker's private memory (USS) is
+what it costs on its own, PSS is its fair share of the pages it shares.
+"""
+
+import gc
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Set in the master by preload_shared_state(); inherited by the workers
+_preload: Optional[Dict[str, Any]] = None
+
+
+def _timed(steps: Dict[str, float], name: str, load) -> Any:
+    start = time.perf_counter()
+    try:
+        return load()
+    except Exception as e:
+        logger.warning("Preload step %s failed, workers will load it lazily: %s", name, e)
+    finally:
+        steps[name] = round(time.perf_counter() - start, 4)
+
+
+def _load_semantic_models():
+    from backend.services.keyword_embedding_store import get_keyword_embedding_store
+    from backend.services.semantic_matcher import get_semantic_matcher
+
+    # No-op unless ENABLE_SEMANTIC_MATCHING=true; loads the model and KeyBERT
+    # without running inference (torch starts its thread pools on first use)
+    get_semantic_matcher()._lazy_init()
+    get_keyword_embedding_store()
+
+
+def _compile_keyword_automata():
+    from backend.services.keyword_automaton import get_keyword_automaton
+    from backend.services.role_keywords import ROLE_KEYWORDS
+    from backend.services.skills_categorizer import SkillsCategorizer
+
+    SkillsCategorizer()
+    for role in ROLE_KEYWORDS.values():
+        for keywords in (role.get('required', []), role.get('preferred', [])):
+            if keywords:
+                get_keyword_automaton(keywords)
+
+
+def _load_synonyms():
+    from backend.services.synonym_index import get_synonym_index
+
+    get_synonym_index()
+
+
+def _load_corpus():
+    from backend.services.corpus_skills_database import get_corpus_skills_database
+    from backend.services.corpus_store import get_role_keywords
+    from backend.services.role_mapping_service import get_role_mapping_service
+
+    get_role_keywords()
+    get_corpus_skills_database().get_top_skills(1)
+    get_role_mapping_service()
+
+
+def _build_scoring_engine():
+    from backend.services.scoring_engine import init_scoring_engine
+
+    init_scoring_engine()
+
+
+def preload_shared_state(freeze: bool = True) -> Dict[str, Any]:
+    """
+    Load models and read-only indexes into this process, then freeze the heap.
+
+    Call in the server master after the app is imported and before workers
+    are forked.  Each step is best effort: a failure is logged and the
+    workers load that piece lazily as before.
+
+    Args:
+        freeze: Call gc.freeze() when done (False leaves the gc untouched)
+
+    Returns:
+        Seconds per step, total seconds and the RSS reached
+    """
+    global _preload
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    start = time.perf_counter()
+    steps: Dict[str, float] = {}
+    try:
+        _timed(steps, 'scoring_engine', _build_scoring_engine)
+        _timed(steps, 'semantic_models', _load_semantic_models)
+        _timed(steps, 'keyword_automata', _compile_keyword_automata)
+        _timed(steps, 'synonym_index', _load_synonyms)
+        _timed(steps, 'corpus', _load_corpus)
+    finally:
+        if freeze:
+            gc.collect()
+            gc.freeze()
+        if gc_was_enabled:
+            gc.enable()
+
+    _preload = {
+        'master_pid': os.getpid(),
+        'seconds': round(time.perf_counter() - start, 4),
+        'steps': steps,
+        'frozen_objects': gc.get_freeze_count(),
+        'master_rss': _memory_kb().get('rss', 0) * 1024,
+    }
+    logger.info(
+        "Preloaded shared state in %.2fs (%s), %d objects frozen",
+        _preload['seconds'],
+        ", ".join(f"{name}={seconds:.2f}s" for name, seconds in steps.items()),
+        _preload['frozen_objects'],
+    )
+    return _preload
+
+
+def is_preloaded() -> bool:
+    """True if this process is (or was forked from) a preloaded master."""
+    return _preload is not None
+
+
+def _memory_kb() -> Dict[str, int]:
+    """RSS/PSS/shared/private kB from /proc/self/smaps_rollup (Linux), else RSS only."""
+    fields = {
+        'Rss': 'rss', 'Pss': 'pss', 'Shared_Clean': 'shared_clean', 'Shared_Dirty': 'shared_dirty',
+        'Private_Clean': 'private_clean', 'Private_Dirty': 'private_dirty',
+    }
+    values: Dict[str, int] = {}
+    try:
+        with open('/proc/self/smaps_rollup', 'r') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0].rstrip(':') in fields:
+                    values[fields[parts[0].rstrip(':')]] = int(parts[1])
+    except (OSError, ValueError):
+        import resource
+        import sys
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        values['rss'] = peak // 1024 if sys.platform == 'darwin' else peak
+    return values
+
+
+def memory_report() -> Dict[str, Any]:
+    """
+    Memory of this worker process in bytes, for /health.
+
+    ``uss`` (private pages) is what the worker costs on its own; ``shared``
+    counts pages also mapped by other processes (the preloaded master and
+    its siblings); ``pss`` splits shared pages evenly between them.
+    """
+    kb = _memory_kb()
+    report: Dict[str, Any] = {
+        'pid': os.getpid(),
+        'rss': kb.get('rss', 0) * 1024,
+    }
+    if 'pss' in kb:
+        report['pss'] = kb['pss'] * 1024
+        report['uss'] = (kb.get('private_clean', 0) + kb.get('private_dirty', 0)) * 1024
+        report['shared'] = (kb.get('shared_clean', 0) + kb.get('shared_dirty', 0)) * 1024
+    report['preloaded'] = is_preloaded()
+    if _preload is not None:
+        report['master_pid'] = _preload['master_pid']
+        report['frozen_objects'] = gc.get_freeze_count()
+    return report
@@ -4,10 +4,11 @@ Checks all 44 parameters and returns issues by severity.
 """
 
 import re
-import hashlib
 from datetime import datetime
 from typing import Dict, List, Optional
 from backend.services.parser import ResumeData
+from backend.services import date_normalizer
+from backend.services.grammar_cache import GrammarResultCache, get_grammar_result_cache
 
 try:
     from spellchecker import SpellChecker
@@ -33,7 +34,6 @@ class RedFlagsValidator:
         """Initialize validator with grammar checker support"""
         self._spell_checker = None
         self._spell_init_failed = False
-        self._grammar_cache = {}  # Cache grammar results by text hash
         self._languagetool = None  # LanguageTool instance
         self._languagetool_failed = False  # Track if LanguageTool initialization failed
 
@@ -103,26 +103,8 @@ class RedFlagsValidator:
         if not date_str or date_str.lower() in ['present', 'current']:
             return datetime.now()
 
-        # Try different formats
-        formats = [
-            "%b %Y",      # Jan 2020
-            "%B %Y",      # January 2020
-            "%m/%Y",      # 01/2020
-            "%Y",         # 2020
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-
-        # Fallback: extract year
-        year_match = re.search(r'(\d{4})', date_str)
-        if year_match:
-            return datetime(int(year_match.group(1)), 1, 1)
-
-        return None
+        # Shared memoized parser; loose=True keeps the year-only fallback
+        return date_normalizer.parse_date(date_str, loose=True)
 
     def calculate_gap_months(self, end_date1: datetime, start_date2: datetime) -> int:
         """Calculate gap in months between two dates using proper month arithmetic"""
@@ -828,158 +810,129 @@ class RedFlagsValidator:
         issue_counts = {'typo': 0, 'grammar': 0, 'capitalization': 0, 'spelling': 0}
         max_per_category = 15  # Allow more issues for better accuracy (increased from 10)
 
+        # PRIORITY 1: Use LanguageTool (advanced grammar checking), one batch
+        # call for every text not already in the shared grammar cache
+        found = {}
+        if use_languagetool:
+            found = self._check_grammar_batch(languagetool, [section['text'] for section in text_sections])
+
         for section in text_sections:
             text = section['text']
-            section_name = section['section']
-            context = section['context']
-
-            # Check cache first
-            text_hash = hashlib.md5(text.encode()).hexdigest()
-            if text_hash in self._grammar_cache:
-                cached_issues = self._grammar_cache[text_hash]
-                for issue in cached_issues:
-                    if issue_counts.get(issue['category'], 0) < max_per_category:
-                        issues.append({
-                            'severity': issue['severity'],
-                            'category': issue['category'],
-                            'message': f"{context}: {issue['message']}",
-                            'section': section_name
-                        })
-                        issue_counts[issue['category']] += 1
-                continue
 
-            # New issues to cache for this text
-            text_issues = []
-
-            # PRIORITY 1: Use LanguageTool (advanced grammar checking)
-            if use_languagetool:
-                try:
-                    lt_result = languagetool.check(text, max_issues=20)
-
-                    # Process LanguageTool issues
-                    for lt_issue in lt_result.get('issues', []):
-                        category = lt_issue.get('category', 'grammar')
-                        severity = lt_issue.get('severity', 'warning')
-
-                        # Map severity to our system
-                        if severity == 'critical':
-                            our_severity = 'warning'
-                        elif severity == 'warning':
-                            our_severity = 'warning'
-                        else:
-                            our_severity = 'suggestion'
-
-                        # Map category
-                        if category == 'spelling':
-                            our_category = 'typo'
-                        elif category in ['grammar', 'typo', 'capitalization']:
-                            our_category = category
-                        else:
-                            our_category = 'grammar'
-
-                        # Check if we've hit the limit for this category
-                        if issue_counts.get(our_category, 0) >= max_per_category:
-                            continue
-
-                        message = lt_issue.get('message', 'Grammar issue detected')
-
-                        # Add suggestions if available
-                        replacements = lt_issue.get('replacements', [])
-                        if replacements:
-                            message += f" - Suggestion: '{replacements[0]}'"
-
-                        text_issues.append({
-                            'category': our_category,
-                            'severity': our_severity,
-                            'message': message
-                        })
+            # PRIORITY 2: Fall back to basic checks (pyspellchecker + regex)
+            if text not in found:
+                found[text] = self._cached_basic_grammar_issues(text)
 
-                        issues.append({
-                            'severity': our_severity,
-                            'category': our_category,
-                            'message': f"{context}: {message}",
-                            'section': section_name
-                        })
-                        issue_counts[our_category] += 1
+            for issue in found[text]:
+                if issue_counts.get(issue['category'], 0) < max_per_category:
+                    issues.append({
+                        'severity': issue['severity'],
+                        'category': issue['category'],
+                        'message': f"{section['context']}: {issue['message']}",
+                        'section': section['section']
+                    })
+                    issue_counts[issue['category']] += 1
 
-                except Exception as e:
-                    # LanguageTool failed for this text, fall through to basic checks
-                    pass
-                else:
-                    # LanguageTool succeeded, cache and continue to next section
-                    self._grammar_cache[text_hash] = text_issues
-                    continue
+        return issues
 
-            # PRIORITY 2: Fall back to basic checks (pyspellchecker + regex)
+    def _check_grammar_batch(self, languagetool, texts: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Check all texts with one LanguageTool call and map their issues.
 
-            # P18: Typo detection using pyspellchecker
-            typo_issues = self._check_spelling(text, spell)
-            for typo_word, suggestion in typo_issues:
-                if issue_counts['typo'] >= max_per_category:
-                    break
+        The checker serves texts it has seen before from the shared grammar
+        cache.  On failure nothing is returned and the texts get the basic
+        checks instead.
+        """
+        unique = list(dict.fromkeys(texts))
+        if not unique:
+            return {}
 
-                message = f"{context}: Possible spelling error '{typo_word}'"
-                if suggestion:
-                    message += f" - Suggestion: '{suggestion}'"
+        try:
+            results = languagetool.check_batch(unique, max_issues=20)
+        except Exception:
+            # LanguageTool failed, fall through to basic checks
+            return {}
+
+        return {text: self._map_languagetool_issues(lt_result) for text, lt_result in zip(unique, results)}
+
+    def _cached_basic_grammar_issues(self, text: str) -> List[Dict]:
+        """_basic_grammar_issues() through the shared grammar cache."""
+        spell = self._get_spell_checker()
+        cache = get_grammar_result_cache()
+        key = GrammarResultCache.key_for(text, 'basic', ('red_flags', spell is not None))
+        issues = cache.get(key)
+        if issues is None:
+            issues = self._basic_grammar_issues(text, spell)
+            cache.set(key, issues)
+        return issues
 
-                text_issues.append({
-                    'category': 'typo',
-                    'severity': 'warning',
-                    'message': f"Possible spelling error '{typo_word}'" + (f" - Suggestion: '{suggestion}'" if suggestion else "")
-                })
+    def _map_languagetool_issues(self, lt_result: Dict) -> List[Dict]:
+        """Map a GrammarChecker result onto validator issue categories/severities."""
+        text_issues = []
+        for lt_issue in lt_result.get('issues', []):
+            category = lt_issue.get('category', 'grammar')
+            severity = lt_issue.get('severity', 'warning')
+
+            # Map severity to our system
+            if severity == 'critical':
+                our_severity = 'warning'
+            elif severity == 'warning':
+                our_severity = 'warning'
+            else:
+                our_severity = 'suggestion'
 
-                issues.append({
-                    'severity': 'warning',
-                    'category': 'typo',
-                    'message': message,
-                    'section': section_name
-                })
-                issue_counts['typo'] += 1
+            # Map category
+            if category == 'spelling':
+                our_category = 'typo'
+            elif category in ['grammar', 'typo', 'capitalization']:
+                our_category = category
+            else:
+                our_category = 'grammar'
 
-            # P19: Basic grammar checks (common patterns)
-            grammar_issues = self._check_basic_grammar(text)
-            for grammar_msg in grammar_issues:
-                if issue_counts['grammar'] >= max_per_category:
-                    break
+            message = lt_issue.get('message', 'Grammar issue detected')
 
-                text_issues.append({
-                    'category': 'grammar',
-                    'severity': 'warning',
-                    'message': grammar_msg
-                })
+            # Add suggestions if available
+            replacements = lt_issue.get('replacements', [])
+            if replacements:
+                message += f" - Suggestion: '{replacements[0]}'"
 
-                issues.append({
-                    'severity': 'warning',
-                    'category': 'grammar',
-                    'message': f"{context}: {grammar_msg}",
-                    'section': section_name
-                })
-                issue_counts['grammar'] += 1
+            text_issues.append({
+                'category': our_category,
+                'severity': our_severity,
+                'message': message
+            })
+        return text_issues
 
-            # P21: Capitalization checks
-            cap_issues = self._check_capitalization(text)
-            for cap_msg in cap_issues:
-                if issue_counts['capitalization'] >= max_per_category:
-                    break
+    def _basic_grammar_issues(self, text: str, spell: Optional['SpellChecker']) -> List[Dict]:
+        """Issues from pyspellchecker and the regex grammar/capitalization checks."""
+        text_issues = []
 
+        # P18: Typo detection using pyspellchecker
+        if spell is not None:
+            for typo_word, suggestion in self._check_spelling(text, spell):
                 text_issues.append({
-                    'category': 'capitalization',
-                    'severity': 'suggestion',
-                    'message': cap_msg
+                    'category': 'typo',
+                    'severity': 'warning',
+                    'message': f"Possible spelling error '{typo_word}'" + (f" - Suggestion: '{suggestion}'" if suggestion else "")
                 })
 
-                issues.append({
-                    'severity': 'suggestion',
-                    'category': 'capitalization',
-                    'message': f"{context}: {cap_msg}",
-                    'section': section_name
-                })
-                issue_counts['capitalization'] += 1
+        # P19: Basic grammar checks (common patterns)
+        for grammar_msg in self._check_basic_grammar(text):
+            text_issues.append({
+                'category': 'grammar',
+                'severity': 'warning',
+                'message': grammar_msg
+            })
 
-            # Cache the issues for this text
-            self._grammar_cache[text_hash] = text_issues
+        # P21: Capitalization checks
+        for cap_msg in self._check_capitalization(text):
+            text_issues.append({
+                'category': 'capitalization',
+                'severity': 'suggestion',
+                'message': cap_msg
+            })
 
-        return issues
+        return text_issues
 
     def _check_spelling(self, text: str, spell: 'SpellChecker') -> List[tuple]:
         """
@@ -1,10 +1,16 @@
-"""Role mapping service for normalizing job titles to standard roles."""
+"""Role mapping service for normalizing job titles to standard roles.
+
+Lookups go to the compiled corpus store (see corpus_store) when it is built
+and current; otherwise role_mappings.json is loaded into memory.
+"""
 
 import json
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from backend.services.corpus_store import CorpusStore, get_corpus_store, normalize_title
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +32,7 @@ class RoleMappingService:
         """
         self._title_to_role: Dict[str, str] = {}
         self._role_to_titles: Dict[str, List[str]] = {}
+        self._store: Optional[CorpusStore] = None
         self._available = False
 
         # Determine data path
@@ -40,11 +47,21 @@ class RoleMappingService:
         self._load_mappings(data_path)
 
     def _load_mappings(self, data_path: Path) -> None:
-        """Load role mappings from JSON file.
+        """Open the corpus store, or load role mappings from JSON file.
 
         Args:
             data_path: Path to the role_mappings.json file.
         """
+        store = get_corpus_store()
+        if store is not None and store.covers('role_mappings', data_path):
+            self._store = store
+            self._available = True
+            logger.info(
+                f"Using corpus store for {store.title_count()} job title mappings "
+                f"for {store.role_count()} roles"
+            )
+            return
+
         try:
             if not data_path.exists():
                 logger.warning(f"Role mappings file not found: {data_path}")
@@ -84,10 +101,8 @@ class RoleMappingService:
         Returns:
             Normalized string (lowercase, trimmed, single spaces).
         """
-        if not text:
-            return ""
         # Convert to lowercase, strip whitespace, normalize internal spaces
-        return " ".join(text.lower().strip().split())
+        return normalize_title(text)
 
     def normalize_role(self, job_title: Optional[str]) -> Optional[str]:
         """Map a job title to its standard role ID.
@@ -109,6 +124,8 @@ class RoleMappingService:
         if not normalized_title:
             return None
 
+        if self._store is not None:
+            return self._store.role_for_title(normalized_title)
         return self._title_to_role.get(normalized_title)
 
     def get_all_variations(self, role_id: Optional[str]) -> Optional[List[str]]:
@@ -130,6 +147,8 @@ class RoleMappingService:
         if not role_id:
             return None
 
+        if self._store is not None:
+            return self._store.titles_for_role(role_id)
         return self._role_to_titles.get(role_id)
 
     def is_available(self) -> bool:
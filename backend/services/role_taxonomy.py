@@ -853,23 +853,15 @@ def get_corpus_keywords(role_id: str, level: str) -> List[str]:
         List of corpus-derived keywords, or empty list if unavailable
     """
     try:
-        import json
-        from pathlib import Path
+        from backend.services.corpus_store import get_role_keywords
 
-        # Load role_keywords.json
-        keywords_file = Path(__file__).parent.parent / "data" / "keywords" / "role_keywords.json"
-
-        if not keywords_file.exists():
-            logger.debug(f"role_keywords.json not found at {keywords_file}")
-            return []
-
-        with open(keywords_file, 'r') as f:
-            all_keywords = json.load(f)
+        # Corpus store lookup, or role_keywords.json parsed once per process
+        all_keywords = get_role_keywords()
 
         # Build key for role+level (e.g., "product_manager_mid")
         key = f"{role_id}_{level}"
 
-        keywords = all_keywords.get(key, [])
+        keywords = list(all_keywords.get(key, []))
         logger.debug(f"Retrieved {len(keywords)} corpus keywords for {key}")
         return keywords
 
@@ -21,10 +21,148 @@ Research Foundation:
 - Industry best practices
 """
 
-from typing import Dict, List, Any, Optional
+import copy
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import date
+from typing import Callable, Dict, List, Any, Mapping, Optional, Tuple
+from backend.services.cache_utils import LRUCache, stable_digest
 from backend.services.parameters.registry import get_parameter_registry
 
 
+# Inputs each parameter reads, used to fingerprint them for incremental
+# rescoring.  Names are resume_data keys, plus:
+# - 'level': normalized experience level
+# - 'required_keywords' / 'preferred_keywords': resolved keyword lists
+#   (job requirements, or role defaults when no JD)
+# - 'today': current date, for scorers that measure against datetime.now()
+# - 'semantic_mode': encoder model id, or 'exact' while no model is loaded
+# - 'grammar_backend': 'languagetool' or 'fallback'
+# The last two keep results computed before the semantic model or
+# LanguageTool became available from being served once they are.
+# Keep in sync with the routing in ScorerV3._score_parameter.
+PARAMETER_INPUTS: Dict[str, Tuple[str, ...]] = {
+    'P1.1': ('text', 'required_keywords', 'level', 'semantic_mode'),
+    'P1.2': ('text', 'preferred_keywords', 'level', 'semantic_mode'),
+    'P2.1': ('bullets', 'level'),
+    'P2.2': ('bullets', 'level'),
+    'P2.3': ('bullets',),
+    'P2.4': ('bullets', 'level'),
+    'P2.5': ('bullets',),
+    'P3.1': ('page_count', 'level'),
+    'P3.2': ('text', 'level'),
+    'P3.3': ('sections',),
+    'P3.4': ('docx_structure', 'format', 'metadata'),
+    'P4.1': ('text', 'grammar_backend'),
+    'P4.2': ('text', 'bullets', 'contact'),
+    'P5.1': ('experience', 'level', 'today'),
+    'P5.2': ('experience', 'today'),
+    'P5.3': ('experience', 'level', 'today'),
+    'P6.1': ('experience', 'today'),
+    'P6.2': ('experience', 'today'),
+    'P6.3': ('bullets',),
+    'P6.4': ('experience',),
+    'P7.1': ('text',),
+    'P7.2': ('bullets',),
+    'P7.3': ('bullets',),
+}
+
+# Default number of parameter results kept for incremental rescoring
+DEFAULT_RESULT_CACHE_SIZE = 512
+
+# Parameters that wait on models or external services (sentence-transformers
+# encode, LanguageTool JVM/HTTP) and overlap well on threads.  Everything else
+# is pure-Python CPU work: run inline, or on the process pool when
+# SCORER_CPU_POOL=process.
+IO_BOUND_PARAMETERS = frozenset({'P1.1', 'P1.2', 'P4.1'})
+
+logger = logging.getLogger(__name__)
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+# Shared pools for parallel parameter evaluation (created on first use)
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_process_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+# Per-process scorer used by process-pool workers
+_worker_scorer: Optional['ScorerV3'] = None
+
+
+def _semantic_mode() -> str:
+    """Matching mode P1.1/P1.2 run in (see HybridKeywordMatcher.match_mode)."""
+    from backend.services.hybrid_keyword_matcher import get_hybrid_matcher
+    return get_hybrid_matcher().match_mode
+
+
+def _grammar_backend() -> str:
+    """Backend P4.1 checks with (see GrammarChecker.backend)."""
+    from backend.services.grammar_checker import get_grammar_checker
+    checker = get_grammar_checker()
+    checker._lazy_init()
+    return checker.backend
+
+
+def _get_thread_pool() -> ThreadPoolExecutor:
+    global _thread_pool
+    with _pool_lock:
+        if _thread_pool is None:
+            _thread_pool = ThreadPoolExecutor(
+                max_workers=int(os.getenv("SCORER_THREADS", "4")),
+                thread_name_prefix="scorer-param"
+            )
+        return _thread_pool
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    with _pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=int(os.getenv("SCORER_PROCESSES", str(min(4, os.cpu_count() or 1))))
+            )
+        return _process_pool
+
+
+def _score_parameter_in_process(
+    code: str,
+    resume_data: Dict[str, Any],
+    job_requirements: Optional[Dict[str, Any]],
+    experience_level: str,
+    role: str
+) -> Dict[str, Any]:
+    """Process-pool entry point: score one parameter with this process's scorer."""
+    global _worker_scorer
+    if _worker_scorer is None:
+        _worker_scorer = ScorerV3(result_cache_size=0, parallel=False)
+    param_info = _worker_scorer.registry.get_scorer(code)
+    return _worker_scorer._score_parameter_safe(
+        code, param_info, resume_data, job_requirements, experience_level, role
+    )
+
+
+def shutdown_parameter_pools(wait: bool = False) -> None:
+    """Shut down the parallel-scoring pools (called at app shutdown)."""
+    global _thread_pool, _process_pool
+    with _pool_lock:
+        for pool in (_thread_pool, _process_pool):
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=True)
+        _thread_pool = None
+        _process_pool = None
+
+
 class ScorerV3:
     """
     Production-ready ATS scorer integrating all 11 core parameters.
@@ -33,26 +171,74 @@ class ScorerV3:
     Provides detailed breakdown by category and parameter.
     """
 
-    def __init__(self):
-        """Initialize with parameter registry."""
+    def __init__(
+        self,
+        scorers: Optional[Mapping[str, Any]] = None,
+        result_cache_size: Optional[int] = None,
+        parallel: Optional[bool] = None,
+        cpu_pool: Optional[str] = None,
+        parameter_timeout: Optional[float] = None,
+        deadline: Optional[float] = None
+    ):
+        """
+        Initialize with parameter registry.
+
+        Args:
+            scorers: Optional pre-built scorer instances keyed by parameter
+                code. Passing the mapping of a warm instance (see
+                backend.services.scoring_engine) skips scorer construction.
+            result_cache_size: Parameter results kept for incremental
+                rescoring (default: SCORER_RESULT_CACHE_SIZE env var or 512,
+                0 disables reuse)
+            parallel: Evaluate parameters concurrently (default:
+                SCORER_PARALLEL env var, off)
+            cpu_pool: Where CPU-bound parameters run in parallel mode:
+                "inline" (calling thread) or "process" (default:
+                SCORER_CPU_POOL env var or "inline")
+            parameter_timeout: Seconds a pooled parameter may take before it
+                is marked 'timeout' (default: SCORER_PARAMETER_TIMEOUT or 15,
+                0 = no limit)
+            deadline: Seconds for all pooled parameters of one score() call
+                (default: SCORER_DEADLINE or 30, 0 = no limit)
+        """
         self.registry = get_parameter_registry()
-        self._load_scorers()
+        if scorers is not None:
+            self.scorers = scorers
+        else:
+            self._load_scorers()
+
+        if result_cache_size is None:
+            result_cache_size = int(os.getenv(
+                "SCORER_RESULT_CACHE_SIZE", str(DEFAULT_RESULT_CACHE_SIZE)
+            ))
+        self._result_cache = LRUCache(result_cache_size) if result_cache_size > 0 else None
+
+        self.parallel = _env_flag("SCORER_PARALLEL", False) if parallel is None else parallel
+        self.cpu_pool = (cpu_pool or os.getenv("SCORER_CPU_POOL", "inline")).lower()
+        if self.cpu_pool not in ("inline", "process"):
+            raise ValueError(f"Unknown cpu_pool: {self.cpu_pool!r} (use 'inline' or 'process')")
+        if parameter_timeout is None:
+            parameter_timeout = float(os.getenv("SCORER_PARAMETER_TIMEOUT", "15"))
+        if deadline is None:
+            deadline = float(os.getenv("SCORER_DEADLINE", "30"))
+        self.parameter_timeout = parameter_timeout or None
+        self.deadline = deadline or None
 
     def _load_scorers(self):
         """Load all scorer instances from registry."""
         all_params = self.registry.get_all_scorers()
 
         self.scorers = {}
-        for code, param_info in all_params.items():
-            scorer_class = param_info['scorer_class']
-            self.scorers[code] = scorer_class()
+        for code in all_params:
+            self.scorers[code] = self.registry.create_scorer(code)
 
     def score(
         self,
         resume_data: Dict[str, Any],
         job_requirements: Optional[Dict[str, Any]] = None,
         experience_level: str = "intermediary",
-        role: str = "software_engineer"
+        role: str = "software_engineer",
+        on_parameter: Optional[Callable[[str, str, Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
         Score a resume across all parameters.
@@ -68,6 +254,15 @@ class ScorerV3:
                 - required_keywords: List[str]
                 - preferred_keywords: List[str]
             experience_level: Experience level (beginner, intermediary, senior)
+            on_parameter: Optional callback(code, category, result) invoked as
+                each parameter result becomes available (reused results
+                first), e.g. to stream progress; exceptions it raises are
+                logged and ignored
+
+        Parameters whose declared inputs (PARAMETER_INPUTS) are unchanged
+        since an earlier call reuse that call's result instead of re-running
+        the scorer, so an edit to one bullet only re-runs scorers that read
+        bullets (or the full text the bullet is part of).
 
         Returns:
             Comprehensive scoring result with:
@@ -76,6 +271,7 @@ class ScorerV3:
             - parameter_scores: Individual parameter results
             - rating: Overall rating (Excellent/Good/Fair/Poor)
             - feedback: Actionable recommendations
+            - reused_parameters: Codes whose cached result was reused
         """
         # Normalize experience level
         experience_level = experience_level.lower().strip()
@@ -92,39 +288,56 @@ class ScorerV3:
             'Readability': {'score': 0, 'max': 5, 'parameters': {}}
         }
 
-        # Score all parameters
+        # Score all parameters (reusing results whose inputs are unchanged)
         all_params = self.registry.get_all_scorers()
+        reused_parameters = []
+        results = {}
+        pending = {}
 
-        for code, param_info in all_params.items():
+        def report(code: str, result: Dict[str, Any]) -> None:
+            if on_parameter is None:
+                return
+            try:
+                on_parameter(code, all_params[code]['category'], result)
+            except Exception as e:
+                logger.warning("on_parameter callback failed for %s: %s", code, e)
+
+        for code in all_params:
             try:
-                result = self._score_parameter(
-                    code,
-                    param_info,
-                    resume_data,
-                    job_requirements,
-                    experience_level,
-                    role  # Pass role for default keyword matching
+                cache_key = self._result_cache_key(
+                    code, resume_data, job_requirements, experience_level, role
                 )
+            except Exception:
+                cache_key = None
+            cached = self._cached_result(cache_key)
+            if cached is not None:
+                results[code] = cached
+                reused_parameters.append(code)
+                report(code, cached)
+            else:
+                pending[code] = cache_key
 
-                parameter_results[code] = result
+        computed = self._run_parameters(
+            list(pending), all_params, resume_data, job_requirements, experience_level, role,
+            on_result=report
+        )
+        for code, result in computed.items():
+            self._store_result(pending[code], result)
+        results.update(computed)
 
-                # Add to category total
-                category = param_info['category']
-                category_scores[category]['score'] = round(
-                    category_scores[category]['score'] + result['score'], 2
-                )
-                category_scores[category]['parameters'][code] = result
+        # Aggregate in registry order
+        for code, param_info in all_params.items():
+            result = results[code]
+            parameter_results[code] = result
+            if result.get('status') in ('error', 'timeout'):
+                continue
 
-            except Exception as e:
-                # Handle scoring errors gracefully (log but don't crash)
-                parameter_results[code] = {
-                    'score': 0,
-                    'max_score': param_info['max_score'],
-                    'percentage': 0,
-                    'error': str(e),
-                    'status': 'error',
-                    'details': {}
-                }
+            # Add to category total
+            category = param_info['category']
+            category_scores[category]['score'] = round(
+                category_scores[category]['score'] + result['score'], 2
+            )
+            category_scores[category]['parameters'][code] = result
 
         # Calculate total score and available maximum
         raw_score = sum(
@@ -132,10 +345,10 @@ class ScorerV3:
             for category in category_scores.values()
         )
 
-        # Calculate max available points (exclude skipped parameters)
+        # Calculate max available points (exclude skipped/timed-out parameters)
         max_available = 0
         for code, result in parameter_results.items():
-            if result.get('status') != 'skipped':
+            if result.get('status') not in ('skipped', 'timeout'):
                 max_available += result.get('max_score', 0)
 
         # Normalize to 100-point scale based on available points
@@ -169,9 +382,184 @@ class ScorerV3:
             'category_scores': category_scores,
             'parameter_scores': parameter_results,
             'feedback': feedback,
+            'reused_parameters': reused_parameters,
             'version': 'v3.0'
         }
 
+    def _run_parameters(
+        self,
+        codes: List[str],
+        all_params: Dict[str, Dict[str, Any]],
+        resume_data: Dict[str, Any],
+        job_requirements: Optional[Dict[str, Any]],
+        experience_level: str,
+        role: str,
+        on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Score the given parameters, serially or in parallel.
+
+        In parallel mode IO-bound parameters go to the shared thread pool and,
+        with cpu_pool="process", CPU-bound ones to the process pool; the rest
+        run inline while pooled work proceeds.  A pooled parameter that misses
+        its per-parameter timeout or the overall deadline is reported with
+        status 'timeout' instead of failing the whole score (the straggler
+        finishes in the background and its result is discarded).
+        ``on_result(code, result)`` is called as each result is collected.
+        """
+        args = (resume_data, job_requirements, experience_level, role)
+        results = {}
+
+        def collect(code: str, result: Dict[str, Any]) -> None:
+            results[code] = result
+            if on_result is not None:
+                on_result(code, result)
+
+        if not self.parallel or len(codes) < 2:
+            for code in codes:
+                collect(code, self._score_parameter_safe(code, all_params[code], *args))
+            return results
+
+        start = time.monotonic()
+        futures = {}
+        inline = []
+        for code in codes:
+            if code in IO_BOUND_PARAMETERS:
+                futures[code] = _get_thread_pool().submit(
+                    self._score_parameter_safe, code, all_params[code], *args
+                )
+            elif self.cpu_pool == "process":
+                futures[code] = _get_process_pool().submit(
+                    _score_parameter_in_process, code, *args
+                )
+            else:
+                inline.append(code)
+
+        for code in inline:
+            collect(code, self._score_parameter_safe(code, all_params[code], *args))
+
+        for code, future in futures.items():
+            max_score = all_params[code]['max_score']
+            limits = []
+            if self.parameter_timeout:
+                limits.append(start + self.parameter_timeout)
+            if self.deadline:
+                limits.append(start + self.deadline)
+            wait = max(0.0, min(limits) - time.monotonic()) if limits else None
+            try:
+                collect(code, future.result(timeout=wait))
+            except FutureTimeoutError:
+                future.cancel()
+                logger.warning("Parameter %s timed out after %.1fs", code, time.monotonic() - start)
+                collect(code, self._timeout_result(max_score, time.monotonic() - start))
+            except Exception as e:
+                # Broken process pool, unpicklable input, ...
+                collect(code, self._error_result(max_score, e))
+
+        return results
+
+    def _score_parameter_safe(
+        self,
+        code: str,
+        param_info: Dict[str, Any],
+        resume_data: Dict[str, Any],
+        job_requirements: Optional[Dict[str, Any]],
+        experience_level: str,
+        role: str
+    ) -> Dict[str, Any]:
+        """_score_parameter that reports exceptions as an error result."""
+        try:
+            return self._score_parameter(
+                code,
+                param_info,
+                resume_data,
+                job_requirements,
+                experience_level,
+                role  # Pass role for default keyword matching
+            )
+        except Exception as e:
+            # Handle scoring errors gracefully (log but don't crash)
+            return self._error_result(param_info['max_score'], e)
+
+    def _resolve_keywords(
+        self,
+        kind: str,
+        job_requirements: Optional[Dict[str, Any]],
+        role: str
+    ) -> List[str]:
+        """
+        Keywords for P1.1 (kind='required') or P1.2 (kind='preferred').
+
+        Uses role-specific default keywords if no JD provided.
+        """
+        key = f'{kind}_keywords'
+        if not job_requirements or key not in job_requirements:
+            from backend.services.role_keywords import get_role_keywords
+            role_keywords = get_role_keywords(role) or {}
+            return role_keywords.get(kind, [])
+        return job_requirements[key]
+
+    def _result_cache_key(
+        self,
+        code: str,
+        resume_data: Dict[str, Any],
+        job_requirements: Optional[Dict[str, Any]],
+        experience_level: str,
+        role: str
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Fingerprint of the inputs parameter ``code`` reads.
+
+        Returns None (never reuse) when caching is disabled, the parameter
+        has no declared inputs, or an input cannot be serialized.
+        """
+        if self._result_cache is None or code not in PARAMETER_INPUTS:
+            return None
+
+        values = []
+        for name in PARAMETER_INPUTS[code]:
+            if name == 'level':
+                values.append(experience_level)
+            elif name == 'today':
+                values.append(date.today().isoformat())
+            elif name == 'required_keywords':
+                values.append(self._resolve_keywords('required', job_requirements, role))
+            elif name == 'preferred_keywords':
+                values.append(self._resolve_keywords('preferred', job_requirements, role))
+            elif name == 'semantic_mode':
+                values.append(_semantic_mode())
+            elif name == 'grammar_backend':
+                values.append(_grammar_backend())
+            else:
+                values.append(resume_data.get(name))
+
+        try:
+            payload = json.dumps(values, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        return (code, stable_digest(code, payload))
+
+    def _cached_result(self, cache_key: Optional[Tuple[str, str]]) -> Optional[Dict[str, Any]]:
+        """Return a copy of a previously computed parameter result, if any."""
+        if cache_key is None:
+            return None
+        cached = self._result_cache.get(cache_key)
+        return copy.deepcopy(cached) if cached is not None else None
+
+    def _store_result(self, cache_key: Optional[Tuple[str, str]], result: Dict[str, Any]) -> None:
+        """Remember a parameter result (errors and timeouts are never cached)."""
+        if cache_key is None or result.get('status') in ('error', 'timeout'):
+            return
+        self._result_cache.set(cache_key, copy.deepcopy(result))
+
+    def result_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss statistics of the incremental rescoring cache."""
+        if self._result_cache is None:
+            return {'enabled': False}
+        stats = self._result_cache.stats()
+        stats['enabled'] = True
+        return stats
+
     def _score_parameter(
         self,
         code: str,
@@ -192,13 +580,7 @@ class ScorerV3:
 
         # P1.1: Required Keywords Match (25pts)
         if code == 'P1.1':
-            # Use role-specific default keywords if no JD provided
-            if not job_requirements or 'required_keywords' not in job_requirements:
-                from backend.services.role_keywords import get_role_keywords
-                role_keywords = get_role_keywords(role) or {}
-                keywords = role_keywords.get('required', [])
-            else:
-                keywords = job_requirements['required_keywords']
+            keywords = self._resolve_keywords('required', job_requirements, role)
 
             result = scorer.score(
                 keywords=keywords,
@@ -208,13 +590,7 @@ class ScorerV3:
 
         # P1.2: Preferred Keywords Match (10pts)
         elif code == 'P1.2':
-            # Use role-specific default keywords if no JD provided
-            if not job_requirements or 'preferred_keywords' not in job_requirements:
-                from backend.services.role_keywords import get_role_keywords
-                role_keywords = get_role_keywords(role) or {}
-                preferred = role_keywords.get('preferred', [])
-            else:
-                preferred = job_requirements['preferred_keywords']
+            preferred = self._resolve_keywords('preferred', job_requirements, role)
 
             result = scorer.score(
                 preferred_keywords=preferred,
@@ -449,6 +825,28 @@ class ScorerV3:
             'details': {}
         }
 
+    def _error_result(self, max_score: int, error: Exception) -> Dict[str, Any]:
+        """Return result for a parameter whose scorer raised."""
+        return {
+            'score': 0,
+            'max_score': max_score,
+            'percentage': 0,
+            'error': str(error),
+            'status': 'error',
+            'details': {}
+        }
+
+    def _timeout_result(self, max_score: int, elapsed: float) -> Dict[str, Any]:
+        """Return result for a parameter that missed its time budget."""
+        return {
+            'score': 0,
+            'max_score': max_score,
+            'percentage': 0,
+            'status': 'timeout',
+            'reason': f'Scoring did not finish within {elapsed:.1f}s',
+            'details': {}
+        }
+
     def _calculate_rating(self, total_score: float) -> str:
         """
         Calculate overall rating based on total score.
@@ -5,9 +5,10 @@ This adapter converts between the ResumeData format used by the API
 and the dict format expected by ScorerV3, and vice versa for responses.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 import re
 from backend.services.parser import ResumeData
+from backend.services.date_normalizer import normalize_entry_dates
 from backend.services.scorer_v3 import ScorerV3
 
 
@@ -22,9 +23,15 @@ class ScorerV3Adapter:
     - Convert ScorerV3 output to API response format
     """
 
-    def __init__(self):
-        """Initialize adapter with ScorerV3 instance."""
-        self.scorer = ScorerV3()
+    def __init__(self, scorer: Optional[ScorerV3] = None):
+        """
+        Initialize adapter with ScorerV3 instance.
+
+        Args:
+            scorer: Optional existing ScorerV3 to reuse (e.g. the warm
+                process-wide engine); a new one is built when omitted.
+        """
+        self.scorer = scorer if scorer is not None else ScorerV3()
 
     def score(
         self,
@@ -32,6 +39,8 @@ class ScorerV3Adapter:
         job_description: Optional[str] = None,
         level: str = "mid",
         role: str = "software_engineer",
+        job_requirements: Optional[Dict[str, List[str]]] = None,
+        on_parameter: Optional[Callable[[str, str, Dict[str, Any]], None]] = None,
         **kwargs  # Accept but ignore other params for compatibility
     ) -> Dict[str, Any]:
         """
@@ -42,6 +51,10 @@ class ScorerV3Adapter:
             job_description: Raw job description text
             level: Experience level (entry/mid/senior/lead/executive)
             role: Job role for default keyword matching (product_manager, software_engineer, etc.)
+            job_requirements: Keywords already extracted from job_description
+                (e.g. once for a whole batch); skips extraction when given
+            on_parameter: Optional per-parameter progress callback, passed
+                to ScorerV3.score
 
         Returns:
             Scoring result in API-compatible format
@@ -50,8 +63,7 @@ class ScorerV3Adapter:
         scorer_input = self._convert_resume_data(resume_data)
 
         # Extract job requirements from description
-        job_requirements = None
-        if job_description:
+        if job_requirements is None and job_description:
             job_requirements = self._extract_job_requirements(job_description)
 
         # Map experience level
@@ -62,7 +74,8 @@ class ScorerV3Adapter:
             resume_data=scorer_input,
             job_requirements=job_requirements,
             experience_level=experience_level,
-            role=role  # Pass role for default keyword matching
+            role=role,  # Pass role for default keyword matching
+            on_parameter=on_parameter
         )
 
         # Convert result to API format
@@ -206,6 +219,8 @@ class ScorerV3Adapter:
                     exp_copy['start_date'] = start
                     exp_copy['end_date'] = end
                     exp_copy['dates'] = f"{start} - {end}".strip(' -') if (start or end) else ''
+                    # Normalized once here; P5/P6 scorers read start_month/end_month
+                    exp_copy.update(normalize_entry_dates(exp_copy))
 
                     transformed_experience.append(exp_copy)
 
@@ -248,6 +263,23 @@ class ScorerV3Adapter:
         """
         Extract required and preferred keywords from job description.
 
+        Memoized per normalized JD in the shared JD analysis cache, so
+        rescoring against the same job description skips extraction.
+        """
+        if not job_description:
+            return {'required_keywords': [], 'preferred_keywords': []}
+
+        from backend.services.jd_analysis_cache import get_jd_analysis_cache
+
+        return get_jd_analysis_cache().job_requirements(
+            job_description,
+            lambda: self._analyze_job_requirements(job_description)
+        )
+
+    def _analyze_job_requirements(self, job_description: str) -> Dict[str, List[str]]:
+        """
+        Uncached keyword extraction behind _extract_job_requirements.
+
         Uses semantic keyword extraction (KeyBERT) for intelligent extraction.
         Falls back to simple heuristics if semantic extraction fails.
 
@@ -0,0 +1,120 @@
+"""
+Scoring Engine - process-wide warm ScorerV3 instance.
+
+Building a ScorerV3 instantiates all 21 parameter scorers, several of which
+load JSON pattern files (ActionVerbClassifier, VaguePhraseDetector) or wire up
+matcher singletons.  Doing that per request puts constructor work inside the
+request latency budget.
+
+The engine is built once (at app lifespan startup via init_scoring_engine())
+and shared by every request.  Parameter scorers keep no per-call state, so a
+single instance is safe to use from concurrent threads; the scorer mapping is
+exposed read-only so nothing can swap scorers out from under an in-flight
+request.
+"""
+
+import logging
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Optional
+
+from backend.services.date_normalizer import cache_stats as date_cache_stats
+from backend.services.grammar_cache import get_grammar_result_cache
+from backend.services.jd_analysis_cache import get_jd_analysis_cache
+from backend.services.scorer_v3 import ScorerV3
+from backend.services.scorer_v3_adapter import ScorerV3Adapter
+
+logger = logging.getLogger(__name__)
+
+
+class ScoringEngine:
+    """
+    Immutable bundle of a warm ScorerV3 and its API adapter.
+
+    Attributes:
+        scorer: Shared ScorerV3 instance (scorers mapping is read-only)
+        adapter: ScorerV3Adapter bound to the shared scorer
+        init_costs: Seconds spent constructing each parameter scorer
+        build_seconds: Total wall time spent building the engine
+    """
+
+    __slots__ = ('scorer', 'adapter', 'init_costs', 'build_seconds')
+
+    def __init__(self):
+        start = time.perf_counter()
+        scorer = ScorerV3()
+        scorer.scorers = MappingProxyType(dict(scorer.scorers))
+        object.__setattr__(self, 'scorer', scorer)
+        object.__setattr__(self, 'adapter', ScorerV3Adapter(scorer=scorer))
+        object.__setattr__(
+            self, 'init_costs', MappingProxyType(scorer.registry.get_init_costs())
+        )
+        object.__setattr__(self, 'build_seconds', time.perf_counter() - start)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ScoringEngine is immutable")
+
+    def score(self, resume_data, **kwargs) -> Dict[str, Any]:
+        """Score ResumeData via the shared adapter (same signature as ScorerV3Adapter.score)."""
+        return self.adapter.score(resume_data=resume_data, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return build timing and cache information for diagnostics."""
+        return {
+            'build_seconds': round(self.build_seconds, 4),
+            'parameters': len(self.scorer.scorers),
+            'init_costs': {code: round(cost, 4) for code, cost in self.init_costs.items()},
+            'result_cache': self.scorer.result_cache_stats(),
+            'jd_analysis_cache': get_jd_analysis_cache().stats(),
+            'date_cache': date_cache_stats(),
+            'grammar_cache': get_grammar_result_cache().stats(),
+        }
+
+
+# Global engine instance
+_engine: Optional[ScoringEngine] = None
+_engine_lock = threading.Lock()
+
+
+def init_scoring_engine() -> ScoringEngine:
+    """
+    Build the process-wide scoring engine if it does not exist yet.
+
+    Called from the FastAPI lifespan hook; safe to call more than once.
+    """
+    global _engine
+
+    if _engine is not None:
+        return _engine
+
+    with _engine_lock:
+        if _engine is None:
+            engine = ScoringEngine()
+            slowest = sorted(engine.init_costs.items(), key=lambda kv: kv[1], reverse=True)[:3]
+            logger.info(
+                "Scoring engine ready in %.3fs (slowest scorers: %s)",
+                engine.build_seconds,
+                ", ".join(f"{code}={cost:.3f}s" for code, cost in slowest),
+            )
+            _engine = engine
+    return _engine
+
+
+def get_scoring_engine() -> ScoringEngine:
+    """
+    Get the shared scoring engine (FastAPI dependency).
+
+    Lazily builds the engine when lifespan startup did not run (e.g. tests
+    that call endpoints without the app lifespan).
+    """
+    if _engine is None:
+        return init_scoring_engine()
+    return _engine
+
+
+def reset_scoring_engine() -> None:
+    """Drop the shared engine so the next access rebuilds it (for tests)."""
+    global _engine
+    with _engine_lock:
+        _engine = None
@@ -4,8 +4,10 @@ Supports various formats: heading styles, bold text, ALL CAPS, tables.
 """
 from docx import Document
 from docx.text.paragraph import Paragraph
-from io import BytesIO
+from typing import Union
 import logging
+from backend.services.parsed_docx import ParsedDocx, ParsedParagraph, parse_run
+from backend.services.section_headers import SECTION_ALIASES, get_section_header_classifier
 
 logger = logging.getLogger(__name__)
 
@@ -16,12 +18,13 @@ class SectionDetector:
     MIN_HEADING_FONT_SIZE = 12  # Minimum font size (in points) for bold text headings
     MIN_HEADING_LENGTH = 2      # Minimum length for ALL CAPS headings
 
-    def detect(self, docx_bytes: bytes) -> list[dict]:
+    def detect(self, docx_bytes: Union[bytes, ParsedDocx]) -> list[dict]:
         """
         Detect sections from DOCX bytes.
 
         Args:
-            docx_bytes: DOCX file content as bytes
+            docx_bytes: DOCX file content as bytes, or a ParsedDocx shared
+                with the parser and HTML converter
 
         Returns:
             List of section dictionaries, each containing:
@@ -40,7 +43,7 @@ class SectionDetector:
             raise ValueError("docx_bytes cannot be empty")
 
         try:
-            doc = Document(BytesIO(docx_bytes))
+            parsed = ParsedDocx.coerce(docx_bytes)
         except Exception as e:
             logger.error(f"Failed to parse DOCX: {e}")
             raise ValueError(f"Invalid DOCX format: {e}")
@@ -50,13 +53,14 @@ class SectionDetector:
         section_counter = 0
 
         # Handle empty document
-        if not doc.paragraphs:
+        if not parsed.paragraphs:
             logger.warning("Document has no paragraphs")
             return sections
 
-        logger.info(f"Processing document with {len(doc.paragraphs)} paragraphs")
+        logger.info(f"Processing document with {len(parsed.paragraphs)} paragraphs")
 
-        for idx, para in enumerate(doc.paragraphs):
+        for para in parsed.paragraphs:
+            idx = para.index
             text = para.text.strip()
             if not text:
                 continue
@@ -95,81 +99,53 @@ class SectionDetector:
         logger.info(f"Detected {len(sections)} sections")
         return sections
 
-    def _is_section_heading(self, paragraph: Paragraph) -> bool:
+    def _is_section_heading(self, paragraph: Union[Paragraph, ParsedParagraph]) -> bool:
         """
         Determine if paragraph is a section heading.
 
         Args:
-            paragraph: DOCX paragraph object
+            paragraph: ParsedParagraph (or python-docx Paragraph)
 
         Returns:
             True if paragraph appears to be a section heading, False otherwise
         """
+        if isinstance(paragraph, Paragraph):
+            paragraph = ParsedParagraph(
+                index=-1,
+                text=paragraph.text,
+                full_text=paragraph.text,
+                style_name=paragraph.style.name if paragraph.style is not None else '',
+                runs=[parse_run(run) for run in paragraph.runs],
+                element=paragraph._element,
+            )
+
         # Check style name
-        if 'Heading' in paragraph.style.name:
+        if 'Heading' in paragraph.style_name:
             logger.debug(f"Heading detected by style: {paragraph.text[:50]}")
             return True
 
         # Check if text is bold and larger font
         if paragraph.runs:
             first_run = paragraph.runs[0]
-            try:
-                # Safely check font size with proper error handling
-                if first_run.bold and first_run.font.size and hasattr(first_run.font.size, 'pt'):
-                    if first_run.font.size.pt >= self.MIN_HEADING_FONT_SIZE:
-                        logger.debug(f"Heading detected by bold+size: {paragraph.text[:50]}")
-                        return True
-            except (AttributeError, TypeError) as e:
-                # Font size may not be available for all runs
-                logger.debug(f"Could not check font size: {e}")
+            if first_run.bold and first_run.font_size_pt:
+                if first_run.font_size_pt >= self.MIN_HEADING_FONT_SIZE:
+                    logger.debug(f"Heading detected by bold+size: {paragraph.text[:50]}")
+                    return True
 
         # Check for ALL CAPS (likely a heading)
         text = paragraph.text.strip()
-        if text and text.isupper() and len(text) > self.MIN_HEADING_LENGTH:
+        if (text and text.isupper() and len(text) > self.MIN_HEADING_LENGTH
+                and get_section_header_classifier().looks_like_header(text)):
             logger.debug(f"Heading detected by ALL CAPS: {text[:50]}")
             return True
 
         return False
 
-    # Common section headers for keyword-based detection
-    # Expanded to recognize many alternate names people use for sections
+    # Common section headers for keyword-based detection, from the alias
+    # table shared with the text parser (see section_headers)
     SECTION_KEYWORDS = {
-        'Contact': ['contact', 'personal', 'contact information', 'personal information', 'details'],
-        'Summary': [
-            'summary', 'objective', 'about', 'profile', 'brief',
-            'professional summary', 'career summary', 'executive summary',
-            'profile brief', 'professional profile', 'career profile',
-            'about me', 'career objective', 'professional objective',
-            'personal statement', 'introduction', 'overview',
-            'professional overview', 'career overview'
-        ],
-        'Experience': [
-            'experience', 'employment', 'work history', 'professional experience',
-            'work experience', 'employment history', 'career history',
-            'professional history', 'relevant experience', 'work'
-        ],
-        'Education': [
-            'education', 'academic', 'qualifications', 'academic background',
-            'educational background', 'academic qualifications', 'academics',
-            'educational qualifications', 'training'
-        ],
-        'Skills': [
-            'skills', 'technical skills', 'competencies', 'core competencies',
-            'areas of expertise', 'key skills', 'expertise', 'capabilities',
-            'technical competencies', 'professional skills', 'skillset'
-        ],
-        'Projects': [
-            'projects', 'portfolio', 'key projects', 'notable projects',
-            'project portfolio', 'major projects', 'project experience'
-        ],
-        'Certifications': [
-            'certifications', 'certificates', 'licenses', 'professional certifications',
-            'licensed', 'certification', 'professional licenses'
-        ],
-        'Awards': [
-            'awards', 'honors', 'achievements', 'accomplishments',
-            'recognition', 'honors and awards', 'awards and honors'
-        ]
+        section.capitalize(): list(aliases)
+        for section, aliases in SECTION_ALIASES.items()
     }
 
     def detect_sections(self, doc: Document) -> list[dict]:
@@ -234,26 +210,12 @@ class SectionDetector:
         if not text or len(text) > 50:
             return False
 
-        text_lower = text.lower().strip()
-
-        # Check against known section keywords
-        for keywords in self.SECTION_KEYWORDS.values():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    return True
-
-        return False
+        return get_section_header_classifier().match(text) is not None
 
     def _identify_section(self, text: str) -> str:
         """Identify which section a header belongs to"""
         if not text:
             return None
 
-        text_lower = text.lower().strip()
-
-        for section_name, keywords in self.SECTION_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    return section_name
-
-        return None
+        found = get_section_header_classifier().match(text)
+        return found.section.capitalize() if found else None
@@ -0,0 +1,247 @@
+"""
+Section Headers - one precompiled engine for recognizing resume section headers.
+
+extract_resume_sections (plain text from PDF/DOCX) and SectionDetector (DOCX
+paragraphs) each kept their own alias lists and matched them by substring,
+one alias at a time, for every line.  Substring matching also fired inside
+body text ("Experienced engineer ...", "Managed tools and budgets").
+
+SectionHeaderClassifier compiles SECTION_ALIASES once per process:
+
+- A combined regex checks header shape (length, leading bullet/number,
+  punctuation) and, in the same pass, that the line contains an alias word
+  at all, so most body lines are rejected by one regex search
+- A trie of normalized alias token sequences finds the longest alias;
+  ties go to SECTION_PRIORITY (so "EXPERIENCE SUMMARY" is experience)
+- Alias words must cover at least half of the line's content words, so
+  "Experienced engineer leading cloud migrations" is not a header
+
+Normalization lowercases, maps "&" to "and" and strips plural "s", so
+"Skills & Tools", "SKILL AND TOOL" and "skills and tools" are one alias.
+For "Header: content" lines only the part before the colon is classified.
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+# Canonical section -> header aliases (shared by the parser and SectionDetector)
+SECTION_ALIASES: Dict[str, Tuple[str, ...]] = {
+    'experience': (
+        'experience', 'employment', 'work history', 'professional experience',
+        'work experience', 'employment history', 'career history',
+        'professional history', 'relevant experience', 'work',
+    ),
+    'education': (
+        'education', 'academic', 'qualifications', 'academic background',
+        'educational background', 'academic qualifications', 'academics',
+        'educational qualifications', 'training',
+    ),
+    'skills': (
+        'skills', 'technical skills', 'competencies', 'core competencies',
+        'areas of expertise', 'key skills', 'expertise', 'capabilities',
+        'technical competencies', 'professional skills', 'skillset',
+        'technical expertise', 'technologies', 'tools', 'tools and technologies',
+        'additional information', 'additional', 'other information',
+    ),
+    'certifications': (
+        'certifications', 'certificates', 'licenses', 'professional certifications',
+        'licensed', 'certification', 'professional licenses',
+        'licenses and certifications', 'certifications and licenses',
+        'certifications and training',
+    ),
+    'projects': (
+        'projects', 'portfolio', 'key projects', 'notable projects',
+        'project portfolio', 'major projects', 'project experience',
+    ),
+    'awards': (
+        'awards', 'honors', 'achievements', 'accomplishments',
+        'recognition', 'honors and awards', 'awards and honors',
+    ),
+    'summary': (
+        'summary', 'objective', 'about', 'profile', 'brief',
+        'professional summary', 'career summary', 'executive summary',
+        'profile brief', 'professional profile', 'career profile',
+        'about me', 'career objective', 'professional objective',
+        'personal statement', 'introduction', 'overview',
+        'professional overview', 'career overview', 'summary of qualifications',
+    ),
+    'contact': (
+        'contact', 'personal', 'contact information', 'personal information', 'details',
+    ),
+}
+
+# Tie-break between equally long aliases, most specific first
+SECTION_PRIORITY: Tuple[str, ...] = (
+    'experience', 'education', 'skills', 'certifications',
+    'projects', 'awards', 'summary', 'contact',
+)
+
+# Sections extract_resume_sections fills in
+PARSER_SECTIONS: FrozenSet[str] = frozenset(
+    {'experience', 'education', 'skills', 'certifications', 'summary'}
+)
+
+MAX_HEADER_LENGTH = 80
+# Share of a line's content words that must belong to an alias
+MIN_ALIAS_COVERAGE = 0.5
+
+# Ignored when measuring alias coverage
+_STOPWORDS = frozenset({'a', 'an', 'and', 'the', 'of', 'in', 'for', 'to', 'my', 'our'})
+
+_TOKEN_RE = re.compile(r"[a-z]+")
+
+# Trie node key marking "an alias ends here"
+_END = ''
+
+# Header shape, as one pattern: at most MAX_HEADER_LENGTH characters, no
+# leading bullet or digit, at most two commas and at most one period
+_SHAPE_PATTERN = (
+    r'(?=.{0,%d}$)'
+    r'(?![•\-*0-9])'
+    r'(?!(?:[^,]*,){3})'
+    r'(?!(?:[^.]*\.){2})'
+) % MAX_HEADER_LENGTH
+
+
+def _singular(token: str) -> str:
+    if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+        return token[:-1]
+    return token
+
+
+def normalize_header(text: str) -> List[str]:
+    """Lowercase, singularized word tokens of ``text`` ("&" reads as "and")."""
+    return [_singular(token) for token in _TOKEN_RE.findall(text.lower().replace('&', ' and '))]
+
+
+@dataclass(frozen=True)
+class HeaderMatch:
+    """A recognized header: canonical section and the alias that matched."""
+    section: str
+    alias: str
+
+
+class SectionHeaderClassifier:
+    """
+    Classify lines as section headers.
+
+    match() classifies header text regardless of shape (for text already
+    known to be a heading, e.g. a DOCX paragraph); classify() also requires
+    the line to look like a header and is meant for plain text lines.
+    """
+
+    def __init__(
+        self,
+        aliases: Optional[Dict[str, Sequence[str]]] = None,
+        priority: Sequence[str] = SECTION_PRIORITY
+    ):
+        self.aliases = {section: tuple(names) for section, names in (aliases or SECTION_ALIASES).items()}
+        self._rank = {section: rank for rank, section in enumerate(priority)}
+
+        self._trie: Dict[str, dict] = {}
+        words = set()
+        for section, names in self.aliases.items():
+            for alias in names:
+                tokens = normalize_header(alias)
+                node = self._trie
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                # First section to claim an alias keeps it
+                node.setdefault(_END, HeaderMatch(section, alias))
+                words.update(alias.lower().replace('&', ' ').split())
+                words.update(tokens)
+
+        alternation = '|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+        self._word_re = re.compile(r'(?<![a-z])(?:%s)s?(?![a-z])' % alternation, re.IGNORECASE)
+        self._header_re = re.compile(
+            r'^%s(?=.*?(?<![a-z])(?:%s)s?(?![a-z]))' % (_SHAPE_PATTERN, alternation),
+            re.IGNORECASE | re.DOTALL,
+        )
+        self._shape_re = re.compile(r'^%s' % _SHAPE_PATTERN, re.DOTALL)
+
+    def looks_like_header(self, line: str) -> bool:
+        """
+        Check if a line is shaped like a section header (not body text).
+
+        Headers are short (<= 80 chars), don't start with a bullet or
+        number, and have at most two commas and one period.
+        """
+        return self._shape_re.match(line.strip()) is not None
+
+    def match(self, text: str, sections: Optional[Iterable[str]] = None) -> Optional[HeaderMatch]:
+        """
+        Find the section named by header text.
+
+        Args:
+            text: Header text
+            sections: Only consider these canonical sections (default: all)
+
+        Returns:
+            HeaderMatch, or None when the text does not name a section
+        """
+        if not text or self._word_re.search(text) is None:
+            return None
+        return self._match_tokens(self._header_part(text), sections)
+
+    def classify(self, line: str, sections: Optional[Iterable[str]] = None) -> Optional[str]:
+        """
+        Canonical section for a plain-text line, or None if it is not a header.
+
+        Args:
+            line: One line of resume text
+            sections: Only consider these canonical sections (default: all)
+        """
+        stripped = line.strip()
+        if self._header_re.match(stripped) is None:
+            return None
+        found = self._match_tokens(self._header_part(stripped), sections)
+        return found.section if found else None
+
+    @staticmethod
+    def _header_part(text: str) -> List[str]:
+        head, sep, _ = text.partition(':')
+        return normalize_header(head if sep and head.strip() else text)
+
+    def _match_tokens(self, tokens: List[str], sections: Optional[Iterable[str]]) -> Optional[HeaderMatch]:
+        allowed = set(sections) if sections is not None else None
+        best: Optional[Tuple[int, int, HeaderMatch]] = None
+        covered = set()
+
+        for start in range(len(tokens)):
+            node = self._trie
+            for end in range(start, len(tokens)):
+                node = node.get(tokens[end])
+                if node is None:
+                    break
+                found = node.get(_END)
+                if found is None:
+                    continue
+                covered.update(range(start, end + 1))
+                if allowed is not None and found.section not in allowed:
+                    continue
+                key = (end - start + 1, -self._rank.get(found.section, len(self._rank)))
+                if best is None or key > best[:2]:
+                    best = (key[0], key[1], found)
+
+        if best is None:
+            return None
+
+        content = [i for i, token in enumerate(tokens) if token not in _STOPWORDS] or list(range(len(tokens)))
+        coverage = sum(1 for i in content if i in covered) / len(content)
+        return best[2] if coverage >= MIN_ALIAS_COVERAGE else None
+
+
+_classifier: Optional[SectionHeaderClassifier] = None
+_classifier_lock = threading.Lock()
+
+
+def get_section_header_classifier() -> SectionHeaderClassifier:
+    """Get or create the shared classifier (compiled once per process)."""
+    global _classifier
+    if _classifier is None:
+        with _classifier_lock:
+            if _classifier is None:
+                _classifier = SectionHeaderClassifier()
+    return _classifier
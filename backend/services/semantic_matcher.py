@@ -16,6 +16,9 @@ import time
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from functools import lru_cache
 
+from backend.services.embedding_cache import cosine_matrix, get_embedding_cache
+from backend.services.sentence_encoder import load_keyword_extractor, load_sentence_encoder, model_id_for
+
 logger = logging.getLogger(__name__)
 
 # Timeout for loading the sentence-transformers model.
@@ -29,17 +32,17 @@ _MODEL_LOAD_TIMEOUT_SECONDS = 15
 # per scoring request the process exceeds the memory limit and OOMs.
 # Set ENABLE_SEMANTIC_MATCHING=true to opt in; default is disabled.
 # Without the model, keyword matching falls back to exact string comparison.
+# SEMANTIC_ENCODER=onnx runs an int8 ONNX export instead of torch, which fits
+# the 512 MB budget (see sentence_encoder.py).
 _SEMANTIC_MATCHING_ENABLED = os.getenv("ENABLE_SEMANTIC_MATCHING", "false").lower() == "true"
 
-# Phase 1.4: Caching support
+# Phase 1.4: Caching support (embeddings: see embedding_cache)
 try:
-    from backend.services.cache_utils import cache_embeddings, cache_keywords
+    from backend.services.cache_utils import cache_keywords
     CACHING_AVAILABLE = True
 except ImportError:
     CACHING_AVAILABLE = False
-    # Fallback decorators that do nothing
-    def cache_embeddings(expire=None):
-        return lambda f: f
+    # Fallback decorator that does nothing
     def cache_keywords(expire=None):
         return lambda f: f
 
@@ -92,10 +95,10 @@ class SemanticKeywordMatcher:
             return
 
         def _load():
-            from sentence_transformers import SentenceTransformer
-            from keybert import KeyBERT
-            model = SentenceTransformer('all-MiniLM-L6-v2')
-            return model, KeyBERT(model)
+            # SEMANTIC_ENCODER picks torch (sentence-transformers + KeyBERT)
+            # or the int8 ONNX encoder
+            model = load_sentence_encoder()
+            return model, load_keyword_extractor(model)
 
         try:
             executor = ThreadPoolExecutor(max_workers=1)
@@ -187,7 +190,6 @@ class SemanticKeywordMatcher:
             print(f"KeyBERT extraction failed: {e}")
             return self._fallback_keyword_extraction(job_description, top_n)
 
-    @cache_embeddings(expire=7200)  # Cache embeddings for 2 hours
     def semantic_match_score(
         self,
         resume_text: str,
@@ -197,7 +199,8 @@ class SemanticKeywordMatcher:
         """
         Calculate semantic similarity between resume and job keywords.
 
-        Phase 1.4: Embeddings are cached for 2 hours for performance.
+        Resume and keyword embeddings come from the shared EmbeddingCache,
+        so unchanged texts are never re-encoded.
 
         Args:
             resume_text: Full resume text
@@ -224,14 +227,11 @@ class SemanticKeywordMatcher:
             return self._fallback_exact_matching(resume_text, job_keywords, similarity_threshold)
 
         try:
-            from sentence_transformers import util
-
             model = self._model  # local ref for thread safety
 
             def _encode():
-                r_emb = model.encode(resume_text, convert_to_tensor=True, show_progress_bar=False)
-                kw_emb = model.encode(job_keywords, convert_to_tensor=True, show_progress_bar=False)
-                return r_emb, kw_emb
+                vectors = get_embedding_cache().encode(model, model_id_for(model), [resume_text] + list(job_keywords))
+                return vectors[0], vectors[1:]
 
             executor = ThreadPoolExecutor(max_workers=1)
             try:
@@ -245,14 +245,14 @@ class SemanticKeywordMatcher:
                 executor.shutdown(wait=False)
 
             # Calculate cosine similarities
-            similarities = util.cos_sim(resume_embedding, keyword_embeddings)[0]
+            similarities = cosine_matrix(resume_embedding, keyword_embeddings)[0]
 
             # Count high-confidence matches
             matches = []
             missing = []
 
             for i, keyword in enumerate(job_keywords):
-                similarity = similarities[i].item()
+                similarity = float(similarities[i])
                 if similarity >= similarity_threshold:
                     matches.append({
                         'keyword': keyword,
@@ -321,6 +321,78 @@ class SemanticKeywordMatcher:
             'total_keywords': len(job_keywords)
         }
 
+    def get_keyword_matches_detailed(
+        self,
+        resume_text: str,
+        job_description: str,
+        threshold: float = 0.7,
+        top_n: int = 20
+    ) -> Dict:
+        """
+        Extract JD keywords and match them against the resume (keyword heat map).
+
+        JD keyword extraction is memoized in the JD analysis cache, so the
+        heat map for many resumes against one posting extracts once.
+        Matching uses HybridKeywordMatcher (best resume chunk per keyword,
+        exact matching when the model is unavailable).
+
+        Args:
+            resume_text: Full resume text
+            job_description: Job description text
+            threshold: Minimum hybrid score to count as a match (0-1)
+            top_n: Number of keywords to extract from the JD
+
+        Returns:
+            Dictionary with:
+            - extracted_keywords: JD keywords with relevance scores
+            - matched_keywords: Matched keywords with similarity and evidence
+            - missing_keywords: Keywords below the threshold
+            - match_rate: Percentage of keywords matched (0-100)
+            - keyword_positions: Character offsets of verbatim matches
+        """
+        from backend.services.hybrid_keyword_matcher import get_hybrid_matcher
+        from backend.services.jd_analysis_cache import get_jd_analysis_cache
+        from backend.services.keyword_automaton import get_keyword_automaton
+
+        extracted = get_jd_analysis_cache().extracted_keywords(
+            job_description,
+            top_n,
+            lambda: [
+                (kw, float(score))
+                for kw, score in self.extract_keywords(job_description, top_n=top_n)
+            ]
+        ) if job_description else []
+        keywords = [kw for kw, _ in extracted]
+
+        results = get_hybrid_matcher().match_keywords_with_evidence(keywords, resume_text or '')
+        matched = []
+        missing = []
+        for keyword in keywords:
+            match = results[keyword]
+            if match['score'] >= threshold:
+                matched.append({
+                    'keyword': keyword,
+                    'similarity': round(match['score'], 3),
+                    'evidence': match['evidence']
+                })
+            else:
+                missing.append(keyword)
+
+        positions = [
+            {'keyword': hit.keyword, 'start': hit.start, 'end': hit.end}
+            for hit in get_keyword_automaton(keywords).find_all(resume_text or '')
+        ] if keywords else []
+
+        return {
+            'extracted_keywords': [
+                {'keyword': kw, 'relevance': round(score, 3)} for kw, score in extracted
+            ],
+            'matched_keywords': matched,
+            'missing_keywords': missing,
+            'match_rate': round(len(matched) / len(keywords) * 100, 1) if keywords else 0.0,
+            'keyword_positions': positions
+        }
+
     def _fallback_keyword_extraction(
         self,
         text: str,
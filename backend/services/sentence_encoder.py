@@ -0,0 +1,294 @@
+"""
+Sentence Encoder - pluggable inference backends for the semantic matcher.
+
+The semantic matchers used to load a PyTorch SentenceTransformer: ~90 MB of
+fp32 weights, the torch runtime itself and up to 200 MB of activations per
+encode() call, which is why semantic matching is off by default on 512 MB
+instances.  SEMANTIC_ENCODER now selects the backend:
+
+- "torch" (default): sentence-transformers + KeyBERT, as before
+- "onnx": an int8-quantized ONNX export of the same model, run with ONNX
+  Runtime on CPU.  Weights are ~4x smaller, torch is never imported and
+  activations are bounded by encoding in small length-sorted batches.
+  Build the export once (needs torch/sentence-transformers at build time only):
+
+      python backend/build_onnx_encoder.py
+
+Both backends produce mean-pooled, L2-normalized vectors in the same space
+and expose the sentence-transformers encode() signature that EmbeddingCache
+and build_keyword_embeddings use.  Each backend has its own model id, so
+cached and precomputed vectors from one are never served to the other.
+
+KeyBERT imports sentence-transformers (and torch) on import, so the ONNX
+backend extracts JD keywords with EmbeddingKeywordExtractor: KeyBERT's
+candidate + MMR algorithm on top of any encoder.
+
+Environment:
+- SEMANTIC_ENCODER       "torch" (default) or "onnx"
+- ONNX_ENCODER_DIR       export directory (default backend/data/models/all-MiniLM-L6-v2-onnx)
+- ONNX_ENCODER_THREADS   ONNX Runtime intra-op threads (default 1)
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from backend.services.keyword_embedding_store import MODEL_NAME
+
+logger = logging.getLogger(__name__)
+
+# Bump when the export layout changes
+ONNX_EXPORT_VERSION = "1"
+
+BACKENDS = ("torch", "onnx")
+
+_MODEL_FILE = "model.int8.onnx"
+_TOKENIZER_FILE = "tokenizer.json"
+_META_FILE = "encoder.json"
+
+
+def configured_backend() -> str:
+    """Backend selected by SEMANTIC_ENCODER."""
+    backend = os.getenv("SEMANTIC_ENCODER", "torch").lower()
+    if backend not in BACKENDS:
+        logger.warning("Unknown SEMANTIC_ENCODER=%r, using torch", backend)
+        return "torch"
+    return backend
+
+
+def configured_model_id() -> str:
+    """Model id of the backend selected by SEMANTIC_ENCODER."""
+    return onnx_model_id(MODEL_NAME) if configured_backend() == "onnx" else MODEL_NAME
+
+
+def onnx_model_id(model_name: str) -> str:
+    return f"{model_name}:onnx-int8"
+
+
+def model_id_for(encoder: Any) -> str:
+    """Name of the vector space ``encoder`` produces (cache and store key)."""
+    return getattr(encoder, 'model_id', MODEL_NAME)
+
+
+def default_onnx_dir() -> Path:
+    """Directory holding the ONNX export."""
+    configured = os.getenv("ONNX_ENCODER_DIR")
+    if configured:
+        return Path(configured)
+    return Path(__file__).resolve().parent.parent / "data" / "models" / f"{MODEL_NAME}-onnx"
+
+
+class OnnxSentenceEncoder:
+    """
+    Mean-pooled sentence embeddings from an ONNX transformer export.
+
+    The ONNX Runtime session is created per process on first use: its thread
+    pool does not survive fork(), so a session built in a prefork master
+    (services/prefork.py) is rebuilt in each worker.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, batch_size: int = 16, threads: Optional[int] = None):
+        self.directory = Path(directory) if directory else default_onnx_dir()
+        meta_path = self.directory / _META_FILE
+        if not meta_path.exists():
+            raise FileNotFoundError(
+                f"No ONNX encoder at {self.directory}; build it with backend/build_onnx_encoder.py"
+            )
+        with open(meta_path, encoding='utf-8') as f:
+            self.meta: Dict[str, Any] = json.load(f)
+        if self.meta.get('version') != ONNX_EXPORT_VERSION:
+            raise ValueError(f"ONNX encoder at {self.directory} is for another version; rebuild it")
+
+        self.model_name = self.meta['model']
+        self.model_id = onnx_model_id(self.model_name)
+        self.max_seq_length = int(self.meta['max_seq_length'])
+        self.normalize = bool(self.meta.get('normalize', True))
+        self.batch_size = batch_size
+        self.threads = threads if threads is not None else int(os.getenv("ONNX_ENCODER_THREADS", "1"))
+
+        from tokenizers import Tokenizer
+
+        self._tokenizer = Tokenizer.from_file(str(self.directory / _TOKENIZER_FILE))
+        self._tokenizer.enable_truncation(max_length=self.max_seq_length)
+        self._tokenizer.no_padding()
+
+        self._session = None
+        self._session_pid = None
+        self._session_lock = threading.Lock()
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return int(self.meta['dimension'])
+
+    def _get_session(self):
+        if self._session is None or self._session_pid != os.getpid():
+            with self._session_lock:
+                if self._session is None or self._session_pid != os.getpid():
+                    import onnxruntime as ort
+
+                    options = ort.SessionOptions()
+                    options.intra_op_num_threads = self.threads
+                    options.inter_op_num_threads = 1
+                    # The arena keeps the peak activation size allocated for
+                    # the life of the process; release per call instead
+                    options.enable_cpu_mem_arena = False
+                    self._session = ort.InferenceSession(
+                        str(self.directory / _MODEL_FILE),
+                        sess_options=options,
+                        providers=['CPUExecutionProvider'],
+                    )
+                    self._input_names = {i.name for i in self._session.get_inputs()}
+                    self._session_pid = os.getpid()
+        return self._session
+
+    def _encode_batch(self, texts: List[str]):
+        import numpy as np
+
+        encodings = self._tokenizer.encode_batch(texts)
+        length = max(len(e.ids) for e in encodings)
+        ids = np.zeros((len(texts), length), dtype=np.int64)
+        mask = np.zeros((len(texts), length), dtype=np.int64)
+        for row, encoding in enumerate(encodings):
+            ids[row, :len(encoding.ids)] = encoding.ids
+            mask[row, :len(encoding.ids)] = 1
+
+        session = self._get_session()
+        feeds = {'input_ids': ids, 'attention_mask': mask}
+        if 'token_type_ids' in self._input_names:
+            feeds['token_type_ids'] = np.zeros_like(ids)
+        hidden = session.run(None, feeds)[0]
+
+        # Mean pooling over real tokens
+        weights = mask[:, :, None].astype(np.float32)
+        pooled = (hidden * weights).sum(axis=1) / np.clip(weights.sum(axis=1), 1e-9, None)
+        if self.normalize:
+            pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+        return pooled.astype(np.float32)
+
+    def encode(
+        self,
+        sentences: Union[str, Sequence[str]],
+        batch_size: Optional[int] = None,
+        show_progress_bar: bool = False,
+        **kwargs,
+    ):
+        """
+        Embed ``sentences`` (sentence-transformers compatible).
+
+        Texts are sorted by length before batching so short keywords are not
+        padded to the length of a resume chunk.
+
+        Returns:
+            float32 array (len(sentences) x dimension), or one vector for a str
+        """
+        import numpy as np
+
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        if not texts:
+            return np.empty((0, self.get_sentence_embedding_dimension()), dtype=np.float32)
+
+        batch_size = batch_size or self.batch_size
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        result = np.empty((len(texts), self.get_sentence_embedding_dimension()), dtype=np.float32)
+        for start in range(0, len(order), batch_size):
+            rows = order[start:start + batch_size]
+            result[rows] = self._encode_batch([texts[i] for i in rows])
+        return result[0] if single else result
+
+
+class EmbeddingKeywordExtractor:
+    """
+    KeyBERT's keyword extraction on top of any sentence encoder.
+
+    Candidates are the document's n-grams (scikit-learn CountVectorizer, as in
+    KeyBERT); they are ranked by similarity to the document embedding, with
+    Maximal Marginal Relevance when ``use_mmr`` is set.
+    """
+
+    def __init__(self, encoder: Any):
+        self.encoder = encoder
+
+    def extract_keywords(
+        self,
+        doc: str,
+        keyphrase_ngram_range: Tuple[int, int] = (1, 1),
+        stop_words: Union[str, List[str], None] = 'english',
+        top_n: int = 5,
+        use_mmr: bool = False,
+        diversity: float = 0.5,
+    ) -> List[Tuple[str, float]]:
+        import numpy as np
+        from sklearn.feature_extraction.text import CountVectorizer
+
+        if not doc:
+            return []
+        try:
+            count = CountVectorizer(ngram_range=keyphrase_ngram_range, stop_words=stop_words).fit([doc])
+        except ValueError:
+            # Only stop words or no tokens at all
+            return []
+        words = list(count.get_feature_names_out())
+
+        doc_embedding = np.asarray(self.encoder.encode([doc], show_progress_bar=False), dtype=np.float32)
+        word_embeddings = np.asarray(self.encoder.encode(words, show_progress_bar=False), dtype=np.float32)
+        word_doc = _cosine(word_embeddings, doc_embedding)[:, 0]
+
+        if not use_mmr:
+            best = np.argsort(word_doc)[::-1][:top_n]
+            return [(words[i], round(float(word_doc[i]), 4)) for i in best]
+
+        word_word = _cosine(word_embeddings, word_embeddings)
+        selected = [int(np.argmax(word_doc))]
+        candidates = [i for i in range(len(words)) if i != selected[0]]
+        for _ in range(min(top_n - 1, len(words) - 1)):
+            redundancy = np.max(word_word[candidates][:, selected], axis=1)
+            scores = (1 - diversity) * word_doc[candidates] - diversity * redundancy
+            best = candidates[int(np.argmax(scores))]
+            selected.append(best)
+            candidates.remove(best)
+
+        keywords = [(words[i], round(float(word_doc[i]), 4)) for i in selected]
+        return sorted(keywords, key=lambda kw: kw[1], reverse=True)
+
+
+def _cosine(a, b):
+    import numpy as np
+
+    a = a / np.clip(np.linalg.norm(a, axis=1, keepdims=True), 1e-12, None)
+    b = b / np.clip(np.linalg.norm(b, axis=1, keepdims=True), 1e-12, None)
+    return a @ b.T
+
+
+def load_sentence_encoder(backend: Optional[str] = None) -> Any:
+    """
+    Load the encoder for ``backend`` (default: SEMANTIC_ENCODER).
+
+    Raises:
+        ImportError: Backend packages are not installed
+        FileNotFoundError / ValueError: ONNX export missing or outdated
+    """
+    backend = backend or configured_backend()
+    if backend == "onnx":
+        encoder = OnnxSentenceEncoder()
+        if encoder.model_name != MODEL_NAME:
+            raise ValueError(
+                f"ONNX encoder at {encoder.directory} exports '{encoder.model_name}', expected '{MODEL_NAME}'"
+            )
+        return encoder
+
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(MODEL_NAME)
+
+
+def load_keyword_extractor(encoder: Any) -> Any:
+    """KeyBERT for the torch backend, EmbeddingKeywordExtractor otherwise."""
+    if isinstance(encoder, OnnxSentenceEncoder):
+        return EmbeddingKeywordExtractor(encoder)
+
+    from keybert import KeyBERT
+
+    return KeyBERT(encoder)
@@ -8,10 +8,11 @@ Hard Skills: Technical, measurable skills (Python, AWS, Project Management)
 Soft Skills: Interpersonal, behavioral skills (Leadership, Communication, Teamwork)
 """
 
-import re
 from typing import Dict, List, Set, Tuple, Any
 from dataclasses import dataclass
 
+from backend.services.keyword_automaton import get_keyword_automaton
+
 
 @dataclass
 class SkillMatch:
@@ -213,6 +214,11 @@ class SkillsCategorizer:
         for category_skills in self.SOFT_SKILLS.values():
             self.soft_skills_set.update(skill.lower() for skill in category_skills)
 
+        # Compiled matchers (shared across instances); skills are lowercase and
+        # matched against lowercased text
+        self._hard_automaton = get_keyword_automaton(self.hard_skills_set, case_sensitive=True)
+        self._soft_automaton = get_keyword_automaton(self.soft_skills_set, case_sensitive=True)
+
         # Create reverse lookup for skill categories
         self.skill_to_category = {}
 
@@ -238,25 +244,14 @@ class SkillsCategorizer:
         """
         text_lower = text.lower()
 
-        # Extract hard skills
-        hard_skills_found = []
-        for skill in self.hard_skills_set:
-            # Use word boundaries to avoid partial matches
-            # e.g., "java" should not match "javascript"
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
-                hard_skills_found.append(skill)
-
-        # Extract soft skills
-        soft_skills_found = []
-        for skill in self.soft_skills_set:
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
-                soft_skills_found.append(skill)
+        # One pass per skill set; word boundaries avoid partial matches
+        # e.g., "java" should not match "javascript"
+        hard_skills_found = self._hard_automaton.found(text_lower)
+        soft_skills_found = self._soft_automaton.found(text_lower)
 
         return {
-            'hard_skills': sorted(list(set(hard_skills_found))),
-            'soft_skills': sorted(list(set(soft_skills_found)))
+            'hard_skills': sorted(hard_skills_found),
+            'soft_skills': sorted(soft_skills_found)
         }
 
     def categorize_skills(self, resume_text: str, job_description: str = None) -> Dict[str, Any]:
@@ -284,7 +279,13 @@ class SkillsCategorizer:
 
         # If job description provided, calculate matches
         if job_description:
-            job_skills = self.extract_skills(job_description)
+            from backend.services.jd_analysis_cache import get_jd_analysis_cache
+
+            # The same JD is analyzed against many resumes
+            job_skills = get_jd_analysis_cache().job_skills(
+                job_description,
+                lambda: self.extract_skills(job_description)
+            )
 
             # Calculate matches for hard skills
             hard_matches = self._calculate_matches(
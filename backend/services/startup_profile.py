@@ -0,0 +1,300 @@
+"""
+Startup Profile - per-module import time and RSS growth, aggregated.
+
+Cold start on autoscaled instances is dominated by imports: main.py imports
+every router, which pulls in FastAPI, SQLAlchemy, the PDF/DOCX parsers and
+whatever else those modules import at top level.  ``python -X importtime``
+lists every module but gives no memory figures and no totals per package.
+This profiler hooks the import system, times each module's execution and
+records the RSS change around it, then aggregates:
+
+- top-level imports: cumulative cost of each module imported directly by the
+  profiled code (for main.py: each router), including everything it pulled in
+- packages: self time/RSS summed per top-level package (first-party modules
+  under ``backend`` are kept per module, e.g. backend.api.upload)
+- deferred stacks: which lazy_callable() modules were loaded anyway
+
+Two ways to run it:
+
+- STARTUP_PROFILE=true when starting the app: main.py logs the report once its
+  routers are registered (STARTUP_PROFILE_OUTPUT=path also writes JSON)
+- python -m backend.services.startup_profile [module] [--top N] [--json PATH]
+  [--budget-ms MS]: imports ``module`` (default backend.main) in this fresh
+  interpreter, prints the report and exits 1 if the total exceeds the budget
+
+RSS is read from /proc/self/statm (Linux); elsewhere the peak RSS from
+getrusage() is used, which only ever grows.
+"""
+
+import argparse
+import importlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_FIRST_PARTY = 'backend'
+
+
+def _rss_bytes() -> int:
+    """Current resident set size in bytes."""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+@dataclass
+class ImportRecord:
+    """Cost of executing one module (children are included in total_*)."""
+    name: str
+    parent: Optional[str]
+    depth: int
+    self_seconds: float
+    total_seconds: float
+    self_rss: int
+    total_rss: int
+
+
+class ImportProfiler:
+    """
+    Records ImportRecords for every module executed between start() and stop().
+
+    Only module execution is timed (finding and loading bytecode included, as
+    with -X importtime); modules already in sys.modules cost nothing and are
+    not recorded.
+    """
+
+    def __init__(self):
+        self.records: List[ImportRecord] = []
+        self.started_at = 0.0
+        self.elapsed = 0.0
+        self.rss_start = 0
+        self.rss_end = 0
+        self.active = False
+        self._finder = _ProfilingFinder(self)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def start(self) -> 'ImportProfiler':
+        if self._finder not in sys.meta_path:
+            sys.meta_path.insert(0, self._finder)
+        self.rss_start = _rss_bytes()
+        self.started_at = time.perf_counter()
+        self.active = True
+        return self
+
+    def stop(self) -> 'ImportProfiler':
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+            self.active = False
+            self.elapsed = time.perf_counter() - self.started_at
+            self.rss_end = _rss_bytes()
+        return self
+
+    def __enter__(self) -> 'ImportProfiler':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _exec(self, name: str, exec_module: Callable, module: Any) -> None:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        # [name, children seconds, children rss]
+        frame = [name, 0.0, 0]
+        stack.append(frame)
+        rss_before = _rss_bytes()
+        t0 = time.perf_counter()
+        try:
+            exec_module(module)
+        finally:
+            total = time.perf_counter() - t0
+            rss = _rss_bytes() - rss_before
+            stack.pop()
+            parent = stack[-1] if stack else None
+            if parent is not None:
+                parent[1] += total
+                parent[2] += rss
+            with self._lock:
+                self.records.append(ImportRecord(
+                    name=name,
+                    parent=parent[0] if parent else None,
+                    depth=len(stack),
+                    self_seconds=max(0.0, total - frame[1]),
+                    total_seconds=total,
+                    self_rss=rss - frame[2],
+                    total_rss=rss,
+                ))
+
+    # Aggregation
+
+    def top_level(self, parent: Optional[str] = None) -> List[ImportRecord]:
+        """Modules imported directly by the profiled code (or by ``parent``), costliest first."""
+        roots = [r for r in self.records if r.parent == parent]
+        return sorted(roots, key=lambda r: r.total_seconds, reverse=True)
+
+    def by_package(self) -> List[Dict[str, Any]]:
+        """Self time/RSS summed per package, costliest first."""
+        groups: Dict[str, Dict[str, Any]] = {}
+        for record in self.records:
+            group = groups.setdefault(_package_of(record.name), {
+                'package': _package_of(record.name), 'modules': 0, 'seconds': 0.0, 'rss': 0,
+            })
+            group['modules'] += 1
+            group['seconds'] += record.self_seconds
+            group['rss'] += record.self_rss
+        return sorted(groups.values(), key=lambda g: g['seconds'], reverse=True)
+
+    def summary(self, top: int = 20, parent: Optional[str] = None) -> Dict[str, Any]:
+        """JSON-serializable report (top-level imports of ``parent`` if given)."""
+        from backend.services.lazy_imports import lazy_status
+
+        return {
+            'modules': len(self.records),
+            'seconds': round(self.elapsed, 4),
+            'rss_start': self.rss_start,
+            'rss_delta': self.rss_end - self.rss_start,
+            'top_level': [asdict(r) for r in self.top_level(parent)[:top]],
+            'packages': self.by_package()[:top],
+            'deferred': lazy_status(),
+        }
+
+    def format_report(self, top: int = 20, parent: Optional[str] = None) -> str:
+        """Human-readable report."""
+        summary = self.summary(top, parent)
+        lines = [
+            f"Startup import profile: {summary['modules']} modules, "
+            f"{summary['seconds'] * 1000:.0f} ms, RSS {_mb(summary['rss_start'])} "
+            f"{_signed_mb(summary['rss_delta'])}",
+            "Top-level imports (cumulative):",
+        ]
+        for r in summary['top_level']:
+            lines.append(f"  {r['total_seconds'] * 1000:9.1f} ms  {_signed_mb(r['total_rss']):>10}  {r['name']}")
+        lines.append("Packages (self):")
+        for g in summary['packages']:
+            lines.append(
+                f"  {g['seconds'] * 1000:9.1f} ms  {_signed_mb(g['rss']):>10}  {g['package']} ({g['modules']} modules)"
+            )
+        if summary['deferred']:
+            lines.append("Deferred stacks:")
+            for module, loaded in summary['deferred'].items():
+                lines.append(f"  {'loaded  ' if loaded else 'deferred'}  {module}")
+        return "\n".join(lines)
+
+
+class _ProfilingFinder:
+    """Meta path finder that wraps each found module's loader.exec_module."""
+
+    def __init__(self, profiler: ImportProfiler):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, 'find_spec', None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        loader = spec.loader
+        # Only per-module loader instances (source, bytecode, extension
+        # modules); class-level importers such as BuiltinImporter are shared
+        if loader is None or isinstance(loader, type) or getattr(loader, '_startup_profiled', False):
+            return spec
+        exec_module = getattr(loader, 'exec_module', None)
+        if exec_module is None:
+            return spec
+
+        profiler = self._profiler
+
+        def profiled_exec_module(module):
+            if not profiler.active:  # e.g. importlib.reload() after stop()
+                return exec_module(module)
+            profiler._exec(module.__spec__.name, exec_module, module)
+
+        try:
+            loader.exec_module = profiled_exec_module
+            loader._startup_profiled = True
+        except (AttributeError, TypeError):
+            pass
+        return spec
+
+
+def _package_of(name: str) -> str:
+    parts = name.split('.')
+    if parts[0] == _FIRST_PARTY:
+        return '.'.join(parts[:3])
+    return parts[0]
+
+
+def _mb(value: int) -> str:
+    return f"{value / 1e6:.1f} MB"
+
+
+def _signed_mb(value: int) -> str:
+    return f"{value / 1e6:+.1f} MB"
+
+
+def start_startup_profile() -> Optional[ImportProfiler]:
+    """Start profiling if STARTUP_PROFILE=true; returns the profiler or None."""
+    if os.getenv("STARTUP_PROFILE", "false").lower() != "true":
+        return None
+    return ImportProfiler().start()
+
+
+def finish_startup_profile(profiler: Optional[ImportProfiler]) -> None:
+    """Stop ``profiler`` (if any), log its report and write STARTUP_PROFILE_OUTPUT."""
+    if profiler is None:
+        return
+    profiler.stop()
+    logger.info("%s", profiler.format_report())
+    output = os.getenv("STARTUP_PROFILE_OUTPUT")
+    if output:
+        try:
+            with open(output, 'w', encoding='utf-8') as f:
+                json.dump(profiler.summary(top=100), f, indent=2)
+        except OSError as e:
+            logger.warning("Could not write startup profile to %s: %s", output, e)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Profile the imports of a module")
+    parser.add_argument("module", nargs="?", default="backend.main")
+    parser.add_argument("--top", type=int, default=20, help="Rows per table (default 20)")
+    parser.add_argument("--json", help="Also write the report as JSON to this path")
+    parser.add_argument("--budget-ms", type=float, help="Exit 1 if the import takes longer than this")
+    args = parser.parse_args(argv)
+
+    with ImportProfiler() as profiler:
+        importlib.import_module(args.module)
+
+    print(profiler.format_report(args.top, parent=args.module))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(profiler.summary(args.top, parent=args.module), f, indent=2)
+
+    if args.budget_ms is not None and profiler.elapsed * 1000 > args.budget_ms:
+        print(f"✗ Import took {profiler.elapsed * 1000:.0f} ms, over the {args.budget_ms:.0f} ms budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,29 +4,17 @@ Synonym database for intelligent keyword matching.
 This module provides a comprehensive mapping of related terms to enable
 better keyword matching in ATS resume scoring. It supports both direct
 lookup (main keyword -> synonyms) and reverse lookup (synonym -> main keyword).
-"""
-
-import json
-from pathlib import Path
-from typing import Dict, List, Set
-
 
-def _load_synonym_database() -> Dict[str, List[str]]:
-    """Load synonym database from JSON file."""
-    json_path = Path(__file__).parent.parent / "data" / "synonyms" / "skill_synonyms.json"
+Lookups are served by the precomputed index in synonym_index.
+"""
 
-    if not json_path.exists():
-        raise FileNotFoundError(
-            f"Synonym database not found at {json_path}. "
-            "Run backend/scripts/build_synonym_database.py to generate it."
-        )
+from typing import List
 
-    with open(json_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+from backend.services.synonym_index import SYNONYM_INDEX
 
 
-# Load synonym database from JSON file
-SYNONYM_DATABASE = _load_synonym_database()
+# Synonym database loaded from JSON (main keyword -> synonyms)
+SYNONYM_DATABASE = SYNONYM_INDEX.groups
 
 
 def get_all_synonyms(keyword: str) -> List[str]:
@@ -49,21 +37,7 @@ def get_all_synonyms(keyword: str) -> List[str]:
         >>> get_all_synonyms("k8s")  # Reverse lookup
         ['k8s', 'kubernetes', 'kube']
     """
-    keyword_lower = keyword.lower().strip()
-    result_set: Set[str] = {keyword_lower}
-
-    # Direct lookup: keyword is a main entry
-    if keyword_lower in SYNONYM_DATABASE:
-        result_set.update(SYNONYM_DATABASE[keyword_lower])
-
-    # Reverse lookup: keyword is a synonym
-    for main_keyword, synonyms in SYNONYM_DATABASE.items():
-        if keyword_lower in synonyms:
-            result_set.add(main_keyword)
-            result_set.update(synonyms)
-            break  # Found it, no need to continue
-
-    return sorted(list(result_set))
+    return list(SYNONYM_INDEX.expand(keyword))
 
 
 def expand_keywords(keywords: List[str]) -> List[str]:
@@ -81,10 +55,4 @@ def expand_keywords(keywords: List[str]) -> List[str]:
         ['amazon aws', 'amazon web services', 'aws', 'cpython', 'py',
          'python', 'python2', 'python3']
     """
-    expanded_set: Set[str] = set()
-
-    for keyword in keywords:
-        synonyms = get_all_synonyms(keyword)
-        expanded_set.update(synonyms)
-
-    return sorted(list(expanded_set))
+    return SYNONYM_INDEX.expand_all(keywords)
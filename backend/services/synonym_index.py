@@ -0,0 +1,128 @@
+"""
+Synonym Index - one precomputed synonym lookup shared by every matcher.
+
+get_all_synonyms() used to scan the whole synonym database for every reverse
+lookup (so expand_keywords() was O(keywords x database)), KeywordMatcher
+built its own reverse map, and match_with_synonyms() compiled a regex per
+synonym form on every call.  This module loads
+data/synonyms/skill_synonyms.json once at import time and precomputes:
+
+- term -> canonical id: a main entry is its own id; any other term maps to
+  the first main entry (in file order) whose synonyms contain it
+- canonical id -> variant set: the main entry plus its synonyms
+- term -> expansion: the term's own group (if it is a main entry) plus the
+  group of the first main entry listing it, which is exactly what the old
+  linear scan returned
+
+All lookups are case-insensitive and O(1).
+"""
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple
+
+
+def _load_synonym_database() -> Dict[str, List[str]]:
+    """Load synonym database from JSON file."""
+    json_path = Path(__file__).parent.parent / "data" / "synonyms" / "skill_synonyms.json"
+
+    if not json_path.exists():
+        raise FileNotFoundError(
+            f"Synonym database not found at {json_path}. "
+            "Run backend/scripts/build_synonym_database.py to generate it."
+        )
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def normalize_term(term: str) -> str:
+    """Lookup form of a term: lowercased and stripped."""
+    return term.lower().strip()
+
+
+class SynonymIndex:
+    """
+    Precomputed term -> canonical id -> variants index over synonym groups.
+
+    Args:
+        groups: Mapping of main keyword -> synonyms (as in skill_synonyms.json)
+    """
+
+    def __init__(self, groups: Dict[str, List[str]]):
+        self.groups = groups
+
+        self._variants: Dict[str, FrozenSet[str]] = {}
+        for main, synonyms in groups.items():
+            main_term = normalize_term(main)
+            members = {main_term, *(normalize_term(s) for s in synonyms)}
+            self._variants[main_term] = frozenset(self._variants.get(main_term, frozenset()) | members)
+
+        # First main entry listing each synonym (reverse lookup)
+        listed_in: Dict[str, str] = {}
+        for main, synonyms in groups.items():
+            for synonym in synonyms:
+                listed_in.setdefault(normalize_term(synonym), normalize_term(main))
+
+        self._canonical: Dict[str, str] = dict(listed_in)
+        self._canonical.update({main: main for main in self._variants})
+
+        self._expansions: Dict[str, Tuple[str, ...]] = {}
+        for term in self._canonical:
+            expansion = {term}
+            if term in self._variants:
+                expansion |= self._variants[term]
+            if term in listed_in:
+                expansion |= self._variants[listed_in[term]]
+            self._expansions[term] = tuple(sorted(expansion))
+
+    def __len__(self) -> int:
+        return len(self._canonical)
+
+    def __contains__(self, term: str) -> bool:
+        return normalize_term(term) in self._canonical
+
+    def canonical_id(self, term: str) -> Optional[str]:
+        """Canonical id (main entry) for ``term``; None if it is not in the database."""
+        return self._canonical.get(normalize_term(term))
+
+    def variants(self, canonical_id: str) -> FrozenSet[str]:
+        """Main entry and synonyms of a canonical id (empty if unknown)."""
+        return self._variants.get(normalize_term(canonical_id), frozenset())
+
+    def expand(self, term: str) -> Tuple[str, ...]:
+        """
+        Sorted forms of ``term``: itself plus every synonym it is related to.
+
+        Unknown terms expand to just themselves (normalized).
+        """
+        term = normalize_term(term)
+        return self._expansions.get(term, (term,))
+
+    def expand_all(self, terms: Iterable[str]) -> List[str]:
+        """Sorted, deduplicated expansion of several terms."""
+        expanded = set()
+        for term in terms:
+            expanded.update(self.expand(term))
+        return sorted(expanded)
+
+    def pattern(self, term: str) -> Pattern:
+        """Compiled whole-word, case-insensitive regex matching any form of ``term``."""
+        return _compile_forms(self.expand(term))
+
+
+@lru_cache(maxsize=4096)
+def _compile_forms(forms: Tuple[str, ...]) -> Pattern:
+    alternation = '|'.join(re.escape(form) for form in sorted(forms, key=len, reverse=True))
+    return re.compile(r'\b(?:' + alternation + r')\b', re.IGNORECASE)
+
+
+# Built once at import time and shared by every caller
+SYNONYM_INDEX = SynonymIndex(_load_synonym_database())
+
+
+def get_synonym_index() -> SynonymIndex:
+    """Return the shared synonym index."""
+    return SYNONYM_INDEX
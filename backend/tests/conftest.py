@@ -29,3 +29,12 @@ def pytest_configure(config):
         "markers", 
         "requires_semantic: mark test as requiring semantic transformer model to be available"
     )
+
+
+@pytest.fixture
+def client():
+    """FastAPI test client for endpoint tests."""
+    from fastapi.testclient import TestClient
+    from backend.main import app
+
+    return TestClient(app)
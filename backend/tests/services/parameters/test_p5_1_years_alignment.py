@@ -469,6 +469,25 @@ class TestEdgeCases:
         years = scorer._calculate_total_years(experience)
         assert years == pytest.approx(3.0, abs=0.1)
 
+    def test_non_standard_dates_with_precomputed_months(self, scorer):
+        """Dates the adapter's strict normalizer rejects still count via loose parsing"""
+        from backend.services.date_normalizer import normalize_entry_dates
+
+        experience = []
+        for start, end in [("Summer 2019", "Fall 2021"), ("Q1 2008", "Q1 2013")]:
+            entry = {
+                "title": "Engineer",
+                "start_date": start,
+                "end_date": end,
+                "dates": f"{start} - {end}",
+            }
+            # As ScorerV3Adapter prepares entries: start_month/end_month are None here
+            entry.update(normalize_entry_dates(entry))
+            experience.append(entry)
+
+        years = scorer._calculate_total_years(experience)
+        assert years == pytest.approx(7.0, abs=0.1)
+
     def test_unknown_experience_level(self, scorer):
         """Unknown experience level defaults gracefully"""
         experience = [
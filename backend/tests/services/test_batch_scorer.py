@@ -0,0 +1,97 @@
+"""
+Tests for batch scoring (file discovery, fan-out, summary).
+"""
+
+import io
+import zipfile
+
+import pytest
+
+from backend.services import batch_scorer
+from backend.services.batch_scorer import BatchJob, iter_resume_files, score_batch, with_summary
+
+
+@pytest.fixture
+def job():
+    return BatchJob(job_description="", job_requirements={'required_keywords': ['python']})
+
+
+def test_iter_directory_finds_supported_files(tmp_path):
+    (tmp_path / 'a.pdf').write_bytes(b'pdf')
+    (tmp_path / 'nested').mkdir()
+    (tmp_path / 'nested' / 'b.DOCX').write_bytes(b'docx')
+    (tmp_path / 'notes.txt').write_bytes(b'skip me')
+
+    files = dict(iter_resume_files(tmp_path))
+
+    assert files == {'a.pdf': b'pdf', 'nested/b.DOCX': b'docx'}
+
+
+def test_iter_zip_bytes_skips_junk():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('cv1.pdf', b'one')
+        archive.writestr('__MACOSX/._cv1.pdf', b'junk')
+        archive.writestr('readme.md', b'skip')
+
+    assert list(iter_resume_files(buffer.getvalue())) == [('cv1.pdf', b'one')]
+
+
+def test_iter_rejects_other_sources(tmp_path):
+    text_file = tmp_path / 'x.txt'
+    text_file.write_text('hi')
+    with pytest.raises(ValueError):
+        list(iter_resume_files(text_file))
+
+
+def test_score_batch_streams_every_file(monkeypatch, job):
+    def fake_score(name, content, batch_job):
+        assert batch_job is job
+        if content == b'bad':
+            return {'file': name, 'status': 'error', 'error': 'unreadable'}
+        return {'file': name, 'status': 'ok', 'overallScore': len(content)}
+
+    monkeypatch.setattr(batch_scorer, 'score_resume_file', fake_score)
+    files = [(f'{i}.pdf', b'x' * i) for i in range(1, 6)] + [('broken.pdf', b'bad')]
+
+    records = list(with_summary(score_batch(iter(files), job, workers=2, kind='thread')))
+
+    summary = records[-1]
+    assert sorted(r['file'] for r in records[:-1]) == sorted(name for name, _ in files)
+    assert summary == {
+        'summary': True, 'scored': 5, 'errors': 1,
+        'average_score': 3.0, 'max_score': 5, 'min_score': 1,
+    }
+
+
+def test_empty_file_reported_as_error(job):
+    record = batch_scorer.score_resume_file('empty.pdf', b'', job)
+
+    assert record['status'] == 'error'
+    assert record['file'] == 'empty.pdf'
+
+
+def test_priming_keys_embeddings_by_the_encoder_model_id(monkeypatch):
+    from backend.services import embedding_cache, hybrid_keyword_matcher
+
+    class FakeEncoder:
+        model_id = 'all-MiniLM-L6-v2-onnx-int8'
+
+    class FakeMatcher:
+        _model = FakeEncoder()
+
+        def _lazy_init(self):
+            pass
+
+    class RecordingCache:
+        calls = []
+
+        def encode(self, model, model_name, texts):
+            self.calls.append((model_name, list(texts)))
+
+    monkeypatch.setattr(hybrid_keyword_matcher, 'get_hybrid_matcher', lambda: FakeMatcher())
+    monkeypatch.setattr(embedding_cache, 'get_embedding_cache', lambda: RecordingCache())
+
+    batch_scorer._prime_keyword_embeddings({'required_keywords': ['python'], 'preferred_keywords': ['go']})
+
+    assert RecordingCache.calls == [('all-MiniLM-L6-v2-onnx-int8', ['python', 'go'])]
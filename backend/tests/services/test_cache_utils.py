@@ -0,0 +1,106 @@
+"""
+Tests for the in-memory LRU tier and stable digests in cache_utils.
+"""
+
+import subprocess
+import sys
+
+from backend.services.cache_utils import LRUCache, TwoTierCache, _generate_cache_key, stable_digest
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1  # 'a' now most recent
+    cache.set('c', 3)
+
+    assert 'b' not in cache
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats()['evictions'] == 1
+
+
+def test_lru_counts_hits_and_misses():
+    cache = LRUCache(max_entries=4)
+    cache.set('k', None)
+
+    assert cache.get('k', 'default') is None  # cached None is a hit
+    assert cache.get('missing', 'default') == 'default'
+
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['hit_rate'] == 0.5
+
+
+def test_stable_digest_is_process_independent():
+    """Digest must not depend on PYTHONHASHSEED (unlike hash())."""
+    local = stable_digest('all-MiniLM-L6-v2', 'python developer')
+    code = (
+        "from backend.services.cache_utils import stable_digest;"
+        "print(stable_digest('all-MiniLM-L6-v2', 'python developer'))"
+    )
+    other = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True, text=True, check=True,
+        env={'PYTHONHASHSEED': '12345', 'PYTHONPATH': ':'.join(sys.path)},
+    ).stdout.strip()
+    assert local == other
+
+
+def test_stable_digest_separates_parts():
+    assert stable_digest('ab', 'c') != stable_digest('a', 'bc')
+    assert stable_digest(b'abc') == stable_digest('abc')
+
+
+def test_generate_cache_key_is_process_independent():
+    """Decorator cache keys are identical across workers (no hash() or object ids)."""
+    args = ('text', ['python', 'aws'], {'b': 1, 'a': 2})
+    local = _generate_cache_key('keywords', (object(),) + args, {'top_n': 20})
+    code = (
+        "from backend.services.cache_utils import _generate_cache_key;"
+        "print(_generate_cache_key('keywords', (object(), 'text', ['python', 'aws'], {'a': 2, 'b': 1}), {'top_n': 20}))"
+    )
+    other = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True, text=True, check=True,
+        env={'PYTHONHASHSEED': '12345', 'PYTHONPATH': ':'.join(sys.path)},
+    ).stdout.strip()
+    assert local == other
+    assert local != _generate_cache_key('keywords', ('other text',), {'top_n': 20})
+
+
+class _NamedCache(TwoTierCache):
+    env_prefix = "NAMED_TEST_CACHE"
+    default_max_entries = 3
+
+
+class _OtherCache(TwoTierCache):
+    env_prefix = "OTHER_TEST_CACHE"
+
+
+def test_two_tier_cache_counts_memory_hits_and_misses():
+    cache = _NamedCache(use_disk=False)
+    cache._set('k', {'v': 1})
+
+    assert cache._get('k') == {'v': 1}
+    assert cache._get('missing') is None
+
+    stats = cache.stats()
+    assert (stats['entries'], stats['max_entries']) == (1, 3)
+    assert (stats['hits'], stats['disk_hits'], stats['misses']) == (1, 0, 1)
+    assert stats['hit_rate'] == 0.5
+
+
+def test_two_tier_cache_shared_instance_per_subclass(monkeypatch):
+    monkeypatch.setenv("NAMED_TEST_CACHE_MAX_ENTRIES", "7")
+    monkeypatch.setenv("NAMED_TEST_CACHE_DISK", "false")
+    monkeypatch.setattr(_NamedCache, '_shared', None)
+    monkeypatch.setattr(_OtherCache, '_shared', None)
+
+    named = _NamedCache.shared()
+
+    assert named is _NamedCache.shared()
+    assert isinstance(_OtherCache.shared(), _OtherCache)
+    assert (named._memory.max_entries, named.use_disk) == (7, False)
@@ -0,0 +1,91 @@
+"""
+Tests for the compiled corpus store.
+"""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from backend.services import corpus_store
+from backend.services.corpus_skills_database import CorpusSkillsDatabase, SKILLS_DB_PATH
+from backend.services.corpus_store import CorpusStore, RoleKeywordsView, build_store
+from backend.services.role_mapping_service import RoleMappingService
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Small corpus with the quirks the JSON loaders handle."""
+    files = {
+        'skills': {'Python': {'frequency': 5}, 'sql': {'frequency': 9}, 'Go': {'frequency': 5},
+                   'python': {'frequency': 7}, 'rare': {'frequency': 1}},
+        'role_mappings': {'Software Engineer': 'software_engineer', 'SWE': 'software_engineer',
+                          '  Data   Analyst ': 'data_analyst'},
+        'role_keywords': {'software_engineer_mid': ['python', 'sql']},
+    }
+    paths = {}
+    for name, data in files.items():
+        paths[name] = tmp_path / f"{name}.json"
+        paths[name].write_text(json.dumps(data), encoding='utf-8')
+    return paths
+
+
+@pytest.fixture
+def store(tmp_path, sources):
+    return CorpusStore.load(build_store(tmp_path / "corpus.sqlite", sources), sources)
+
+
+def test_skills_match_json_loader(store, sources):
+    from_json = CorpusSkillsDatabase(sources['skills'])
+
+    assert store.skill_frequencies() == from_json.skills
+    assert store.skills_by_frequency() == from_json.get_all_skills()
+    assert store.skills_by_frequency(5) == from_json.get_skills_for_role('any', min_frequency=5)
+    assert store.skills_by_frequency(limit=2) == ['sql', 'python']
+    assert store.skill_frequency('python') == 7
+    assert store.skill_frequency('cobol') == 0
+
+
+def test_role_mappings_match_json_loader(store, sources):
+    from_json = RoleMappingService(str(sources['role_mappings']))
+
+    assert store.role_for_title('data analyst') == from_json.normalize_role('Data Analyst') == 'data_analyst'
+    assert store.titles_for_role('software_engineer') == from_json.get_all_variations('software_engineer')
+    assert store.titles_for_role('unknown') is None
+    assert (store.title_count(), store.role_count()) == (3, 2)
+
+
+def test_role_keywords_view(store):
+    view = RoleKeywordsView(store)
+
+    assert view['software_engineer_mid'] == ['python', 'sql']
+    assert 'software_engineer_entry' not in view
+    assert list(view) == ['software_engineer_mid'] and len(view) == 1
+
+
+def test_missing_or_stale_store_is_ignored(tmp_path, sources):
+    assert CorpusStore.load(tmp_path / "missing.sqlite", sources) is None
+
+    path = build_store(tmp_path / "corpus.sqlite", sources)
+    sources['skills'].write_text(json.dumps({'rust': {'frequency': 3}}), encoding='utf-8')
+
+    assert CorpusStore.load(path, sources) is None
+
+
+def test_services_use_store(monkeypatch, tmp_path):
+    store = CorpusStore.load(build_store(tmp_path / "corpus.sqlite"))
+    monkeypatch.setattr(corpus_store, '_store', store)
+    monkeypatch.setattr(corpus_store, '_store_checked', True)
+
+    db = CorpusSkillsDatabase()
+    # Any other path is not covered by the store and is loaded from JSON
+    from_json = CorpusSkillsDatabase(Path(shutil.copy(SKILLS_DB_PATH, tmp_path / "skills.json")))
+
+    assert db._store is store and from_json._store is None
+    assert db.get_top_skills(20) == from_json.get_top_skills(20)
+    assert db.get_skill_frequency('PYTHON') == from_json.get_skill_frequency('python') > 0
+
+    service = RoleMappingService()
+    assert service._store is store and not service._title_to_role
+    assert service.normalize_role('Software Engineer') is not None
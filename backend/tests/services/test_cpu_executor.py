@@ -0,0 +1,86 @@
+"""
+Tests for the shared CPU executor (bounded pool with backpressure).
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from backend.services.cpu_executor import (
+    CPUExecutor,
+    ExecutorSaturatedError,
+    ExecutorUnavailableError,
+)
+
+
+def _add(a, b):
+    return a + b
+
+
+@pytest.fixture
+def executor():
+    """Small thread pool: 1 worker + 1 queued job."""
+    ex = CPUExecutor(kind="thread", max_workers=1, max_queue=1, timeout=5)
+    yield ex
+    ex.shutdown(wait=True)
+
+
+def test_runs_function_off_event_loop(executor):
+    """Result is returned and work runs on a pool thread."""
+    async def main():
+        loop_thread = threading.get_ident()
+        worker_thread = await executor.run(threading.get_ident)
+        total = await executor.run(_add, 2, b=3)
+        return loop_thread, worker_thread, total
+
+    loop_thread, worker_thread, total = asyncio.run(main())
+    assert total == 5
+    assert worker_thread != loop_thread
+
+
+def test_rejects_when_queue_full(executor):
+    """Submissions beyond workers + max_queue raise ExecutorSaturatedError."""
+    release = threading.Event()
+
+    async def main():
+        running = [
+            asyncio.ensure_future(executor.run(release.wait))
+            for _ in range(executor.capacity)
+        ]
+        await asyncio.sleep(0)
+        with pytest.raises(ExecutorSaturatedError):
+            await executor.run(_add, 1, 1)
+        release.set()
+        await asyncio.gather(*running)
+
+    asyncio.run(main())
+    assert executor.stats()['rejected'] == 1
+    assert executor.stats()['in_flight'] == 0
+
+
+def test_timeout_raises_unavailable_and_keeps_slot(executor):
+    """A timed-out job still occupies its slot until it actually finishes."""
+    async def main():
+        with pytest.raises(ExecutorUnavailableError):
+            await executor.run(time.sleep, 0.3, timeout=0.05)
+        assert executor.stats()['in_flight'] == 1
+
+    asyncio.run(main())
+    time.sleep(0.4)
+    stats = executor.stats()
+    assert stats['timed_out'] == 1
+    assert stats['in_flight'] == 0
+
+
+def test_shutdown_rejects_new_work():
+    ex = CPUExecutor(kind="thread", max_workers=1)
+    ex.shutdown()
+
+    with pytest.raises(ExecutorUnavailableError):
+        asyncio.run(ex.run(_add, 1, 2))
+
+
+def test_unknown_kind_rejected():
+    with pytest.raises(ValueError):
+        CPUExecutor(kind="gpu")
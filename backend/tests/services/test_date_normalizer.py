@@ -0,0 +1,118 @@
+"""
+Tests for the shared date normalizer.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from backend.services import date_normalizer
+from backend.services.date_normalizer import (
+    entry_months,
+    is_present,
+    normalize_date,
+    normalize_entry_dates,
+    parse_date,
+)
+from backend.services.gap_detector import GapDetector
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("Jan 2020", (2020, 1)),
+    ("January 2020", (2020, 1)),
+    ("Sept. 2019", (2019, 9)),
+    ("DEC 2021", (2021, 12)),
+    ("01/2020", (2020, 1)),
+    ("3/2018", (2018, 3)),
+    ("2020-01", (2020, 1)),
+    ("2020-01-15", (2020, 1)),
+    ("2020", (2020, 1)),
+    ("  May 2017 ", (2017, 5)),
+])
+def test_fast_path_formats(text, expected):
+    assert normalize_date(text) == expected
+
+
+def test_fast_path_does_not_need_dateutil(monkeypatch):
+    def fail(text):
+        raise AssertionError("slow path used")
+
+    monkeypatch.setattr(date_normalizer, "_slow_path", fail)
+    date_normalizer._normalize.cache_clear()
+
+    assert normalize_date("Mar 2022") == (2022, 3)
+    assert normalize_date("2022-03") == (2022, 3)
+
+
+def test_present_terms_resolve_to_current_month():
+    now = datetime.now()
+
+    for term in ("Present", "current", "NOW", "Ongoing"):
+        assert is_present(term)
+        assert normalize_date(term) == (now.year, now.month)
+    assert parse_date("Present").date() == now.date()
+
+
+def test_unparseable_and_empty():
+    assert normalize_date("") is None
+    assert normalize_date(None) is None
+    assert normalize_date("sometime", loose=True) is None
+
+
+def test_slow_path_parses_dates_with_a_year():
+    pytest.importorskip("dateutil")
+    date_normalizer._normalize.cache_clear()
+
+    assert normalize_date("15 March 2019") == (2019, 3)
+    assert normalize_date("Mar 19, 2020") == (2020, 3)
+
+
+def test_year_less_dates_are_not_dated_to_the_current_year():
+    pytest.importorskip("dateutil")
+    date_normalizer._normalize.cache_clear()
+
+    assert normalize_date("March") is None
+    assert normalize_date("15 March") is None
+    assert normalize_date("March", loose=True) is None
+
+
+def test_loose_finds_year_and_month_name():
+    assert normalize_date("Summer of 2019", loose=True) == (2019, 1)
+    assert normalize_date("since mid-March 2016", loose=True) == (2016, 3)
+
+
+def test_results_are_cached():
+    date_normalizer._normalize.cache_clear()
+
+    normalize_date("Feb 2015")
+    normalize_date("feb 2015")
+    normalize_date("Feb 2015 ")
+
+    stats = date_normalizer.cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+
+
+def test_entry_dates_precomputed_once():
+    entry = {"startDate": "Jan 2019", "endDate": "Present"}
+    normalized = normalize_entry_dates(entry)
+
+    assert normalized["start_month"] == (2019, 1)
+    assert normalized["is_current"] is True
+    assert entry_months({**entry, **normalized}) == (
+        normalized["start_month"], normalized["end_month"], True
+    )
+
+
+def test_detectors_use_precomputed_months():
+    # Strings say otherwise: only the precomputed months must be read
+    history = [
+        {"start_date": "unparseable", "end_date": "unparseable",
+         "start_month": (2018, 1), "end_month": (2019, 12), "is_current": False},
+        {"start_date": "unparseable", "end_date": "unparseable",
+         "start_month": (2021, 1), "end_month": (2022, 6), "is_current": False},
+    ]
+
+    result = GapDetector().detect(history)
+
+    assert result["total_gap_months"] == 13
@@ -0,0 +1,64 @@
+"""
+Tests for the shared embedding cache used by the semantic matchers.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.services.embedding_cache import EmbeddingCache, cosine_matrix
+
+
+class CountingModel:
+    """Deterministic encoder that records what it was asked to encode."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, show_progress_bar=False):
+        self.calls.append(list(texts))
+        return np.array([[len(t), t.count('a'), 1.0] for t in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def cache():
+    return EmbeddingCache(max_entries=8, use_disk=False)
+
+
+def test_only_misses_are_encoded(cache):
+    model = CountingModel()
+
+    first = cache.encode(model, 'm', ['alpha', 'beta'])
+    second = cache.encode(model, 'm', ['beta', 'gamma', 'alpha'])
+
+    assert model.calls == [['alpha', 'beta'], ['gamma']]
+    np.testing.assert_array_equal(second[0], first[1])
+    np.testing.assert_array_equal(second[2], first[0])
+    assert cache.stats()['hits'] == 2
+    assert cache.stats()['misses'] == 3
+
+
+def test_key_normalizes_whitespace_and_includes_model():
+    assert EmbeddingCache.key_for('m', ' python  developer\n') == EmbeddingCache.key_for('m', 'python developer')
+    assert EmbeddingCache.key_for('m', 'python') != EmbeddingCache.key_for('other', 'python')
+
+
+def test_duplicate_texts_encoded_once(cache):
+    model = CountingModel()
+    vectors = cache.encode(model, 'm', ['same', 'same '])
+
+    assert model.calls == [['same']]
+    assert vectors.shape == (2, 3)
+
+
+def test_cached_vectors_are_read_only(cache):
+    model = CountingModel()
+    cache.encode(model, 'm', ['alpha'])
+
+    with pytest.raises(ValueError):
+        cache.get('m', 'alpha')[0] = 99.0
+
+
+def test_cosine_matrix():
+    sims = cosine_matrix([[1.0, 0.0]], [[2.0, 0.0], [0.0, 3.0]])
+    np.testing.assert_allclose(sims, [[1.0, 0.0]], atol=1e-6)
@@ -0,0 +1,118 @@
+"""
+Tests for the shared grammar result cache.
+"""
+
+import pytest
+
+from backend.services import grammar_cache, grammar_checker
+from backend.services.grammar_cache import GrammarResultCache
+from backend.services.grammar_checker import GrammarChecker
+from backend.services.parameters.p4_1_grammar import GrammarScorer
+from backend.services.parser import ResumeData
+from backend.services.red_flags_validator import RedFlagsValidator
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Memory-only cache installed as the shared instance."""
+    cache = GrammarResultCache(max_entries=8, use_disk=False)
+    monkeypatch.setattr(GrammarResultCache, '_shared', cache)
+    return cache
+
+
+@pytest.fixture
+def checker(cache, monkeypatch):
+    """Shared GrammarChecker on the fallback backend, counting checks."""
+    checker = GrammarChecker(cache=cache)
+    checker.calls = []
+
+    def fallback(text):
+        checker.calls.append(text)
+        return {'total_issues': 1, 'score': 95, 'severity_breakdown': {'critical': 1, 'warning': 0, 'info': 0},
+                'issues': [{'message': "Possible typo: 'teh'", 'category': 'spelling', 'severity': 'critical',
+                            'replacements': ['the']}]}
+
+    monkeypatch.setattr(checker, '_fallback_check', fallback)
+    monkeypatch.setattr(grammar_checker, '_grammar_checker_instance', checker)
+    return checker
+
+
+def make_resume(description):
+    return ResumeData(
+        fileName='cv.pdf',
+        contact={'name': 'Jane Doe'},
+        experience=[{'title': 'Engineer', 'company': 'Acme', 'description': description}],
+        metadata={'pageCount': 1, 'wordCount': 300, 'fileFormat': 'pdf'}
+    )
+
+
+def test_key_depends_on_text_backend_and_ruleset(monkeypatch):
+    key = GrammarResultCache.key_for('Led teh migration', 'languagetool')
+
+    assert key == GrammarResultCache.key_for('Led teh migration', 'languagetool')
+    assert key != GrammarResultCache.key_for('Led the migration', 'languagetool')
+    assert key != GrammarResultCache.key_for('Led teh migration', 'fallback')
+
+    monkeypatch.setattr(grammar_cache, 'RULESET_VERSION', '999')
+    assert key != GrammarResultCache.key_for('Led teh migration', 'languagetool')
+
+
+def test_lru_eviction_and_hit_rate():
+    cache = GrammarResultCache(max_entries=2, use_disk=False)
+    for name in ('a', 'b', 'c'):
+        cache.set(name, {'issues': [name]})
+
+    assert cache.get('a') is None
+    assert cache.get('c') == {'issues': ['c']}
+
+    stats = cache.stats()
+    assert (stats['entries'], stats['evictions']) == (2, 1)
+    assert (stats['hits'], stats['misses'], stats['hit_rate']) == (1, 1, 0.5)
+
+
+def test_returns_copies(cache):
+    cache.set('k', {'issues': [1]})
+    cache.get('k')['issues'].clear()
+
+    assert cache.get('k') == {'issues': [1]}
+
+
+def test_results_survive_validator_recreation(checker):
+    resume = make_resume('• Led teh migration of billing services')
+
+    first = RedFlagsValidator().validate_grammar(resume)
+    second = RedFlagsValidator().validate_grammar(resume)
+
+    assert first == second and first
+    assert checker.calls == ['Led teh migration of billing services']
+
+
+def test_basic_checks_shared_across_validators(cache, monkeypatch):
+    calls = []
+    original = RedFlagsValidator._basic_grammar_issues
+
+    def counting(self, text, spell):
+        calls.append(text)
+        return original(self, text, spell)
+
+    monkeypatch.setattr(RedFlagsValidator, '_basic_grammar_issues', counting)
+    resume = make_resume('• Built dashboards used by forty teams')
+
+    for _ in range(2):
+        validator = RedFlagsValidator()
+        validator._languagetool_failed = True
+        validator.validate_grammar(resume)
+
+    assert calls == ['Built dashboards used by forty teams']
+
+
+def test_grammar_scorer_uses_shared_cache(checker, cache):
+    text = 'Led teh migration of billing services'
+
+    first = GrammarScorer().score(text)
+    second = GrammarScorer().score(text)
+
+    assert first == second
+    assert first['critical_errors'] == 1
+    assert checker.calls == [text]
+    assert cache.stats()['hits'] == 1
@@ -0,0 +1,109 @@
+"""
+Tests for batched grammar checking.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services.grammar_cache import GrammarResultCache
+from backend.services.grammar_checker import GrammarChecker, _SEGMENT_SEPARATOR
+
+
+class FakeTool:
+    """Stands in for language_tool_python.LanguageTool: flags every 'teh'."""
+
+    def __init__(self):
+        self.calls = []
+
+    def check(self, text):
+        self.calls.append(text)
+        matches = []
+        start = text.find('teh')
+        while start != -1:
+            matches.append(SimpleNamespace(
+                offset=start, errorLength=3, message='Possible typo',
+                replacements=['the'], ruleIssueType='misspelling',
+                ruleId='MORFOLOGIK_RULE_EN_US', context=text,
+            ))
+            start = text.find('teh', start + 1)
+        # Would relate neighbouring bullets once they are joined
+        matches.append(SimpleNamespace(
+            offset=0, errorLength=len(text), message='Three successive paragraphs',
+            replacements=[], ruleIssueType='style',
+            ruleId='PARAGRAPH_REPEAT_BEGINNING_RULE', context=text,
+        ))
+        return matches
+
+
+@pytest.fixture
+def checker():
+    checker = GrammarChecker(cache=GrammarResultCache(use_disk=False))
+    checker._tool = FakeTool()
+    checker._initialized = True
+    return checker
+
+
+def test_batch_makes_one_languagetool_call(checker):
+    texts = [
+        'Led teh migration of billing services',
+        'Built dashboards used by 40 teams',
+        'Cut build times by half for teh monorepo',
+    ]
+
+    results = checker.check_batch(texts)
+
+    assert len(checker._tool.calls) == 1
+    assert checker._tool.calls[0] == _SEGMENT_SEPARATOR.join(texts)
+    assert [r['total_issues'] for r in results] == [1, 0, 1]
+
+
+def test_offsets_map_back_to_each_text(checker):
+    texts = ['Built dashboards for ops', 'Fixed teh deploy pipeline']
+
+    issue = checker.check_batch(texts)[1]['issues'][0]
+
+    assert texts[1][issue['offset']:issue['offset'] + issue['length']] == 'teh'
+    assert 'teh deploy' in issue['context']
+
+
+def test_cross_segment_rules_dropped(checker):
+    results = checker.check_batch(['Designed the API layer', 'Designed the data model'])
+
+    assert all(r['issues'] == [] for r in results)
+
+
+def test_unchanged_texts_not_rechecked(checker):
+    checker.check_batch(['Led teh migration of billing services', 'Built dashboards'])
+    results = checker.check_batch(['Led teh migration of billing services', 'Mentored two interns'])
+
+    assert len(checker._tool.calls) == 2
+    assert checker._tool.calls[1] == 'Mentored two interns'
+    assert results[0]['total_issues'] == 1
+
+
+def test_cached_results_are_copies(checker):
+    first = checker.check('Fixed teh deploy pipeline')
+    first['issues'].clear()
+
+    assert checker.check('Fixed teh deploy pipeline')['total_issues'] == 1
+
+
+def test_short_texts_skip_the_checker(checker):
+    results = checker.check_batch(['', 'ok', 'Shipped teh release'])
+
+    assert results[0]['message'] == 'Text too short to analyze'
+    assert results[1]['message'] == 'Text too short to analyze'
+    assert checker._tool.calls == ['Shipped teh release']
+
+
+def test_languagetool_failure_falls_back(checker, monkeypatch):
+    def boom(text):
+        raise RuntimeError('JVM gone')
+
+    monkeypatch.setattr(checker._tool, 'check', boom)
+    monkeypatch.setattr(checker, '_fallback_check', lambda text: {'total_issues': 0, 'issues': [], 'fallback': True})
+
+    results = checker.check_batch(['Led the migration', 'Built dashboards'])
+
+    assert all(r.get('fallback') for r in results)
@@ -234,3 +234,65 @@ def test_context_awareness(matcher):
     # Both should detect "Python" but programming context might score higher
     assert score_programming >= 0.95, f"Programming context should match, got {score_programming}"
     assert score_snake >= 0.95, f"Should match exact string regardless, got {score_snake}"
+
+
+def test_split_resume_chunks_strips_bullets_and_sentences():
+    """Resume text is split into bullet/sentence chunks without markers or duplicates"""
+    from backend.services.hybrid_keyword_matcher import split_resume_chunks
+
+    text = "• Led team of 5. Shipped v2 on time\n- Led team of 5.\n\n1) Built APIs\nok"
+
+    assert split_resume_chunks(text) == ["Led team of 5.", "Shipped v2 on time", "Built APIs"]
+    assert split_resume_chunks(text, max_chunks=1) == ["Led team of 5."]
+
+
+def test_max_chunk_similarity_picks_best_chunk():
+    """Each keyword's semantic score is its best cosine over all chunks"""
+    np = pytest.importorskip("numpy")
+    from backend.services.hybrid_keyword_matcher import max_chunk_similarity
+
+    keywords = np.array([[1.0, 0.0], [0.0, 2.0]])
+    chunks = np.array([[0.0, 1.0], [1.0, 1.0], [3.0, 0.0]])
+
+    scores, best = max_chunk_similarity(keywords, chunks)
+
+    assert list(best) == [2, 0]
+    np.testing.assert_allclose(scores, [1.0, 1.0], atol=1e-6)
+
+
+def test_match_keywords_with_evidence(matcher):
+    """Matched keywords report the resume chunk/line that matched"""
+    resume_text = "Summary\nBuilt Django services in Python\nLed hiring"
+
+    results = matcher.match_keywords_with_evidence(["Python", "Ruby"], resume_text)
+
+    assert results["Python"]["score"] >= 0.95
+    assert "Python" in results["Python"]["evidence"]
+    assert set(results) == {"Python", "Ruby"}
+
+
+def test_exact_match_reports_its_own_line_as_evidence(monkeypatch):
+    """A verbatim keyword cites its own line even if another chunk is semantically closer"""
+    np = pytest.importorskip("numpy")
+    from backend.services import hybrid_keyword_matcher as module
+    from backend.services.embedding_cache import EmbeddingCache
+
+    class FakeModel:
+        def encode(self, texts, show_progress_bar=False):
+            # "Python" and the scripting chunk share a direction; the Django chunk does not
+            return np.array(
+                [[1.0, 0.0] if t == "Python" or "scripting" in t.lower() else [0.0, 1.0] for t in texts],
+                dtype=np.float32
+            )
+
+    monkeypatch.setattr(module, 'get_keyword_embedding_store', lambda: None)
+    monkeypatch.setattr(module, 'get_embedding_cache', lambda: EmbeddingCache(use_disk=False))
+    matcher = HybridKeywordMatcher()
+    matcher._model = FakeModel()
+    matcher._initialized = True
+
+    resume_text = "Built Django services in Python\nAutomated scripting for ops"
+    results = matcher.match_keywords_with_evidence(["Python", "Scripting language"], resume_text)
+
+    assert results["Python"] == {'score': 1.0, 'evidence': "Built Django services in Python"}
+    assert results["Scripting language"]["evidence"] == "Automated scripting for ops"
@@ -0,0 +1,143 @@
+"""
+Tests for the memoized job-description analysis cache.
+"""
+
+import pytest
+
+from backend.services.jd_analysis_cache import JDAnalysisCache
+from backend.services.semantic_matcher import get_semantic_matcher
+from backend.services.skills_categorizer import SkillsCategorizer
+
+
+JD = """Senior Python Developer
+Required: Python, Django, PostgreSQL, Docker
+Nice to have: Kubernetes, Terraform
+Strong communication and leadership skills."""
+
+
+@pytest.fixture
+def cache():
+    return JDAnalysisCache(max_entries=4, use_disk=False)
+
+
+def test_result_computed_once_per_jd(cache):
+    calls = []
+
+    def extract():
+        calls.append(1)
+        return {'required_keywords': ['Python'], 'preferred_keywords': []}
+
+    first = cache.get_or_compute(JD, 'requirements', extract)
+    second = cache.get_or_compute(JD, 'requirements', extract)
+
+    assert first == second
+    assert len(calls) == 1
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_whitespace_only_differences_share_an_entry(cache):
+    reformatted = '  ' + JD.replace('\n', '\n\n  ') + '\n'
+    assert cache.digest_for(reformatted) == cache.digest_for(JD)
+    assert cache.digest_for(JD + ' Go') != cache.digest_for(JD)
+
+
+def test_returned_results_are_copies(cache):
+    result = cache.get_or_compute(JD, 'requirements', lambda: {'required_keywords': ['Python']})
+    result['required_keywords'].append('Mutated')
+
+    again = cache.get_or_compute(JD, 'requirements', lambda: {'required_keywords': []})
+    assert again == {'required_keywords': ['Python']}
+
+
+def test_results_are_named_per_jd(cache):
+    cache.get_or_compute(JD, 'skills', lambda: 'first')
+
+    assert cache.get_or_compute(JD, 'keywords', lambda: 'second') == 'second'
+    assert cache.get_or_compute('Another job', 'skills', lambda: 'third') == 'third'
+
+
+def test_job_requirements_keyed_by_extraction_mode(cache, monkeypatch):
+    import backend.services.jd_analysis_cache as module
+
+    calls = []
+
+    def extract():
+        calls.append(1)
+        return {'required_keywords': ['Python'], 'preferred_keywords': ['Terraform']}
+
+    monkeypatch.setattr(module, 'extraction_mode', lambda: 'heuristic')
+    cache.job_requirements(JD, extract)
+    cache.job_requirements(JD, extract)
+    assert len(calls) == 1
+
+    monkeypatch.setattr(module, 'extraction_mode', lambda: 'semantic')
+    cache.job_requirements(JD, extract)
+    assert len(calls) == 2
+
+
+def test_extraction_mode_separates_encoder_backends(monkeypatch):
+    import backend.services.jd_analysis_cache as module
+    import backend.services.semantic_matcher as semantic_matcher
+
+    class FakeMatcher:
+        def __init__(self, model):
+            self._model = model
+
+        def _lazy_init(self):
+            pass
+
+    class TorchModel:
+        pass
+
+    class OnnxModel:
+        model_id = 'all-MiniLM-L6-v2-onnx-int8'
+
+    modes = []
+    for model in (None, TorchModel(), OnnxModel()):
+        monkeypatch.setattr(semantic_matcher, 'get_semantic_matcher', lambda m=model: FakeMatcher(m))
+        modes.append(module.extraction_mode())
+
+    assert modes[0] == 'heuristic'
+    assert modes[1].startswith('semantic:') and modes[2].startswith('semantic:')
+    assert modes[1] != modes[2]
+
+
+def test_skills_categorizer_extracts_job_skills_once(monkeypatch, cache):
+    monkeypatch.setattr(JDAnalysisCache, '_shared', cache)
+    categorizer = SkillsCategorizer()
+    calls = []
+    original = categorizer.extract_skills
+
+    def counting_extract(text):
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(categorizer, 'extract_skills', counting_extract)
+
+    first = categorizer.categorize_skills('Python developer', JD)
+    second = categorizer.categorize_skills('Django developer', JD)
+
+    assert calls.count(JD) == 1
+    assert first['job_skills'] == second['job_skills']
+
+
+def test_keyword_heat_map_reuses_extraction(monkeypatch, cache):
+    monkeypatch.setattr(JDAnalysisCache, '_shared', cache)
+    matcher = get_semantic_matcher()
+    calls = []
+
+    def fake_extract(job_description, top_n=20, diversity=0.7):
+        calls.append(top_n)
+        return [('python', 0.9), ('kubernetes', 0.5)]
+
+    monkeypatch.setattr(matcher, 'extract_keywords', fake_extract)
+
+    result = matcher.get_keyword_matches_detailed('Python developer', JD, threshold=0.7, top_n=5)
+    matcher.get_keyword_matches_detailed('Kubernetes admin', JD, threshold=0.7, top_n=5)
+
+    assert calls == [5]
+    assert [m['keyword'] for m in result['matched_keywords']] == ['python']
+    assert result['missing_keywords'] == ['kubernetes']
+    assert result['match_rate'] == 50.0
+    assert result['keyword_positions'] == [{'keyword': 'python', 'start': 0, 'end': 6}]
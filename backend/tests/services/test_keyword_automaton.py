@@ -0,0 +1,78 @@
+"""
+Tests for the precompiled multi-keyword matcher.
+"""
+
+import re
+
+from backend.services.keyword_automaton import (
+    KeywordAutomaton,
+    KeywordHit,
+    get_keyword_automaton,
+)
+
+
+def _per_keyword_regex(keywords, text):
+    """Reference behaviour: one \\b<kw>\\b search per keyword."""
+    return {
+        kw for kw in keywords
+        if re.search(r'\b' + re.escape(kw) + r'\b', text, re.IGNORECASE)
+    }
+
+
+def test_hits_have_offsets_in_text_order():
+    automaton = KeywordAutomaton(['Python', 'AWS'])
+    text = 'AWS and python'
+
+    assert automaton.find_all(text) == [
+        KeywordHit('AWS', 0, 3),
+        KeywordHit('Python', 8, 14),
+    ]
+
+
+def test_overlapping_and_shared_prefix_keywords_all_reported():
+    """Keywords inside or sharing a start with longer keywords are still found."""
+    automaton = KeywordAutomaton(['react', 'react native', 'machine learning', 'learning'])
+
+    found = automaton.found('Built React Native apps with machine learning')
+
+    assert found == {'react', 'react native', 'machine learning', 'learning'}
+
+
+def test_word_boundaries_match_regex_semantics():
+    """\\b semantics are preserved, including for non-word characters."""
+    keywords = ['java', 'C++', '.NET', 'Node.js', 'r', 'go']
+    texts = [
+        'JavaScript and Go developer',
+        'C++ and C# experience',
+        'C++developer, ASP.NET, Node.js-based',
+        'R, Rust, golang',
+    ]
+
+    automaton = KeywordAutomaton(keywords)
+    for text in texts:
+        assert automaton.found(text) == _per_keyword_regex(keywords, text)
+
+
+def test_case_sensitive_mode():
+    automaton = KeywordAutomaton(['aws'], case_sensitive=True)
+
+    assert automaton.found('AWS') == set()
+    assert automaton.found('aws') == {'aws'}
+
+
+def test_case_variants_each_reported():
+    automaton = KeywordAutomaton(['AWS', 'aws'])
+    assert automaton.found('Deployed on aws') == {'AWS', 'aws'}
+
+
+def test_empty_keywords_and_text():
+    assert KeywordAutomaton([]).find_all('anything') == []
+    assert KeywordAutomaton(['', 'python']).found('') == set()
+
+
+def test_automaton_cached_per_keyword_set():
+    first = get_keyword_automaton(['Python', 'Django'])
+    second = get_keyword_automaton(['Django', 'Python'])
+
+    assert first is second
+    assert get_keyword_automaton(['Python', 'Django'], case_sensitive=True) is not first
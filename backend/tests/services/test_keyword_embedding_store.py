@@ -0,0 +1,80 @@
+"""
+Tests for the precomputed role keyword embedding store.
+"""
+
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.services.keyword_embedding_store import (
+    KeywordEmbeddingStore,
+    build_store,
+    role_keyword_list,
+)
+
+
+class FakeModel:
+    """Deterministic stand-in for SentenceTransformer.encode."""
+
+    def __init__(self, dimension=8):
+        self.dimension = dimension
+        self.calls = []
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False):
+        self.calls.append(list(texts))
+        return np.array([
+            [(len(text) + i) % 7 for i in range(self.dimension)]
+            for text in texts
+        ], dtype=np.float32)
+
+
+def test_build_and_load_round_trip(tmp_path):
+    model = FakeModel()
+    build_store(model, tmp_path)
+
+    store = KeywordEmbeddingStore.load(tmp_path)
+
+    assert store is not None
+    assert len(store) == len(role_keyword_list())
+    assert store.matrix.dtype == np.float16
+    assert isinstance(store.matrix, np.memmap)
+
+
+def test_embeddings_for_only_encodes_unknown_keywords(tmp_path):
+    build_store(FakeModel(), tmp_path)
+    store = KeywordEmbeddingStore.load(tmp_path)
+    known = role_keyword_list()[:3]
+
+    model = FakeModel()
+    matrix = store.embeddings_for(known + ['not a role keyword'], model.encode)
+
+    assert matrix.shape == (4, 8)
+    assert matrix.dtype == np.float32
+    assert model.calls == [['not a role keyword']]
+    np.testing.assert_allclose(matrix[:3], FakeModel().encode(known), atol=1e-2)
+
+
+def test_stale_store_ignored(tmp_path):
+    build_store(FakeModel(), tmp_path)
+    index_path = tmp_path / 'role_keywords.json'
+    meta = json.loads(index_path.read_text())
+    meta['role_keywords_digest'] = 'outdated'
+    index_path.write_text(json.dumps(meta))
+
+    assert KeywordEmbeddingStore.load(tmp_path) is None
+
+
+def test_store_for_other_encoder_backend_ignored(tmp_path, monkeypatch):
+    """Vectors built with the torch backend are not served to the ONNX one."""
+    monkeypatch.delenv("SEMANTIC_ENCODER", raising=False)
+    build_store(FakeModel(), tmp_path)
+
+    monkeypatch.setenv("SEMANTIC_ENCODER", "onnx")
+
+    assert KeywordEmbeddingStore.load(tmp_path) is None
+
+
+def test_missing_store_returns_none(tmp_path):
+    assert KeywordEmbeddingStore.load(tmp_path) is None
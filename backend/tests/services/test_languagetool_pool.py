@@ -0,0 +1,125 @@
+"""
+Tests for the LanguageTool HTTP server pool.
+"""
+
+import pytest
+
+from backend.services.grammar_cache import GrammarResultCache
+from backend.services.grammar_checker import GrammarChecker
+from backend.services.languagetool_pool import (
+    CircuitBreaker,
+    LanguageToolPool,
+    LanguageToolUnavailableError,
+)
+
+httpx = pytest.importorskip("httpx")
+
+
+MATCH = {
+    'message': 'Possible spelling mistake found.',
+    'offset': 4,
+    'length': 3,
+    'replacements': [{'value': 'the'}, {'value': 'tea'}],
+    'context': {'text': 'Led teh migration', 'offset': 4, 'length': 3},
+    'rule': {'id': 'MORFOLOGIK_RULE_EN_US', 'issueType': 'misspelling'},
+}
+
+
+class FakeServers:
+    """httpx transport standing in for LanguageTool servers by host name."""
+
+    def __init__(self, down=()):
+        self.down = set(down)
+        self.checks = []
+
+    def __call__(self, request):
+        host = request.url.host
+        if host in self.down:
+            raise httpx.ConnectError("connection refused", request=request)
+        if request.url.path == '/v2/languages':
+            return httpx.Response(200, json=[{'code': 'en-US'}])
+        self.checks.append(host)
+        return httpx.Response(200, json={'matches': [MATCH]})
+
+
+def make_pool(servers, fake, **kwargs):
+    client = httpx.Client(transport=httpx.MockTransport(fake))
+    return LanguageToolPool(servers, client=client, **kwargs)
+
+
+def test_check_parses_matches():
+    pool = make_pool(['http://lt1'], FakeServers())
+
+    match = pool.check('Led teh migration')[0]
+
+    assert (match.offset, match.errorLength) == (4, 3)
+    assert match.replacements == ['the', 'tea']
+    assert match.ruleIssueType == 'misspelling'
+
+
+def test_round_robin_over_ready_servers():
+    fake = FakeServers()
+    pool = make_pool(['http://lt1', 'http://lt2'], fake)
+
+    for _ in range(4):
+        pool.check('Led teh migration')
+
+    assert fake.checks == ['lt1', 'lt2', 'lt1', 'lt2']
+
+
+def test_failed_server_is_skipped():
+    fake = FakeServers(down={'lt1'})
+    pool = make_pool(['http://lt1', 'http://lt2'], fake, failure_threshold=1)
+
+    pool.check('Led teh migration')
+    pool.check('Led teh migration')
+
+    assert fake.checks == ['lt2', 'lt2']
+    assert pool.servers[0].breaker.state == 'open'
+    assert pool.status()['available'] is True
+
+
+def test_all_servers_down_raises():
+    pool = make_pool(['http://lt1'], FakeServers(down={'lt1'}), failure_threshold=1)
+
+    with pytest.raises(LanguageToolUnavailableError):
+        pool.check('Led teh migration')
+    assert pool.available() is False
+
+
+def test_circuit_breaker_half_open_trial():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=30, clock=lambda: now[0])
+
+    breaker.record_failure()
+    assert breaker.state == 'closed'
+    breaker.record_failure()
+    assert breaker.state == 'open' and not breaker.allow()
+
+    now[0] = 31
+    assert breaker.allow()          # the single trial request
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == 'open'
+
+    now[0] = 62
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == 'closed'
+
+
+def test_grammar_checker_uses_pool_and_falls_back(monkeypatch):
+    fake = FakeServers()
+    pool = make_pool(['http://lt1'], fake, failure_threshold=1)
+    checker = GrammarChecker(cache=GrammarResultCache(use_disk=False))
+    checker._pool = pool
+
+    result = checker.check('Led teh migration')
+    assert checker.backend == 'languagetool'
+    assert result['issues'][0]['replacements'] == ['the', 'tea']
+
+    fake.down.add('lt1')
+    monkeypatch.setattr(checker, '_fallback_check', lambda text: {'total_issues': 0, 'issues': [], 'fallback': True})
+
+    assert checker.check('Shipped the release on time').get('fallback')
+    assert checker.backend == 'fallback'
@@ -0,0 +1,61 @@
+"""
+Tests for the content-addressed parse cache.
+"""
+
+import pytest
+from backend.services.parse_cache import ParseCache, ParsedUpload, PARSER_VERSION
+from backend.services.parser import ResumeData
+
+
+@pytest.fixture
+def cache():
+    """Memory-only cache (no diskcache dependency in tests)."""
+    return ParseCache(max_entries=2, use_disk=False)
+
+
+@pytest.fixture
+def parsed():
+    return ParsedUpload(
+        resume_data=ResumeData(
+            fileName='cv.pdf',
+            contact={'name': 'Jane Doe'},
+            skills=['Python'],
+            metadata={'pageCount': 1, 'wordCount': 300, 'fileFormat': 'pdf'}
+        ),
+        editable_html='<p>Jane Doe</p>',
+        sections=[{'title': 'Skills', 'content': 'Python'}]
+    )
+
+
+def test_key_depends_on_content_and_version():
+    key = ParseCache.key_for(b'%PDF-1.4 same bytes')
+    assert key == ParseCache.key_for(b'%PDF-1.4 same bytes')
+    assert key != ParseCache.key_for(b'%PDF-1.4 other bytes')
+    assert f':{PARSER_VERSION}:' in key
+
+
+def test_roundtrip_and_stats(cache, parsed):
+    key = ParseCache.key_for(b'resume')
+    assert cache.get(key) is None
+
+    cache.set(key, parsed)
+    hit = cache.get(key)
+
+    assert hit.resume_data == parsed.resume_data
+    assert hit.editable_html == parsed.editable_html
+    assert hit.sections == parsed.sections
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_returned_values_are_copies(cache, parsed):
+    key = ParseCache.key_for(b'resume')
+    cache.set(key, parsed)
+
+    first = cache.get(key)
+    first.resume_data.skills.append('Java')
+    first.sections[0]['title'] = 'Changed'
+
+    second = cache.get(key)
+    assert second.resume_data.skills == ['Python']
+    assert second.sections[0]['title'] == 'Skills'
@@ -0,0 +1,93 @@
+"""
+Tests for the PDF layout probe that picks parse_pdf's extractor.
+"""
+
+from backend.services.pdf_layout_probe import (
+    PageLayout,
+    analyze_page_blocks,
+    choose_extractor,
+    column_ordered_text,
+    count_table_rows,
+)
+
+WIDTH, HEIGHT = 612.0, 792.0
+LINE = "Designed and shipped backend services in Python"
+
+
+def _block(x0, y0, x1, text, block_type=0):
+    return (x0, y0, x1, y0 + 12, text, 0, block_type)
+
+
+def _single_column_page():
+    return [_block(72, 72 + i * 16, 540, LINE) for i in range(20)]
+
+
+def _two_column_page():
+    header = [_block(72, 40, 540, "Jane Smith - Senior Engineer")]
+    left = [_block(40, 100 + i * 16, 200, f"Skill {i}") for i in range(12)]
+    right = [_block(230, 100 + i * 16, 570, f"{LINE} {i}") for i in range(12)]
+    return header + left + right
+
+
+def test_single_column_has_no_gutter():
+    assert analyze_page_blocks(1, _single_column_page(), WIDTH, HEIGHT).columns == 1
+
+
+def test_two_column_gutter_found():
+    blocks = _two_column_page()
+    layout = analyze_page_blocks(1, blocks, WIDTH, HEIGHT)
+
+    assert layout.columns == 2
+    assert 200 <= layout.gutter <= 230
+
+
+def test_column_ordered_text_reads_header_then_left_then_right():
+    blocks = _two_column_page()
+    gutter = analyze_page_blocks(1, blocks, WIDTH, HEIGHT).gutter
+
+    lines = column_ordered_text(blocks, gutter).splitlines()
+
+    assert lines[0] == "Jane Smith - Senior Engineer"
+    assert lines[1:13] == [f"Skill {i}" for i in range(12)]
+    assert lines[13] == f"{LINE} 0"
+
+
+def test_table_rows_counted():
+    blocks = []
+    for r in range(4):
+        for c in range(3):
+            x0 = 72 + c * 160
+            blocks.append((x0, 100 + r * 20, x0 + 120, 112 + r * 20, f"cell {r}-{c}"))
+
+    assert count_table_rows(blocks) == 4
+    assert count_table_rows(blocks[:3]) == 1
+
+
+def test_image_blocks_ignored():
+    blocks = [_block(0, 0, 600, "", block_type=1), _block(72, 72, 540, "Text")]
+    assert analyze_page_blocks(1, blocks, WIDTH, HEIGHT, images=1).chars == 4
+
+
+def test_choose_extractor_decisions():
+    plain = PageLayout(page_number=1, chars=2000, density=4.0)
+    columns = PageLayout(page_number=2, columns=2, gutter=210.0, chars=2000, density=4.0)
+    table = PageLayout(page_number=1, table_rows=5, chars=2000, density=4.0)
+    scanned = PageLayout(page_number=1, chars=10, density=0.02, images=1)
+
+    assert choose_extractor([plain]).extractor == "pymupdf"
+    assert choose_extractor([plain, columns]).extractor == "pymupdf_columns"
+    assert choose_extractor([table, columns]).extractor == "pdfplumber"
+    probe = choose_extractor([scanned])
+    assert probe.extractor == "pypdf"
+    assert any("image pages" in reason for reason in probe.reasons)
+
+
+def test_probe_metadata_is_serializable():
+    import json
+
+    probe = choose_extractor([analyze_page_blocks(1, _two_column_page(), WIDTH, HEIGHT)])
+    metadata = probe.to_metadata()
+
+    assert json.loads(json.dumps(metadata)) == metadata
+    assert metadata["extractor"] == "pymupdf_columns"
+    assert metadata["pages"][0]["columns"] == 2
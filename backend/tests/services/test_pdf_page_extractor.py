@@ -0,0 +1,121 @@
+"""
+Tests for page-parallel PDF extraction and the page cap.
+"""
+
+import io
+import threading
+
+import pytest
+
+import backend.services.pdf_page_extractor as extractor
+
+
+def test_page_ranges_cover_pages_in_order():
+    ranges = extractor._page_ranges(10, 4)
+
+    assert ranges == [(0, 3), (3, 6), (6, 8), (8, 10)]
+    assert extractor._page_ranges(2, 4) == [(0, 1), (1, 2)]
+
+
+def test_page_limit_caps_long_documents(monkeypatch):
+    monkeypatch.setattr(extractor, 'MAX_PDF_PAGES', 30)
+    assert extractor.page_limit(12) == 12
+    assert extractor.page_limit(300) == 30
+
+    monkeypatch.setattr(extractor, 'MAX_PDF_PAGES', 0)
+    assert extractor.page_limit(300) == 300
+
+
+def _multi_page_pdf(pages):
+    canvas_module = pytest.importorskip("reportlab.pdfgen.canvas")
+    buffer = io.BytesIO()
+    c = canvas_module.Canvas(buffer)
+    for number in range(pages):
+        c.drawString(72, 750, f"Page {number + 1} publications and projects")
+        c.showPage()
+    c.save()
+    return buffer.getvalue()
+
+
+def test_parallel_pdfplumber_matches_serial_and_respects_cap(monkeypatch):
+    pytest.importorskip("pdfplumber")
+    content = _multi_page_pdf(6)
+
+    monkeypatch.setattr(extractor, 'PARALLEL_MIN_PAGES', 100)
+    serial, total = extractor.extract_pdfplumber_pages(content)
+
+    monkeypatch.setattr(extractor, 'PARALLEL_MIN_PAGES', 2)
+    try:
+        parallel, _ = extractor.extract_pdfplumber_pages(content)
+    finally:
+        extractor.shutdown_page_pool(wait=True)
+
+    assert total == 6
+    assert parallel == serial
+    assert serial[0].startswith("Page 1")
+
+    monkeypatch.setattr(extractor, 'MAX_PDF_PAGES', 4)
+    capped, total = extractor.extract_pdfplumber_pages(content)
+    assert (len(capped), total) == (4, 6)
+
+
+def test_parallel_pymupdf_matches_serial(monkeypatch):
+    fitz = pytest.importorskip("fitz")
+    content = _multi_page_pdf(6)
+
+    with fitz.open(stream=content, filetype="pdf") as doc:
+        monkeypatch.setattr(extractor, 'PARALLEL_MIN_PAGES', 100)
+        serial = extractor.extract_pymupdf_pages(content, doc)
+        monkeypatch.setattr(extractor, 'PARALLEL_MIN_PAGES', 2)
+        try:
+            parallel = extractor.extract_pymupdf_pages(content, doc)
+        finally:
+            extractor.shutdown_page_pool(wait=True)
+
+    assert parallel == serial
+    assert [text.split()[1] for text in serial] == [str(n) for n in range(1, 7)]
+
+
+def _hanging_range(file_content, start, stop, *args):
+    import time
+    time.sleep(30)
+    return []
+
+
+class _HangingPage:
+    """Page whose serial extraction would hang (records that it was tried)."""
+
+    def __init__(self, tried):
+        self.tried = tried
+
+    def get_text(self, *args):
+        self.tried.set()
+        threading.Event().wait(10)
+        return ""
+
+
+def test_hanging_page_range_times_out_and_discards_pool(monkeypatch):
+    monkeypatch.setattr(extractor, 'PAGE_TIMEOUT', 0.5)
+    pool = extractor._get_page_pool()
+    try:
+        with pytest.raises(extractor.PageExtractionTimeout):
+            extractor._run_ranges(_hanging_range, b"", 4)
+        assert extractor._page_pool is None
+    finally:
+        extractor._discard_page_pool(pool)
+
+
+def test_timed_out_extraction_is_not_retried_serially(monkeypatch):
+    monkeypatch.setattr(extractor, 'PAGE_TIMEOUT', 0.5)
+    monkeypatch.setattr(extractor, 'PARALLEL_MIN_PAGES', 2)
+    monkeypatch.setattr(extractor, '_pymupdf_range', _hanging_range)
+    tried = threading.Event()
+    doc = [_HangingPage(tried) for _ in range(4)]
+
+    try:
+        with pytest.raises(extractor.PageExtractionTimeout):
+            extractor.extract_pymupdf_pages(b"", doc)
+    finally:
+        extractor.shutdown_page_pool()
+
+    assert not tried.is_set()
@@ -0,0 +1,53 @@
+"""
+Tests for pre-fork loading of shared state.
+"""
+
+import gc
+import os
+import sys
+
+import pytest
+
+from backend.services import prefork
+from backend.services.corpus_store import CorpusStore, build_store
+
+
+@pytest.fixture(autouse=True)
+def reset_preload(monkeypatch):
+    monkeypatch.setattr(prefork, '_preload', None)
+
+
+def test_preload_runs_every_step_and_restores_gc():
+    assert not prefork.is_preloaded()
+
+    result = prefork.preload_shared_state(freeze=False)
+
+    assert set(result['steps']) == {'scoring_engine', 'semantic_models', 'keyword_automata', 'synonym_index', 'corpus'}
+    assert result['master_pid'] == os.getpid()
+    assert prefork.is_preloaded() and gc.isenabled()
+
+
+def test_memory_report():
+    report = prefork.memory_report()
+
+    assert report['pid'] == os.getpid()
+    assert report['rss'] > 0
+    assert report['preloaded'] is False
+    if sys.platform.startswith('linux'):
+        assert 0 < report['uss'] <= report['pss'] <= report['rss']
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="requires fork()")
+def test_corpus_store_reconnects_after_fork(tmp_path):
+    store = CorpusStore.load(build_store(tmp_path / "corpus.sqlite"))
+    expected = store.skill_count()
+    parent_conn = store._connection()
+
+    pid = os.fork()
+    if pid == 0:
+        ok = store._connection() is not parent_conn and store.skill_count() == expected
+        os._exit(0 if ok else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+    assert store._connection() is parent_conn
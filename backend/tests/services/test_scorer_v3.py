@@ -469,3 +469,149 @@ def test_full_workflow_with_all_data(scorer):
         if data['status'] in ['success', 'error']
     ]
     assert len(successful_or_error_params) >= 7  # At least 7/11 should attempt scoring
+
+
+# ============================================================================
+# INCREMENTAL RESCORING TESTS
+# ============================================================================
+
+def test_parameter_inputs_cover_registry():
+    """Every registered parameter declares the inputs it reads."""
+    from backend.services.parameters.registry import get_parameter_registry
+    from backend.services.scorer_v3 import PARAMETER_INPUTS
+
+    assert set(get_parameter_registry().get_all_scorers()) <= set(PARAMETER_INPUTS)
+
+
+def test_rescore_unchanged_resume_reuses_all_parameters(scorer, sample_resume_data, sample_job_requirements):
+    """Scoring identical inputs twice reuses every parameter and gives the same total."""
+    first = scorer.score(sample_resume_data, sample_job_requirements)
+    second = scorer.score(sample_resume_data, sample_job_requirements)
+
+    assert first['reused_parameters'] == []
+    reusable = [code for code, r in first['parameter_scores'].items() if r['status'] != 'error']
+    assert second['reused_parameters'] == reusable
+    assert second['total_score'] == first['total_score']
+
+
+def test_bullet_edit_only_reruns_bullet_dependent_parameters(scorer, sample_resume_data, sample_job_requirements):
+    """Editing one bullet re-runs only scorers that read bullets."""
+    from backend.services.scorer_v3 import PARAMETER_INPUTS
+
+    scorer.score(sample_resume_data, sample_job_requirements)
+
+    edited = dict(sample_resume_data)
+    edited['bullets'] = list(sample_resume_data['bullets'])
+    edited['bullets'][0] = "Led migration of monolith to microservices for 2M users"
+    result = scorer.score(edited, sample_job_requirements)
+
+    recomputed = set(result['parameter_scores']) - set(result['reused_parameters'])
+    for code in recomputed:
+        assert 'bullets' in PARAMETER_INPUTS[code] or result['parameter_scores'][code]['status'] == 'error'
+    assert 'P3.1' in result['reused_parameters']
+
+
+def test_reused_results_are_independent_copies(scorer, sample_resume_data):
+    """Mutating a returned result does not corrupt the cached one."""
+    first = scorer.score(sample_resume_data)
+    first['parameter_scores']['P3.1']['score'] = -99
+
+    second = scorer.score(sample_resume_data)
+    assert second['parameter_scores']['P3.1']['score'] != -99
+
+
+def test_backend_change_invalidates_dependent_results(scorer, sample_resume_data, monkeypatch):
+    """Results computed before the semantic model or LanguageTool loaded are not reused after."""
+    from backend.services import scorer_v3
+
+    monkeypatch.setattr(scorer_v3, '_semantic_mode', lambda: 'exact')
+    monkeypatch.setattr(scorer_v3, '_grammar_backend', lambda: 'fallback')
+    scorer.score(sample_resume_data)
+
+    monkeypatch.setattr(scorer_v3, '_semantic_mode', lambda: 'all-MiniLM-L6-v2')
+    monkeypatch.setattr(scorer_v3, '_grammar_backend', lambda: 'languagetool')
+    result = scorer.score(sample_resume_data)
+
+    for code in ('P1.1', 'P1.2', 'P4.1'):
+        assert code not in result['reused_parameters']
+    assert 'P3.1' in result['reused_parameters']
+
+
+def test_result_cache_can_be_disabled(sample_resume_data):
+    scorer = ScorerV3(result_cache_size=0)
+    scorer.score(sample_resume_data)
+    result = scorer.score(sample_resume_data)
+
+    assert result['reused_parameters'] == []
+    assert scorer.result_cache_stats() == {'enabled': False}
+
+
+# ============================================================================
+# PARALLEL EVALUATION TESTS
+# ============================================================================
+
+def test_parallel_mode_matches_serial(sample_resume_data, sample_job_requirements):
+    """Parallel evaluation produces the same scores as the serial loop."""
+    serial = ScorerV3(result_cache_size=0, parallel=False)
+    parallel = ScorerV3(result_cache_size=0, parallel=True)
+
+    expected = serial.score(sample_resume_data, sample_job_requirements)
+    result = parallel.score(sample_resume_data, sample_job_requirements)
+
+    assert list(result['parameter_scores']) == list(expected['parameter_scores'])
+    assert result['total_score'] == expected['total_score']
+
+
+def test_slow_parameter_marked_timeout(sample_resume_data):
+    """A pooled parameter past its timeout degrades to status 'timeout'."""
+    import time
+
+    scorer = ScorerV3(result_cache_size=0, parallel=True, parameter_timeout=0.2)
+    real_score = scorer.scorers['P4.1'].score
+
+    def slow_score(*args, **kwargs):
+        time.sleep(1)
+        return real_score(*args, **kwargs)
+
+    scorer.scorers['P4.1'].score = slow_score
+    result = scorer.score(sample_resume_data)
+
+    p41 = result['parameter_scores']['P4.1']
+    assert p41['status'] == 'timeout'
+    assert 'P4.1' not in result['category_scores']['Professional Polish']['parameters']
+    assert result['max_available'] == sum(
+        r['max_score'] for r in result['parameter_scores'].values()
+        if r['status'] not in ('skipped', 'timeout')
+    )
+
+
+def test_unknown_cpu_pool_rejected():
+    with pytest.raises(ValueError):
+        ScorerV3(cpu_pool='gpu')
+
+
+def test_on_parameter_reports_every_parameter(scorer, sample_resume_data, sample_job_requirements):
+    """The progress callback sees each parameter once, including reused results."""
+    seen = []
+
+    def on_parameter(code, category, result):
+        seen.append((code, category, result['score']))
+
+    scorer.score(sample_resume_data, sample_job_requirements, on_parameter=on_parameter)
+    first = list(seen)
+    seen.clear()
+    scorer.score(sample_resume_data, sample_job_requirements, on_parameter=on_parameter)
+
+    all_params = scorer.registry.get_all_scorers()
+    assert sorted(code for code, _, _ in first) == sorted(all_params)
+    assert all(category == all_params[code]['category'] for code, category, _ in first)
+    assert sorted(seen) == sorted(first)
+
+
+def test_on_parameter_errors_do_not_fail_scoring(scorer, sample_resume_data):
+    def on_parameter(code, category, result):
+        raise RuntimeError("client went away")
+
+    result = scorer.score(sample_resume_data, on_parameter=on_parameter)
+
+    assert 0 <= result['total_score'] <= 100
@@ -0,0 +1,56 @@
+"""
+Tests for the process-wide ScoringEngine.
+"""
+
+import pytest
+from backend.services.scoring_engine import (
+    ScoringEngine,
+    get_scoring_engine,
+    init_scoring_engine,
+    reset_scoring_engine,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_engine():
+    """Ensure each test starts without a cached engine."""
+    reset_scoring_engine()
+    yield
+    reset_scoring_engine()
+
+
+def test_engine_is_built_once():
+    """Repeated access returns the same warm instance."""
+    engine = init_scoring_engine()
+    assert get_scoring_engine() is engine
+    assert init_scoring_engine() is engine
+
+
+def test_adapter_reuses_engine_scorer():
+    """Adapter must not construct its own ScorerV3."""
+    engine = get_scoring_engine()
+    assert engine.adapter.scorer is engine.scorer
+
+
+def test_engine_is_immutable():
+    """Attributes and the scorer mapping cannot be replaced."""
+    engine = get_scoring_engine()
+
+    with pytest.raises(AttributeError):
+        engine.scorer = None
+
+    with pytest.raises(TypeError):
+        engine.scorer.scorers['P1.1'] = object()
+
+
+def test_init_costs_cover_all_parameters():
+    """Registry exposes per-parameter construction cost."""
+    engine = ScoringEngine()
+    all_codes = set(engine.scorer.registry.get_all_scorers())
+
+    assert set(engine.init_costs) == all_codes
+    assert all(cost >= 0 for cost in engine.init_costs.values())
+
+    stats = engine.stats()
+    assert stats['parameters'] == len(all_codes)
+    assert stats['build_seconds'] >= 0
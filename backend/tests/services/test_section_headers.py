@@ -0,0 +1,103 @@
+"""
+Tests for the shared section-header classifier.
+"""
+
+import time
+
+import pytest
+
+from backend.services.section_headers import (
+    PARSER_SECTIONS,
+    SECTION_ALIASES,
+    SectionHeaderClassifier,
+    normalize_header,
+)
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    return SectionHeaderClassifier()
+
+
+@pytest.mark.parametrize("line,section", [
+    ("EXPERIENCE", "experience"),
+    ("Work Experience", "experience"),
+    ("EXPERIENCE SUMMARY", "experience"),
+    ("PROFESSIONAL SUMMARY", "summary"),
+    ("Summary of Qualifications", "summary"),
+    ("Education:", "education"),
+    ("Technical Skills & Tools", "skills"),
+    ("Certifications & Training", "certifications"),
+    ("Key Projects", "projects"),
+    ("Honors and Awards", "awards"),
+    ("  SKILLS  ", "skills"),
+])
+def test_classifies_headers(classifier, line, section):
+    assert classifier.classify(line) == section
+
+
+@pytest.mark.parametrize("line", [
+    "Experienced engineer leading cloud migrations",
+    "Managed tools and budgets for a team of 12",
+    "• Work experience with Python",
+    "2019 - 2021 Education Program Coordinator",
+    "Skills, Python, Java, Go",
+    "Built services. Cut costs. Shipped weekly.",
+    "x" * 70 + " experience",
+    "John Doe",
+    "",
+])
+def test_rejects_body_text(classifier, line):
+    assert classifier.classify(line) is None
+
+
+def test_header_with_inline_content_uses_text_before_colon(classifier):
+    assert classifier.classify("Skills: Python, Java") == "skills"
+    assert classifier.classify("Objective: lead a data platform team") == "summary"
+
+
+def test_sections_filter(classifier):
+    assert classifier.classify("Project Experience") == "projects"
+    assert classifier.classify("Project Experience", PARSER_SECTIONS) == "experience"
+    assert classifier.classify("Contact Information", PARSER_SECTIONS) is None
+
+
+def test_match_reports_alias_without_shape_check(classifier):
+    found = classifier.match("Professional Experience")
+
+    assert found.section == "experience"
+    assert found.alias == "professional experience"
+    assert classifier.match("Lorem ipsum dolor") is None
+
+
+def test_normalization_is_case_plural_and_ampersand_insensitive():
+    assert normalize_header("Skills & Tools") == normalize_header("skill and tool")
+    assert normalize_header("ADDRESS") == ["address"]
+
+
+def test_every_alias_classifies_to_its_section(classifier):
+    for section, aliases in SECTION_ALIASES.items():
+        for alias in aliases:
+            assert classifier.match(alias).section in SECTION_ALIASES
+            assert classifier.classify(alias.upper()) is not None
+
+
+def test_per_line_cost(classifier):
+    """Classifying a line must stay cheap: it runs for every line of every resume."""
+    lines = [
+        "PROFESSIONAL EXPERIENCE",
+        "Senior Software Engineer, Acme Corp, 2019 - Present",
+        "• Led migration of 40 services to Kubernetes, cutting costs by 30%",
+        "Designed and built event-driven data pipelines processing 2M events/day",
+        "EDUCATION",
+        "B.S. Computer Science, State University, 2015",
+        "Technical Skills: Python, Go, PostgreSQL",
+        "Mentored four junior engineers and ran the team's hiring loop",
+    ] * 250
+
+    start = time.perf_counter()
+    for line in lines:
+        classifier.classify(line)
+    per_line_us = (time.perf_counter() - start) / len(lines) * 1e6
+
+    assert per_line_us < 100, f"{per_line_us:.1f}us per line"
@@ -0,0 +1,144 @@
+"""
+Tests for the sentence encoder backends.
+
+The equivalence tests export the real model to int8 ONNX and compare it with
+the torch backend; they are skipped when sentence-transformers, onnxruntime
+or the model itself are not available.
+"""
+
+import hashlib
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.services.keyword_embedding_store import MODEL_NAME
+from backend.services.sentence_encoder import (
+    EmbeddingKeywordExtractor,
+    OnnxSentenceEncoder,
+    configured_model_id,
+    load_sentence_encoder,
+    model_id_for,
+)
+
+JOB_DESCRIPTION = (
+    "We are hiring a senior backend engineer. Requirements: Python, PostgreSQL and AWS. "
+    "You will design REST APIs, mentor engineers and own CI/CD pipelines. "
+    "Nice to have: Kubernetes, Terraform and experience with machine learning platforms."
+)
+
+RESUME_CHUNKS = [
+    "Led a team of 5 engineers building Python microservices on AWS Lambda",
+    "Designed PostgreSQL schemas and reduced query latency by 40%",
+    "Built CI/CD pipelines with GitHub Actions and Docker",
+    "Mentored junior developers and ran weekly code reviews",
+    "Trained gradient boosted models for churn prediction",
+]
+
+KEYWORDS = ["python", "postgres", "amazon web services", "continuous integration", "mentoring", "machine learning"]
+
+
+class FakeEncoder:
+    """Deterministic bag-of-trigrams vectors."""
+
+    def encode(self, texts, show_progress_bar=False):
+        vectors = np.zeros((len(texts), 64), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for i in range(max(1, len(text) - 2)):
+                vectors[row, hashlib.md5(text[i:i + 3].encode()).digest()[0] % 64] += 1
+        return vectors
+
+
+def test_backend_selection(monkeypatch):
+    monkeypatch.delenv("SEMANTIC_ENCODER", raising=False)
+    assert configured_model_id() == MODEL_NAME
+
+    monkeypatch.setenv("SEMANTIC_ENCODER", "onnx")
+    assert configured_model_id() == f"{MODEL_NAME}:onnx-int8"
+
+    monkeypatch.setenv("SEMANTIC_ENCODER", "tensorflow")
+    assert configured_model_id() == MODEL_NAME
+
+
+def test_missing_onnx_export_raises(monkeypatch, tmp_path):
+    monkeypatch.setenv("ONNX_ENCODER_DIR", str(tmp_path))
+
+    with pytest.raises(FileNotFoundError):
+        load_sentence_encoder("onnx")
+
+
+def test_keyword_extractor_matches_keybert():
+    keybert = pytest.importorskip("keybert")
+    from keybert.backend import BaseEmbedder
+
+    encoder = FakeEncoder()
+
+    class Embedder(BaseEmbedder):
+        def embed(self, documents, verbose=False):
+            return encoder.encode(list(documents))
+
+    options = dict(keyphrase_ngram_range=(1, 2), stop_words='english', top_n=8, use_mmr=True, diversity=0.7)
+    expected = keybert.KeyBERT(model=Embedder()).extract_keywords(JOB_DESCRIPTION, **options)
+
+    assert EmbeddingKeywordExtractor(encoder).extract_keywords(JOB_DESCRIPTION, **options) == expected
+
+
+@pytest.fixture(scope="module")
+def backends(tmp_path_factory):
+    """(torch SentenceTransformer, OnnxSentenceEncoder exported from it)"""
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("onnx")
+    sentence_transformers = pytest.importorskip("sentence_transformers")
+    try:
+        torch_model = sentence_transformers.SentenceTransformer(MODEL_NAME, device='cpu')
+    except Exception as e:
+        pytest.skip(f"{MODEL_NAME} is not available: {e}")
+
+    from backend.build_onnx_encoder import export
+
+    directory = export(MODEL_NAME, tmp_path_factory.mktemp("onnx"), model_name=MODEL_NAME)
+    return torch_model, OnnxSentenceEncoder(directory)
+
+
+def test_onnx_vectors_match_torch(backends):
+    torch_model, onnx_model = backends
+    texts = RESUME_CHUNKS + KEYWORDS + [JOB_DESCRIPTION * 20]  # last one is truncated
+
+    expected = torch_model.encode(texts, show_progress_bar=False)
+    actual = onnx_model.encode(texts)
+
+    assert actual.shape == expected.shape and actual.dtype == np.float32
+    cosine = (expected * actual).sum(axis=1) / np.linalg.norm(expected, axis=1) / np.linalg.norm(actual, axis=1)
+    assert cosine.min() >= 0.98
+    # Dynamic quantization scales activations per batch, so batching shifts vectors slightly
+    np.testing.assert_allclose(onnx_model.encode(KEYWORDS[0]), actual[len(RESUME_CHUNKS)], atol=2e-3)
+    assert model_id_for(onnx_model) != model_id_for(torch_model) == MODEL_NAME
+
+
+def test_onnx_match_scores_match_torch(backends):
+    """Keyword x chunk similarities (what HybridKeywordMatcher scores) agree."""
+    torch_model, onnx_model = backends
+
+    def similarities(model):
+        chunks = model.encode(RESUME_CHUNKS, show_progress_bar=False)
+        keywords = model.encode(KEYWORDS, show_progress_bar=False)
+        return keywords @ chunks.T
+
+    expected, actual = similarities(torch_model), similarities(onnx_model)
+
+    assert np.abs(expected - actual).max() <= 0.05
+    # The chunk picked as evidence is the best (or within noise of it) under torch
+    picked = actual.argmax(axis=1)
+    assert (expected.max(axis=1) - expected[np.arange(len(KEYWORDS)), picked]).max() <= 0.02
+
+
+def test_onnx_keyword_extraction_matches_keybert(backends):
+    from keybert import KeyBERT
+
+    torch_model, onnx_model = backends
+    options = dict(keyphrase_ngram_range=(1, 2), stop_words='english', top_n=10, use_mmr=True, diversity=0.7)
+
+    expected = {kw for kw, _ in KeyBERT(torch_model).extract_keywords(JOB_DESCRIPTION, **options)}
+    actual = {kw for kw, _ in EmbeddingKeywordExtractor(onnx_model).extract_keywords(JOB_DESCRIPTION, **options)}
+
+    assert len(expected & actual) >= 7
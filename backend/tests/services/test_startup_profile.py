@@ -0,0 +1,100 @@
+"""
+Tests for the startup import profiler and lazy import shims.
+"""
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from backend.services import lazy_imports
+from backend.services.lazy_imports import lazy_callable, lazy_status
+from backend.services.startup_profile import ImportProfiler
+
+
+@pytest.fixture
+def modules(tmp_path, monkeypatch):
+    """Write throwaway modules onto sys.path; removed from sys.modules afterwards."""
+    written = []
+
+    def write(name, source):
+        (tmp_path / f"{name}.py").write_text(textwrap.dedent(source))
+        written.append(name)
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield write
+    for name in written:
+        sys.modules.pop(name, None)
+
+
+def test_profiler_records_nested_imports(modules):
+    modules('sp_outer', """
+        import time
+        import sp_inner
+        time.sleep(0.02)
+    """)
+    modules('sp_inner', """
+        import time
+        time.sleep(0.03)
+        DATA = bytearray(8 * 1024 * 1024)
+    """)
+
+    with ImportProfiler() as profiler:
+        import sp_outer  # noqa: F401
+
+    records = {r.name: r for r in profiler.records}
+    outer, inner = records['sp_outer'], records['sp_inner']
+
+    assert inner.parent == 'sp_outer' and inner.depth == 1
+    assert outer.total_seconds >= inner.total_seconds + 0.02
+    assert outer.self_seconds == pytest.approx(outer.total_seconds - inner.total_seconds)
+    assert inner.total_rss >= 4 * 1024 * 1024
+    assert [r.name for r in profiler.top_level()] == ['sp_outer']
+    assert 'sp_outer' in profiler.format_report()
+
+
+def test_profiler_stops_recording(modules):
+    modules('sp_after', "X = 1\n")
+
+    profiler = ImportProfiler().start().stop()
+    import sp_after  # noqa: F401
+
+    assert profiler.records == []
+
+
+def test_lazy_callable_imports_on_first_call(modules, monkeypatch):
+    monkeypatch.setattr(lazy_imports, '_registered', {})
+    modules('sp_heavy', """
+        def double(x):
+            return 2 * x
+    """)
+
+    double = lazy_callable('sp_heavy', 'double')
+
+    assert 'sp_heavy' not in sys.modules
+    assert lazy_status() == {'sp_heavy': False}
+    assert double(21) == 42
+    assert lazy_status() == {'sp_heavy': True}
+
+
+def test_routers_do_not_import_optional_stacks():
+    """Import budget: heavy optional stacks stay out of router imports."""
+    script = textwrap.dedent("""
+        import sys
+        try:
+            import backend.api.upload, backend.api.export, backend.api.editor
+            import backend.api.latex_editor, backend.api.onlyoffice
+        except ImportError as e:
+            print(e)
+            sys.exit(2)
+        deferred = ['pdf2docx', 'cv2', 'mammoth', 'reportlab', 'bs4', 'jwt',
+                    'backend.services.docx_to_latex', 'backend.services.pdf_to_docx']
+        print('loaded:', *(m for m in deferred if m in sys.modules))
+    """)
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, timeout=120)
+
+    if result.returncode == 2:
+        pytest.skip(f"router dependencies not installed: {result.stdout.strip()}")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines()[-1] == 'loaded:'
@@ -0,0 +1,77 @@
+"""
+Tests for the precomputed synonym index.
+"""
+
+import re
+
+import pytest
+
+from backend.services.keyword_extractor import match_with_synonyms
+from backend.services.synonym_database import SYNONYM_DATABASE, expand_keywords, get_all_synonyms
+from backend.services.synonym_index import SYNONYM_INDEX, SynonymIndex
+
+
+def linear_synonyms(keyword):
+    """The original full-scan lookup, kept as the reference behaviour."""
+    keyword_lower = keyword.lower().strip()
+    result_set = {keyword_lower}
+    if keyword_lower in SYNONYM_DATABASE:
+        result_set.update(SYNONYM_DATABASE[keyword_lower])
+    for main_keyword, synonyms in SYNONYM_DATABASE.items():
+        if keyword_lower in synonyms:
+            result_set.add(main_keyword)
+            result_set.update(synonyms)
+            break
+    return sorted(result_set)
+
+
+def test_matches_linear_scan_for_every_term():
+    terms = set(SYNONYM_DATABASE)
+    for synonyms in SYNONYM_DATABASE.values():
+        terms.update(synonyms)
+
+    for term in sorted(terms) + ['not-a-skill', '  K8S ']:
+        assert get_all_synonyms(term) == linear_synonyms(term), term
+
+
+def test_canonical_ids_and_variants():
+    index = SynonymIndex({
+        'kubernetes': ['kubernetes', 'k8s', 'kube'],
+        'terraform': ['terraform', 'tf'],
+        'tensorflow': ['tensorflow', 'tf'],
+    })
+
+    assert index.canonical_id('K8s') == 'kubernetes'
+    assert index.canonical_id('tf') == 'terraform'  # First group listing it wins
+    assert index.canonical_id('cobol') is None
+    assert index.variants('kubernetes') == {'kubernetes', 'k8s', 'kube'}
+    assert index.expand('cobol') == ('cobol',)
+    assert 'KUBE' in index and len(index) == 6
+
+
+def test_expand_keywords_is_union_of_expansions():
+    keywords = ['python', 'aws', 'k8s', 'unknown skill']
+    expected = sorted(set().union(*(linear_synonyms(k) for k in keywords)))
+
+    assert expand_keywords(keywords) == expected
+
+
+@pytest.mark.parametrize("keyword,text", [
+    ("kubernetes", "i use k8s daily"),
+    ("python", "I know Python"),
+    ("python", "pythonic code only"),
+    ("javascript", "copy editor"),
+    ("c++", "wrote c++ services"),
+    ("machine learning", "applied ML to fraud"),
+])
+def test_pattern_matches_like_per_form_search(keyword, text):
+    expected = any(
+        re.search(r'\b' + re.escape(form) + r'\b', text, re.IGNORECASE)
+        for form in linear_synonyms(keyword)
+    )
+
+    assert match_with_synonyms(keyword, text) == expected
+
+
+def test_patterns_compiled_once():
+    assert SYNONYM_INDEX.pattern('kubernetes') is SYNONYM_INDEX.pattern('K8s ')
@@ -260,3 +260,61 @@ def test_upload_mode_backward_compatibility(client):
     # Should default to quality_coach without JD
     assert result["scoringMode"] == "quality_coach"
     assert result["score"]["mode"] == "quality_coach"
+
+
+def _parse_sse(body):
+    """Split a text/event-stream body into (event, data) pairs."""
+    import json
+
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_upload_stream_emits_stages_in_order(client):
+    """Streaming upload sends parsed data first and the full response last"""
+    pdf_content = create_test_pdf()
+    files = {"file": ("test_resume.pdf", io.BytesIO(pdf_content), "application/pdf")}
+
+    response = client.post("/api/upload/stream", files=files, data={"role": "software_engineer"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(response.text)
+    names = [name for name, _ in events]
+
+    assert names[0] == "parsed"
+    assert "contact" in events[0][1]
+    assert names.count("parameter") > 0
+    assert names.index("score") > max(i for i, n in enumerate(names) if n == "parameter")
+    assert names[-3:] == ["suggestions", "html", "result"]
+    assert events[-1][1]["score"]["overallScore"] == events[names.index("score")][1]["overallScore"]
+
+
+def test_upload_stream_rejects_invalid_type(client):
+    """Validation errors are returned before streaming starts"""
+    files = {"file": ("test.txt", io.BytesIO(b"not a resume"), "text/plain")}
+
+    response = client.post("/api/upload/stream", files=files)
+
+    assert response.status_code == 400
+
+
+def test_slow_docx_html_falls_back_to_basic_converter(monkeypatch):
+    """A DOCX conversion that overruns its limit falls back to mammoth HTML"""
+    import threading
+    from backend.api import upload
+
+    release = threading.Event()
+    monkeypatch.setattr(upload, "DOCX_HTML_TIMEOUT", 0.05)
+    monkeypatch.setattr(upload, "docx_to_html_advanced", lambda parsed: release.wait(5))
+    monkeypatch.setattr(upload, "docx_to_html", lambda content: "<p>basic</p>")
+
+    try:
+        html = upload._convert_to_html(b"docx-bytes", None, upload.DOCX_CONTENT_TYPE, object())
+    finally:
+        release.set()
+
+    assert html == "<p>basic</p>"
@@ -0,0 +1,71 @@
+import pytest
+from docx import Document
+from docx.shared import Pt
+from io import BytesIO
+from backend.services.parsed_docx import ParsedDocx, ParsedParagraph, ParsedTable
+from backend.services.parser import parse_docx
+from backend.services.section_detector import SectionDetector
+from backend.services.docx_to_html_advanced import docx_to_html_advanced
+
+
+def _build_docx() -> bytes:
+    doc = Document()
+    doc.add_paragraph('Jane Doe')
+    doc.add_heading('Experience', level=2)
+    p = doc.add_paragraph()
+    run = p.add_run('Senior Engineer at Acme')
+    run.bold = True
+    run.font.size = Pt(11)
+    table = doc.add_table(rows=1, cols=2)
+    table.cell(0, 0).text = 'Python'
+    table.cell(0, 1).text = ' AWS '
+    doc.add_heading('Education', level=2)
+    doc.add_paragraph('BS Computer Science')
+
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def test_blocks_preserve_document_order():
+    """Paragraphs and tables are interleaved in body order"""
+    parsed = ParsedDocx.from_bytes(_build_docx())
+
+    kinds = [type(block) for block in parsed.blocks]
+    assert kinds == [
+        ParsedParagraph, ParsedParagraph, ParsedParagraph,
+        ParsedTable, ParsedParagraph, ParsedParagraph,
+    ]
+    assert parsed.tables[0].rows == [['Python', 'AWS']]
+    assert parsed.section_count == 1
+
+
+def test_paragraph_indices_styles_and_runs():
+    """Paragraph metadata matches doc.paragraphs"""
+    parsed = ParsedDocx.from_bytes(_build_docx())
+
+    assert [p.index for p in parsed.paragraphs] == list(range(len(parsed.paragraphs)))
+    assert parsed.paragraphs[1].style_name.startswith('Heading')
+    run = parsed.paragraphs[2].runs[0]
+    assert run.bold is True
+    assert run.font_size_pt == 11
+
+
+def test_coerce_returns_same_instance():
+    parsed = ParsedDocx.from_bytes(_build_docx())
+    assert ParsedDocx.coerce(parsed) is parsed
+
+
+def test_consumers_match_bytes_and_parsed_input():
+    """Parser, section detector and HTML converter give identical output either way"""
+    docx_bytes = _build_docx()
+    parsed = ParsedDocx.from_bytes(docx_bytes)
+
+    assert parse_docx(parsed, 'cv.docx') == parse_docx(docx_bytes, 'cv.docx')
+    assert SectionDetector().detect(parsed) == SectionDetector().detect(docx_bytes)
+    assert docx_to_html_advanced(parsed) == docx_to_html_advanced(docx_bytes)
+
+
+def test_invalid_bytes_raise():
+    with pytest.raises(Exception):
+        ParsedDocx.from_bytes(b'not a docx')
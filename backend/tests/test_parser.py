@@ -216,3 +216,26 @@ def test_extract_resume_sections_empty_sections():
     assert isinstance(sections['education'], list)
     assert isinstance(sections['skills'], list)
     assert isinstance(sections['certifications'], list)
+
+
+def test_parse_pdf_records_parse_strategy():
+    """parse_pdf picks one extractor up front and records the decision"""
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=letter)
+    y = 750
+    for line in ["John Doe", "john@example.com", "EXPERIENCE"] + \
+            ["Built Python services handling millions of requests per day"] * 20:
+        c.drawString(72, y, line)
+        y -= 16
+    c.save()
+
+    result = parse_pdf(buffer.getvalue(), "test.pdf")
+    strategy = result.metadata["parseStrategy"]
+
+    assert strategy["extractor"] == "pymupdf"
+    assert strategy["used"] == "pymupdf"
+    assert strategy["reasons"]
+    assert strategy["pages"][0]["columns"] == 1